@@ -19,8 +19,7 @@ import streamlit as st
 from app.controllers.input_factory import InputFactory
 from app.state.session_manager import SessionManager
 from app.state.store import get_state
-from infra.data_providers.yahoo_financial_provider import YahooFinancialProvider
-from infra.macro.default_macro_provider import DefaultMacroProvider
+from infra.data_providers.yahoo_financial_provider import get_yahoo_provider
 from src.core.exceptions import ExternalServiceError, TickerNotFoundError, ValuationError
 from src.i18n import CommonTexts
 from src.valuation.orchestrator import ValuationOrchestrator
@@ -44,9 +43,8 @@ class AppController:
         # 1. UI Feedback: Spinner
         with st.spinner(CommonTexts.STATUS_CALCULATED):
             try:
-                # 2. Infrastructure Setup (DI)
-                macro = DefaultMacroProvider()
-                provider = YahooFinancialProvider(macro_provider=macro)
+                # 2. Infrastructure Setup (DI): long-lived, process-wide provider
+                provider = get_yahoo_provider()
 
                 # 3. Input Assembly
                 request = InputFactory.build_request()
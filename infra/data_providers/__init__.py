@@ -1,7 +1,8 @@
 from .base_provider import FinancialDataProvider
-from .yahoo_financial_provider import YahooFinancialProvider
+from .yahoo_financial_provider import YahooFinancialProvider, get_yahoo_provider
 
 __all__ = [
     "YahooFinancialProvider",
+    "get_yahoo_provider",
     "FinancialDataProvider",
 ]
@@ -12,11 +12,29 @@ class ProviderConfig:
     MAX_RETRY_ATTEMPTS: int = 3
     RETRY_DELAY_BASE: float = 1.0  # seconds
     REQUEST_TIMEOUT: float = 10.0  # seconds
+    HTTP_POOL_SIZE: int = 8  # keep-alive connections / API worker threads (see http_session.py)
+
+    # Rate limiting (token bucket shared by all processes, see rate_limiter.py)
+    RATE_LIMIT_PER_SECOND: float = 2.0
+    RATE_LIMIT_BURST: float = 10.0
+    RATE_LIMIT_STATE_FILE: str = ".cache/yahoo_rate_limit.bin"
 
     # Caching
     CACHE_ENABLED: bool = True
     CACHE_TTL_SECONDS: int = 3600
 
+    # Persistent snapshot cache and watchlist pre-warming (see snapshot_cache.py, prewarm.py)
+    SNAPSHOT_CACHE_DIR: str = ".cache/snapshots"
+    SNAPSHOT_CACHE_TTL_SECONDS: int = 86400  # a pre-open warm-up serves the whole trading day
+    PREWARM_MAX_WORKERS: int = 4
+
     # Data Fetching
     DEFAULT_PERIOD: str = "annual"
     DEFAULT_LIMIT: int = 5
+    HISTORY_PERIOD: str = "10y"  # cold download; stored series are refreshed incrementally
+    HISTORY_ADJUSTMENT_RTOL: float = 1e-4  # settled Close drift that reveals a back-adjusted series
+    HISTORY_BULK_CHUNK_SIZE: int = 100  # tickers per multi-ticker download
+
+    # Local raw-data store (see raw_store.py)
+    RAW_STORE_DIR: str = ".cache/raw_store"
+    RAW_STORE_ENABLED: bool = True  # the process-wide provider writes through it and refreshes history incrementally
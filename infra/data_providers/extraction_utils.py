@@ -15,13 +15,16 @@ from __future__ import annotations
 import logging
 import time
 from collections.abc import Callable
-from concurrent.futures import ThreadPoolExecutor
 from concurrent.futures import TimeoutError as FuturesTimeoutError
 from typing import Any
 
 import pandas as pd
 
 from infra.data_providers.config import ProviderConfig
+from infra.data_providers.http_session import submit_api_call
+from infra.data_providers.rate_limiter import get_rate_limiter
+from infra.data_providers.statement_index import StatementIndex
+from src.core.tracing import tracer
 
 logger = logging.getLogger(__name__)
 
@@ -46,6 +49,15 @@ def safe_api_call(
     """
     Executes an API function with exponential backoff and timeout protection.
 
+    Every attempt first takes a token from the shared rate limiter
+    (`get_rate_limiter`), so bulk jobs stay under the throttling threshold.
+
+    The timeout covers the call itself, not the wait for a worker: an attempt
+    first waits (at most the same timeout) for a free slot of the shared pool
+    (`submit_api_call`), then runs at once. A timed-out call cannot be
+    stopped; it keeps its worker until it returns, and the next attempt waits
+    for another one.
+
     Parameters
     ----------
     func : Callable
@@ -61,20 +73,29 @@ def safe_api_call(
         The API result or None if all attempts fail.
     """
     # DT-022: Enforce strict execution window to prevent Streamlit hanging
-    timeout = 10.0
-    for i in range(max_retries):
-        try:
-            with ThreadPoolExecutor(max_workers=1) as executor:
-                future = executor.submit(func)
+    timeout = ProviderConfig.REQUEST_TIMEOUT
+    with tracer.span("provider.call", category="provider", context=context) as span:
+        for i in range(max_retries):
+            span.set(attempts=i + 1)
+            limiter = get_rate_limiter()
+            if limiter is not None:
+                limiter.acquire()
+            # Shared long-lived workers: their keep-alive connections survive between calls
+            future = submit_api_call(func, wait=timeout)
+            if future is None:
+                logger.warning(f"[{context}] No free API worker (attempt {i+1})")
+                continue
+            try:
                 return future.result(timeout=timeout)
-        except FuturesTimeoutError:
-            logger.warning(f"[{context}] Timeout reached (attempt {i+1})")
-            continue
-        except Exception as e:
-            wait = ProviderConfig.RETRY_DELAY_BASE * (2 ** i)
-            logger.warning(f"[{context}] Error: {e}. Retry in {wait}s...")
-            time.sleep(wait)
-
+            except FuturesTimeoutError:
+                logger.warning(f"[{context}] Timeout reached (attempt {i+1})")
+                continue
+            except Exception as e:
+                wait = ProviderConfig.RETRY_DELAY_BASE * (2 ** i)
+                logger.warning(f"[{context}] Error: {e}. Retry in {wait}s...")
+                time.sleep(wait)
+
+        span.set(exhausted=True)
     logger.error(f"[{context}] All API retries exhausted.")
     return None
 
@@ -97,29 +118,14 @@ def extract_most_recent_value(df: pd.DataFrame, keys: list[str]) -> float | None
     -------
     Optional[float]
         The extracted numeric value or None.
+
+    Notes
+    -----
+    Callers reading several fields from the same statement should compile it
+    once with `StatementIndex.from_frame` and use `StatementIndex.latest`.
     """
-    if df is None or df.empty:
-        return None
-
-    # Fix: Specific exception handling for chronological sorting
-    try:
-        # Prioritize TTM or the latest fiscal year data by sorting columns
-        df = df.sort_index(axis=1, ascending=False)
-    except (AttributeError, TypeError, ValueError) as e:
-        logger.debug(f"Index sorting skipped: {e}")
-
-    for key in keys:
-        if key in df.index:
-            row = df.loc[key]
-            # Handle cases where row might be a Series or a single scalar
-            values = row.values if hasattr(row, 'values') else [row]
-            for val in values:
-                if pd.notnull(val):
-                    try:
-                        return float(val)
-                    except (ValueError, TypeError):
-                        continue
-    return None
+    # One-off lookups compile the statement; the mapper compiles each statement once
+    return StatementIndex.from_frame(df).latest(keys)
 
 def normalize_currency_and_price(info: dict) -> tuple[str, float]:
     """
@@ -0,0 +1,153 @@
+"""
+infra/data_providers/history_backend.py
+
+HISTORY BACKENDS — Bulk Multi-Ticker Price Downloads
+====================================================
+Role: Fetch the daily price history of many tickers per round-trip.
+Responsibility: `YahooHistoryBackend` sends chunked `yf.download` requests,
+      paced by the shared rate limiter (through `safe_api_call`), and splits
+      the combined frame back into one frame per ticker. `InMemoryHistoryBackend` answers the same requests
+      from recorded series, offline (tests, benchmarks).
+Architecture: Provider Pattern; the universe refresh lives in `history_refresh`.
+
+Style: Numpy docstrings.
+"""
+
+from __future__ import annotations
+
+import logging
+from abc import ABC, abstractmethod
+from collections.abc import Mapping, Sequence
+from typing import Any
+
+import pandas as pd
+import yfinance as yf
+
+from infra.data_providers.config import ProviderConfig
+from infra.data_providers.extraction_utils import safe_api_call
+from infra.data_providers.http_session import get_http_session
+
+logger = logging.getLogger(__name__)
+
+
+class HistoryBackend(ABC):
+    """
+    Contract of a multi-ticker daily price source.
+    """
+
+    @abstractmethod
+    def download(self, tickers: Sequence[str], request: Mapping[str, Any]) -> dict[str, pd.DataFrame]:
+        """
+        Daily bars of several tickers sharing one request.
+
+        Parameters
+        ----------
+        tickers : Sequence[str]
+            The stock symbols.
+        request : Mapping[str, Any]
+            ``{"period": "10y"}`` or ``{"start": "YYYY-MM-DD"}`` (see `history_request`).
+
+        Returns
+        -------
+        dict[str, pd.DataFrame]
+            One non-empty frame per ticker that has bars; others are absent.
+        """
+        raise NotImplementedError
+
+
+class YahooHistoryBackend(HistoryBackend):
+    """
+    Chunked `yf.download` requests.
+
+    Each chunk goes through `safe_api_call`, so the shared token bucket paces
+    them like every other Yahoo call.
+
+    Attributes
+    ----------
+    chunk_size : int
+        Tickers per request.
+    """
+
+    def __init__(self, chunk_size: int = ProviderConfig.HISTORY_BULK_CHUNK_SIZE):
+        self.chunk_size = max(1, chunk_size)
+
+    def download(self, tickers: Sequence[str], request: Mapping[str, Any]) -> dict[str, pd.DataFrame]:
+        """Daily bars of `tickers`, one `yf.download` call per chunk."""
+        frames: dict[str, pd.DataFrame] = {}
+        for i in range(0, len(tickers), self.chunk_size):
+            chunk = list(tickers[i:i + self.chunk_size])
+            combined = safe_api_call(
+                lambda chunk=chunk: yf.download(chunk, group_by="ticker", actions=True, auto_adjust=True,
+                                                threads=False, progress=False, session=get_http_session(), **request),
+                f"BulkHist:{chunk[0]}+{len(chunk) - 1}",
+            )
+            frames.update(split_download(combined, chunk))
+        return frames
+
+
+class InMemoryHistoryBackend(HistoryBackend):
+    """
+    Offline backend serving recorded series.
+
+    Attributes
+    ----------
+    series : dict[str, pd.DataFrame]
+        Full daily series per ticker.
+    calls : list[tuple[tuple[str, ...], dict[str, Any]]]
+        Every request received, in order.
+    """
+
+    def __init__(self, series: Mapping[str, pd.DataFrame]):
+        self.series = dict(series)
+        self.calls: list[tuple[tuple[str, ...], dict[str, Any]]] = []
+
+    def download(self, tickers: Sequence[str], request: Mapping[str, Any]) -> dict[str, pd.DataFrame]:
+        """Recorded bars of `tickers` from `request['start']` (inclusive), or all of them."""
+        self.calls.append((tuple(tickers), dict(request)))
+        frames = {}
+        for ticker in tickers:
+            frame = self.series.get(ticker)
+            if frame is None or frame.empty:
+                continue
+            if "start" in request:
+                start = pd.Timestamp(request["start"])
+                dates = frame.index.tz_localize(None) if frame.index.tz is not None else frame.index
+                frame = frame[dates.normalize() >= start]
+            if not frame.empty:
+                frames[ticker] = frame
+        return frames
+
+
+def split_download(combined: pd.DataFrame | None, tickers: Sequence[str]) -> dict[str, pd.DataFrame]:
+    """
+    Splits a ``group_by="ticker"`` download into one frame per ticker.
+
+    Dates on which a ticker has no bar (other listings, holidays) are dropped.
+
+    Parameters
+    ----------
+    combined : pd.DataFrame, optional
+        The `yf.download` result (columns: ticker, field).
+    tickers : Sequence[str]
+        Requested symbols.
+
+    Returns
+    -------
+    dict[str, pd.DataFrame]
+        Non-empty frames only.
+    """
+    if combined is None or combined.empty:
+        return {}
+    if not isinstance(combined.columns, pd.MultiIndex):
+        # Single-level columns: a single ticker was requested
+        combined = pd.concat({tickers[0]: combined}, axis=1)
+
+    present = set(combined.columns.get_level_values(0))
+    frames = {}
+    for ticker in tickers:
+        if ticker not in present:
+            continue
+        frame = combined[ticker].dropna(how="all")
+        if not frame.empty:
+            frames[ticker] = frame.rename_axis(columns=None)
+    return frames
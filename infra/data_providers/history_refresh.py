@@ -0,0 +1,232 @@
+"""
+infra/data_providers/history_refresh.py
+
+INCREMENTAL PRICE HISTORY
+=========================
+Role: Turns a stored daily price series into the smallest Yahoo request that
+      brings it up to date, and merges the answer back into the series.
+Responsibility: A cold ticker downloads the full `ProviderConfig.HISTORY_PERIOD`;
+      a stored one asks only for bars from its second-to-last stored date
+      onwards. The merge is append-only: stored bars are kept as they are,
+      except the last one, which is re-downloaded because it may have been an
+      intraday bar. Yahoo bars are back-adjusted (auto_adjust), so after a
+      dividend or a split the whole series changes basis: the re-downloaded
+      settled bar and the corporate actions of the fresh bars detect it
+      (`is_readjusted`), and the series is then downloaded again in full.
+      `refresh_universe` does the same for many tickers through a bulk
+      `HistoryBackend`, grouping tickers that share a request.
+Standards: Honest Data (a failed refresh keeps the stored series). No business
+      logic allowed.
+
+Style: Numpy docstrings.
+"""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Callable, Sequence
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+import pandas as pd
+
+from infra.data_providers.config import ProviderConfig
+
+if TYPE_CHECKING:
+    from infra.data_providers.history_backend import HistoryBackend
+    from infra.data_providers.raw_store import RawDataStore
+
+logger = logging.getLogger(__name__)
+
+# Corporate-action columns of `history(actions=True)` / `yf.download(actions=True)`.
+ACTION_COLUMNS = ("Dividends", "Stock Splits")
+
+FULL_REQUEST = {"period": ProviderConfig.HISTORY_PERIOD}
+
+
+def history_request(stored: pd.DataFrame | None) -> dict[str, Any]:
+    """
+    Keyword arguments of `yf.Ticker.history` for a refresh of `stored`.
+
+    Parameters
+    ----------
+    stored : pd.DataFrame, optional
+        The stored daily series (DatetimeIndex, oldest first).
+
+    Returns
+    -------
+    dict[str, Any]
+        ``{"period": ...}`` for a cold fetch, ``{"start": "YYYY-MM-DD"}`` otherwise.
+        The start is the second-to-last stored bar: a settled close re-downloaded
+        for `is_readjusted`, then the last, possibly intraday, bar.
+    """
+    if stored is None or stored.empty or not isinstance(stored.index, pd.DatetimeIndex):
+        return dict(FULL_REQUEST)
+    dates = stored.index.sort_values()
+    return {"start": dates[max(len(dates) - 2, 0)].strftime("%Y-%m-%d")}
+
+
+def is_readjusted(stored: pd.DataFrame | None, fresh: pd.DataFrame | None) -> bool:
+    """
+    True when the fresh bars are not on the price basis of the stored series.
+
+    Parameters
+    ----------
+    stored : pd.DataFrame, optional
+        The stored daily series.
+    fresh : pd.DataFrame, optional
+        Bars returned by the refresh request.
+
+    Returns
+    -------
+    bool
+        A dividend or split in the fresh bars that the stored series does not
+        hold yet, or a settled overlapping Close (any stored bar but the last)
+        that moved by more than `ProviderConfig.HISTORY_ADJUSTMENT_RTOL`.
+    """
+    if stored is None or stored.empty or fresh is None or fresh.empty:
+        return False
+    fresh = _align_timezone(fresh, stored.index.tz)
+
+    for column in ACTION_COLUMNS:
+        if column not in fresh:
+            continue
+        events = fresh[column].fillna(0.0)
+        known = stored[column].reindex(events.index).fillna(0.0) if column in stored else 0.0
+        if ((events != 0.0) & (events != known)).any():
+            return True
+
+    if "Close" not in fresh or "Close" not in stored:
+        return False
+    settled = stored.index.sort_values()[:-1].intersection(fresh.index)
+    if settled.empty:
+        return False
+    return not np.allclose(fresh.loc[settled, "Close"], stored.loc[settled, "Close"],
+                           rtol=ProviderConfig.HISTORY_ADJUSTMENT_RTOL, atol=0.0, equal_nan=True)
+
+
+def refresh_history(
+        stored: pd.DataFrame | None,
+        download: Callable[[dict[str, Any]], pd.DataFrame | None],
+) -> pd.DataFrame:
+    """
+    Brings one stored series up to date.
+
+    Parameters
+    ----------
+    stored : pd.DataFrame, optional
+        The stored daily series.
+    download : Callable
+        Called with the keyword arguments of `yf.Ticker.history`; returns the
+        bars (None or empty on failure).
+
+    Returns
+    -------
+    pd.DataFrame
+        The merged series; the full re-download when the price basis changed
+        (the stored series if that download fails).
+    """
+    fresh = download(history_request(stored))
+    if not is_readjusted(stored, fresh):
+        return merge_history(stored, fresh)
+
+    logger.info("[History] Price basis changed (dividend, split or revised adjustment): full re-download.")
+    full = download(dict(FULL_REQUEST))
+    return full if full is not None and not full.empty else stored
+
+
+def merge_history(stored: pd.DataFrame | None, fresh: pd.DataFrame | None) -> pd.DataFrame:
+    """
+    Appends the freshly downloaded bars to the stored series.
+
+    Parameters
+    ----------
+    stored : pd.DataFrame, optional
+        The stored daily series.
+    fresh : pd.DataFrame, optional
+        Bars returned by the refresh request (None or empty on failure).
+
+    Returns
+    -------
+    pd.DataFrame
+        Stored bars strictly before the first fresh bar, followed by the fresh bars.
+    """
+    if fresh is None or fresh.empty:
+        return stored if stored is not None else pd.DataFrame()
+    if stored is None or stored.empty:
+        return fresh
+
+    fresh = _align_timezone(fresh, stored.index.tz)
+    kept = stored[stored.index < fresh.index.min()]
+    merged = pd.concat([kept, fresh])
+    return merged[~merged.index.duplicated(keep="last")].sort_index()
+
+
+def refresh_universe(
+        tickers: Sequence[str],
+        backend: HistoryBackend,
+        store: RawDataStore | None = None,
+) -> dict[str, pd.DataFrame]:
+    """
+    Brings the price history of many tickers up to date in bulk requests.
+
+    Tickers are grouped by request (cold tickers together, stored ones by last
+    date), so a daily refresh of a universe is a handful of backend calls.
+    Tickers whose price basis changed are downloaded again in full, together.
+
+    Parameters
+    ----------
+    tickers : Sequence[str]
+        The stock symbols.
+    backend : HistoryBackend
+        The multi-ticker price source.
+    store : RawDataStore, optional
+        Source of the stored series; merged series are written back to it.
+
+    Returns
+    -------
+    dict[str, pd.DataFrame]
+        Merged series per ticker (empty frame when nothing is known).
+    """
+    stored = {ticker: store.load_frame(ticker, "history", mmap=False) if store is not None else None
+              for ticker in tickers}
+
+    groups: dict[tuple[tuple[str, Any], ...], list[str]] = {}
+    for ticker in tickers:
+        groups.setdefault(tuple(history_request(stored[ticker]).items()), []).append(ticker)
+
+    fresh: dict[str, pd.DataFrame] = {}
+    for request, members in groups.items():
+        fresh.update(backend.download(members, dict(request)))
+
+    readjusted = [ticker for ticker in tickers if is_readjusted(stored[ticker], fresh.get(ticker))]
+    if readjusted:
+        logger.info(f"[History] Price basis changed for {len(readjusted)} ticker(s): full re-download.")
+        full = backend.download(readjusted, dict(FULL_REQUEST))
+        for ticker in readjusted:
+            # Without the full series, keep the stored one rather than mix price bases
+            fresh.pop(ticker, None)
+            if ticker in full:
+                stored[ticker], fresh[ticker] = None, full[ticker]
+
+    merged = {}
+    for ticker in tickers:
+        merged[ticker] = merge_history(stored[ticker], fresh.get(ticker))
+        if store is not None and ticker in fresh:
+            store.save_frame(ticker, "history", merged[ticker])
+    logger.info(f"[History] Refreshed {len(fresh)}/{len(tickers)} tickers in {len(groups)} request group(s).")
+    return merged
+
+
+def _align_timezone(fresh: pd.DataFrame, tz: Any) -> pd.DataFrame:
+    """
+    Fresh bars on the stored series' timezone.
+
+    Bulk downloads (`yf.download`) return exchange-local naive dates while
+    `Ticker.history` returns tz-aware ones; either may be stored first. A naive
+    stored series keeps naive dates: aware bars drop their timezone, keeping
+    their exchange-local calendar date.
+    """
+    if tz is None:
+        return fresh if fresh.index.tz is None else fresh.tz_localize(None)
+    return fresh.tz_localize(tz) if fresh.index.tz is None else fresh.tz_convert(tz)
@@ -0,0 +1,145 @@
+"""
+infra/data_providers/http_session.py
+
+SHARED HTTP SESSION — Keep-Alive Connection Pool
+================================================
+Role: One process-wide HTTP session and API worker pool shared by every
+      Yahoo call (`yf.Ticker`, `yf.download`, `safe_api_call`).
+Responsibility: Connections are opened once and kept alive across fetches;
+      the TLS handshake is paid per worker thread, not per request.
+
+The curl_cffi session used by yfinance keeps one connection cache per thread.
+Running API calls on a fixed pool of `ProviderConfig.HTTP_POOL_SIZE` long-lived
+workers (instead of a fresh thread per call) is what lets those connections be
+reused. Without curl_cffi, a `requests` session with a pooled adapter of the
+same size is used.
+
+Calls enter the pool through `submit_api_call`, which holds one of
+`HTTP_POOL_SIZE` slots from submission until the call returns. A submitted
+call therefore never queues behind busy workers, so a timeout on its future
+measures the call itself. A running thread cannot be cancelled: a call
+abandoned on timeout keeps its slot (and its worker) until it returns, and
+later callers wait for a free slot instead of piling up in the queue.
+
+Style: Numpy docstrings.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any
+
+from infra.data_providers.config import ProviderConfig
+
+logger = logging.getLogger(__name__)
+
+_lock = threading.Lock()
+_session: Any = None
+_executor: ThreadPoolExecutor | None = None
+_slots: threading.BoundedSemaphore | None = None
+
+
+def _new_session(pool_size: int) -> Any:
+    """Keep-alive session sized for `pool_size` concurrent connections."""
+    try:
+        from curl_cffi import CurlOpt
+        from curl_cffi import requests as curl_requests
+    except ImportError:
+        import requests
+        from requests.adapters import HTTPAdapter
+
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
+    return curl_requests.Session(impersonate="chrome", curl_options={CurlOpt.MAXCONNECTS: pool_size})
+
+
+def get_http_session() -> Any:
+    """
+    The shared HTTP session, created on first use.
+
+    Returns
+    -------
+    curl_cffi.requests.Session | requests.Session
+        Session to pass as ``session=`` to yfinance.
+    """
+    global _session
+    with _lock:
+        if _session is None:
+            _session = _new_session(ProviderConfig.HTTP_POOL_SIZE)
+            logger.debug(f"[HTTP] Shared session opened ({type(_session).__module__}, "
+                         f"pool={ProviderConfig.HTTP_POOL_SIZE}).")
+        return _session
+
+
+def get_api_executor() -> ThreadPoolExecutor:
+    """
+    The shared pool of API worker threads, created on first use.
+
+    Returns
+    -------
+    ThreadPoolExecutor
+        `ProviderConfig.HTTP_POOL_SIZE` long-lived workers.
+    """
+    return _pool()[0]
+
+
+def submit_api_call(func: Callable[[], Any], wait: float) -> Future | None:
+    """
+    Runs `func` on the shared pool as soon as a worker is free.
+
+    Parameters
+    ----------
+    func : Callable
+        The API call.
+    wait : float
+        Maximum seconds to wait for a free slot.
+
+    Returns
+    -------
+    Future | None
+        The running call, or None when every worker stayed busy for `wait`
+        seconds. The slot is given back when `func` returns, not when the
+        caller stops waiting.
+    """
+    executor, slots = _pool()
+    if not slots.acquire(timeout=wait):
+        return None
+
+    def run() -> Any:
+        try:
+            return func()
+        finally:
+            slots.release()
+
+    try:
+        return executor.submit(run)
+    except RuntimeError:  # pool closed in between
+        slots.release()
+        raise
+
+
+def close_http_session() -> None:
+    """Closes the shared session and worker pool; the next call reopens them."""
+    global _session, _executor, _slots
+    with _lock:
+        if _session is not None:
+            _session.close()
+        if _executor is not None:
+            _executor.shutdown(wait=False)
+        _session, _executor, _slots = None, None, None
+
+
+def _pool() -> tuple[ThreadPoolExecutor, threading.BoundedSemaphore]:
+    """The worker pool and its slots, created together on first use."""
+    global _executor, _slots
+    with _lock:
+        if _executor is None or _slots is None:
+            _executor = ThreadPoolExecutor(max_workers=ProviderConfig.HTTP_POOL_SIZE, thread_name_prefix="api")
+            _slots = threading.BoundedSemaphore(ProviderConfig.HTTP_POOL_SIZE)
+        return _executor, _slots
@@ -0,0 +1,182 @@
+"""
+infra/data_providers/prewarm.py
+
+WATCHLIST PRE-WARM — Scheduled Snapshot Building
+================================================
+Role: Builds the `CompanySnapshot` of every watchlist ticker ahead of market
+      open and stores it in the persistent snapshot cache, so the first
+      valuation of the day is served warm instead of paying a cold fetch in
+      the Streamlit click handler.
+Responsibility: Bounded concurrency (`ProviderConfig.PREWARM_MAX_WORKERS`),
+      skipping of still-fresh entries, progress reporting and a summary whose
+      exit code suits cron. Request pacing is left to the shared rate limiter.
+
+Usage
+-----
+python -m infra.data_providers.prewarm AAPL MSFT OR.PA
+python -m infra.data_providers.prewarm --watchlist watchlist.txt --workers 8
+
+Cron (06:30 on weekdays, before the US open):
+30 6 * * 1-5  cd /srv/pricer && python -m infra.data_providers.prewarm -w watchlist.txt
+
+Style: Numpy docstrings.
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import sys
+import time
+from collections.abc import Callable, Iterable, Sequence
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from infra.data_providers.config import ProviderConfig
+from infra.data_providers.yahoo_financial_provider import YahooFinancialProvider, get_yahoo_provider
+
+logger = logging.getLogger(__name__)
+
+# Progress callback: (completed, total, ticker, status) with status in PrewarmReport's categories.
+ProgressCallback = Callable[[int, int, str, str], None]
+
+
+@dataclass
+class PrewarmReport:
+    """Outcome of a pre-warm run."""
+    warmed: list[str] = field(default_factory=list)
+    skipped: list[str] = field(default_factory=list)
+    failed: list[str] = field(default_factory=list)
+    elapsed_seconds: float = 0.0
+
+    @property
+    def total(self) -> int:
+        return len(self.warmed) + len(self.skipped) + len(self.failed)
+
+
+def read_watchlist(path: str | Path) -> list[str]:
+    """
+    Tickers of a watchlist file: one per line, '#' starts a comment.
+
+    Returns
+    -------
+    list[str]
+        Upper-cased tickers, duplicates removed, file order kept.
+    """
+    tickers = []
+    for line in Path(path).read_text(encoding="utf-8").splitlines():
+        ticker = line.split("#", 1)[0].strip().upper()
+        if ticker:
+            tickers.append(ticker)
+    return list(dict.fromkeys(tickers))
+
+
+def prewarm_watchlist(
+        tickers: Iterable[str],
+        provider: YahooFinancialProvider | None = None,
+        max_workers: int = ProviderConfig.PREWARM_MAX_WORKERS,
+        force: bool = False,
+        progress: ProgressCallback | None = None,
+) -> PrewarmReport:
+    """
+    Builds and caches the snapshots of a watchlist.
+
+    Parameters
+    ----------
+    tickers : Iterable[str]
+        The watchlist.
+    provider : YahooFinancialProvider, optional
+        Provider with a snapshot cache; defaults to the process-wide one.
+    max_workers : int
+        Tickers built concurrently.
+    force : bool, default False
+        Rebuild entries that are still fresh.
+    progress : ProgressCallback, optional
+        Called after each ticker with (completed, total, ticker, status).
+
+    Returns
+    -------
+    PrewarmReport
+        Warmed, skipped (still fresh) and failed tickers.
+    """
+    provider = provider or get_yahoo_provider()
+    cache = provider.snapshot_cache
+    if cache is None:
+        raise ValueError("Pre-warming requires a provider with a snapshot cache.")
+
+    tickers = list(dict.fromkeys(ticker.upper() for ticker in tickers))
+    report = PrewarmReport()
+    start = time.perf_counter()
+    done = 0
+
+    def _notify(ticker: str, status: str) -> None:
+        nonlocal done
+        done += 1
+        getattr(report, status).append(ticker)
+        if progress is not None:
+            progress(done, len(tickers), ticker, status)
+
+    pending = []
+    for ticker in tickers:
+        if not force and cache.is_fresh(ticker):
+            _notify(ticker, "skipped")
+        else:
+            pending.append(ticker)
+
+    with ThreadPoolExecutor(max_workers=max(1, max_workers), thread_name_prefix="prewarm") as executor:
+        futures = {executor.submit(provider.refresh_snapshot, ticker): ticker for ticker in pending}
+        for future in as_completed(futures):
+            ticker = futures[future]
+            try:
+                snapshot = future.result()
+            except Exception as e:
+                logger.error(f"[Prewarm] {ticker} failed: {e}")
+                snapshot = None
+            _notify(ticker, "warmed" if snapshot is not None else "failed")
+
+    report.elapsed_seconds = time.perf_counter() - start
+    logger.info(f"[Prewarm] {len(report.warmed)} warmed, {len(report.skipped)} fresh, "
+                f"{len(report.failed)} failed in {report.elapsed_seconds:.1f}s.")
+    return report
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """
+    Command-line entry point.
+
+    Returns
+    -------
+    int
+        0 when every ticker is warm, 1 if some failed, 2 on usage errors.
+    """
+    parser = argparse.ArgumentParser(prog="python -m infra.data_providers.prewarm",
+                                     description="Pre-fetch and cache the snapshots of a watchlist.")
+    parser.add_argument("tickers", nargs="*", help="Tickers to warm (added to the watchlist file).")
+    parser.add_argument("-w", "--watchlist", help="File with one ticker per line ('#' for comments).")
+    parser.add_argument("--workers", type=int, default=ProviderConfig.PREWARM_MAX_WORKERS,
+                        help="Tickers fetched concurrently (default: %(default)s).")
+    parser.add_argument("--force", action="store_true", help="Rebuild snapshots that are still fresh.")
+    args = parser.parse_args(argv)
+
+    tickers = read_watchlist(args.watchlist) if args.watchlist else []
+    tickers += [ticker.upper() for ticker in args.tickers]
+    if not tickers:
+        parser.print_usage(sys.stderr)
+        print("error: no tickers (give tickers or --watchlist)", file=sys.stderr)
+        return 2
+
+    def _print(done: int, total: int, ticker: str, status: str) -> None:
+        print(f"[{done}/{total}] {ticker}: {status}", flush=True)
+
+    report = prewarm_watchlist(tickers, max_workers=args.workers, force=args.force, progress=_print)
+    print(f"{len(report.warmed)} warmed, {len(report.skipped)} fresh, {len(report.failed)} failed "
+          f"in {report.elapsed_seconds:.1f}s")
+    if report.failed:
+        print(f"failed: {' '.join(report.failed)}", file=sys.stderr)
+    return 1 if report.failed else 0
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.WARNING)
+    sys.exit(main())
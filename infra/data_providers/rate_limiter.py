@@ -0,0 +1,207 @@
+"""
+infra/data_providers/rate_limiter.py
+
+TOKEN-BUCKET RATE LIMITER — Proactive Yahoo Throttling
+======================================================
+Role: Keeps the request rate to Yahoo below the throttling threshold before
+      failures happen, instead of relying on `safe_api_call` retries.
+Responsibility: A token bucket (`rate` tokens per second, at most `capacity`
+      banked) whose state lives in a small file locked with `fcntl.flock`, so
+      every thread and every process on the machine draws from one budget.
+      Without `fcntl` (Windows) or a state file, the bucket is shared by the
+      threads of the process only.
+
+A caller short of tokens reserves them (the balance goes negative) and sleeps
+outside the lock until they are due: concurrent callers queue up at exactly
+`rate` requests per second instead of polling.
+
+Style: Numpy docstrings.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import struct
+import threading
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+from infra.data_providers.config import ProviderConfig
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+# State record: (tokens, last refill epoch seconds), two float64.
+_STATE = struct.Struct("<dd")
+
+
+class TokenBucketRateLimiter:
+    """
+    Token bucket shared across threads and, through its state file, processes.
+
+    Attributes
+    ----------
+    rate : float
+        Tokens added per second (sustained requests per second).
+    capacity : float
+        Maximum banked tokens (burst size).
+    state_path : Path | None
+        File holding the shared bucket state; None keeps it in memory.
+    """
+
+    def __init__(
+            self,
+            rate: float,
+            capacity: float,
+            state_path: str | Path | None = None,
+            clock: Callable[[], float] = time.time,
+            sleep: Callable[[float], None] = time.sleep,
+    ):
+        if rate <= 0 or capacity < 1:
+            raise ValueError(f"rate must be > 0 and capacity >= 1, got rate={rate}, capacity={capacity}.")
+        self.rate = rate
+        self.capacity = capacity
+        self.state_path = Path(state_path) if state_path is not None and fcntl is not None else None
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self._state = (capacity, clock())
+        if self.state_path is not None:
+            self.state_path.parent.mkdir(parents=True, exist_ok=True)
+
+    def acquire(self, tokens: float = 1.0) -> float:
+        """
+        Takes `tokens`, sleeping until they are available.
+
+        Parameters
+        ----------
+        tokens : float, default 1.0
+            Cost of the request.
+
+        Returns
+        -------
+        float
+            Seconds waited.
+        """
+        wait = self._reserve(tokens, allow_debt=True)
+        if wait > 0:
+            self._sleep(wait)
+        return wait
+
+    def try_acquire(self, tokens: float = 1.0) -> bool:
+        """Takes `tokens` if they are available right now; never waits."""
+        return self._reserve(tokens, allow_debt=False) == 0.0
+
+    def available(self) -> float:
+        """Tokens currently banked (negative while callers are queued)."""
+        with self._locked() as state:
+            return self._refill(*state.read())[0]
+
+    # =========================================================================
+    # INTERNALS
+    # =========================================================================
+
+    def _refill(self, tokens: float, last: float) -> tuple[float, float]:
+        now = self._clock()
+        return min(self.capacity, tokens + max(0.0, now - last) * self.rate), now
+
+    def _reserve(self, tokens: float, allow_debt: bool) -> float:
+        """Debits the bucket; returns the wait until the debit is covered (inf if refused)."""
+        with self._locked() as state:
+            balance, now = self._refill(*state.read())
+            if balance >= tokens:
+                state.write(balance - tokens, now)
+                return 0.0
+            if not allow_debt:
+                state.write(balance, now)
+                return float("inf")
+            state.write(balance - tokens, now)
+            return (tokens - balance) / self.rate
+
+    def _locked(self) -> _LockedState:
+        return _LockedState(self)
+
+
+class _LockedState:
+    """Context manager holding the thread lock and, if any, the file lock on the state."""
+
+    def __init__(self, limiter: TokenBucketRateLimiter):
+        self._limiter = limiter
+        self._fd: int | None = None
+
+    def __enter__(self) -> _LockedState:
+        self._limiter._lock.acquire()
+        path = self._limiter.state_path
+        if path is not None:
+            try:
+                self._fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o644)
+                fcntl.flock(self._fd, fcntl.LOCK_EX)
+            except OSError as e:
+                logger.warning(f"[RateLimiter] State file unavailable, limiting this process only: {e}")
+                self._close()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self._close()
+        self._limiter._lock.release()
+
+    def _close(self) -> None:
+        if self._fd is not None:
+            os.close(self._fd)  # also releases the flock
+            self._fd = None
+
+    def read(self) -> tuple[float, float]:
+        if self._fd is not None:
+            raw = os.pread(self._fd, _STATE.size, 0)
+            if len(raw) == _STATE.size:
+                return _STATE.unpack(raw)
+            return self._limiter.capacity, self._limiter._clock()
+        return self._limiter._state
+
+    def write(self, tokens: float, last: float) -> None:
+        if self._fd is not None:
+            os.pwrite(self._fd, _STATE.pack(tokens, last), 0)
+        else:
+            self._limiter._state = (tokens, last)
+
+
+# ==============================================================================
+# SHARED INSTANCE
+# ==============================================================================
+
+_UNSET = object()
+_shared: TokenBucketRateLimiter | None | object = _UNSET
+_shared_lock = threading.Lock()
+
+
+def get_rate_limiter() -> TokenBucketRateLimiter | None:
+    """
+    The limiter in front of every Yahoo call, created on first use from `ProviderConfig`.
+
+    Returns
+    -------
+    TokenBucketRateLimiter | None
+        None when rate limiting was disabled with `set_rate_limiter(None)`.
+    """
+    global _shared
+    with _shared_lock:
+        if _shared is _UNSET:
+            _shared = TokenBucketRateLimiter(
+                rate=ProviderConfig.RATE_LIMIT_PER_SECOND,
+                capacity=ProviderConfig.RATE_LIMIT_BURST,
+                state_path=ProviderConfig.RATE_LIMIT_STATE_FILE,
+            )
+        return _shared
+
+
+def set_rate_limiter(limiter: TokenBucketRateLimiter | None) -> None:
+    """Replaces the shared limiter; None disables rate limiting."""
+    global _shared
+    with _shared_lock:
+        _shared = limiter
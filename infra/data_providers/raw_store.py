@@ -0,0 +1,266 @@
+"""
+infra/data_providers/raw_store.py
+
+RAW DATA STORE — Persistent Columnar Storage
+============================================
+Role: Keeps every RawFinancialData fetched from Yahoo (statements, 10-year
+      price history, info payload) on disk, one directory per ticker.
+Responsibility: Lossless round-trip of the raw bundle and memory-mapped reads,
+      so that backtests, re-mappings and offline benchmarks read disk instead
+      of refetching. No business logic allowed.
+
+Layout
+------
+<root>/<TICKER>/manifest.json      info payload, axes and dtypes of every frame
+<root>/<TICKER>/<frame>.npy        float64 values, column-major (one contiguous
+                                   block per column: reading 'Close' of the
+                                   history touches only that column's pages)
+<root>/<TICKER>/<frame>.index.npy  int64 nanoseconds of a datetime index
+
+NumPy ``.npy`` files are used rather than Parquet: they need no additional
+dependency and open with ``np.load(mmap_mode="r")``. A ticker is written to a
+temporary directory that then replaces the previous one, so readers never see
+a half-written bundle.
+
+Style: Numpy docstrings.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import shutil
+import time
+from dataclasses import fields
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+from infra.data_providers.config import ProviderConfig
+from infra.data_providers.yahoo_raw_fetcher import RawFinancialData
+
+logger = logging.getLogger(__name__)
+
+# Format version written to each manifest; bundles of another version are ignored.
+STORE_VERSION = 1
+
+# DataFrame fields of RawFinancialData, in declaration order.
+FRAME_FIELDS = tuple(f.name for f in fields(RawFinancialData) if f.name not in ("ticker", "info", "is_valid"))
+
+
+class RawDataStore:
+    """
+    Per-ticker columnar store for raw Yahoo payloads.
+
+    Attributes
+    ----------
+    root : Path
+        Directory holding one sub-directory per ticker.
+    """
+
+    def __init__(self, root: str | Path | None = None):
+        self.root = Path(root if root is not None else ProviderConfig.RAW_STORE_DIR)
+
+    # =========================================================================
+    # WRITE
+    # =========================================================================
+
+    def save(self, raw: RawFinancialData) -> Path:
+        """
+        Persists a raw bundle, replacing any previous version of the ticker.
+
+        Parameters
+        ----------
+        raw : RawFinancialData
+            The bundle to store (invalid bundles are stored as-is).
+
+        Returns
+        -------
+        Path
+            The ticker directory.
+        """
+        target = self._ticker_dir(raw.ticker)
+        staging = target.with_name(f".{target.name}.{os.getpid()}.tmp")
+        shutil.rmtree(staging, ignore_errors=True)
+        staging.mkdir(parents=True)
+
+        frames = {}
+        for name in FRAME_FIELDS:
+            frame = getattr(raw, name)
+            if frame is not None:
+                frames[name] = self._write_frame(staging, name, frame)
+
+        manifest = {
+            "version": STORE_VERSION,
+            "ticker": raw.ticker,
+            "saved_at": time.time(),
+            "is_valid": raw.is_valid,
+            "info": raw.info,
+            "frames": frames,
+        }
+        (staging / "manifest.json").write_text(json.dumps(manifest, default=str), encoding="utf-8")
+
+        previous = target.with_name(f".{target.name}.{os.getpid()}.old")
+        if target.exists():
+            target.rename(previous)
+        staging.rename(target)
+        shutil.rmtree(previous, ignore_errors=True)
+        return target
+
+    def save_frame(self, ticker: str, name: str, frame: pd.DataFrame) -> Path:
+        """
+        Replaces one frame of a stored bundle (e.g. a refreshed 'history').
+
+        A ticker absent from the store gets a bundle holding only this frame.
+
+        Returns
+        -------
+        Path
+            The ticker directory.
+        """
+        if name not in FRAME_FIELDS:
+            raise ValueError(f"Unknown frame '{name}', expected one of {FRAME_FIELDS}.")
+        raw = self.load(ticker, mmap=False) or RawFinancialData(ticker=ticker)
+        setattr(raw, name, frame)
+        return self.save(raw)
+
+    @staticmethod
+    def _write_frame(directory: Path, name: str, frame: pd.DataFrame) -> dict[str, Any]:
+        """Writes the values (column-major) and the datetime index of one frame."""
+        try:
+            values = frame.to_numpy(dtype=np.float64, na_value=np.nan)
+        except (TypeError, ValueError):
+            values = frame.apply(pd.to_numeric, errors="coerce").to_numpy(dtype=np.float64, na_value=np.nan)
+        np.save(directory / f"{name}.npy", np.asfortranarray(values))
+
+        entry: dict[str, Any] = {"columns": _encode_axis(frame.columns)}
+        if isinstance(frame.index, pd.DatetimeIndex):
+            np.save(directory / f"{name}.index.npy", frame.index.asi8)
+            entry["index"] = {"kind": "datetime", "tz": str(frame.index.tz) if frame.index.tz else None}
+        else:
+            entry["index"] = _encode_axis(frame.index)
+        return entry
+
+    # =========================================================================
+    # READ
+    # =========================================================================
+
+    def __contains__(self, ticker: str) -> bool:
+        return self._manifest(ticker) is not None
+
+    def tickers(self) -> list[str]:
+        """Tickers currently stored, sorted."""
+        if not self.root.exists():
+            return []
+        return sorted(path.name for path in self.root.iterdir()
+                      if not path.name.startswith(".") and (path / "manifest.json").exists())
+
+    def saved_at(self, ticker: str) -> float | None:
+        """Epoch seconds of the last save of a ticker, or None if absent."""
+        manifest = self._manifest(ticker)
+        return manifest["saved_at"] if manifest else None
+
+    def load(self, ticker: str, mmap: bool = True) -> RawFinancialData | None:
+        """
+        Rebuilds the stored RawFinancialData.
+
+        Parameters
+        ----------
+        ticker : str
+            The stock symbol.
+        mmap : bool, default True
+            Back the frames with read-only memory maps instead of reading the files.
+
+        Returns
+        -------
+        RawFinancialData | None
+            The bundle, or None if the ticker is not stored.
+        """
+        manifest = self._manifest(ticker)
+        if manifest is None:
+            return None
+        directory = self._ticker_dir(ticker)
+        frames = {name: self._read_frame(directory, name, entry, mmap) for name, entry in manifest["frames"].items()}
+        return RawFinancialData(ticker=manifest["ticker"], info=manifest["info"], is_valid=manifest["is_valid"],
+                                **{name: frame for name, frame in frames.items() if name in FRAME_FIELDS})
+
+    def load_frame(self, ticker: str, name: str, mmap: bool = True) -> pd.DataFrame | None:
+        """
+        Reads one frame (e.g. 'history') without touching the others.
+
+        Returns
+        -------
+        pd.DataFrame | None
+            The frame, or None if the ticker or the frame is not stored.
+        """
+        manifest = self._manifest(ticker)
+        if manifest is None or name not in manifest["frames"]:
+            return None
+        return self._read_frame(self._ticker_dir(ticker), name, manifest["frames"][name], mmap)
+
+    def load_column(self, ticker: str, name: str, column: str) -> np.ndarray | None:
+        """
+        Memory-mapped view of a single column (e.g. the 'Close' of 'history').
+
+        Returns
+        -------
+        np.ndarray | None
+            Read-only contiguous view, or None if absent.
+        """
+        manifest = self._manifest(ticker)
+        if manifest is None or name not in manifest["frames"]:
+            return None
+        columns = _decode_axis(manifest["frames"][name]["columns"])
+        if column not in columns:
+            return None
+        values = np.load(self._ticker_dir(ticker) / f"{name}.npy", mmap_mode="r")
+        return values[:, columns.get_loc(column)]
+
+    def delete(self, ticker: str) -> None:
+        """Removes a ticker from the store."""
+        shutil.rmtree(self._ticker_dir(ticker), ignore_errors=True)
+
+    # =========================================================================
+    # INTERNALS
+    # =========================================================================
+
+    def _ticker_dir(self, ticker: str) -> Path:
+        return self.root / ticker.upper().replace("/", "_")
+
+    def _manifest(self, ticker: str) -> dict[str, Any] | None:
+        path = self._ticker_dir(ticker) / "manifest.json"
+        try:
+            manifest = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        if manifest.get("version") != STORE_VERSION:
+            logger.debug(f"[RawStore] Ignoring {ticker}: store version {manifest.get('version')}.")
+            return None
+        return manifest
+
+    @staticmethod
+    def _read_frame(directory: Path, name: str, entry: dict[str, Any], mmap: bool) -> pd.DataFrame:
+        values = np.load(directory / f"{name}.npy", mmap_mode="r" if mmap else None)
+        if entry["index"].get("kind") == "datetime":
+            index: pd.Index = pd.DatetimeIndex(np.load(directory / f"{name}.index.npy").view("datetime64[ns]"))
+            if entry["index"]["tz"]:
+                index = index.tz_localize("UTC").tz_convert(entry["index"]["tz"])
+        else:
+            index = _decode_axis(entry["index"])
+        return pd.DataFrame(values, index=index, columns=_decode_axis(entry["columns"]), copy=False)
+
+
+def _encode_axis(axis: pd.Index) -> dict[str, Any]:
+    """JSON form of a statement axis (line items, or dates as ISO strings)."""
+    if isinstance(axis, pd.DatetimeIndex):
+        return {"kind": "dates", "labels": [ts.isoformat() for ts in axis]}
+    return {"kind": "labels", "labels": [str(label) for label in axis]}
+
+
+def _decode_axis(entry: dict[str, Any]) -> pd.Index:
+    if entry["kind"] == "dates":
+        return pd.DatetimeIndex(pd.to_datetime(entry["labels"]))
+    return pd.Index(entry["labels"], dtype=object)
@@ -0,0 +1,105 @@
+"""
+infra/data_providers/record_replay.py
+
+RECORD / REPLAY PROVIDER — Offline Deterministic Runs
+=====================================================
+Role: FinancialDataProvider that records every raw Yahoo payload to an
+      archive during live runs and replays it offline, without network.
+Responsibility: In 'record' mode, fetches through `YahooRawFetcher` with the
+      archive as write-through store. In 'replay' mode, reads the archived
+      `RawFinancialData` (memory-mapped `RawDataStore`) and never touches the
+      network; a ticker absent from the archive is a miss (None). Both modes
+      then run the same map -> sector fallback -> macro pipeline as
+      `YahooFinancialProvider`, so a replayed run values exactly what the
+      recorded one did.
+Architecture: Provider Pattern (drop-in for YahooFinancialProvider).
+
+Style: Numpy docstrings.
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import Literal
+
+import pandas as pd
+
+from infra.macro.base_macro_provider import MacroDataProvider
+from src.core.tracing import tracer
+from src.models.company import CompanySnapshot
+
+from .base_provider import FinancialDataProvider
+from .raw_store import RawDataStore
+from .yahoo_financial_provider import build_company_snapshot
+from .yahoo_raw_fetcher import RawFinancialData, YahooRawFetcher
+from .yahoo_snapshot_mapper import YahooSnapshotMapper
+
+logger = logging.getLogger(__name__)
+
+ProviderMode = Literal["record", "replay"]
+MODES = ("record", "replay")
+
+
+class ArchiveFetcher(YahooRawFetcher):
+    """
+    `YahooRawFetcher` served from a raw archive (no network).
+
+    Keeps the market-suffix fallback of the live fetcher, so a ticker
+    recorded under its resolved symbol ('OR' -> 'OR.PA') replays under the
+    symbol the user typed.
+    """
+
+    def __init__(self, archive: RawDataStore):
+        super().__init__()
+        self.archive = archive
+
+    def _execute_fetch(self, ticker: str, stored_history: pd.DataFrame | None = None) -> RawFinancialData:
+        """Archived payload of one symbol; an invalid bundle on archive miss."""
+        raw = self.archive.load(ticker)
+        if raw is None or not raw.is_valid:
+            logger.debug(f"[Replay] No archived payload for {ticker}.")
+            return RawFinancialData(ticker=ticker, is_valid=False)
+        return raw
+
+
+class RecordReplayProvider(FinancialDataProvider):
+    """
+    Records raw payloads during live runs; replays them offline.
+
+    Attributes
+    ----------
+    archive : RawDataStore
+        The indexed payload archive.
+    mode : str
+        'record' (live fetch, archived) or 'replay' (archive only).
+    """
+
+    def __init__(self, archive: RawDataStore, macro_provider: MacroDataProvider, mode: ProviderMode = "replay"):
+        if mode not in MODES:
+            raise ValueError(f"mode must be one of {MODES}, got '{mode}'.")
+        self.archive = archive
+        self.mode = mode
+        self.fetcher = YahooRawFetcher(store=archive) if mode == "record" else ArchiveFetcher(archive)
+        self.mapper = YahooSnapshotMapper()
+        self.macro_provider = macro_provider
+
+    def get_company_snapshot(self, ticker: str) -> CompanySnapshot | None:
+        """
+        Builds the snapshot from a live (recorded) or archived payload.
+
+        Parameters
+        ----------
+        ticker : str
+            The stock symbol.
+
+        Returns
+        -------
+        CompanySnapshot | None
+            The enriched snapshot, or None on fetch failure / archive miss.
+        """
+        with tracer.span("provider.get_company_snapshot", category="provider", ticker=ticker, mode=self.mode):
+            return build_company_snapshot(ticker, self.fetcher, self.mapper, self.macro_provider)
+
+    def recorded_tickers(self) -> list[str]:
+        """Symbols available for replay."""
+        return self.archive.tickers()
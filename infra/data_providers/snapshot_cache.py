@@ -0,0 +1,108 @@
+"""
+infra/data_providers/snapshot_cache.py
+
+SNAPSHOT CACHE — Persistent Mapped Snapshots
+============================================
+Role: Keeps fully built `CompanySnapshot`s (fetched, mapped, sector and macro
+      enriched) on disk, one JSON file per ticker, with a time-to-live.
+Responsibility: Lets the provider serve a valuation from a snapshot built
+      earlier, e.g. by the watchlist pre-warm job (`prewarm.py`), instead of
+      paying the cold fetch in the click handler. Entries are keyed by the
+      requested symbol (a suffix fallback may resolve ``MC`` to ``MC.PA``).
+      Writes are atomic (temporary file + rename). No business logic allowed.
+
+Style: Numpy docstrings.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import time
+from pathlib import Path
+
+from pydantic import ValidationError
+
+from infra.data_providers.config import ProviderConfig
+from src.models.company import CompanySnapshot
+
+logger = logging.getLogger(__name__)
+
+
+class SnapshotCache:
+    """
+    Per-ticker JSON cache of `CompanySnapshot`.
+
+    Attributes
+    ----------
+    root : Path
+        Directory holding one ``<TICKER>.json`` per snapshot.
+    ttl_seconds : float
+        Age after which a snapshot is no longer served.
+    """
+
+    def __init__(self, root: str | Path | None = None, ttl_seconds: float = ProviderConfig.SNAPSHOT_CACHE_TTL_SECONDS):
+        self.root = Path(root if root is not None else ProviderConfig.SNAPSHOT_CACHE_DIR)
+        self.ttl_seconds = ttl_seconds
+
+    def get(self, ticker: str) -> CompanySnapshot | None:
+        """
+        The cached snapshot if it is younger than the TTL.
+
+        Parameters
+        ----------
+        ticker : str
+            The stock symbol.
+
+        Returns
+        -------
+        CompanySnapshot | None
+            None when absent, expired or unreadable.
+        """
+        age = self.age(ticker)
+        if age is None or age > self.ttl_seconds:
+            return None
+        try:
+            return CompanySnapshot.model_validate_json(self._path(ticker).read_text(encoding="utf-8"))
+        except (OSError, ValidationError) as e:
+            logger.warning(f"[SnapshotCache] Unreadable entry for {ticker}: {e}")
+            return None
+
+    def put(self, snapshot: CompanySnapshot, ticker: str | None = None) -> Path:
+        """
+        Stores a snapshot, replacing the previous one.
+
+        Parameters
+        ----------
+        snapshot : CompanySnapshot
+            The snapshot to store.
+        ticker : str, optional
+            The requested symbol the entry is read back with; defaults to
+            ``snapshot.ticker``.
+
+        Returns
+        -------
+        Path
+            The snapshot file.
+        """
+        path = self._path(ticker or snapshot.ticker)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        staging = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+        staging.write_text(snapshot.model_dump_json(), encoding="utf-8")
+        os.replace(staging, path)
+        return path
+
+    def age(self, ticker: str) -> float | None:
+        """Seconds since the snapshot was stored, or None if absent."""
+        try:
+            return time.time() - self._path(ticker).stat().st_mtime
+        except OSError:
+            return None
+
+    def is_fresh(self, ticker: str) -> bool:
+        """True when a snapshot younger than the TTL is stored."""
+        age = self.age(ticker)
+        return age is not None and age <= self.ttl_seconds
+
+    def _path(self, ticker: str) -> Path:
+        return self.root / f"{ticker.upper().replace('/', '_')}.json"
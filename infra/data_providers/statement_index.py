@@ -0,0 +1,163 @@
+"""
+infra/data_providers/statement_index.py
+
+STATEMENT INDEX — Compiled Line-Item Lookups
+============================================
+Role: One-pass conversion of a Yahoo statement DataFrame into a compact
+      indexed structure: line item -> row of a date-sorted float matrix.
+Responsibility: Column sorting, numeric coercion, alias resolution and the
+      per-row "most recent value" / trailing-sum reductions are done once at
+      compile time; mapping lookups are then dictionary hits.
+Standards: Honest Data (Strict None propagation). No business logic allowed.
+
+Style: Numpy docstrings.
+"""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Sequence
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# Number of quarters summed into a trailing-twelve-month value.
+TTM_QUARTERS = 4
+
+
+class StatementIndex:
+    """
+    Date-sorted, float-coerced view of one financial statement.
+
+    Attributes
+    ----------
+    columns : tuple
+        Statement dates, most recent first (original order if unsortable).
+    values : np.ndarray
+        Float matrix [line items, dates]; non-numeric cells are NaN.
+    """
+
+    __slots__ = ("columns", "values", "_rows", "_latest", "_ttm", "_resolved")
+
+    def __init__(self, columns: tuple, values: np.ndarray, line_items: Sequence[str]):
+        self.columns = columns
+        self.values = values
+        self._rows: dict[str, int] = {}
+        for i, item in enumerate(line_items):
+            self._rows.setdefault(item, i)  # duplicated labels: the first row wins
+        self._resolved: dict[tuple[str, ...], tuple[int, ...]] = {}
+
+        # Per-row reductions, computed once for every line item
+        self._latest = np.full(values.shape[0], np.nan)
+        self._ttm = np.full(values.shape[0], np.nan)
+        if values.shape[1] > 0:
+            present = ~np.isnan(values)
+            first = present.argmax(axis=1)
+            self._latest = np.where(present.any(axis=1), values[np.arange(values.shape[0]), first], np.nan)
+        if values.shape[1] >= TTM_QUARTERS:
+            window = values[:, :TTM_QUARTERS]
+            self._ttm = np.where(present[:, :TTM_QUARTERS].all(axis=1), window.sum(axis=1), np.nan)
+
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame | None) -> StatementIndex:
+        """
+        Compiles a statement DataFrame (line items as index, dates as columns).
+
+        Parameters
+        ----------
+        df : pd.DataFrame, optional
+            The financial statement; None or empty gives an empty index.
+
+        Returns
+        -------
+        StatementIndex
+            The compiled statement.
+        """
+        if df is None or df.empty:
+            return cls((), np.empty((0, 0)), ())
+
+        try:
+            # Most recent period first (TTM or the latest fiscal year)
+            df = df.sort_index(axis=1, ascending=False)
+        except (AttributeError, TypeError, ValueError) as e:
+            logger.debug(f"Index sorting skipped: {e}")
+
+        try:
+            values = df.to_numpy(dtype=np.float64, na_value=np.nan)
+        except (TypeError, ValueError):
+            values = df.apply(pd.to_numeric, errors="coerce").to_numpy(dtype=np.float64, na_value=np.nan)
+        return cls(tuple(df.columns), values, [str(item) for item in df.index])
+
+    def __contains__(self, line_item: str) -> bool:
+        return line_item in self._rows
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def resolve(self, keys: Sequence[str]) -> tuple[int, ...]:
+        """
+        Rows of the aliases present in the statement, in priority order (memoized).
+
+        Parameters
+        ----------
+        keys : Sequence[str]
+            Potential aliases of one line item (e.g. `OCF_KEYS`).
+
+        Returns
+        -------
+        tuple[int, ...]
+            Row indices; empty when no alias is present.
+        """
+        key = tuple(keys)
+        rows = self._resolved.get(key)
+        if rows is None:
+            rows = tuple(self._rows[alias] for alias in key if alias in self._rows)
+            self._resolved[key] = rows
+        return rows
+
+    def row(self, keys: Sequence[str]) -> np.ndarray | None:
+        """Date-sorted values of the first alias present, or None."""
+        rows = self.resolve(keys)
+        return self.values[rows[0]] if rows else None
+
+    def latest(self, keys: Sequence[str]) -> float | None:
+        """
+        Most recent non-null value of the first alias that has one.
+
+        Parameters
+        ----------
+        keys : Sequence[str]
+            Potential aliases of one line item.
+
+        Returns
+        -------
+        float | None
+            The value, or None.
+        """
+        for row in self.resolve(keys):
+            value = self._latest[row]
+            if not np.isnan(value):
+                return float(value)
+        return None
+
+    def ttm(self, keys: Sequence[str]) -> float | None:
+        """
+        Sum of the four most recent quarters of the first alias that has them all.
+
+        Parameters
+        ----------
+        keys : Sequence[str]
+            Potential aliases of one line item (quarterly statement).
+
+        Returns
+        -------
+        float | None
+            The trailing-twelve-month value, or None.
+        """
+        for row in self.resolve(keys):
+            value = self._ttm[row]
+            if not np.isnan(value):
+                return float(value)
+        return None
@@ -11,41 +11,61 @@ Standards: SOLID, Clean Code, No IDE warnings.
 from __future__ import annotations
 
 import logging
+from functools import lru_cache
 
 import streamlit as st
 
 from infra.macro.base_macro_provider import MacroDataProvider
+from infra.macro.default_macro_provider import DefaultMacroProvider
 from infra.ref_data.sector_fallback import get_sector_data
+from src.core.tracing import tracer
 from src.models.company import CompanySnapshot
 
 from .base_provider import FinancialDataProvider
+from .config import ProviderConfig
+from .raw_store import RawDataStore
+from .snapshot_cache import SnapshotCache
 from .yahoo_raw_fetcher import YahooRawFetcher
 from .yahoo_snapshot_mapper import YahooSnapshotMapper
 
 logger = logging.getLogger(__name__)
 
 
-@st.cache_data(ttl=3600, show_spinner=False)
-def _get_cached_snapshot(
+def build_company_snapshot(
     ticker: str,
-    _fetcher: YahooRawFetcher,
-    _mapper: YahooSnapshotMapper,
-    _macro_provider: MacroDataProvider
+    fetcher: YahooRawFetcher,
+    mapper: YahooSnapshotMapper,
+    macro_provider: MacroDataProvider
 ) -> CompanySnapshot | None:
     """
-    Module-level private function to handle Streamlit caching.
-
-    Arguments prefixed with '_' are ignored by Streamlit's hash engine,
-    preventing errors with non-hashable objects like API fetchers.
+    Runs the full acquisition pipeline of one ticker, without any cache.
+
+    Parameters
+    ----------
+    ticker : str
+        The stock symbol.
+    fetcher : YahooRawFetcher
+        Raw data acquisition.
+    mapper : YahooSnapshotMapper
+        Raw data to snapshot mapping.
+    macro_provider : MacroDataProvider
+        Macro hydration.
+
+    Returns
+    -------
+    CompanySnapshot | None
+        The enriched snapshot, or None if the fetch or the pipeline fails.
     """
     try:
         # 1. API Fetching
-        raw_data = _fetcher.fetch_ttm_snapshot(ticker)
+        with tracer.span("provider.fetch", category="provider", ticker=ticker):
+            raw_data = fetcher.fetch_ttm_snapshot(ticker)
         if not raw_data or not raw_data.is_valid:
             return None
 
         # 2. Technical Mapping
-        snapshot = _mapper.map_to_snapshot(raw_data)
+        with tracer.span("provider.map", category="provider", ticker=ticker):
+            snapshot = mapper.map_to_snapshot(raw_data)
 
         # 3. Sector Fallback Enrichment (Knowledge Base)
         # Note: s_data is now a strongly typed SectorBenchmarks object (not a dict)
@@ -56,30 +76,128 @@ def _get_cached_snapshot(
         snapshot.sector_ev_rev_fallback = s_data.ev_revenue
 
         # 4. Macro Hydration
-        return _macro_provider.hydrate_macro_data(snapshot)
+        with tracer.span("provider.macro", category="provider", ticker=ticker):
+            return macro_provider.hydrate_macro_data(snapshot)
 
     except Exception as e:
         logger.error(f"[YahooProvider] Internal pipeline failed for {ticker}: {e}")
         return None
 
 
+@st.cache_data(ttl=3600, show_spinner=False)
+def _get_cached_snapshot(
+    ticker: str,
+    _fetcher: YahooRawFetcher,
+    _mapper: YahooSnapshotMapper,
+    _macro_provider: MacroDataProvider,
+    _snapshot_cache: SnapshotCache | None = None
+) -> CompanySnapshot | None:
+    """
+    Module-level private function to handle Streamlit caching.
+
+    Arguments prefixed with '_' are ignored by Streamlit's hash engine,
+    preventing errors with non-hashable objects like API fetchers.
+    A fresh entry of the persistent snapshot cache (pre-warmed) is served
+    before any fetch. A snapshot built here is not written back: the cache
+    only holds what the pre-warm job built, so its TTL never serves a price
+    fetched by an earlier click.
+    """
+    if _snapshot_cache is not None:
+        cached = _snapshot_cache.get(ticker)
+        if cached is not None:
+            return cached
+
+    return build_company_snapshot(ticker, _fetcher, _mapper, _macro_provider)
+
+
+def _store_snapshot(cache: SnapshotCache, ticker: str, snapshot: CompanySnapshot) -> None:
+    """Writes to the persistent cache; a storage failure never fails the valuation."""
+    try:
+        cache.put(snapshot, ticker=ticker)
+    except OSError as e:
+        logger.warning(f"[YahooProvider] Snapshot cache write failed for {ticker}: {e}")
+
+
 class YahooFinancialProvider(FinancialDataProvider):
     """
     Orchestrates the data acquisition pipeline.
     """
 
-    def __init__(self, macro_provider: MacroDataProvider):
-        self.fetcher = YahooRawFetcher()
+    def __init__(
+            self,
+            macro_provider: MacroDataProvider,
+            snapshot_cache: SnapshotCache | None = None,
+            raw_store: RawDataStore | None = None,
+    ):
+        """
+        Parameters
+        ----------
+        macro_provider : MacroDataProvider
+            Source of the macro enrichment.
+        snapshot_cache : SnapshotCache, optional
+            Persistent cache of built snapshots (see `prewarm`).
+        raw_store : RawDataStore, optional
+            Local raw-data store handed to the fetcher: fetches are written
+            through and the price history is refreshed incrementally.
+        """
+        self.fetcher = YahooRawFetcher(store=raw_store)
         self.mapper = YahooSnapshotMapper()
         self.macro_provider = macro_provider
+        self.snapshot_cache = snapshot_cache
 
     def get_company_snapshot(self, ticker: str) -> CompanySnapshot | None:
         """
         Public entry point. Delegates to a cached module function.
         """
-        return _get_cached_snapshot(
-            ticker,
-            self.fetcher,
-            self.mapper,
-            self.macro_provider
-        )
+        with tracer.span("provider.get_company_snapshot", category="provider", ticker=ticker):
+            return _get_cached_snapshot(
+                ticker,
+                self.fetcher,
+                self.mapper,
+                self.macro_provider,
+                self.snapshot_cache
+            )
+
+    def refresh_snapshot(self, ticker: str) -> CompanySnapshot | None:
+        """
+        Rebuilds a snapshot from the API, bypassing every cache, and stores it
+        in the persistent snapshot cache under `ticker` (used by the pre-warm job).
+
+        Parameters
+        ----------
+        ticker : str
+            The stock symbol.
+
+        Returns
+        -------
+        CompanySnapshot | None
+            The new snapshot, or None if the pipeline fails.
+        """
+        with tracer.span("provider.refresh_snapshot", category="provider", ticker=ticker):
+            snapshot = build_company_snapshot(ticker, self.fetcher, self.mapper, self.macro_provider)
+        if snapshot is not None and self.snapshot_cache is not None:
+            _store_snapshot(self.snapshot_cache, ticker, snapshot)
+        return snapshot
+
+
+@lru_cache(maxsize=1)
+def get_yahoo_provider() -> YahooFinancialProvider:
+    """
+    Process-wide provider instance (default macro provider, persistent
+    snapshot cache and, when `ProviderConfig.RAW_STORE_ENABLED`, the local
+    raw-data store, so the app and the pre-warm job only download the missing
+    history bars).
+
+    Reusing one instance keeps its fetcher, mapper and the shared HTTP
+    session (see `http_session`) warm across analyses.
+
+    Returns
+    -------
+    YahooFinancialProvider
+        The same instance on every call.
+    """
+    return YahooFinancialProvider(
+        macro_provider=DefaultMacroProvider(),
+        snapshot_cache=SnapshotCache(),
+        raw_store=RawDataStore() if ProviderConfig.RAW_STORE_ENABLED else None,
+    )
@@ -14,12 +14,17 @@ from __future__ import annotations
 
 import logging
 from dataclasses import dataclass, field
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import pandas as pd
 import yfinance as yf
 
 from .extraction_utils import safe_api_call  #
+from .history_refresh import refresh_history
+from .http_session import get_http_session
+
+if TYPE_CHECKING:
+    from .raw_store import RawDataStore
 
 logger = logging.getLogger(__name__)
 
@@ -51,6 +56,16 @@ class YahooRawFetcher:
     # DT-022: Common suffixes for European markets
     MARKET_SUFFIXES = [".PA", ".L", ".DE", ".AS", ".MI", ".MC", ".BR"]
 
+    def __init__(self, store: RawDataStore | None = None):
+        """
+        Parameters
+        ----------
+        store : RawDataStore, optional
+            When provided, every valid fetch is written through to the local store
+            and the stored price history is only refreshed with the missing bars.
+        """
+        self.store = store
+
     def fetch_ttm_snapshot(self, ticker: str) -> RawFinancialData:
         """
         Public entry point to fetch a complete raw dataset.
@@ -67,31 +82,51 @@ class YahooRawFetcher:
             The raw data container, marked as valid or invalid.
         """
         # 1. Attempt with the raw ticker provided
-        data = self._execute_fetch(ticker)
+        data = self._execute_fetch(ticker, self._stored_history(ticker))
         if data.is_valid:
-            return data
+            return self._persist(data)
 
         # 2. Resiliency: Retry with suffixes if no market suffix is present
         if "." not in ticker:
             for suffix in self.MARKET_SUFFIXES:
                 alt_ticker = f"{ticker.upper()}{suffix}"
                 logger.info(f"[Fetcher] Retrying with suffix fallback: {alt_ticker}")
-                data = self._execute_fetch(alt_ticker)
+                data = self._execute_fetch(alt_ticker, self._stored_history(alt_ticker))
                 if data.is_valid:
-                    return data
+                    return self._persist(data)
+
+        return data
 
+    def _stored_history(self, ticker: str) -> pd.DataFrame | None:
+        """Price history kept in the local store, read into memory (it is about to be merged)."""
+        if self.store is None:
+            return None
+        return self.store.load_frame(ticker, "history", mmap=False)
+
+    def _persist(self, data: RawFinancialData) -> RawFinancialData:
+        """Writes a valid fetch to the local store; a storage failure never fails the fetch."""
+        if self.store is not None:
+            try:
+                self.store.save(data)
+            except (OSError, TypeError, ValueError) as e:
+                logger.warning(f"[Fetcher] Raw store write failed for {data.ticker}: {e}")
         return data
 
     @staticmethod
-    def _execute_fetch(ticker: str) -> RawFinancialData:
+    def _execute_fetch(ticker: str, stored_history: pd.DataFrame | None = None) -> RawFinancialData:
         """
         Executes individual API calls wrapped in safety layers.
 
+        With a stored price history, only the bars from its last dates onwards
+        are downloaded and appended, unless a dividend or split re-based the
+        series (see `history_refresh`); otherwise the full
+        `ProviderConfig.HISTORY_PERIOD` is.
+
         Note: Marked as @staticmethod because it does not access instance state (self).
         This complies with 'King Code' standards and IDE linter rules.
         """
         try:
-            yf_ticker = yf.Ticker(ticker)
+            yf_ticker = yf.Ticker(ticker, session=get_http_session())
 
             # Use safe_api_call from extraction_utils to handle timeouts
             info = safe_api_call(lambda: yf_ticker.info, f"Info:{ticker}")
@@ -108,7 +143,10 @@ class YahooRawFetcher:
                 cash_flow=safe_api_call(lambda: yf_ticker.cash_flow, f"CF:{ticker}"),
                 quarterly_income_stmt=safe_api_call(lambda: yf_ticker.quarterly_income_stmt, f"QIS:{ticker}"),
                 quarterly_cash_flow=safe_api_call(lambda: yf_ticker.quarterly_cash_flow, f"QCF:{ticker}"),
-                history=safe_api_call(lambda: yf_ticker.history(period="10y"), f"Hist:{ticker}"),
+                history=refresh_history(
+                    stored_history,
+                    lambda request: safe_api_call(lambda: yf_ticker.history(**request), f"Hist:{ticker}"),
+                ),
                 is_valid=True
             )
 
@@ -21,9 +21,9 @@ from infra.data_providers.extraction_utils import (
     CAPEX_KEYS,
     DEBT_KEYS,
     OCF_KEYS,
-    extract_most_recent_value,
     normalize_currency_and_price,
 )
+from infra.data_providers.statement_index import StatementIndex
 from infra.data_providers.yahoo_raw_fetcher import RawFinancialData
 from src.models.company import CompanySnapshot
 
@@ -63,31 +63,36 @@ class YahooSnapshotMapper:
             current_price=current_price
         )
 
+        # Each statement is compiled once; every field below is then an index lookup
+        bs = StatementIndex.from_frame(raw.balance_sheet)
+        income = StatementIndex.from_frame(raw.income_stmt)
+        quarterly_income = StatementIndex.from_frame(raw.quarterly_income_stmt)
+        quarterly_cash_flow = StatementIndex.from_frame(raw.quarterly_cash_flow)
+
         # Extraction Micro (Pillar 2)
-        bs = raw.balance_sheet
-        snapshot.total_debt = extract_most_recent_value(bs, DEBT_KEYS)
-        snapshot.cash_and_equivalents = extract_most_recent_value(bs, ["Cash And Cash Equivalents"])
-        snapshot.minority_interests = extract_most_recent_value(bs, ["Minority Interest"])
-        snapshot.pension_provisions = extract_most_recent_value(bs, ["Long Term Provisions"])
+        snapshot.total_debt = bs.latest(DEBT_KEYS)
+        snapshot.cash_and_equivalents = bs.latest(["Cash And Cash Equivalents"])
+        snapshot.minority_interests = bs.latest(["Minority Interest"])
+        snapshot.pension_provisions = bs.latest(["Long Term Provisions"])
         snapshot.shares_outstanding = float(info.get("sharesOutstanding") or 1.0)
-        snapshot.interest_expense = extract_most_recent_value(raw.income_stmt, ["Interest Expense"]) # For Cost of Debt
+        snapshot.interest_expense = income.latest(["Interest Expense"]) # For Cost of Debt
 
         # TTM Reconstruction (Pillar 3)
         snapshot.revenue_ttm = (
-            self._sum_last_4_quarters(raw.quarterly_income_stmt, ["Total Revenue"])
+            self._sum_last_4_quarters(quarterly_income, ["Total Revenue"])
             or info.get("totalRevenue")
         )
         snapshot.ebit_ttm = (
-            self._sum_last_4_quarters(raw.quarterly_income_stmt, ["EBIT"])
+            self._sum_last_4_quarters(quarterly_income, ["EBIT"])
             or info.get("operatingCashflow")
         )
         snapshot.net_income_ttm = (
-            self._sum_last_4_quarters(raw.quarterly_income_stmt, ["Net Income"])
+            self._sum_last_4_quarters(quarterly_income, ["Net Income"])
             or info.get("netIncomeToCommon")
         )
 
-        ocf = self._sum_last_4_quarters(raw.quarterly_cash_flow, OCF_KEYS)
-        capex = self._sum_last_4_quarters(raw.quarterly_cash_flow, CAPEX_KEYS)
+        ocf = self._sum_last_4_quarters(quarterly_cash_flow, OCF_KEYS)
+        capex = self._sum_last_4_quarters(quarterly_cash_flow, CAPEX_KEYS)
         snapshot.fcf_ttm = (ocf + capex) if (ocf is not None and capex is not None) else info.get("freeCashflow")
 
         snapshot.eps_ttm = info.get("trailingEps")
@@ -102,14 +107,14 @@ class YahooSnapshotMapper:
     # =========================================================================
 
     @staticmethod
-    def _sum_last_4_quarters(df: pd.DataFrame | None, keys: list[str]) -> float | None:
+    def _sum_last_4_quarters(statement: StatementIndex | pd.DataFrame | None, keys: list[str]) -> float | None:
         """
         Aggregates the last 4 quarters for a given metric to build TTM values.
 
         Parameters
         ----------
-        df : pd.DataFrame, optional
-            The quarterly financial statement.
+        statement : StatementIndex or pd.DataFrame, optional
+            The quarterly financial statement, compiled or raw (compiled on the fly).
         keys : List[str]
             List of accounting keys to search for.
 
@@ -118,13 +123,6 @@ class YahooSnapshotMapper:
         float, optional
             The sum of the last 4 quarters or None.
         """
-        if df is None or df.empty:
-            return None
-
-        for key in keys:
-            if key in df.index:
-                # Yahoo delivers Newest-to-Oldest
-                last_4 = df.loc[key].iloc[:4]
-                if len(last_4) == 4 and not last_4.isnull().any():
-                    return float(last_4.sum())
-        return None
+        if not isinstance(statement, StatementIndex):
+            statement = StatementIndex.from_frame(statement)
+        return statement.ttm(keys)
@@ -36,12 +36,18 @@ from src.computation.flow_projector import (
     ProjectionOutput,
     SimpleFlowProjector,
 )
+from src.computation.quasi_random import inverse_normal_cdf, sobol_points
 from src.computation.statistics import (
+    CorrelatedShockSampler,
     MonteCarloEngine,
     StochasticOutput,
+    control_variate_weights,
     generate_independent_samples,
     generate_multivariate_samples,
+    iid_quantile_standard_error,
+    weighted_quantiles,
 )
+from src.computation.workspace import KernelWorkspace, get_workspace, use_workspace
 
 __all__ = [
     # Financial Mathematics (Atomic)
@@ -75,6 +81,19 @@ __all__ = [
     # Statistics & Monte Carlo (Vectorized)
     "MonteCarloEngine",
     "StochasticOutput",
+    "CorrelatedShockSampler",
     "generate_multivariate_samples",
-    "generate_independent_samples"
+    "generate_independent_samples",
+    "control_variate_weights",
+    "weighted_quantiles",
+    "iid_quantile_standard_error",
+
+    # Quasi-random sequences
+    "sobol_points",
+    "inverse_normal_cdf",
+
+    # Kernel scratch buffers
+    "KernelWorkspace",
+    "get_workspace",
+    "use_workspace",
 ]
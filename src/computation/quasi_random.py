@@ -0,0 +1,147 @@
+"""
+src/computation/quasi_random.py
+
+QUASI-RANDOM SEQUENCES
+======================
+Role: Low-discrepancy (Sobol) points and the inverse normal CDF used by the
+      variance-reduced Monte Carlo samplers.
+Architecture: Pure NumPy, no SciPy dependency.
+
+Sobol points use the Joe-Kuo (new-joe-kuo-6.21201) direction numbers and
+Gray-code construction, randomised with a digital shift (XOR with a random
+32-bit vector per dimension), which keeps the net structure and makes the
+estimator unbiased. The inverse CDF is Acklam's rational approximation
+(relative error < 1.2e-9).
+
+Style: Numpy docstrings.
+"""
+
+from __future__ import annotations
+
+from functools import cache
+
+import numpy as np
+
+SOBOL_BITS = 32
+
+# (s, a, m_1..m_s) for dimensions 2..8 (dimension 1 is van der Corput).
+_JOE_KUO: tuple[tuple[int, int, tuple[int, ...]], ...] = (
+    (1, 0, (1,)),
+    (2, 1, (1, 3)),
+    (3, 1, (1, 3, 1)),
+    (3, 2, (1, 1, 1)),
+    (4, 1, (1, 1, 3, 3)),
+    (4, 4, (1, 3, 5, 13)),
+    (5, 2, (1, 1, 5, 5, 17)),
+)
+SOBOL_MAX_DIM = len(_JOE_KUO) + 1
+
+
+@cache
+def _direction_numbers(dim: int) -> np.ndarray:
+    """(dim, SOBOL_BITS) direction numbers V[j, i] (as uint64 holding 32-bit words)."""
+    v = np.zeros((dim, SOBOL_BITS), dtype=np.uint64)
+    v[0] = [1 << (SOBOL_BITS - 1 - i) for i in range(SOBOL_BITS)]
+    for j in range(1, dim):
+        s, a, m = _JOE_KUO[j - 1]
+        row = [0] * SOBOL_BITS
+        for i in range(s):
+            row[i] = m[i] << (SOBOL_BITS - 1 - i)
+        for i in range(s, SOBOL_BITS):
+            value = row[i - s] ^ (row[i - s] >> s)
+            for k in range(1, s):
+                if (a >> (s - 1 - k)) & 1:
+                    value ^= row[i - k]
+            row[i] = value
+        v[j] = row
+    v.setflags(write=False)
+    return v
+
+
+def sobol_points(n: int, dim: int, rng: np.random.Generator | None = None) -> np.ndarray:
+    """
+    First `n` points of the `dim`-dimensional Sobol sequence in (0, 1).
+
+    Parameters
+    ----------
+    n : int
+        Number of points (powers of two keep the sequence balanced).
+    dim : int
+        Number of dimensions (1 to SOBOL_MAX_DIM).
+    rng : np.random.Generator, optional
+        When given, applies a random digital shift (randomised QMC).
+
+    Returns
+    -------
+    np.ndarray
+        (n, dim) array of points, each offset by half a grid cell so that
+        no coordinate is exactly 0 or 1.
+    """
+    if not 1 <= dim <= SOBOL_MAX_DIM:
+        raise ValueError(f"Sobol dimension must be within [1, {SOBOL_MAX_DIM}].")
+    if n <= 0:
+        raise ValueError("n must be strictly positive.")
+    if n > 2 ** SOBOL_BITS:
+        raise ValueError("n exceeds the Sobol sequence period.")
+
+    directions = _direction_numbers(dim)
+    index = np.arange(n, dtype=np.uint64)
+    gray = index ^ (index >> np.uint64(1))
+
+    points = np.zeros((n, dim), dtype=np.uint64)
+    for bit in range(int(n - 1).bit_length()):
+        selected = ((gray >> np.uint64(bit)) & np.uint64(1)).astype(bool)
+        points[selected] ^= directions[:, bit]
+
+    if rng is not None:
+        points ^= rng.integers(0, 2 ** SOBOL_BITS, size=dim, dtype=np.uint64)
+
+    return (points.astype(np.float64) + 0.5) / float(2 ** SOBOL_BITS)
+
+
+# Acklam's coefficients
+_A = (-3.969683028665376e+01, 2.209460984245205e+02, -2.759285104469687e+02,
+      1.383577518672690e+02, -3.066479806614716e+01, 2.506628277459239e+00)
+_B = (-5.447609879822406e+01, 1.615858368580409e+02, -1.556989798598866e+02,
+      6.680131188771972e+01, -1.328068155288572e+01)
+_C = (-7.784894002430293e-03, -3.223964580411365e-01, -2.400758277161838e+00,
+      -2.549732539343734e+00, 4.374664141464968e+00, 2.938163982698783e+00)
+_D = (7.784695709041462e-03, 3.224671290700398e-01, 2.445134137142996e+00,
+      3.754408661907416e+00)
+_P_LOW = 0.02425
+
+
+def inverse_normal_cdf(u: np.ndarray) -> np.ndarray:
+    """
+    Standard normal quantile function, vectorized.
+
+    Parameters
+    ----------
+    u : np.ndarray
+        Probabilities strictly within (0, 1).
+
+    Returns
+    -------
+    np.ndarray
+        z such that Phi(z) = u, same shape as `u`.
+    """
+    u = np.asarray(u, dtype=np.float64)
+    z = np.empty_like(u)
+
+    low = u < _P_LOW
+    high = u > 1.0 - _P_LOW
+    mid = ~(low | high)
+
+    q = u[mid] - 0.5
+    r = q * q
+    num = (((((_A[0] * r + _A[1]) * r + _A[2]) * r + _A[3]) * r + _A[4]) * r + _A[5]) * q
+    den = ((((_B[0] * r + _B[1]) * r + _B[2]) * r + _B[3]) * r + _B[4]) * r + 1.0
+    z[mid] = num / den
+
+    for mask, sign, p in ((low, 1.0, u[low]), (high, -1.0, 1.0 - u[high])):
+        q = np.sqrt(-2.0 * np.log(p))
+        num = ((((_C[0] * q + _C[1]) * q + _C[2]) * q + _C[3]) * q + _C[4]) * q + _C[5]
+        den = (((_D[0] * q + _D[1]) * q + _D[2]) * q + _D[3]) * q + 1.0
+        z[mask] = sign * num / den
+
+    return z
@@ -13,6 +13,7 @@ Style: Numpy docstrings.
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import lru_cache
 
 import numpy as np
 
@@ -241,6 +242,92 @@ class MonteCarloEngine:
 # CORRELATED SAMPLING GENERATION
 # ============================================================================
 
+@lru_cache(maxsize=64)
+def _cholesky_factor(flat: tuple[float, ...], dim: int) -> np.ndarray:
+    """
+    Lower Cholesky factor of a correlation matrix, cached per configuration.
+
+    Non positive-definite inputs (e.g. inconsistent user-supplied pairwise
+    correlations) are repaired by clipping the eigenvalues and rescaling to
+    a unit diagonal before factorising.
+    """
+    corr = np.array(flat, dtype=float).reshape(dim, dim)
+    try:
+        factor = np.linalg.cholesky(corr)
+    except np.linalg.LinAlgError:
+        eigenvalues, eigenvectors = np.linalg.eigh(corr)
+        repaired = (eigenvectors * np.maximum(eigenvalues, 1e-10)) @ eigenvectors.T
+        scale = np.sqrt(np.diag(repaired))
+        factor = np.linalg.cholesky(repaired / np.outer(scale, scale))
+    factor.setflags(write=False)
+    return factor
+
+
+class CorrelatedShockSampler:
+    """
+    Correlates blocks of standard normal draws with a cached Cholesky factor.
+
+    Parameters
+    ----------
+    correlation : array-like
+        Symmetric (k, k) correlation matrix with a unit diagonal.
+
+    Notes
+    -----
+    The factor is computed once per distinct matrix (process-wide LRU cache).
+    `correlate` transforms a (k, n) block in place, row by row from the last
+    driver to the first, so no (k, n) temporary is allocated. An identity
+    matrix is detected and left as a no-op.
+    """
+
+    def __init__(self, correlation) -> None:
+        corr = np.asarray(correlation, dtype=float)
+        if corr.ndim != 2 or corr.shape[0] != corr.shape[1]:
+            raise ValueError("The correlation matrix must be square.")
+        if not np.allclose(corr, corr.T):
+            raise ValueError("The correlation matrix must be symmetric.")
+        if not np.allclose(np.diag(corr), 1.0):
+            raise ValueError("The correlation matrix must have a unit diagonal.")
+        if np.any(np.abs(corr) > 1.0):
+            raise ValueError("Correlation coefficients must be within [-1, 1].")
+
+        self.dim = corr.shape[0]
+        self.is_identity = bool(np.array_equal(corr, np.eye(self.dim)))
+        self.factor = None if self.is_identity else _cholesky_factor(tuple(corr.ravel().tolist()), self.dim)
+
+    def correlate(self, block: np.ndarray) -> np.ndarray:
+        """
+        Applies the factor in place to independent standard normal rows.
+
+        Parameters
+        ----------
+        block : np.ndarray
+            (k, n) array of independent N(0, 1) draws, one row per driver.
+
+        Returns
+        -------
+        np.ndarray
+            The same array, now holding correlated N(0, 1) rows.
+        """
+        if block.shape[0] != self.dim:
+            raise ValueError(f"Expected {self.dim} driver rows, got {block.shape[0]}.")
+        if self.is_identity:
+            return block
+        factor = self.factor
+        # Row i only depends on original rows 0..i, which are still untouched.
+        for i in range(self.dim - 1, -1, -1):
+            block[i] *= factor[i, i]
+            for j in range(i):
+                if factor[i, j] != 0.0:
+                    block[i] += factor[i, j] * block[j]
+        return block
+
+    def standard_normals(self, rng: np.random.Generator, n: int, dtype=np.float64) -> np.ndarray:
+        """Draws a (k, n) block of correlated N(0, 1) shocks."""
+        block = rng.standard_normal((self.dim, n), dtype=dtype)
+        return self.correlate(block)
+
+
 def generate_multivariate_samples(
         *,
         mu_beta: float,
@@ -252,7 +339,7 @@ def generate_multivariate_samples(
         seed: int | None = 42
 ) -> tuple[np.ndarray, np.ndarray]:
     """
-    Generates correlated random samples for Beta and Growth using Cholesky or SVD.
+    Generates correlated random samples for Beta and Growth (cached Cholesky factor).
 
     Parameters
     ----------
@@ -282,20 +369,14 @@ def generate_multivariate_samples(
         raise ValueError("The correlation coefficient rho must be within [-1, 1].")
 
     rng = np.random.default_rng(seed)
+    sampler = CorrelatedShockSampler([[1.0, rho], [rho, 1.0]])
+    draws = sampler.standard_normals(rng, num_simulations)
 
-    # Covariance Matrix
-    covariance = rho * sigma_beta * sigma_growth
-    cov_matrix = np.array([
-        [sigma_beta ** 2, covariance],
-        [covariance, sigma_growth ** 2]
-    ])
-
-    mean_vector = np.array([mu_beta, mu_growth])
-
-    # Multivariate Normal Draw
-    draws = rng.multivariate_normal(mean=mean_vector, cov=cov_matrix, size=num_simulations, method='svd')
-
-    return draws[:, 0], draws[:, 1]
+    draws[0] *= sigma_beta
+    draws[0] += mu_beta
+    draws[1] *= sigma_growth
+    draws[1] += mu_growth
+    return draws[0], draws[1]
 
 
 def generate_independent_samples(
@@ -337,3 +418,85 @@ def generate_independent_samples(
         draws = np.clip(draws, clip_min or -np.inf, clip_max or np.inf)
 
     return draws
+
+
+# ============================================================================
+# ESTIMATORS & STANDARD ERRORS
+# ============================================================================
+
+def control_variate_weights(controls: np.ndarray, control_mean: float) -> np.ndarray:
+    """
+    Linear control-variate weights over a sample.
+
+    The weights sum to one and reweight the sample so that the weighted mean
+    of the control equals its known expectation; applying them to the
+    empirical CDF gives control-variate quantiles as well as the mean.
+
+    Parameters
+    ----------
+    controls : np.ndarray
+        Control value of every path.
+    control_mean : float
+        Exact expectation of the control.
+
+    Returns
+    -------
+    np.ndarray
+        One weight per path (uniform weights when the control is constant).
+    """
+    n = controls.size
+    centred = controls - controls.mean()
+    ss = float(centred @ centred)
+    if n == 0 or ss <= 0.0:
+        return np.full(n, 1.0 / max(n, 1))
+    return 1.0 / n + (control_mean - controls.mean()) * centred / ss
+
+
+def weighted_quantiles(values: np.ndarray, weights: np.ndarray, probs) -> np.ndarray:
+    """
+    Quantiles of a weighted empirical distribution.
+
+    Parameters
+    ----------
+    values : np.ndarray
+        Sample values.
+    weights : np.ndarray
+        Weights summing to one (may be slightly negative, see `control_variate_weights`).
+    probs : array-like
+        Probabilities in [0, 1].
+
+    Returns
+    -------
+    np.ndarray
+        Smallest sample value whose cumulative weight reaches each probability.
+    """
+    order = np.argsort(values)
+    cumulative = np.maximum.accumulate(np.cumsum(weights[order]))
+    # Small tolerance: floating cumulative sums land just below exact levels (e.g. 10 x 0.01).
+    idx = np.searchsorted(cumulative, np.asarray(probs, dtype=float) - 1e-12, side="left")
+    return values[order][np.clip(idx, 0, values.size - 1)]
+
+
+def iid_quantile_standard_error(values: np.ndarray, prob: float, bandwidth: float = 0.02) -> float:
+    """
+    Standard error of a sample quantile under plain i.i.d. sampling.
+
+    Uses the asymptotic variance p(1-p) / (n f(q)^2) with the density
+    estimated from the quantile spacing (Siddiqui-Bloch-Gastwirth).
+
+    Parameters
+    ----------
+    values : np.ndarray
+        Sample values.
+    prob : float
+        Quantile level in (0, 1).
+    bandwidth : float
+        Half-width of the probability window used for the density estimate.
+    """
+    n = values.size
+    if n < 2:
+        return float("nan")
+    h = min(bandwidth, prob / 2.0, (1.0 - prob) / 2.0)
+    lo, hi = np.quantile(values, [prob - h, prob + h])
+    sparsity = (hi - lo) / (2.0 * h)
+    return float(np.sqrt(prob * (1.0 - prob) / n) * sparsity)
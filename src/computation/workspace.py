@@ -0,0 +1,151 @@
+"""
+src/computation/workspace.py
+
+KERNEL WORKSPACE
+================
+Role: Reusable scratch buffers for the vectorized `execute_stochastic` kernels.
+Architecture: Named flat buffers grown on demand, one workspace per thread.
+
+Kernels request their time-major [T, N] intermediates (growth factors, discount factors,
+clean-surplus state) by name and fill them with in-place ufuncs (`out=`).
+A buffer is reallocated only when a call needs more capacity or another
+dtype, so repeated Monte Carlo batches, control-variate probes and scenario
+calls reuse the same memory. Buffers never escape a kernel: returned arrays
+are always freshly allocated.
+
+Style: Numpy docstrings.
+"""
+
+from __future__ import annotations
+
+import math
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+import numpy as np
+
+
+class KernelWorkspace:
+    """
+    Pool of named scratch arrays.
+
+    Attributes
+    ----------
+    allocations : int
+        Number of buffer (re)allocations so far; stays constant once the
+        workspace has seen the largest batch.
+
+    Notes
+    -----
+    Not thread-safe: use one workspace per thread (see `get_workspace`).
+    """
+
+    def __init__(self) -> None:
+        self._buffers: dict[str, np.ndarray] = {}
+        self.allocations = 0
+
+    @property
+    def nbytes(self) -> int:
+        """Total memory held by the workspace."""
+        return sum(buf.nbytes for buf in self._buffers.values())
+
+    def buffer(self, name: str, shape: tuple[int, ...], dtype: np.dtype | type = np.float64) -> np.ndarray:
+        """
+        Uninitialised C-contiguous view of the named buffer.
+
+        Parameters
+        ----------
+        name : str
+            Buffer key; each live intermediate of a kernel needs its own name.
+        shape : tuple[int, ...]
+            Requested shape.
+        dtype : np.dtype, default float64
+            Requested dtype.
+
+        Returns
+        -------
+        np.ndarray
+            View into the pooled memory; overwritten by the next request of the same name.
+        """
+        dtype = np.dtype(dtype)
+        size = math.prod(shape)
+        buf = self._buffers.get(name)
+        if buf is None or buf.dtype != dtype or buf.size < size:
+            buf = np.empty(size, dtype=dtype)
+            self._buffers[name] = buf
+            self.allocations += 1
+        return buf[:size].reshape(shape)
+
+    def compound_factors(self, name: str, rate: np.ndarray, years: int, inverse: bool = False) -> np.ndarray:
+        """
+        Time-major [years, N] matrix of (1 + rate)^t for t = 1..years.
+
+        Each row is the previous one times (1 + rate) (running product), which
+        replaces the `**` powers and keeps every write contiguous.
+
+        Parameters
+        ----------
+        name : str
+            Buffer key.
+        rate : np.ndarray
+            Per-path rate vector (N,).
+        years : int
+            Number of periods.
+        inverse : bool, default False
+            Returns discount factors (1 + rate)^-t instead.
+
+        Returns
+        -------
+        np.ndarray
+            Workspace view with the dtype of `rate`.
+        """
+        out = self.buffer(name, (years, rate.shape[0]), rate.dtype)
+        step = out[0]
+        np.add(rate, 1.0, out=step)
+        if inverse:
+            np.reciprocal(step, out=step)
+        for t in range(1, years):
+            np.multiply(out[t - 1], step, out=out[t])
+        return out
+
+    def release(self) -> None:
+        """Drops every buffer."""
+        self._buffers.clear()
+
+
+_local = threading.local()
+
+
+def get_workspace() -> KernelWorkspace:
+    """
+    Workspace of the calling thread (created on first use).
+
+    Returns
+    -------
+    KernelWorkspace
+        The innermost workspace installed by `use_workspace`, else the
+        thread's default workspace.
+    """
+    workspace = getattr(_local, "workspace", None)
+    if workspace is None:
+        workspace = _local.workspace = KernelWorkspace()
+    return workspace
+
+
+@contextmanager
+def use_workspace(workspace: KernelWorkspace) -> Iterator[KernelWorkspace]:
+    """
+    Installs `workspace` for the kernels run by the current thread.
+
+    Parameters
+    ----------
+    workspace : KernelWorkspace
+        Workspace to activate until the block exits.
+    """
+    previous = getattr(_local, "workspace", None)
+    _local.workspace = workspace
+    try:
+        yield workspace
+    finally:
+        _local.workspace = previous
@@ -25,6 +25,19 @@ class MonteCarloDefaults:
     DEFAULT_RHO: float = -0.30
     MIN_VALID_RATIO: float = 0.80
     CLAMPING_THRESHOLD: float = 0.10
+    # Row/column order of MCParameters.correlation
+    SHOCK_DRIVERS: tuple[str, ...] = ("beta", "growth", "terminal_growth", "base_flow")
+    # Standard errors: paths are split into contiguous batches (independent replications)
+    SE_BATCHES: int = 20
+    MIN_BATCH_PATHS: int = 50
+    # Adaptive stopping
+    ADAPTIVE_BATCH_SIZE: int = 2_048
+    ADAPTIVE_MIN_BATCHES: int = 5   # replications needed before the stopping test is trusted
+    ADAPTIVE_TOLERANCE: float = 0.01
+    ADAPTIVE_TIME_BUDGET_S: float = 5.0
+    ADAPTIVE_MAX_SIMULATIONS: int = 200_000
+    # Path-dependent growth (AR(1) mean reversion towards the perpetual growth)
+    DEFAULT_GROWTH_PERSISTENCE: float = 0.6
 
 
 # ==============================================================================
@@ -37,6 +50,13 @@ class SensitivityDefaults:
     DEFAULT_WACC_SPAN: float = 0.01
     DEFAULT_GROWTH_SPAN: float = 0.005
     DEFAULT_YIELD_SPAN: float = 0.01
+    # Tornado (one-at-a-time) shocks
+    TORNADO_RELATIVE_SHOCK: float = 0.10   # levels: beta, base flow, debt, cash, shares
+    TORNADO_RATE_SHOCK: float = 0.01       # rates: Rf, MRP, tax, growth, perpetual growth
+    TORNADO_YEARS_SHOCK: int = 1
+    # Greeks (analytical input sensitivities)
+    GREEKS_COMPLEX_STEP: float = 1e-30     # imaginary step of the complex-step derivative
+    GREEKS_FD_STEP: float = 1e-6           # relative step of the central differences
 
 
 # ==============================================================================
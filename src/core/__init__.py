@@ -19,7 +19,9 @@ from src.core.exceptions import (
 )
 from src.core.formatting import COLOR_NEGATIVE, COLOR_NEUTRAL, COLOR_POSITIVE, format_smart_number, get_delta_color
 from src.core.interfaces import DataProviderProtocol, IResultRenderer, IUIProgressHandler, NullProgressHandler
-from src.core.quant_logger import QuantLogger, log_valuation
+from src.core.quant_logger import QuantLogger, configure_quant_logging, log_valuation, shutdown_quant_logging
+from src.core.resource_accounting import ResourceAccountant, resource_accounting_requested
+from src.core.tracing import SpanRecord, Tracer, tracer
 
 __all__ = [
     # Diagnostics
@@ -52,4 +54,15 @@ __all__ = [
     # Logger
     "QuantLogger",
     "log_valuation",
+    "configure_quant_logging",
+    "shutdown_quant_logging",
+
+    # Resource accounting
+    "ResourceAccountant",
+    "resource_accounting_requested",
+
+    # Tracing
+    "Tracer",
+    "SpanRecord",
+    "tracer",
 ]
@@ -10,17 +10,28 @@ Architecture: ST-4.2 Compliance.
 Format:
 [DOMAIN][LEVEL] Ticker: XXX | Key: Value | Key: Value
 
+Modes:
+- Eager (default): messages are formatted at the call site.
+- Lazy: `configure_quant_logging()` defers formatting until a handler emits the
+  record, and can route records through a QueueHandler to a background
+  JSON-lines writer with size-based rotation.
+
 Style: Numpy docstrings.
 """
 
 from __future__ import annotations
 
+import atexit
 import functools
 import json
 import logging
+import os
+import queue
 from collections.abc import Callable
 from datetime import datetime, timezone
 from enum import Enum
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from pathlib import Path
 from typing import Any, TypeVar
 
 # Type variable for preserving function signatures in decorators
@@ -49,9 +60,10 @@ class LogDomain(Enum):
     PIPELINE = "PIPELINE"
 
 
-# Configure specialized quant logger
+# Configure specialized quant logger (level overridable through QUANT_LOG_LEVEL)
 _logger = logging.getLogger("quant")
-_logger.setLevel(logging.DEBUG)
+_env_level = logging.getLevelName(os.environ.get("QUANT_LOG_LEVEL", "DEBUG").upper())
+_logger.setLevel(_env_level if isinstance(_env_level, int) else logging.DEBUG)
 
 # Terminal Handler (Standard Out)
 if not _logger.handlers:
@@ -60,6 +72,173 @@ if not _logger.handlers:
     sh.setFormatter(formatter)
     _logger.addHandler(sh)
 
+# Runtime mode (see configure_quant_logging)
+_lazy_formatting: bool = False
+_queue_listener: QueueListener | None = None
+_replaced_handlers: list[logging.Handler] = []
+_replaced_propagate: bool = _logger.propagate
+_atexit_registered: bool = False
+
+
+class _DeferredMessage:
+    """
+    Log message rendered on first ``str()`` call, i.e. only when a handler emits.
+
+    Handed to ``logging`` as the record ``msg``; ``LogRecord.getMessage`` calls
+    ``str()`` on it, so filtered-out records never pay the formatting cost.
+    """
+
+    __slots__ = ("_build", "_args", "_kwargs", "_text")
+
+    def __init__(self, build: Callable[..., str], *args: Any, **kwargs: Any) -> None:
+        self._build = build
+        self._args = args
+        self._kwargs = kwargs
+        self._text: str | None = None
+
+    def __str__(self) -> str:
+        if self._text is None:
+            self._text = self._build(*self._args, **self._kwargs)
+        return self._text
+
+
+class _DeferredJson(_DeferredMessage):
+    """Deferred `log_json` record; the JSON-lines formatter reads ``payload`` directly."""
+
+    __slots__ = ("payload",)
+
+    def __init__(self, payload: dict[str, Any]) -> None:
+        super().__init__(json.dumps, payload, default=str)
+        self.payload = payload
+
+
+class _DeferredQueueHandler(QueueHandler):
+    """
+    QueueHandler that enqueues records unformatted.
+
+    The stock ``prepare`` renders the message in the calling thread; here the
+    rendering is left to the listener thread so the valuation path only pays
+    for a queue put.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+class JsonLinesFormatter(logging.Formatter):
+    """Formats each record as one JSON object per line (JSON-lines)."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry: dict[str, Any] = {
+            "timestamp": datetime.fromtimestamp(record.created, tz=timezone.utc).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+        }
+        if isinstance(record.msg, _DeferredJson) and not record.args:
+            entry.update(record.msg.payload)
+        else:
+            entry["message"] = record.getMessage()
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        return json.dumps(entry, default=str)
+
+
+def configure_quant_logging(
+    *,
+    lazy: bool = True,
+    log_file: str | Path | None = None,
+    max_bytes: int = 10 * 1024 * 1024,
+    backup_count: int = 5,
+    console: bool = True,
+    level: int | str | None = None,
+) -> None:
+    """
+    Switches the quant logger to its low-overhead mode.
+
+    Parameters
+    ----------
+    lazy : bool, default True
+        Defer message formatting (and ``json.dumps`` in `log_json`) until a
+        handler emits the record. Disabled levels cost a single level check.
+    log_file : str | Path | None
+        If set, records are pushed onto an in-memory queue and written by a
+        background thread to this file as JSON lines, with size-based rotation.
+    max_bytes : int, default 10 MiB
+        Rotation threshold of the JSON-lines file.
+    backup_count : int, default 5
+        Number of rotated files kept.
+    console : bool, default True
+        Keep a console stream (moved behind the queue when ``log_file`` is set).
+    level : int | str | None
+        Optional new level for the quant logger (e.g. "WARNING" in batch runs).
+
+    Notes
+    -----
+    Calling it again reconfigures from scratch; `shutdown_quant_logging` drains
+    the queue and restores the import-time handlers. It is registered with
+    ``atexit`` the first time a background writer is started.
+    While the writer runs, quant records stop propagating to the root logger so
+    that no caller-thread handler formats them a second time.
+    """
+    global _lazy_formatting, _queue_listener, _atexit_registered, _replaced_propagate
+
+    shutdown_quant_logging()
+    _lazy_formatting = lazy
+    if level is not None:
+        _logger.setLevel(level)
+
+    if log_file is None:
+        return
+
+    path = Path(log_file)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    file_handler = RotatingFileHandler(path, maxBytes=max_bytes, backupCount=backup_count, encoding="utf-8")
+    file_handler.setFormatter(JsonLinesFormatter())
+    sinks: list[logging.Handler] = [file_handler]
+    if console:
+        stream = logging.StreamHandler()
+        stream.setFormatter(logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
+        sinks.append(stream)
+
+    record_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    _replaced_handlers[:] = list(_logger.handlers)
+    for handler in _replaced_handlers:
+        _logger.removeHandler(handler)
+    _logger.addHandler(_DeferredQueueHandler(record_queue))
+    _replaced_propagate = _logger.propagate
+    _logger.propagate = False
+
+    _queue_listener = QueueListener(record_queue, *sinks, respect_handler_level=True)
+    _queue_listener.start()
+
+    if not _atexit_registered:
+        atexit.register(shutdown_quant_logging)
+        _atexit_registered = True
+
+
+def shutdown_quant_logging() -> None:
+    """
+    Flushes the background writer (if any) and restores eager, import-time logging.
+    """
+    global _lazy_formatting, _queue_listener
+
+    _lazy_formatting = False
+    if _queue_listener is None:
+        return
+
+    _queue_listener.stop()
+    for handler in _queue_listener.handlers:
+        handler.close()
+    _queue_listener = None
+
+    for handler in list(_logger.handlers):
+        if isinstance(handler, _DeferredQueueHandler):
+            _logger.removeHandler(handler)
+    for handler in _replaced_handlers:
+        _logger.addHandler(handler)
+    _replaced_handlers.clear()
+    _logger.propagate = _replaced_propagate
+
 
 class QuantLogger:
     """
@@ -124,6 +303,26 @@ class QuantLogger:
 
         return " | ".join(parts)
 
+    @classmethod
+    def _emit(cls, level: int, domain: LogDomain, log_level: LogLevel, ticker: str, **kwargs: Any) -> None:
+        """
+        Sends a structured message to the quant logger.
+
+        Skips all work when ``level`` is filtered out; in lazy mode the message
+        is only rendered if a handler emits it.
+        """
+        if not _logger.isEnabledFor(level):
+            return
+        message: Any
+        if _lazy_formatting:
+            message = _DeferredMessage(cls._format_message, domain, log_level, ticker, **kwargs)
+        else:
+            message = cls._format_message(domain, log_level, ticker, **kwargs)
+        if level >= logging.ERROR:
+            _logger.error(message)
+        else:
+            _logger.info(message)
+
     @classmethod
     def log_success(
         cls,
@@ -136,7 +335,8 @@ class QuantLogger:
         **extra: Any
     ) -> None:
         """Logs a successful valuation completion."""
-        msg = cls._format_message(
+        cls._emit(
+            logging.INFO,
             LogDomain.VALUATION,
             LogLevel.SUCCESS,
             ticker,
@@ -147,7 +347,6 @@ class QuantLogger:
             compute_time=f"{duration_ms}ms" if duration_ms else None,
             **extra
         )
-        _logger.info(msg)
 
     @classmethod
     def log_audit(
@@ -159,7 +358,8 @@ class QuantLogger:
         failed: int
     ) -> None:
         """Logs a Pillar 3 audit result summary."""
-        msg = cls._format_message(
+        cls._emit(
+            logging.INFO,
             LogDomain.AUDIT,
             LogLevel.INFO,
             ticker,
@@ -168,7 +368,6 @@ class QuantLogger:
             checks_passed=passed,
             checks_failed=failed
         )
-        _logger.info(msg)
 
     @classmethod
     def log_error(
@@ -180,14 +379,14 @@ class QuantLogger:
     ) -> None:
         """Logs a critical engine or data error."""
         error_msg = str(error)
-        msg = cls._format_message(
+        cls._emit(
+            logging.ERROR,
             domain,
             LogLevel.ERROR,
             ticker,
             error=error_msg,
             **context
         )
-        _logger.error(msg)
 
     @classmethod
     def log_json(cls, event: str, **data: Any) -> None:
@@ -201,12 +400,14 @@ class QuantLogger:
         **data
             Arbitrary key-value pairs to include in the JSON record.
         """
+        if not _logger.isEnabledFor(logging.INFO):
+            return
         record = {
             "timestamp": datetime.now(timezone.utc).isoformat(),
             "event": event,
             **data
         }
-        _logger.info(json.dumps(record, default=str))
+        _logger.info(_DeferredJson(record) if _lazy_formatting else json.dumps(record, default=str))
 
     # ==================================================================
     # PIPELINE STAGE LOGGING (Descriptive step-by-step tracing)
@@ -226,11 +427,11 @@ class QuantLogger:
         **context
             Additional context key-value pairs.
         """
-        msg = cls._format_message(
+        cls._emit(
+            logging.INFO,
             LogDomain.PIPELINE, LogLevel.INFO, ticker,
             stage=stage, status="STARTED", **context
         )
-        _logger.info(msg)
 
     @classmethod
     def log_stage_complete(cls, ticker: str, stage: str, duration_ms: int | None = None, **context: Any) -> None:
@@ -248,13 +449,13 @@ class QuantLogger:
         **context
             Additional context key-value pairs.
         """
-        msg = cls._format_message(
+        cls._emit(
+            logging.INFO,
             LogDomain.PIPELINE, LogLevel.SUCCESS, ticker,
             stage=stage, status="COMPLETED",
             duration=f"{duration_ms}ms" if duration_ms else None,
             **context
         )
-        _logger.info(msg)
 
     @classmethod
     def log_stage_error(cls, ticker: str, stage: str, error: str | Exception, **context: Any) -> None:
@@ -272,11 +473,11 @@ class QuantLogger:
         **context
             Additional context key-value pairs.
         """
-        msg = cls._format_message(
+        cls._emit(
+            logging.ERROR,
             LogDomain.PIPELINE, LogLevel.ERROR, ticker,
             stage=stage, status="FAILED", error=str(error), **context
         )
-        _logger.error(msg)
 
     @classmethod
     def log_data_fetching(cls, ticker: str, provider: str = "Yahoo Finance") -> None:
@@ -290,11 +491,11 @@ class QuantLogger:
         provider : str
             The data source name.
         """
-        msg = cls._format_message(
+        cls._emit(
+            logging.INFO,
             LogDomain.DATA, LogLevel.INFO, ticker,
             stage="DATA_FETCHING", provider=provider
         )
-        _logger.info(msg)
 
     @classmethod
     def log_parameter_resolution(cls, ticker: str, mode: str, **resolved_fields: Any) -> None:
@@ -310,11 +511,11 @@ class QuantLogger:
         **resolved_fields
             Key resolved parameters and their values.
         """
-        msg = cls._format_message(
+        cls._emit(
+            logging.INFO,
             LogDomain.RESOLVER, LogLevel.INFO, ticker,
             stage="PARAMETER_RESOLUTION", model=mode, **resolved_fields
         )
-        _logger.info(msg)
 
     @classmethod
     def log_strategy_execution(cls, ticker: str, strategy: str, **context: Any) -> None:
@@ -330,11 +531,11 @@ class QuantLogger:
         **context
             Additional execution context.
         """
-        msg = cls._format_message(
+        cls._emit(
+            logging.INFO,
             LogDomain.ENGINE, LogLevel.INFO, ticker,
             stage="STRATEGY_EXECUTION", strategy=strategy, **context
         )
-        _logger.info(msg)
 
     @classmethod
     def log_extension_processing(cls, ticker: str, extension: str, **context: Any) -> None:
@@ -350,11 +551,11 @@ class QuantLogger:
         **context
             Additional context.
         """
-        msg = cls._format_message(
+        cls._emit(
+            logging.INFO,
             LogDomain.EXTENSION, LogLevel.INFO, ticker,
             stage="EXTENSION_PROCESSING", extension=extension, **context
         )
-        _logger.info(msg)
 
     @classmethod
     def log_final_packaging(cls, ticker: str, intrinsic_value: float, **context: Any) -> None:
@@ -370,11 +571,11 @@ class QuantLogger:
         **context
             Additional context (audit score, upside, etc.).
         """
-        msg = cls._format_message(
+        cls._emit(
+            logging.INFO,
             LogDomain.PIPELINE, LogLevel.SUCCESS, ticker,
             stage="FINAL_PACKAGING", intrinsic_value=intrinsic_value, **context
         )
-        _logger.info(msg)
 
 
 def log_valuation(func: F) -> F:
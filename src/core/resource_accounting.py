@@ -0,0 +1,153 @@
+"""
+src/core/resource_accounting.py
+
+RUN RESOURCE ACCOUNTING
+=======================
+Role: Optional CPU / memory / allocation accounting of pipeline stages.
+Pattern: Context-manager meters, nested like tracing spans.
+Architecture: One `ResourceAccountant` per valuation run, disabled by default
+(stages are then shared no-op context managers).
+
+Measures per stage:
+- wall time and process CPU time (`time.process_time`, includes BLAS threads),
+- peak traced memory above the stage entry level (`tracemalloc`),
+- net change of live allocated blocks (`sys.getallocatedblocks`).
+
+Notes
+-----
+`tracemalloc` is process-wide and roughly doubles allocation cost while
+active: enable accounting for diagnosis runs, not by default. Concurrent
+accounted runs in the same process share the traced peak.
+
+Style: Numpy docstrings.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import os
+import sys
+import time
+import tracemalloc
+from typing import Any
+
+_NULL_STAGE = contextlib.nullcontext()
+
+
+def resource_accounting_requested() -> bool:
+    """True when the VALUATION_RESOURCE_ACCOUNTING environment flag is set."""
+    return os.environ.get("VALUATION_RESOURCE_ACCOUNTING", "").lower() in ("1", "true", "yes")
+
+
+class _Meter:
+    """Open measurement window (one stage, or the whole run)."""
+
+    __slots__ = ("_accountant", "name", "_wall", "_cpu", "_blocks", "_base_memory", "max_peak")
+
+    def __init__(self, accountant: ResourceAccountant, name: str) -> None:
+        self._accountant = accountant
+        self.name = name
+        self._wall = 0.0
+        self._cpu = 0.0
+        self._blocks = 0
+        self._base_memory = 0
+        self.max_peak = 0
+
+    def __enter__(self) -> _Meter:
+        self._accountant._open(self)
+        self._wall = time.perf_counter()
+        self._cpu = time.process_time()
+        self._blocks = sys.getallocatedblocks()
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self._accountant._close(self, self.read())
+
+    def read(self) -> dict[str, float | int]:
+        """Usage accumulated since entry (the meter stays open)."""
+        _, peak = tracemalloc.get_traced_memory()
+        return {
+            "wall_time_ms": (time.perf_counter() - self._wall) * 1e3,
+            "cpu_time_ms": (time.process_time() - self._cpu) * 1e3,
+            "peak_memory_bytes": max(0, max(self.max_peak, peak) - self._base_memory),
+            "allocated_blocks": sys.getallocatedblocks() - self._blocks,
+        }
+
+
+class ResourceAccountant:
+    """
+    Collects per-stage resource usage for one run.
+
+    Parameters
+    ----------
+    enabled : bool
+        When False, `stage` returns a shared no-op context manager and
+        `tracemalloc` is never started.
+
+    Notes
+    -----
+    Use the accountant itself as the outer context manager: it starts
+    `tracemalloc` if needed (and stops it on exit if it started it).
+    Stages may nest; the peak reported for an outer stage includes the
+    peaks reached inside its children.
+    """
+
+    def __init__(self, enabled: bool = False) -> None:
+        self.enabled = enabled
+        self.stages: dict[str, dict[str, float | int]] = {}
+        self._open_meters: list[_Meter] = []
+        self._run: _Meter | None = None
+        self._started_tracemalloc = False
+
+    def __enter__(self) -> ResourceAccountant:
+        if self.enabled:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+                self._started_tracemalloc = True
+            self._run = _Meter(self, "run").__enter__()
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        if self._run is not None and self._run in self._open_meters:
+            self._open_meters.remove(self._run)
+        if self._started_tracemalloc:
+            tracemalloc.stop()
+            self._started_tracemalloc = False
+
+    def stage(self, name: str) -> _Meter | contextlib.nullcontext[None]:
+        """
+        Opens a measurement window, to be used as a context manager.
+
+        Parameters
+        ----------
+        name : str
+            Stage label (e.g. "strategy", "extension.monte_carlo").
+        """
+        if not self.enabled or not tracemalloc.is_tracing():
+            return _NULL_STAGE
+        return _Meter(self, name)
+
+    def totals(self) -> dict[str, float | int] | None:
+        """Usage of the whole run so far, or None when accounting is off."""
+        if self._run is None or not tracemalloc.is_tracing():
+            return None
+        return self._run.read()
+
+    # ------------------------------------------------------------------
+    # Peak bookkeeping: `tracemalloc.reset_peak` is global, so the peak
+    # reached so far is folded into every open meter before each reset.
+    # ------------------------------------------------------------------
+
+    def _open(self, meter: _Meter) -> None:
+        current, peak = tracemalloc.get_traced_memory()
+        for parent in self._open_meters:
+            parent.max_peak = max(parent.max_peak, peak)
+        tracemalloc.reset_peak()
+        meter._base_memory = current
+        meter.max_peak = current
+        self._open_meters.append(meter)
+
+    def _close(self, meter: _Meter, usage: dict[str, float | int]) -> None:
+        if meter in self._open_meters:
+            self._open_meters.remove(meter)
+        self.stages[meter.name] = usage
@@ -0,0 +1,270 @@
+"""
+src/core/tracing.py
+
+PIPELINE SPAN TRACING
+=====================
+Role: Nested, monotonic-clock timing of the valuation pipeline.
+Pattern: Context-manager spans recorded into an in-memory ring buffer.
+Architecture: Process-wide `tracer` singleton, disabled by default (no-op spans).
+
+Exports:
+- Chrome trace format (chrome://tracing, Perfetto): `Tracer.export_chrome_trace`.
+- Plain JSON list of spans: `Tracer.export_json`.
+
+Style: Numpy docstrings.
+"""
+
+from __future__ import annotations
+
+import functools
+import itertools
+import json
+import os
+import threading
+import time
+from collections import deque
+from collections.abc import Callable
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, TypeVar
+
+F = TypeVar('F', bound=Callable[..., Any])
+
+DEFAULT_TRACE_CAPACITY = 10_000
+
+
+@dataclass(frozen=True)
+class SpanRecord:
+    """
+    One closed span.
+
+    Attributes
+    ----------
+    name : str
+        Span label (e.g. "strategy.execute").
+    category : str
+        Coarse grouping used by trace viewers (e.g. "pipeline", "extension", "provider").
+    start_ns : int
+        `time.perf_counter_ns()` at span entry.
+    duration_ns : int
+        Wall time spent inside the span.
+    span_id : int
+        Process-unique identifier.
+    parent_id : int | None
+        Identifier of the enclosing span on the same thread.
+    depth : int
+        Nesting level (0 for a root span).
+    thread_id : int
+        `threading.get_ident()` of the recording thread.
+    attrs : dict[str, Any]
+        Free-form annotations (ticker, n_sims, ...).
+    """
+    name: str
+    category: str
+    start_ns: int
+    duration_ns: int
+    span_id: int
+    parent_id: int | None
+    depth: int
+    thread_id: int
+    attrs: dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def duration_ms(self) -> float:
+        return self.duration_ns / 1e6
+
+
+class _NullSpan:
+    """Shared no-op span returned while tracing is disabled."""
+
+    __slots__ = ()
+
+    def __enter__(self) -> _NullSpan:
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        return None
+
+    def set(self, **attrs: Any) -> None:
+        return None
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class _Span:
+    """Active span; closes itself into the tracer ring buffer on exit."""
+
+    __slots__ = ("_tracer", "name", "category", "attrs", "span_id", "parent_id", "depth", "_start")
+
+    def __init__(self, tracer: Tracer, name: str, category: str, attrs: dict[str, Any]) -> None:
+        self._tracer = tracer
+        self.name = name
+        self.category = category
+        self.attrs = attrs
+        self.span_id = 0
+        self.parent_id: int | None = None
+        self.depth = 0
+        self._start = 0
+
+    def set(self, **attrs: Any) -> None:
+        """Adds annotations to the span while it is open."""
+        self.attrs.update(attrs)
+
+    def __enter__(self) -> _Span:
+        stack = self._tracer._stack()
+        self.parent_id = stack[-1].span_id if stack else None
+        self.depth = len(stack)
+        self.span_id = next(self._tracer._ids)
+        stack.append(self)
+        self._start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type: Any, exc: Any, tb: Any) -> None:
+        end = time.perf_counter_ns()
+        stack = self._tracer._stack()
+        if stack and stack[-1] is self:
+            stack.pop()
+        if exc_type is not None:
+            self.attrs["error"] = exc_type.__name__
+        self._tracer._buffer.append(SpanRecord(
+            name=self.name,
+            category=self.category,
+            start_ns=self._start,
+            duration_ns=end - self._start,
+            span_id=self.span_id,
+            parent_id=self.parent_id,
+            depth=self.depth,
+            thread_id=threading.get_ident(),
+            attrs=self.attrs,
+        ))
+
+
+class Tracer:
+    """
+    Records nested spans into a bounded ring buffer.
+
+    Parameters
+    ----------
+    capacity : int
+        Maximum number of spans kept; the oldest are dropped first.
+    enabled : bool
+        When False, `span` returns a shared no-op context manager.
+
+    Notes
+    -----
+    Nesting is tracked per thread, so spans opened from worker threads
+    (e.g. provider calls) form their own trees.
+    """
+
+    def __init__(self, capacity: int = DEFAULT_TRACE_CAPACITY, enabled: bool = False) -> None:
+        self.enabled = enabled
+        self._buffer: deque[SpanRecord] = deque(maxlen=capacity)
+        self._ids = itertools.count(1)
+        self._local = threading.local()
+
+    def _stack(self) -> list[_Span]:
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    @property
+    def capacity(self) -> int:
+        return self._buffer.maxlen or 0
+
+    def configure(self, enabled: bool = True, capacity: int | None = None) -> None:
+        """
+        Turns recording on/off and optionally resizes (and clears) the ring buffer.
+        """
+        self.enabled = enabled
+        if capacity is not None and capacity != self.capacity:
+            self._buffer = deque(maxlen=capacity)
+
+    def span(self, name: str, category: str = "pipeline", **attrs: Any) -> _Span | _NullSpan:
+        """
+        Opens a span, to be used as a context manager.
+
+        Parameters
+        ----------
+        name : str
+            Span label.
+        category : str, default "pipeline"
+            Grouping label.
+        **attrs
+            Annotations stored with the span.
+        """
+        if not self.enabled:
+            return _NULL_SPAN
+        return _Span(self, name, category, attrs)
+
+    def traced(self, name: str | None = None, category: str = "pipeline") -> Callable[[F], F]:
+        """
+        Decorator wrapping each call of the function in a span.
+        """
+        def decorator(func: F) -> F:
+            label = name or func.__qualname__
+
+            @functools.wraps(func)
+            def wrapper(*args: Any, **kwargs: Any) -> Any:
+                if not self.enabled:
+                    return func(*args, **kwargs)
+                with self.span(label, category):
+                    return func(*args, **kwargs)
+
+            return wrapper  # type: ignore[return-value]
+
+        return decorator
+
+    def records(self) -> list[SpanRecord]:
+        """Snapshot of the ring buffer, oldest first."""
+        return list(self._buffer)
+
+    def clear(self) -> None:
+        self._buffer.clear()
+
+    def export_json(self, path: str | Path | None = None) -> list[dict[str, Any]]:
+        """
+        Exports spans as a list of plain dicts (optionally written to ``path``).
+        """
+        payload = [asdict(r) for r in self._buffer]
+        if path is not None:
+            Path(path).write_text(json.dumps(payload, default=str), encoding="utf-8")
+        return payload
+
+    def export_chrome_trace(self, path: str | Path | None = None) -> dict[str, Any]:
+        """
+        Exports spans in the Chrome trace event format ("X" complete events).
+
+        Parameters
+        ----------
+        path : str | Path | None
+            If given, the trace is also written there (open it in chrome://tracing or Perfetto).
+
+        Returns
+        -------
+        dict[str, Any]
+            ``{"traceEvents": [...], "displayTimeUnit": "ms"}`` with microsecond timestamps.
+        """
+        pid = os.getpid()
+        events = [
+            {
+                "name": r.name,
+                "cat": r.category,
+                "ph": "X",
+                "ts": r.start_ns / 1_000,
+                "dur": r.duration_ns / 1_000,
+                "pid": pid,
+                "tid": r.thread_id,
+                "args": {**r.attrs, "span_id": r.span_id, "parent_id": r.parent_id},
+            }
+            for r in self._buffer
+        ]
+        trace = {"traceEvents": events, "displayTimeUnit": "ms"}
+        if path is not None:
+            Path(path).write_text(json.dumps(trace, default=str), encoding="utf-8")
+        return trace
+
+
+# Process-wide tracer (enable with VALUATION_TRACE=1 or tracer.configure()).
+tracer = Tracer(enabled=os.environ.get("VALUATION_TRACE", "").lower() in ("1", "true", "yes"))
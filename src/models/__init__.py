@@ -56,7 +56,7 @@ from .parameters.options import (
 from .results.base_result import Results
 
 # 5. High-Level Envelopes
-from .valuation import AuditReport, ValuationRequest, ValuationResult, ValuationRunMetadata
+from .valuation import AuditReport, StageResourceUsage, ValuationRequest, ValuationResult, ValuationRunMetadata
 
 __all__ = [
     # Enums
@@ -77,6 +77,7 @@ __all__ = [
     "ValuationRequest",
     "ValuationResult",
     "ValuationRunMetadata",
+    "StageResourceUsage",
     "AuditReport",
 
     # Parameters Sub-structures
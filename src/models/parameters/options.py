@@ -12,7 +12,7 @@ from __future__ import annotations
 
 from typing import Annotated, Literal
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator
 
 from src.config.constants import BacktestDefaults, MonteCarloDefaults, SensitivityDefaults, SOTPDefaults, UIKeys
 from src.models.parameters.common import BaseNormalizedModel
@@ -57,6 +57,39 @@ class MCParameters(BaseNormalizedModel):
         Polymorphic container for volatility settings based on the strategy.
     random_seed : int | None
         Random seed for reproducibility (default: 42).
+    scenario_mixture : bool
+        When True and scenarios are defined, each path first draws a scenario
+        (by probability) and applies its overrides on top of the usual shocks.
+    correlation : list[list[float]] | None
+        Correlation matrix between the shock drivers, ordered as
+        `MonteCarloDefaults.SHOCK_DRIVERS` (beta, growth, terminal growth,
+        base flow). None draws the drivers independently.
+    variance_reduction : str
+        Sampling scheme: "none" (plain pseudo-random), "antithetic" (mirrored
+        pairs), "sobol" (randomised quasi-Monte Carlo) or "control_variate"
+        (linearised kernel as control, applied to the mean and quantiles).
+    adaptive : bool
+        Run batches until the precision target is met instead of a fixed
+        `iterations` count.
+    tolerance : float
+        Adaptive mode: target relative half-width of the 95% confidence
+        interval of the mean and of P10/P50/P90.
+    time_budget_s : float | None
+        Adaptive mode: wall-clock budget in seconds (None for no limit).
+    max_iterations : int
+        Adaptive mode: hard cap on the number of paths.
+    precision : str
+        Floating-point type of the shock vectors and kernel matrices
+        ("float64", or "float32" for half the memory on large runs).
+    growth_process : str
+        "constant" (one growth draw per path, faded as in `execute`) or "ar1"
+        (yearly growth mean-reverting towards the path's perpetual growth).
+    growth_persistence : float
+        AR(1) coefficient: share of the gap to the perpetual growth kept from
+        one year to the next (0 = immediate reversion, 1 = random walk).
+    flow_noise_volatility : float
+        Std-dev of a transitory multiplicative shock on each projected flow
+        (0 disables it).
     """
     enabled: Annotated[bool, UIKey(UIKeys.MC_ENABLE, scale="raw")] = False
     iterations: Annotated[int, UIKey(UIKeys.MC_SIMS, scale="raw")] = Field(
@@ -66,6 +99,31 @@ class MCParameters(BaseNormalizedModel):
     )
     shocks: MCShockUnion | None = None
     random_seed: int | None = 42
+    scenario_mixture: bool = False
+    correlation: list[list[float]] | None = None
+    variance_reduction: Literal["none", "antithetic", "sobol", "control_variate"] = "none"
+    adaptive: bool = False
+    tolerance: float = Field(default=MonteCarloDefaults.ADAPTIVE_TOLERANCE, gt=0, lt=1)
+    time_budget_s: float | None = Field(default=MonteCarloDefaults.ADAPTIVE_TIME_BUDGET_S, gt=0)
+    max_iterations: int = Field(
+        default=MonteCarloDefaults.ADAPTIVE_MAX_SIMULATIONS,
+        ge=MonteCarloDefaults.MIN_SIMULATIONS,
+    )
+    precision: Literal["float64", "float32"] = "float64"
+    growth_process: Literal["constant", "ar1"] = "constant"
+    growth_persistence: float = Field(default=MonteCarloDefaults.DEFAULT_GROWTH_PERSISTENCE, ge=0, le=1)
+    flow_noise_volatility: float = Field(default=0.0, ge=0, lt=1)
+
+    @field_validator("correlation")
+    @classmethod
+    def _check_correlation_shape(cls, value: list[list[float]] | None) -> list[list[float]] | None:
+        """Ensures one row and one column per shock driver."""
+        if value is None:
+            return value
+        dim = len(MonteCarloDefaults.SHOCK_DRIVERS)
+        if len(value) != dim or any(len(row) != dim for row in value):
+            raise ValueError(f"correlation must be a {dim}x{dim} matrix ordered as {MonteCarloDefaults.SHOCK_DRIVERS}.")
+        return value
 
 
 # ==============================================================================
@@ -100,6 +158,56 @@ class SensitivityParameters(BaseNormalizedModel):
     )
 
 
+class TornadoParameters(BaseNormalizedModel):
+    """
+    Configuration for the one-at-a-time (tornado) sensitivity.
+
+    Attributes
+    ----------
+    enabled : bool
+        Whether to rank the drivers by impact.
+    relative_shock : float
+        Relative move of level drivers (beta, base flow, debt, cash, shares).
+    rate_shock : float
+        Absolute move of rate drivers (Rf, MRP, tax, growth, perpetual growth).
+    years_shock : int
+        Move of the projection horizon, in years.
+    """
+    enabled: bool = False
+    relative_shock: float = Field(default=SensitivityDefaults.TORNADO_RELATIVE_SHOCK, gt=0, lt=1)
+    rate_shock: float = Field(default=SensitivityDefaults.TORNADO_RATE_SHOCK, gt=0, lt=0.5)
+    years_shock: int = Field(default=SensitivityDefaults.TORNADO_YEARS_SHOCK, ge=1)
+
+
+class GreeksParameters(BaseNormalizedModel):
+    """
+    Configuration for the analytical input sensitivities (Greeks).
+
+    Attributes
+    ----------
+    enabled : bool
+        Whether to report the gradient of the intrinsic value.
+    """
+    enabled: bool = False
+
+
+class ReverseDCFParameters(BaseNormalizedModel):
+    """
+    Configuration for the market-implied (reverse DCF) solve.
+
+    Attributes
+    ----------
+    enabled : bool
+        Whether to solve IV(target) = current price.
+    target : Literal["growth", "terminal_growth", "wacc"]
+        Kernel input solved for: initial growth (growth_rate_p1 and
+        equivalents), perpetual growth, or the discount rate (WACC, Ke for
+        equity models).
+    """
+    enabled: bool = False
+    target: Literal["growth", "terminal_growth", "wacc"] = "growth"
+
+
 # ==============================================================================
 # 3. SCENARIOS & EXTENSIONS
 # ==============================================================================
@@ -181,6 +289,12 @@ class ExtensionBundleParameters(BaseModel):
         Stochastic simulation settings.
     sensitivity : SensitivityParameters
         Sensitivity heatmap settings.
+    tornado : TornadoParameters
+        One-at-a-time driver ranking settings.
+    greeks : GreeksParameters
+        Gradient of the intrinsic value settings.
+    reverse_dcf : ReverseDCFParameters
+        Market-implied growth / discount rate settings.
     scenarios : ScenariosParameters
         Multi-scenario analysis settings.
     backtest : BacktestParameters
@@ -192,6 +306,9 @@ class ExtensionBundleParameters(BaseModel):
     """
     monte_carlo: MCParameters = Field(default_factory=MCParameters)
     sensitivity: SensitivityParameters = Field(default_factory=SensitivityParameters)
+    tornado: TornadoParameters = Field(default_factory=TornadoParameters)
+    greeks: GreeksParameters = Field(default_factory=GreeksParameters)
+    reverse_dcf: ReverseDCFParameters = Field(default_factory=ReverseDCFParameters)
     scenarios: ScenariosParameters = Field(default_factory=ScenariosParameters)
     backtest: BacktestParameters = Field(default_factory=BacktestParameters)
     peers: PeersParameters = Field(default_factory=PeersParameters)
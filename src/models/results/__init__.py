@@ -11,6 +11,7 @@ from src.models.results.common import CommonResults, ResolvedCapital, ResolvedRa
 from src.models.results.options import (
     BacktestResults,
     ExtensionBundleResults,
+    MCConvergencePoint,
     MCResults,
     PeersResults,
     ScenariosResults,
@@ -51,6 +52,7 @@ __all__ = [
 
     # Options
     "ExtensionBundleResults",
+    "MCConvergencePoint",
     "MCResults",
     "SensitivityResults",
     "ScenariosResults",
@@ -23,6 +23,24 @@ from src.models.glass_box import CalculationStep
 # PILLAR 4: RISK ENGINEERING (Simulation, Sensitivity, Scenarios & Backtest)
 # ==============================================================================
 
+class MCConvergencePoint(BaseModel):
+    """
+    One checkpoint of an adaptive Monte Carlo run.
+
+    Attributes
+    ----------
+    paths : int
+        Paths simulated so far.
+    elapsed_s : float
+        Wall-clock time since the start of the run.
+    relative_half_widths : Dict[str, float]
+        95% confidence half-width over the estimate, for the mean and P10/P50/P90.
+    """
+    paths: int
+    elapsed_s: float
+    relative_half_widths: dict[str, float]
+
+
 class MCResults(BaseModel):
     """
     Statistical outputs of the Monte Carlo simulation.
@@ -37,11 +55,58 @@ class MCResults(BaseModel):
         Arithmetic average of all simulations.
     std_dev : float
         Standard deviation of the distribution (Volatility).
+    terminal_growth_violation_rate : float
+        Share of simulated paths where the terminal growth reaches the discount rate (g >= WACC).
+    scenario_mix : Dict[str, float]
+        Mixture mode only: share of the retained paths drawn from each scenario.
+    variance_reduction : str
+        Sampling scheme used for the run.
+    standard_errors : Dict[str, float]
+        Standard error of the mean and of P10/P50/P90 (spread of batch replications).
+    efficiency_gains : Dict[str, float]
+        Plain i.i.d. paths needed per path of this run for the same precision
+        ((SE_iid / SE)^2; above 1 means fewer paths are needed).
+    stop_reason : str | None
+        Adaptive mode: "tolerance", "time_budget" or "max_iterations".
+    achieved_precision : Dict[str, float]
+        Adaptive mode: final relative 95% half-widths per statistic.
+    convergence_trace : List[MCConvergencePoint]
+        Adaptive mode: precision after each batch.
+    flow_fan_chart : Dict[str, List[float]]
+        Path-dependent runs: P10/P50/P90 of the projected flows, one value per year.
+    growth_fan_chart : Dict[str, List[float]]
+        Path-dependent runs: P10/P50/P90 of the yearly growth rates.
     """
     simulation_values: list[float] = Field(..., description="Raw intrinsic values from all iterations.")
     quantiles: dict[str, float] = Field(..., description="Key probability points (P10, P50, P90).")
     mean: float = Field(..., description="Arithmetic average of all simulations.")
     std_dev: float = Field(..., description="Standard deviation of the distribution.")
+    terminal_growth_violation_rate: float = Field(
+        0.0, ge=0, le=1, description="Share of paths where g >= WACC (Gordon model diverges)."
+    )
+    scenario_mix: dict[str, float] = Field(
+        default_factory=dict, description="Share of retained paths per scenario (mixture mode)."
+    )
+    variance_reduction: str = Field("none", description="Sampling scheme used for the run.")
+    standard_errors: dict[str, float] = Field(
+        default_factory=dict, description="Standard errors of the mean and quantiles (batch replications)."
+    )
+    efficiency_gains: dict[str, float] = Field(
+        default_factory=dict, description="Equivalent i.i.d. paths per simulated path, per statistic."
+    )
+    stop_reason: str | None = Field(None, description="Why an adaptive run stopped.")
+    achieved_precision: dict[str, float] = Field(
+        default_factory=dict, description="Final relative 95% CI half-widths (adaptive mode)."
+    )
+    convergence_trace: list[MCConvergencePoint] = Field(
+        default_factory=list, description="Precision after each adaptive batch."
+    )
+    flow_fan_chart: dict[str, list[float]] = Field(
+        default_factory=dict, description="Yearly P10/P50/P90 of the projected flows (path-dependent runs)."
+    )
+    growth_fan_chart: dict[str, list[float]] = Field(
+        default_factory=dict, description="Yearly P10/P50/P90 of the growth rates (path-dependent runs)."
+    )
 
 
 class SensitivityResults(BaseModel):
@@ -74,6 +139,108 @@ class SensitivityResults(BaseModel):
     sensitivity_score: float = Field(0.0, description="Metric of volatility (Spread / Base).")
 
 
+class TornadoBar(BaseModel):
+    """
+    Impact of one driver moved down and up, all else equal.
+
+    Attributes
+    ----------
+    driver : str
+        Parameter name (e.g. 'beta', 'fcf_anchor', 'projection_years').
+    base_input : float
+        Resolved value of the driver.
+    low_input, high_input : float
+        Driver values of the down and up moves.
+    low_value, high_value : float
+        Intrinsic value per share for the down and up moves.
+    swing : float
+        |high_value - low_value|, the ranking key.
+    """
+    driver: str = Field(..., description="Parameter name.")
+    base_input: float = Field(..., description="Resolved value of the driver.")
+    low_input: float = Field(..., description="Driver value of the down move.")
+    high_input: float = Field(..., description="Driver value of the up move.")
+    low_value: float = Field(..., description="Intrinsic value for the down move.")
+    high_value: float = Field(..., description="Intrinsic value for the up move.")
+    swing: float = Field(..., ge=0, description="Absolute value range between the two moves.")
+
+
+class TornadoResults(BaseModel):
+    """
+    Output of the one-at-a-time sensitivity, ranked by impact.
+
+    Attributes
+    ----------
+    base_value : float
+        Intrinsic value per share of the unshocked case.
+    bars : List[TornadoBar]
+        One bar per driver, largest swing first.
+    vectorized : bool
+        True when every variant came from one batched kernel evaluation.
+    """
+    base_value: float = Field(..., description="Intrinsic value of the unshocked case.")
+    bars: list[TornadoBar] = Field(default_factory=list, description="Drivers ranked by swing.")
+    vectorized: bool = Field(False, description="Variants evaluated by the batched kernel.")
+
+
+class GreeksResults(BaseModel):
+    """
+    Value and gradient of the intrinsic value per share, from one evaluation.
+
+    Attributes
+    ----------
+    value : float
+        Intrinsic value per share.
+    method : str
+        'complex_step' (kernel differentiated in one batched call) or
+        'finite_difference' (central differences of `execute`).
+    input_gradient : Dict[str, float]
+        d(value) / d(kernel input) for every kernel input ('wacc', 'growth',
+        'base_flow', 'total_debt', ...); empty for finite differences.
+    gradient : Dict[str, float]
+        d(value) / d(driver) for every resolved driver ('beta',
+        'risk_free_rate', 'fcf_anchor', ...).
+    elasticities : Dict[str, float]
+        Relative sensitivities, gradient * driver / value.
+    """
+    value: float = Field(..., description="Intrinsic value per share.")
+    method: str = Field("complex_step", description="Differentiation method.")
+    input_gradient: dict[str, float] = Field(default_factory=dict, description="Derivatives per kernel input.")
+    gradient: dict[str, float] = Field(default_factory=dict, description="Derivatives per driver.")
+    elasticities: dict[str, float] = Field(default_factory=dict, description="Relative sensitivities per driver.")
+
+
+class ReverseDCFResults(BaseModel):
+    """
+    Market-implied value of one kernel input (reverse DCF).
+
+    Attributes
+    ----------
+    target : str
+        Kernel input solved for ('growth', 'terminal_growth' or 'wacc').
+    model_value : float | None
+        Value of the input in the resolved model.
+    implied_value : float | None
+        Input value at which the intrinsic value equals the market price;
+        None when the solve did not converge.
+    market_price : float
+        Price the intrinsic value was matched to.
+    converged : bool
+        True when |IV - price| fell within tolerance.
+    iterations : int
+        Newton / bisection iterations performed.
+    residual : float | None
+        IV - price at the last iterate.
+    """
+    target: str = Field(..., description="Kernel input solved for.")
+    model_value: float | None = Field(None, description="Input value in the resolved model.")
+    implied_value: float | None = Field(None, description="Market-implied input value.")
+    market_price: float = Field(..., description="Price matched by the solve.")
+    converged: bool = Field(False, description="Solve converged within tolerance.")
+    iterations: int = Field(0, ge=0, description="Iterations performed.")
+    residual: float | None = Field(None, description="IV - price at the last iterate.")
+
+
 class ScenarioOutcome(BaseModel):
     """
     Individual result of a specific deterministic case (Bull, Base, Bear).
@@ -237,6 +404,9 @@ class ExtensionBundleResults(BaseModel):
     # Pillar 4: Risk Engineering
     monte_carlo: MCResults | None = None
     sensitivity: SensitivityResults | None = None
+    tornado: TornadoResults | None = None
+    greeks: GreeksResults | None = None
+    reverse_dcf: ReverseDCFResults | None = None
     scenarios: ScenariosResults | None = None
     backtest: BacktestResults | None = None
 
@@ -41,6 +41,28 @@ class ValuationRequest(BaseModel):
         description="The complete bundle containing Identity, Common, Strategy, and Extensions."
     )
 
+class StageResourceUsage(BaseModel):
+    """
+    Resources consumed by one pipeline stage or extension.
+
+    Attributes
+    ----------
+    wall_time_ms : float
+        Elapsed wall-clock time.
+    cpu_time_ms : float
+        Process CPU time (all threads, including BLAS workers).
+    peak_memory_bytes : int
+        Peak traced memory above the level at stage entry (tracemalloc).
+    allocated_blocks : int
+        Net change in live allocated blocks (negative when the stage frees memory).
+    """
+    model_config = ConfigDict(frozen=True)
+
+    wall_time_ms: float = 0.0
+    cpu_time_ms: float = 0.0
+    peak_memory_bytes: int = 0
+    allocated_blocks: int = 0
+
 class ValuationRunMetadata(BaseModel):
     """
     Immutable provenance record for every valuation run.
@@ -63,6 +85,13 @@ class ValuationRunMetadata(BaseModel):
         SHA-256 hash of serialized DCFParameters for change detection.
     execution_time_ms : int, optional
         Execution time in milliseconds.
+    cpu_time_ms : float, optional
+        Process CPU time of the run (resource accounting only).
+    peak_memory_bytes : int, optional
+        Peak traced memory of the run (resource accounting only).
+    stage_resources : dict[str, StageResourceUsage]
+        Per-stage usage keyed by stage name (e.g. "strategy", "extension.monte_carlo").
+        Empty unless resource accounting is enabled.
     """
     model_config = ConfigDict(frozen=True, protected_namespaces=())
 
@@ -74,6 +103,9 @@ class ValuationRunMetadata(BaseModel):
     random_seed: int | None = None
     input_hash: str = ""
     execution_time_ms: int | None = None
+    cpu_time_ms: float | None = None
+    peak_memory_bytes: int | None = None
+    stage_resources: dict[str, StageResourceUsage] = Field(default_factory=dict)
 
 class AuditReport(BaseModel):
     """
@@ -11,13 +11,24 @@ Style: Numpy docstrings, type-safe, institutional-grade validations.
 
 from __future__ import annotations
 
+from collections.abc import Sequence
+from dataclasses import dataclass
 from typing import Any, Literal
 
+import numpy as np
 from pydantic import BaseModel, Field
 
 from src.models.company import Company
 from src.models.parameters.base_parameter import Parameters
 
+# Rule thresholds shared by the scalar checks and their vectorized counterparts.
+_TERMINAL_GROWTH_CLOSE_THRESHOLD = 0.005
+_ROIC_NEUTRAL_TOLERANCE = 0.01
+_DEFAULT_TAX_RATE = 0.21
+_MAX_DEBT_EQUITY_RATIO = 10.0
+_MAX_CASH_DEBT_RATIO = 5.0
+_PROBABILITY_SUM_TOLERANCE = 0.01
+
 
 class GuardrailCheckResult(BaseModel):
     """
@@ -101,7 +112,7 @@ def validate_terminal_growth(params: Parameters, wacc: float) -> GuardrailCheckR
         )
 
     # WARNING: g is very close to WACC (within 0.5%)
-    threshold = 0.005
+    threshold = _TERMINAL_GROWTH_CLOSE_THRESHOLD
     if wacc - g < threshold:
         return GuardrailCheckResult(
             type="warning",
@@ -172,7 +183,7 @@ def validate_roic_spread(
     cash = capital.cash_and_equivalents if capital.cash_and_equivalents else 0.0
     shares = capital.shares_outstanding if capital.shares_outstanding else 1.0
     price = financials.current_price
-    tax_rate = rates.tax_rate if rates.tax_rate else 0.21
+    tax_rate = rates.tax_rate if rates.tax_rate else _DEFAULT_TAX_RATE
 
     # Get EBIT from financials (if available)
     ebit = getattr(financials, "ebit_ttm", None)
@@ -224,7 +235,7 @@ def validate_roic_spread(
         )
 
     # INFO: ROIC approximately equals WACC (neutral)
-    tolerance = 0.01
+    tolerance = _ROIC_NEUTRAL_TOLERANCE
     if abs(roic - wacc) < tolerance:
         return GuardrailCheckResult(
             type="info",
@@ -310,7 +321,7 @@ def validate_capital_structure(
     market_equity = price * shares
     if market_equity > 0:
         debt_equity_ratio = total_debt / market_equity
-        if debt_equity_ratio > 10.0:
+        if debt_equity_ratio > _MAX_DEBT_EQUITY_RATIO:
             return GuardrailCheckResult(
                 type="warning",
                 message=f"Debt/Equity ratio ({debt_equity_ratio:.2f}x) is extremely high. "
@@ -324,7 +335,7 @@ def validate_capital_structure(
             )
 
     # WARNING: Excessive cash relative to debt
-    if total_debt > 0 and cash / total_debt > 5.0:
+    if total_debt > 0 and cash / total_debt > _MAX_CASH_DEBT_RATIO:
         return GuardrailCheckResult(
             type="warning",
             message=f"Cash ({cash:.2f}M) is {cash / total_debt:.2f}x total debt ({total_debt:.2f}M). "
@@ -394,7 +405,7 @@ def validate_scenario_probabilities(params: Parameters) -> GuardrailCheckResult:
     prob_sum = sum(probabilities)
 
     # Define tolerance
-    tolerance = 0.01
+    tolerance = _PROBABILITY_SUM_TOLERANCE
     lower_bound = 1.0 - tolerance
     upper_bound = 1.0 + tolerance
 
@@ -491,3 +502,432 @@ def _extract_growth_rate(strategy: Any) -> float | None:
         return strategy.terminal_value.perpetual_growth_rate
 
     return None
+
+
+# ==============================================================================
+# VECTORIZED COUNTERPARTS (BATCH SCREENING & MONTE CARLO PATHS)
+# ==============================================================================
+
+SEVERITY_INFO = 0
+SEVERITY_WARNING = 1
+SEVERITY_ERROR = 2
+SEVERITY_LABELS: tuple[str, ...] = ("info", "warning", "error")
+
+_TERMINAL_GROWTH_CODES: tuple[str, ...] = (
+    "GUARDRAIL_TERMINAL_GROWTH_NOT_SET",
+    "GUARDRAIL_TERMINAL_GROWTH_EXCEEDS_WACC",
+    "GUARDRAIL_TERMINAL_GROWTH_CLOSE_TO_WACC",
+    "GUARDRAIL_TERMINAL_GROWTH_OK",
+    "GUARDRAIL_TERMINAL_GROWTH_CONSERVATIVE",
+)
+_ROIC_CODES: tuple[str, ...] = (
+    "GUARDRAIL_ROIC_DATA_INSUFFICIENT",
+    "GUARDRAIL_ROIC_INVALID_CAPITAL",
+    "GUARDRAIL_ROIC_NO_GROWTH",
+    "GUARDRAIL_ROIC_BELOW_WACC_WITH_GROWTH",
+    "GUARDRAIL_ROIC_NEUTRAL",
+    "GUARDRAIL_ROIC_ABOVE_WACC",
+)
+_CAPITAL_CODES: tuple[str, ...] = (
+    "GUARDRAIL_CAPITAL_NEGATIVE_DEBT",
+    "GUARDRAIL_CAPITAL_NEGATIVE_CASH",
+    "GUARDRAIL_CAPITAL_INVALID_SHARES",
+    "GUARDRAIL_CAPITAL_EXTREME_DEBT_EQUITY",
+    "GUARDRAIL_CAPITAL_EXCESSIVE_CASH",
+    "GUARDRAIL_CAPITAL_OK",
+)
+_SCENARIO_CODES: tuple[str, ...] = (
+    "GUARDRAIL_SCENARIOS_NOT_ENABLED",
+    "GUARDRAIL_SCENARIOS_PROBABILITIES_INVALID_SUM",
+    "GUARDRAIL_SCENARIOS_PROBABILITIES_INEXACT",
+    "GUARDRAIL_SCENARIOS_PROBABILITIES_OK",
+)
+
+
+@dataclass(frozen=True)
+class GuardrailBatchResult:
+    """
+    Columnar outcome of one guardrail rule evaluated over N rows.
+
+    A row is either a company (batch screening) or a Monte Carlo path.
+    The rule precedence is identical to the scalar check, so row ``i`` carries
+    the same code and severity the scalar function would return for it.
+
+    Attributes
+    ----------
+    severity : np.ndarray
+        Integer array of shape (N,) holding SEVERITY_INFO, SEVERITY_WARNING or SEVERITY_ERROR.
+    code_index : np.ndarray
+        Integer array of shape (N,) indexing into ``code_labels``.
+    code_labels : tuple[str, ...]
+        Guardrail codes this rule can emit (same strings as the scalar check).
+    """
+
+    severity: np.ndarray
+    code_index: np.ndarray
+    code_labels: tuple[str, ...]
+
+    @property
+    def codes(self) -> np.ndarray:
+        """Object array of shape (N,) with the guardrail code of each row."""
+        return np.asarray(self.code_labels, dtype=object)[self.code_index]
+
+    @property
+    def types(self) -> np.ndarray:
+        """Object array of shape (N,) with 'info' / 'warning' / 'error' per row."""
+        return np.asarray(SEVERITY_LABELS, dtype=object)[self.severity]
+
+    @property
+    def is_blocking(self) -> np.ndarray:
+        """Boolean mask of rows carrying a blocking error."""
+        return self.severity == SEVERITY_ERROR
+
+    def mask(self, code: str) -> np.ndarray:
+        """Boolean mask of rows flagged with ``code``."""
+        if code not in self.code_labels:
+            return np.zeros(self.code_index.shape, dtype=bool)
+        return self.code_index == self.code_labels.index(code)
+
+    def share(self, severity: int = SEVERITY_ERROR) -> float:
+        """Fraction of rows at or above ``severity`` (0.0 for an empty batch)."""
+        if self.severity.size == 0:
+            return 0.0
+        return float(np.count_nonzero(self.severity >= severity) / self.severity.size)
+
+
+def _as_column(values: Any) -> np.ndarray:
+    """Converts a scalar or sequence into a float64 array (None → NaN)."""
+    return np.asarray(values, dtype=np.float64)
+
+
+def _or_default(values: np.ndarray, default: float) -> np.ndarray:
+    """Mirrors the scalar ``x if x else default`` idiom (None/NaN and 0 fall back)."""
+    return np.where(np.isnan(values) | (values == 0), default, values)
+
+
+def _select(
+    conditions: list[np.ndarray], severities: tuple[int, ...], labels: tuple[str, ...], shape: tuple[int, ...]
+) -> GuardrailBatchResult:
+    """
+    Resolves first-match precedence over ``conditions``; the last label is the default.
+    """
+    code_index = np.select(conditions, list(range(len(conditions))), default=len(conditions))
+    code_index = np.broadcast_to(code_index, shape).astype(np.int8)
+    severity = np.asarray(severities, dtype=np.int8)[code_index]
+    return GuardrailBatchResult(severity=severity, code_index=code_index, code_labels=labels)
+
+
+def validate_terminal_growth_batch(terminal_growth: Any, wacc: Any) -> GuardrailBatchResult:
+    """
+    Vectorized counterpart of `validate_terminal_growth`.
+
+    Parameters
+    ----------
+    terminal_growth : array_like
+        Perpetual growth rates, shape (N,). NaN (or None) means "not set".
+    wacc : array_like
+        Discount rates, shape (N,) or scalar (broadcast).
+
+    Returns
+    -------
+    GuardrailBatchResult
+        Per-row severity and code, same precedence as the scalar check.
+    """
+    g, w = np.broadcast_arrays(_as_column(terminal_growth), _as_column(wacc))
+    not_set = np.isnan(g)
+    with np.errstate(invalid="ignore"):
+        conditions = [
+            not_set,
+            g >= w,
+            (w - g) < _TERMINAL_GROWTH_CLOSE_THRESHOLD,
+            g > 0,
+        ]
+    return _select(
+        conditions,
+        (SEVERITY_INFO, SEVERITY_ERROR, SEVERITY_WARNING, SEVERITY_INFO, SEVERITY_INFO),
+        _TERMINAL_GROWTH_CODES,
+        g.shape,
+    )
+
+
+def validate_roic_spread_batch(
+    ebit: Any,
+    current_price: Any,
+    wacc: Any,
+    growth: Any,
+    tax_rate: Any = None,
+    total_debt: Any = None,
+    cash: Any = None,
+    shares_outstanding: Any = None,
+) -> GuardrailBatchResult:
+    """
+    Vectorized counterpart of `validate_roic_spread`.
+
+    Parameters
+    ----------
+    ebit : array_like
+        EBIT (TTM) per row; NaN means unavailable.
+    current_price : array_like
+        Share price per row.
+    wacc : array_like
+        Discount rate per row (or scalar).
+    growth : array_like
+        Primary growth rate per row (see `_extract_growth_rate`); NaN means none.
+    tax_rate, total_debt, cash, shares_outstanding : array_like, optional
+        Capital inputs. Missing or zero values take the same defaults as the
+        scalar check (tax 21%, debt 0, cash 0, shares 1).
+
+    Returns
+    -------
+    GuardrailBatchResult
+        Per-row severity and code, same precedence as the scalar check.
+    """
+    e, price, w, g = np.broadcast_arrays(
+        _as_column(ebit), _as_column(current_price), _as_column(wacc), _as_column(growth)
+    )
+    tax, debt, cash_v, shares = (
+        _or_default(np.broadcast_to(_as_column(values), e.shape), default)
+        for values, default in (
+            (tax_rate, _DEFAULT_TAX_RATE), (total_debt, 0.0), (cash, 0.0), (shares_outstanding, 1.0)
+        )
+    )
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        invested_capital = debt + price * shares - cash_v
+        roic = e * (1.0 - tax) / invested_capital
+        conditions = [
+            np.isnan(e) | (e <= 0),
+            invested_capital <= 0,
+            np.isnan(g) | (g <= 0),
+            roic < w,
+            np.abs(roic - w) < _ROIC_NEUTRAL_TOLERANCE,
+        ]
+    return _select(
+        conditions,
+        (SEVERITY_INFO, SEVERITY_INFO, SEVERITY_INFO, SEVERITY_WARNING, SEVERITY_INFO, SEVERITY_INFO),
+        _ROIC_CODES,
+        e.shape,
+    )
+
+
+def validate_capital_structure_batch(
+    total_debt: Any, cash: Any, shares_outstanding: Any, current_price: Any
+) -> GuardrailBatchResult:
+    """
+    Vectorized counterpart of `validate_capital_structure`.
+
+    Parameters
+    ----------
+    total_debt, cash : array_like
+        Balance sheet items per row; NaN is read as 0 (scalar default).
+    shares_outstanding : array_like
+        Share count per row; NaN or 0 is flagged as invalid.
+    current_price : array_like
+        Share price per row.
+
+    Returns
+    -------
+    GuardrailBatchResult
+        Per-row severity and code, same precedence as the scalar check.
+    """
+    debt, cash_v, shares, price = np.broadcast_arrays(
+        _or_default(_as_column(total_debt), 0.0),
+        _or_default(_as_column(cash), 0.0),
+        _as_column(shares_outstanding),
+        _as_column(current_price),
+    )
+    with np.errstate(invalid="ignore", divide="ignore"):
+        market_equity = price * shares
+        conditions = [
+            debt < 0,
+            cash_v < 0,
+            np.isnan(shares) | (shares <= 0),
+            (market_equity > 0) & (debt / market_equity > _MAX_DEBT_EQUITY_RATIO),
+            (debt > 0) & (cash_v / debt > _MAX_CASH_DEBT_RATIO),
+        ]
+    return _select(
+        conditions,
+        (SEVERITY_ERROR, SEVERITY_ERROR, SEVERITY_ERROR, SEVERITY_WARNING, SEVERITY_WARNING, SEVERITY_INFO),
+        _CAPITAL_CODES,
+        debt.shape,
+    )
+
+
+def validate_scenario_probabilities_batch(probabilities: Any, enabled: Any = True) -> GuardrailBatchResult:
+    """
+    Vectorized counterpart of `validate_scenario_probabilities`.
+
+    Parameters
+    ----------
+    probabilities : array_like
+        Matrix of shape (N, K): scenario probabilities per row, NaN-padded when
+        rows have fewer than K cases. A case without probability is passed as 0
+        (scalar behaviour); NaN inside a row also counts as 0.
+    enabled : array_like of bool, optional
+        Whether the scenarios extension is active for each row (default: all).
+        Rows with no case at all (every entry NaN) are treated as disabled.
+
+    Returns
+    -------
+    GuardrailBatchResult
+        Per-row severity and code, same precedence as the scalar check.
+
+    Notes
+    -----
+    Cases are accumulated column by column so the float sum matches the
+    scalar left-to-right ``sum()`` bit for bit; the INEXACT check relies on it.
+    """
+    p = _as_column(probabilities)
+    if p.ndim == 1:
+        p = p[np.newaxis, :]
+    n_rows, n_cases = p.shape
+
+    prob_sum = np.zeros(n_rows)
+    for k in range(n_cases):
+        prob_sum += np.nan_to_num(p[:, k], nan=0.0)
+
+    # A fully padded row has no case: INFO like the scalar check on an empty case list
+    has_cases = ~np.isnan(p).all(axis=1)
+    active = np.broadcast_to(np.asarray(enabled, dtype=bool), (n_rows,)) & has_cases
+
+    lower_bound = 1.0 - _PROBABILITY_SUM_TOLERANCE
+    upper_bound = 1.0 + _PROBABILITY_SUM_TOLERANCE
+    conditions = [
+        ~active,
+        (prob_sum < lower_bound) | (prob_sum > upper_bound),
+        prob_sum != 1.0,
+    ]
+    return _select(
+        conditions,
+        (SEVERITY_INFO, SEVERITY_ERROR, SEVERITY_WARNING, SEVERITY_INFO),
+        _SCENARIO_CODES,
+        (n_rows,),
+    )
+
+
+def combine_guardrail_severity(*results: GuardrailBatchResult) -> np.ndarray:
+    """
+    Worst severity per row across several batch results.
+
+    Parameters
+    ----------
+    *results : GuardrailBatchResult
+        Batch results over the same N rows.
+
+    Returns
+    -------
+    np.ndarray
+        Integer array of shape (N,); rows equal to SEVERITY_ERROR should be rejected.
+    """
+    if not results:
+        return np.zeros(0, dtype=np.int8)
+    return np.maximum.reduce([r.severity for r in results])
+
+
+def extract_guardrail_columns(
+    companies: Sequence[Company], params_list: Sequence[Parameters]
+) -> dict[str, np.ndarray]:
+    """
+    Gathers the guardrail inputs of N valuations into columns (None → NaN).
+
+    Parameters
+    ----------
+    companies : Sequence[Company]
+        Company identities, aligned with ``params_list``.
+    params_list : Sequence[Parameters]
+        Parameter sets, one per company.
+
+    Returns
+    -------
+    dict[str, np.ndarray]
+        Keys: terminal_growth, growth, ebit, current_price, tax_rate, total_debt,
+        cash, shares_outstanding (shape (N,)), scenario_probabilities (shape (N, K))
+        and scenarios_enabled (bool, shape (N,)).
+    """
+    if len(companies) != len(params_list):
+        raise ValueError("companies and params_list must have the same length.")
+
+    def _nan(value: Any) -> float:
+        return np.nan if value is None else float(value)
+
+    terminal_growth, growth, ebit, price = [], [], [], []
+    tax_rate, total_debt, cash, shares = [], [], [], []
+    probabilities: list[list[float]] = []
+    enabled: list[bool] = []
+
+    for company, params in zip(companies, params_list, strict=True):
+        strategy = params.strategy
+        tv = getattr(strategy, "terminal_value", None)
+        terminal_growth.append(_nan(tv.perpetual_growth_rate if tv else None))
+        growth.append(_nan(_extract_growth_rate(strategy)))
+        ebit.append(_nan(getattr(company, "ebit_ttm", None)))
+        price.append(_nan(company.current_price))
+
+        capital, rates = params.common.capital, params.common.rates
+        tax_rate.append(_nan(rates.tax_rate))
+        total_debt.append(_nan(capital.total_debt))
+        cash.append(_nan(capital.cash_and_equivalents))
+        shares.append(_nan(capital.shares_outstanding))
+
+        scenarios = params.extensions.scenarios
+        enabled.append(bool(scenarios.enabled and scenarios.cases))
+        # A case without probability counts as 0 (scalar check); NaN is left for padding
+        probabilities.append([case.probability if case.probability is not None else 0.0
+                              for case in scenarios.cases])
+
+    n_cases = max((len(row) for row in probabilities), default=0)
+    prob_matrix = np.full((len(probabilities), n_cases), np.nan)
+    for i, row in enumerate(probabilities):
+        prob_matrix[i, : len(row)] = row
+
+    return {
+        "terminal_growth": np.asarray(terminal_growth, dtype=np.float64),
+        "growth": np.asarray(growth, dtype=np.float64),
+        "ebit": np.asarray(ebit, dtype=np.float64),
+        "current_price": np.asarray(price, dtype=np.float64),
+        "tax_rate": np.asarray(tax_rate, dtype=np.float64),
+        "total_debt": np.asarray(total_debt, dtype=np.float64),
+        "cash": np.asarray(cash, dtype=np.float64),
+        "shares_outstanding": np.asarray(shares, dtype=np.float64),
+        "scenario_probabilities": prob_matrix,
+        "scenarios_enabled": np.asarray(enabled, dtype=bool),
+    }
+
+
+def run_guardrails_batch(
+    companies: Sequence[Company], params_list: Sequence[Parameters], wacc: Any
+) -> dict[str, GuardrailBatchResult]:
+    """
+    Runs the four economic guardrails over N valuations in one vectorized pass.
+
+    Parameters
+    ----------
+    companies : Sequence[Company]
+        Company identities, aligned with ``params_list``.
+    params_list : Sequence[Parameters]
+        Parameter sets, one per company.
+    wacc : array_like
+        Discount rate per row, or a single rate for the whole batch.
+
+    Returns
+    -------
+    dict[str, GuardrailBatchResult]
+        Keyed by 'terminal_growth', 'roic_spread', 'capital_structure' and
+        'scenario_probabilities'. Use `combine_guardrail_severity` to reject
+        rows before any strategy work.
+    """
+    cols = extract_guardrail_columns(companies, params_list)
+    return {
+        "terminal_growth": validate_terminal_growth_batch(cols["terminal_growth"], wacc),
+        "roic_spread": validate_roic_spread_batch(
+            cols["ebit"], cols["current_price"], wacc, cols["growth"],
+            tax_rate=cols["tax_rate"], total_debt=cols["total_debt"],
+            cash=cols["cash"], shares_outstanding=cols["shares_outstanding"],
+        ),
+        "capital_structure": validate_capital_structure_batch(
+            cols["total_debt"], cols["cash"], cols["shares_outstanding"], cols["current_price"]
+        ),
+        "scenario_probabilities": validate_scenario_probabilities_batch(
+            cols["scenario_probabilities"], cols["scenarios_enabled"]
+        ),
+    }
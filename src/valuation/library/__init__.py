@@ -8,12 +8,14 @@ Role: Facade for the valuation logic blocks.
 
 from src.valuation.library.common import CommonLibrary
 from src.valuation.library.dcf import DCFLibrary
+from src.valuation.library.dcf_vector import DCFVectorLibrary
 from src.valuation.library.graham import GrahamLibrary
 from src.valuation.library.rim import RIMLibrary
 
 __all__ = [
     "CommonLibrary",
     "DCFLibrary",
+    "DCFVectorLibrary",
     "GrahamLibrary",
     "RIMLibrary"
 ]
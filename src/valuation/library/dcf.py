@@ -43,12 +43,14 @@ class DCFLibrary:
     """
 
     @staticmethod
-    def project_flows_simple(
-        base_flow: float,
-        params: Parameters
-    ) -> tuple[list[float], CalculationStep]:
+    def resolve_projection_inputs(params: Parameters) -> tuple[float, float, int]:
         """
-        Projects cash flows using a standard growth rate with linear fade-down.
+        Resolves the growth inputs of the simple fade-down projection.
+
+        Returns
+        -------
+        tuple[float, float, int]
+            (g_start, g_term, years), with the library defaults applied.
         """
         # --- FIX: Access Strategy Parameters (Polymorphic) ---
         strat = params.strategy
@@ -66,6 +68,17 @@ class DCFLibrary:
 
         # Access Projection Years
         years = getattr(strat, "projection_years", None) or ModelDefaults.DEFAULT_PROJECTION_YEARS
+        return g_start, g_term, years
+
+    @staticmethod
+    def project_flows_simple(
+        base_flow: float,
+        params: Parameters
+    ) -> tuple[list[float], CalculationStep]:
+        """
+        Projects cash flows using a standard growth rate with linear fade-down.
+        """
+        g_start, g_term, years = DCFLibrary.resolve_projection_inputs(params)
 
         # 2. Projection Loop (Linear Convergence)
         flows = []
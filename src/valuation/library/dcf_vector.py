@@ -0,0 +1,289 @@
+"""
+src/valuation/library/dcf_vector.py
+
+VECTORIZED DCF LIBRARY
+======================
+Role: Array counterpart of `DCFLibrary` for the `execute_stochastic` kernels.
+Responsibilities:
+  - Flow Projection (linear fade-down, manual growth vector, revenue x margin,
+    time-varying growth paths and yearly flow noise)
+  - Terminal Value Calculation (Gordon / Exit Multiple)
+  - Discounting, Equity Bridge and Per-Share Value (SBC dilution)
+
+Architecture: Stateless Functional Library, one branch per `DCFLibrary` branch.
+Input: Per-path vectors (N,) for the shocked drivers + resolved Parameters.
+Output: Per-path values (N,); no CalculationSteps.
+
+Fed with the deterministic anchors, every function returns what its scalar
+twin returns, so a kernel built from this library reproduces `execute`.
+Projection matrices are time-major [T, N] workspace buffers (see
+`src.computation.workspace`).
+
+Style: Numpy docstrings.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+from src.computation.financial_math import (
+    apply_dilution_adjustment,
+    calculate_dilution_factor,
+    calculate_terminal_value_exit_multiple,
+)
+from src.computation.workspace import get_workspace
+from src.config.constants import ModelDefaults
+from src.models.enums import TerminalValueMethod
+from src.models.parameters.base_parameter import Parameters
+from src.valuation.library.dcf import DCFLibrary
+
+# Smallest (r - g) spread searched by the reverse DCF brackets. The Gordon
+# kernel itself is not floored: paths with g >= r are NaN (see
+# `compute_terminal_value`).
+GORDON_MIN_SPREAD = 0.001
+
+
+class DCFVectorLibrary:
+    """
+    Stateless vectorized mirror of `DCFLibrary`.
+    """
+
+    @staticmethod
+    def resolve_projection(params: Parameters) -> tuple[int, list[float] | None, float]:
+        """
+        Projection branch taken by `execute` (manual vector or fade-down).
+
+        Returns
+        -------
+        tuple[int, list[float] | None, float]
+            (years, manual growth vector or None, deterministic g_start).
+        """
+        g_start, _, years = DCFLibrary.resolve_projection_inputs(params)
+        manual_vector = getattr(params.strategy, "manual_growth_vector", None) or None
+        if manual_vector:
+            years = len(manual_vector)
+        return years, manual_vector, g_start
+
+    @staticmethod
+    def project_flows(
+            base_flow: np.ndarray,
+            g_start: np.ndarray,
+            g_term: np.ndarray,
+            years: int,
+            manual_vector: list[float] | None = None,
+            growth_centre: float = 0.0,
+            growth_path: np.ndarray | None = None,
+            flow_noise: np.ndarray | None = None,
+    ) -> np.ndarray:
+        """
+        Projects flows year by year, as `project_flows_simple` / `project_flows_manual`.
+
+        Parameters
+        ----------
+        base_flow : np.ndarray
+            Year-0 flow per path (N,).
+        g_start : np.ndarray
+            Initial growth per path (N,).
+        g_term : np.ndarray
+            Terminal growth per path (N,), the end point of the linear fade.
+        years : int
+            Projection horizon.
+        manual_vector : list[float], optional
+            Explicit growth for the first `len(manual_vector)` years. Each path
+            shifts it by its growth shock (g_start - growth_centre).
+        growth_centre : float, default 0.0
+            Deterministic initial growth the shock is measured from.
+        growth_path : np.ndarray, optional
+            Time-varying growth [>= years, N] (path-dependent Monte Carlo);
+            replaces the fade-down and the manual vector when given.
+        flow_noise : np.ndarray, optional
+            Transitory multiplicative factors [>= years, N] applied to each
+            year's flow after compounding (not carried into later years).
+
+        Returns
+        -------
+        np.ndarray
+            Workspace view [years, N] of projected flows.
+        """
+        for name, matrix in (("growth_path", growth_path), ("flow_noise", flow_noise)):
+            if matrix is not None and matrix.shape[0] < years:
+                raise ValueError(f"{name} covers {matrix.shape[0]} years, the projection needs {years}.")
+
+        flows = get_workspace().buffer("dcf.flows", (years, base_flow.shape[0]), base_flow.dtype)
+        manual = manual_vector or []
+        g_step = g_term - g_start
+
+        for t in range(years):
+            row = flows[t]
+            if growth_path is not None:
+                np.copyto(row, growth_path[t])
+            elif t < len(manual):
+                # Manual growth, shifted by the path's growth shock
+                np.subtract(g_start, growth_centre - manual[t], out=row)
+            elif years > 1:
+                # Linear convergence: g_t = g_start * (1 - alpha) + g_term * alpha
+                np.multiply(g_step, t / (years - 1), out=row)
+                row += g_start
+            else:
+                np.copyto(row, g_start)
+            row += 1.0
+            row *= flows[t - 1] if t > 0 else base_flow
+
+        if flow_noise is not None:
+            flows *= flow_noise[:years]
+        return flows
+
+    @staticmethod
+    def project_flows_revenue_model(
+            base_revenue: np.ndarray,
+            current_margin: float,
+            target_margin: float | np.ndarray,
+            g_start: np.ndarray,
+            g_term: np.ndarray,
+            years: int,
+            manual_vector: list[float] | None = None,
+            growth_centre: float = 0.0,
+            growth_path: np.ndarray | None = None,
+            flow_noise: np.ndarray | None = None,
+    ) -> np.ndarray:
+        """
+        FCF = projected revenue x converging margin, as `project_flows_revenue_model`.
+
+        Parameters
+        ----------
+        base_revenue : np.ndarray
+            Year-0 revenue per path (N,).
+        current_margin : float
+            Current FCF margin (start of the convergence).
+        target_margin : float or np.ndarray
+            Margin reached in the final year, scalar or per path (N,).
+        g_start, g_term, years, manual_vector, growth_centre, growth_path, flow_noise
+            See `project_flows`; the manual vector may be shorter than the horizon.
+
+        Returns
+        -------
+        np.ndarray
+            Workspace view [years, N] of projected FCF.
+        """
+        flows = DCFVectorLibrary.project_flows(
+            base_revenue, g_start, g_term, years, manual_vector, growth_centre, growth_path, flow_noise)
+        progress = np.arange(1, years + 1, dtype=flows.dtype)[:, np.newaxis] / years
+
+        if np.ndim(target_margin) == 0:
+            flows *= current_margin * (1 - progress) + float(target_margin) * progress
+        else:
+            margins = get_workspace().buffer("dcf.margins", flows.shape, flows.dtype)
+            np.multiply(progress, target_margin, out=margins)
+            margins += current_margin * (1 - progress)
+            flows *= margins
+        return flows
+
+    @staticmethod
+    def compute_terminal_value(
+            final_flow: np.ndarray,
+            discount_rate: np.ndarray,
+            g_perp: np.ndarray,
+            params: Parameters
+    ) -> np.ndarray:
+        """
+        Terminal value per path for the strategy's TV method (Gordon or exit multiple).
+
+        Parameters
+        ----------
+        final_flow : np.ndarray
+            Last projected flow (N,).
+        discount_rate : np.ndarray
+            WACC or Ke per path (N,).
+        g_perp : np.ndarray
+            Perpetual growth per path (N,); unused by the exit multiple.
+        params : Parameters
+            Supplies the TV method and exit multiple.
+
+        Returns
+        -------
+        np.ndarray
+            Terminal value at year n (N,). Gordon paths with rate <= g are NaN,
+            where `DCFLibrary.calculate_terminal_value_gordon` raises, so that
+            callers drop them.
+        """
+        tv_params = params.strategy.terminal_value
+        method = tv_params.method or TerminalValueMethod.GORDON_GROWTH
+
+        if method == TerminalValueMethod.GORDON_GROWTH:
+            spread = discount_rate - g_perp
+            with np.errstate(divide='ignore', invalid='ignore'):
+                # Real part: complex-step inputs carry the perturbation in the imaginary part
+                tv: np.ndarray = np.where(np.real(spread) > 0, final_flow * (1.0 + g_perp) / spread, np.nan)
+            return tv
+
+        multiple = tv_params.exit_multiple or ModelDefaults.DEFAULT_EXIT_MULTIPLE
+        exit_tv: np.ndarray = calculate_terminal_value_exit_multiple(final_flow, multiple)
+        return exit_tv
+
+    @staticmethod
+    def compute_discounting(
+            flows: np.ndarray,
+            terminal_value: np.ndarray,
+            discount_rate: np.ndarray
+    ) -> np.ndarray:
+        """
+        NPV of the explicit flows plus PV of the terminal value, per path.
+
+        Parameters
+        ----------
+        flows : np.ndarray
+            Projected flows [years, N] (left untouched).
+        terminal_value : np.ndarray
+            Terminal value at year n (N,).
+        discount_rate : np.ndarray
+            Discount rate per path (N,).
+
+        Returns
+        -------
+        np.ndarray
+            Enterprise (or equity) value (N,).
+        """
+        factors = get_workspace().compound_factors("dcf.discount", discount_rate, flows.shape[0], inverse=True)
+        total: np.ndarray = np.einsum("tn,tn->n", flows, factors)
+        total += terminal_value * factors[-1]
+        return total
+
+    @staticmethod
+    def compute_equity_bridge(
+            enterprise_value: np.ndarray,
+            params: Parameters,
+            total_debt: np.ndarray | None = None,
+            cash: np.ndarray | None = None,
+    ) -> np.ndarray:
+        """
+        EV - Debt + Cash - Minorities - Pensions, as `CommonLibrary.compute_equity_bridge`.
+
+        `total_debt` and `cash`, when given, are per-path values (N,) that
+        replace the resolved capital structure (batched sensitivity runs).
+        """
+        cap = params.common.capital
+        debt = (cap.total_debt or 0.0) if total_debt is None else total_debt
+        cash_value = (cap.cash_and_equivalents or 0.0) if cash is None else cash
+        claims = debt - cash_value + (cap.minority_interests or 0.0) + (cap.pension_provisions or 0.0)
+        equity: np.ndarray = enterprise_value - claims
+        return equity
+
+    @staticmethod
+    def compute_value_per_share(
+            equity_value: np.ndarray,
+            params: Parameters,
+            shares: np.ndarray | None = None,
+    ) -> np.ndarray:
+        """
+        Value per share net of SBC dilution, as `DCFLibrary.compute_value_per_share`.
+
+        `shares`, when given, is a per-path share count (N,) replacing the resolved one.
+        """
+        if shares is None:
+            shares = params.common.capital.shares_outstanding or ModelDefaults.DEFAULT_SHARES_OUTSTANDING
+        dilution_rate = params.common.capital.annual_dilution_rate or 0.0
+        years = getattr(params.strategy, "projection_years", ModelDefaults.DEFAULT_PROJECTION_YEARS)
+
+        dilution_factor = calculate_dilution_factor(dilution_rate, years)
+        iv: np.ndarray = apply_dilution_adjustment(equity_value / shares, dilution_factor)
+        return iv
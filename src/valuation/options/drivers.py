@@ -0,0 +1,140 @@
+"""
+src/valuation/options/drivers.py
+
+VALUATION DRIVERS
+=================
+Role: Shared catalogue of the numeric inputs a valuation can be moved along
+(rates, growth, anchor flow, capital structure, horizon), used by the
+one-at-a-time sensitivity runners (Tornado, Greeks).
+Logic: A driver is located on the resolved Parameters by owner and first
+defined candidate attribute, set in place on a working copy, and translated
+into the inputs of the strategy's vectorized kernel (`stochastic_anchors`
+plus the per-path capital-structure vectors).
+Architecture: Stateless helpers.
+
+Style: Numpy docstrings.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import Any
+
+from src.config.constants import ModelDefaults
+from src.models.company import Company
+from src.models.parameters.base_parameter import Parameters
+from src.valuation.strategies.interface import IValuationRunner
+
+# Driver table: (owner, candidate attributes, shock kind). The first candidate
+# the owner defines is the driver. "relative" drivers move proportionally,
+# "rate" drivers additively and "years" drivers by whole years.
+DRIVERS: tuple[tuple[str, tuple[str, ...], str], ...] = (
+    ("rates", ("beta",), "relative"),
+    ("rates", ("risk_free_rate",), "rate"),
+    ("rates", ("market_risk_premium",), "rate"),
+    ("rates", ("tax_rate",), "rate"),
+    ("strategy", ("growth_rate_p1", "growth_rate", "revenue_growth_rate", "growth_estimate"), "rate"),
+    ("terminal_value", ("perpetual_growth_rate",), "rate"),
+    ("strategy", ("fcf_anchor", "fcf_norm", "fcfe_anchor", "revenue_ttm", "dividend_per_share", "eps_normalized"),
+     "relative"),
+    ("capital", ("total_debt",), "relative"),
+    ("capital", ("cash_and_equivalents",), "relative"),
+    ("capital", ("shares_outstanding",), "relative"),
+    ("strategy", ("projection_years",), "years"),
+)
+
+# Kernel anchor holding the effective value of a driver left unset (execute applies the same default).
+ANCHOR_FALLBACKS = {
+    "growth_rate_p1": "growth",
+    "growth_rate": "growth",
+    "revenue_growth_rate": "growth",
+    "growth_estimate": "growth",
+    "perpetual_growth_rate": "terminal_growth",
+}
+
+# Capital-structure drivers passed to the kernel as per-path vectors.
+CAPITAL_KEYS = ("total_debt", "cash_and_equivalents", "shares_outstanding")
+
+Driver = tuple[str, str, str, float]  # (owner, attribute, kind, base value)
+
+
+def driver_owner(params: Parameters, owner: str) -> Any:
+    """Parameter block holding the drivers of an owner key."""
+    if owner == "rates":
+        return params.common.rates
+    if owner == "capital":
+        return params.common.capital
+    if owner == "terminal_value":
+        return getattr(params.strategy, 'terminal_value', None)
+    return params.strategy
+
+
+def collect_drivers(strategy: IValuationRunner, params: Parameters, financials: Company) -> list[Driver]:
+    """
+    Drivers the strategy defines, with their effective base values.
+
+    Parameters
+    ----------
+    strategy : IValuationRunner
+        Engine whose `stochastic_anchors` resolve the defaults of unset drivers.
+    params : Parameters
+        Resolved parameters.
+    financials : Company
+        The financial dataset used for valuation.
+
+    Returns
+    -------
+    list[Driver]
+        One entry per defined driver, in `DRIVERS` order (unset drivers with
+        no kernel default are skipped).
+    """
+    anchors_fn = getattr(strategy, 'stochastic_anchors', None)
+    anchors = anchors_fn(financials, params) if anchors_fn is not None else {}
+
+    drivers: list[Driver] = []
+    for owner_key, candidates, kind in DRIVERS:
+        owner = driver_owner(params, owner_key)
+        attribute = next((name for name in candidates if owner is not None and hasattr(owner, name)), None)
+        if attribute is None:
+            continue
+        base = getattr(owner, attribute)
+        if base is None and kind == "years":
+            base = ModelDefaults.DEFAULT_PROJECTION_YEARS
+        elif base is None and ANCHOR_FALLBACKS.get(attribute) in anchors:
+            base = anchors[ANCHOR_FALLBACKS[attribute]]
+        if base is None:
+            continue
+        drivers.append((owner_key, attribute, kind, float(base)))
+    return drivers
+
+
+@contextmanager
+def applied_driver(params: Parameters, driver: Driver, value: float) -> Iterator[None]:
+    """Sets one driver on a working copy for the duration of the block."""
+    owner_key, attribute, kind, _ = driver
+    owner = driver_owner(params, owner_key)
+    previous = getattr(owner, attribute)
+    setattr(owner, attribute, int(value) if kind == "years" else value)
+    try:
+        yield
+    finally:
+        setattr(owner, attribute, previous)
+
+
+def kernel_inputs(anchors_fn: Any, params: Parameters, financials: Company) -> tuple[dict[str, float], int]:
+    """
+    Kernel inputs of the current working copy, and its projection horizon.
+
+    Returns
+    -------
+    tuple[dict[str, float], int]
+        (`stochastic_anchors` plus the `CAPITAL_KEYS` values, projection years).
+    """
+    inputs = {key: float(value) for key, value in anchors_fn(financials, params).items()}
+    cap = params.common.capital
+    inputs['total_debt'] = cap.total_debt or 0.0
+    inputs['cash_and_equivalents'] = cap.cash_and_equivalents or 0.0
+    inputs['shares_outstanding'] = cap.shares_outstanding or ModelDefaults.DEFAULT_SHARES_OUTSTANDING
+    years = getattr(params.strategy, 'projection_years', None) or ModelDefaults.DEFAULT_PROJECTION_YEARS
+    return inputs, years
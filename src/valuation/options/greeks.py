@@ -0,0 +1,289 @@
+"""
+src/valuation/options/greeks.py
+
+GREEKS RUNNER
+=============
+Role: Returns the intrinsic value per share together with its gradient with
+respect to every kernel input and every numeric driver, for risk attribution.
+Drivers: see `src.valuation.options.drivers` (the projection horizon, an
+integer, is left out).
+Logic: Forward-mode differentiation of the vectorized kernel by complex step:
+row 0 of a single complex `execute_stochastic` call is the base case, row
+1 + k carries an imaginary step ih on kernel input k, so that
+d(value)/d(input k) = Im(value_k) / h, exact to machine precision (no
+subtractive cancellation). Driver derivatives follow by the chain rule: the
+input gradient is applied to the change of the scalar `stochastic_anchors`
+over a central-difference bracket of the driver, plus the kernel's direct
+dependence on the parameters (e.g. the current margin of the revenue model),
+measured by two one-row kernel calls on the base inputs at the bracket ends.
+So one complex call gives the input gradient, then each driver costs two
+anchor resolutions and two kernel calls.
+Architecture: Runner Pattern.
+
+Fast path contract: as `ScenariosRunner`, the real part of the base row must
+match `execute` within `PARITY_RTOL`; any strategy whose kernel passes (RIM
+included, when its book value anchor is set) uses the complex step.
+Otherwise (a kernel that drifts from `execute`, or a strategy without
+kernel) the driver gradient comes from central differences of `execute` and
+the input gradient is left empty.
+
+Style: Numpy docstrings.
+"""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Mapping
+from typing import Any
+
+import numpy as np
+
+from src.config.constants import SensitivityDefaults
+from src.core.exceptions import CalculationError
+from src.models.company import Company
+from src.models.parameters.base_parameter import Parameters
+from src.models.results.options import GreeksResults
+from src.valuation.options.drivers import Driver, applied_driver, collect_drivers, kernel_inputs
+from src.valuation.options.scenarios import PARITY_RTOL
+from src.valuation.strategies.interface import IValuationRunner
+
+logger = logging.getLogger(__name__)
+
+# Errors that send a strategy to the finite-difference fallback.
+KERNEL_ERRORS = (CalculationError, ValueError, AttributeError, TypeError, KeyError, ZeroDivisionError)
+
+
+class GreeksRunner:
+    """
+    Orchestrates the value-and-gradient evaluation of a valuation.
+
+    Attributes
+    ----------
+    strategy : IValuationRunner
+        The valuation engine being differentiated.
+    """
+
+    def __init__(self, strategy: IValuationRunner):
+        self.strategy = strategy
+
+    def execute(self, params: Parameters, financials: Company) -> GreeksResults | None:
+        """
+        Computes the Greeks when enabled in the extension settings.
+
+        Parameters
+        ----------
+        params : Parameters
+            Resolved parameters (left untouched).
+        financials : Company
+            The financial dataset used for valuation.
+
+        Returns
+        -------
+        GreeksResults | None
+            Value and gradients, or None if disabled or if the base case cannot
+            be valued.
+        """
+        if not params.extensions.greeks.enabled:
+            return None
+        return self.compute(params, financials)
+
+    def compute(self, params: Parameters, financials: Company) -> GreeksResults | None:
+        """
+        Value and gradient of the intrinsic value per share, regardless of the settings.
+
+        Parameters
+        ----------
+        params : Parameters
+            Resolved parameters (left untouched).
+        financials : Company
+            The financial dataset used for valuation.
+
+        Returns
+        -------
+        GreeksResults | None
+            None if the base case cannot be valued.
+        """
+        work = params.model_copy(deep=True)
+        drivers = [d for d in collect_drivers(self.strategy, work, financials) if d[2] != "years"]
+
+        original_audit_state = getattr(self.strategy, 'glass_box_enabled', True)
+        self.strategy.glass_box_enabled = False
+        try:
+            result = self._complex_step(work, financials, drivers)
+            if result is None:
+                result = self._finite_difference(work, financials, drivers)
+        finally:
+            self.strategy.glass_box_enabled = original_audit_state
+        return result
+
+    def execute_many(self, cases: Mapping[str, tuple[Parameters, Company]]) -> dict[str, GreeksResults]:
+        """
+        Greeks of several tickers valued with this runner's strategy.
+
+        Parameters
+        ----------
+        cases : Mapping[str, tuple[Parameters, Company]]
+            Resolved parameters and financials per ticker.
+
+        Returns
+        -------
+        dict[str, GreeksResults]
+            Results per ticker; tickers whose base case cannot be valued are omitted.
+        """
+        results: dict[str, GreeksResults] = {}
+        for ticker, (params, financials) in cases.items():
+            greeks = self.compute(params, financials)
+            if greeks is not None:
+                results[ticker] = greeks
+        return results
+
+    @staticmethod
+    def attribution_matrix(
+            results: Mapping[str, GreeksResults],
+            field: str = "elasticities",
+    ) -> tuple[list[str], list[str], np.ndarray]:
+        """
+        Stacks per-ticker sensitivities into a [tickers, drivers] matrix.
+
+        Parameters
+        ----------
+        results : Mapping[str, GreeksResults]
+            Greeks per ticker (e.g. from `execute_many`).
+        field : str, default "elasticities"
+            'elasticities', 'gradient' or 'input_gradient'.
+
+        Returns
+        -------
+        tuple[list[str], list[str], np.ndarray]
+            (tickers, drivers, matrix). Drivers are the union over tickers in
+            first-seen order; a driver a ticker does not define is NaN.
+        """
+        tickers = list(results)
+        drivers: list[str] = []
+        for greeks in results.values():
+            drivers.extend(name for name in getattr(greeks, field) if name not in drivers)
+
+        matrix = np.full((len(tickers), len(drivers)), np.nan)
+        for i, ticker in enumerate(tickers):
+            values = getattr(results[ticker], field)
+            for j, name in enumerate(drivers):
+                if name in values:
+                    matrix[i, j] = values[name]
+        return tickers, drivers, matrix
+
+    # =========================================================================
+    # DIFFERENTIATION PATHS
+    # =========================================================================
+
+    def _complex_step(self, work: Parameters, financials: Company, drivers: list[Driver]) -> GreeksResults | None:
+        """Kernel path: complex-step input gradient, chain rule onto the drivers."""
+        anchors_fn = getattr(self.strategy, 'stochastic_anchors', None)
+        kernel = getattr(self.strategy, 'execute_stochastic', None)
+        if anchors_fn is None or kernel is None:
+            return None
+
+        try:
+            inputs, _ = kernel_inputs(anchors_fn, work, financials)
+            value, input_gradient = self._input_gradient(kernel, financials, work, inputs)
+
+            reference = self.strategy.execute(financials, work).results.common.intrinsic_value_per_share
+            if not np.isclose(value, reference, rtol=PARITY_RTOL, atol=PARITY_RTOL):
+                logger.debug("[Greeks] %s kernel differs from execute (%.6f vs %.6f), using finite differences.",
+                             type(self.strategy).__name__, value, reference)
+                return None
+
+            base_vectors = {key: np.array([x]) for key, x in inputs.items()}
+            gradient = {}
+            for driver in drivers:
+                down, up = self._bracket(driver)
+                rows, direct = [], []
+                for x in (down, up):
+                    with applied_driver(work, driver, x):
+                        rows.append(kernel_inputs(anchors_fn, work, financials)[0])
+                        direct.append(float(kernel(financials, work, base_vectors)[0]))
+                through_inputs = sum(input_gradient[key] * (rows[1][key] - rows[0][key]) for key in input_gradient)
+                gradient[driver[1]] = (through_inputs + direct[1] - direct[0]) / (up - down)
+        except KERNEL_ERRORS as e:
+            logger.debug("[Greeks] Complex-step path unavailable: %s", e)
+            return None
+
+        return self._package(value, "complex_step", input_gradient, gradient, drivers)
+
+    @staticmethod
+    def _input_gradient(
+            kernel: Any,
+            financials: Company,
+            work: Parameters,
+            inputs: dict[str, float],
+    ) -> tuple[float, dict[str, float]]:
+        """
+        Value and d(value)/d(input) for every kernel input, in one complex kernel call.
+
+        Returns
+        -------
+        tuple[float, dict[str, float]]
+            (real part of the base row, derivative per kernel input).
+        """
+        keys = list(inputs)
+        h = SensitivityDefaults.GREEKS_COMPLEX_STEP
+        vectors = {key: np.full(len(keys) + 1, inputs[key], dtype=np.complex128) for key in keys}
+        for k, key in enumerate(keys):
+            vectors[key][1 + k] += 1j * h
+
+        values = np.asarray(kernel(financials, work, vectors))
+        return float(values[0].real), {key: float(values[1 + k].imag / h) for k, key in enumerate(keys)}
+
+    def _finite_difference(self, work: Parameters, financials: Company,
+                           drivers: list[Driver]) -> GreeksResults | None:
+        """Fallback: central differences of `execute`, two runs per driver."""
+        try:
+            value = self.strategy.execute(financials, work).results.common.intrinsic_value_per_share
+        except KERNEL_ERRORS as e:
+            logger.warning("[Greeks] Base case could not be valued: %s", e)
+            return None
+
+        gradient = {}
+        for driver in drivers:
+            down, up = self._bracket(driver)
+            try:
+                bumped = []
+                for x in (down, up):
+                    with applied_driver(work, driver, x):
+                        bumped.append(self.strategy.execute(financials, work).results.common.intrinsic_value_per_share)
+            except KERNEL_ERRORS as e:
+                logger.debug("[Greeks] Driver '%s' skipped: %s", driver[1], e)
+                continue
+            gradient[driver[1]] = (bumped[1] - bumped[0]) / (up - down)
+
+        return self._package(value, "finite_difference", {}, gradient, drivers)
+
+    # =========================================================================
+    # HELPERS
+    # =========================================================================
+
+    @staticmethod
+    def _bracket(driver: Driver) -> tuple[float, float]:
+        """(down, up) points of the central difference; levels are not taken below zero."""
+        _, _, kind, base = driver
+        step = SensitivityDefaults.GREEKS_FD_STEP * max(abs(base), 1.0)
+        down = base - step
+        if kind == "relative" and base >= 0.0:
+            down = max(down, 0.0)
+        return down, base + step
+
+    @staticmethod
+    def _package(
+            value: float,
+            method: str,
+            input_gradient: dict[str, float],
+            gradient: dict[str, float],
+            drivers: list[Driver],
+    ) -> GreeksResults | None:
+        """Builds the results, with elasticities relative to the value."""
+        if not np.isfinite(value):
+            logger.warning("[Greeks] Base case could not be valued.")
+            return None
+        bases = {driver[1]: driver[3] for driver in drivers}
+        elasticities = {name: d * bases[name] / value for name, d in gradient.items()} if value != 0.0 else {}
+        return GreeksResults(value=float(value), method=method, input_gradient=input_gradient,
+                             gradient=gradient, elasticities=elasticities)
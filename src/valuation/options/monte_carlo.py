@@ -5,24 +5,78 @@ MONTE CARLO SIMULATION ENGINE
 =============================
 Role: Orchestrates stochastic simulations using efficient vectorization.
 Architecture: Fast-Path NumPy implementation (No loops).
+
+Mixture mode (`MCParameters.scenario_mixture`): each path draws one of the
+defined scenarios by probability, then that case's overrides re-center the
+shocked vectors. One kernel call yields the probability-weighted distribution.
+
+Variance reduction (`MCParameters.variance_reduction`):
+- "antithetic": every standard normal draw z is paired with -z;
+- "sobol": randomised Sobol points mapped through the inverse normal CDF;
+- "control_variate": the kernel linearised around the mean inputs is the
+  control (known expectation: the kernel's deterministic value), applied to
+  the mean and, through reweighting, to the quantiles.
+Standard errors come from contiguous batches of paths (independent
+replications of the sampler); `efficiency_gains` compares them with the
+plain i.i.d. error of the same sample size.
+
+Precision (`MCParameters.precision`): "float32" draws and values every
+path in single precision (half the memory traffic and peak RAM of the
+[N_SIMS, YEARS] kernel matrices); summary statistics stay in float64.
+
+Path-dependent mode (`MCParameters.growth_process = "ar1"` and/or
+`flow_noise_volatility > 0`): time-major [YEARS, N_SIMS] matrices of
+mean-reverting growth and transitory flow noise are drawn in one block and
+consumed by the kernels that expose `stochastic_flows`; the yearly quantiles
+of the projected flows and growth rates are reported as fan charts.
+
+Adaptive mode (`MCParameters.adaptive`): batches of
+`MonteCarloDefaults.ADAPTIVE_BATCH_SIZE` paths, each seeded from its own
+`SeedSequence` child, run until the 95% confidence intervals of the mean and
+P10/P50/P90 meet the relative tolerance, the time budget expires or the path
+cap is reached. The convergence trace is reported in `MCResults`.
+
+Centring: the base flow, growth and terminal growth draws are centred on the
+strategy's `stochastic_anchors`, and the discount rate on its anchor rate
+(WACC, or Ke for equity models) moved by the beta draws, so that a run with
+vanishing volatilities returns the `execute` value. Strategies without
+anchors keep generic centres.
 """
 
 from __future__ import annotations
 
 import logging
+import time
+from typing import Any
 
 import numpy as np
 
 from src.computation.financial_math import calculate_cost_of_equity_capm
+from src.computation.quasi_random import inverse_normal_cdf, sobol_points
+from src.computation.statistics import (
+    CorrelatedShockSampler,
+    control_variate_weights,
+    iid_quantile_standard_error,
+    weighted_quantiles,
+)
 from src.config.constants import MacroDefaults, ModelDefaults, MonteCarloDefaults
 from src.core.exceptions import CalculationError
+from src.core.tracing import tracer
 from src.models.company import Company
 from src.models.parameters.base_parameter import Parameters
-from src.models.results.options import MCResults
+from src.models.results.options import MCConvergencePoint, MCResults
+from src.valuation.guardrails import SEVERITY_ERROR, validate_terminal_growth_batch
+from src.valuation.options.drivers import applied_driver
+from src.valuation.options.scenarios import ScenariosRunner
 from src.valuation.strategies.interface import IValuationRunner
 
 logger = logging.getLogger(__name__)
 
+QUANTILE_LEVELS = {"P10": 0.10, "P50": 0.50, "P90": 0.90}
+
+# Index of the seed substream of the path matrices (scenario draws use child 0).
+PATH_STREAM = 1
+
 
 class MonteCarloRunner:
     """Orchestrates the stochastic simulation lifecycle."""
@@ -35,9 +89,22 @@ class MonteCarloRunner:
         if not mc_cfg or not mc_cfg.enabled:
             return None
 
-        num_simulations = mc_cfg.iterations or MonteCarloDefaults.DEFAULT_SIMULATIONS
         seed = mc_cfg.random_seed if mc_cfg.random_seed is not None else 42
+        ctx = self._rate_context(params, financials)
+
+        if mc_cfg.adaptive:
+            return self._execute_adaptive(params, financials, seed, ctx)
 
+        num_simulations = mc_cfg.iterations or MonteCarloDefaults.DEFAULT_SIMULATIONS
+        batch = self._simulate(params, financials, num_simulations, seed, ctx)
+        return self._package(params, [batch])
+
+    # =========================================================================
+    # SIMULATION
+    # =========================================================================
+
+    def _rate_context(self, params: Parameters, financials: Company) -> dict[str, Any]:
+        """Discount-rate inputs and kernel anchors shared by every batch of a run."""
         # 1. Establish Baselines & Economic Guardrails
         # --------------------------------------------
         r = params.common.rates
@@ -63,7 +130,7 @@ class MonteCarloRunner:
             if base_wacc <= 0:
                 base_wacc = ModelDefaults.DEFAULT_WACC
         except (ArithmeticError, TypeError, ValueError) as e:
-            logger.warning(f"Failed to calculate base WACC for MC clamping, using default: {e}")
+            logger.warning("Failed to calculate base WACC for MC clamping, using default: %s", e)
             base_wacc = ModelDefaults.DEFAULT_WACC
 
         # --- FIX: Dynamic Calculation of Weights & Cost of Debt (Local Fix) ---
@@ -89,59 +156,518 @@ class MonteCarloRunner:
         kd_post_tax = kd_pre_tax * (1 - tax_rate)
         # -----------------------------------------------------------
 
+        anchors, rate_beta_slope = self._kernel_anchors(params, financials, beta_base)
+
+        return {
+            'rf': rf,
+            'mrp': mrp,
+            'beta_base': beta_base,
+            'base_wacc': base_wacc,
+            'weight_e': weight_e,
+            'weight_d': weight_d,
+            'kd_post_tax': kd_post_tax,
+            'anchors': anchors,
+            'rate_beta_slope': rate_beta_slope,
+        }
+
+    def _kernel_anchors(
+            self,
+            params: Parameters,
+            financials: Company,
+            beta_base: float,
+    ) -> tuple[dict[str, float] | None, float]:
+        """
+        Deterministic centre of the draws and slope of the discount rate in beta.
+
+        Returns
+        -------
+        tuple[dict[str, float] | None, float]
+            The strategy's `stochastic_anchors` (None without anchors, or if
+            they cannot be resolved) and the change of its anchor rate per unit
+            of beta.
+        """
+        anchors_fn = getattr(self.strategy, 'stochastic_anchors', None)
+        if anchors_fn is None:
+            return None, 0.0
+        beta_driver = ("rates", "beta", "relative", beta_base)
+        try:
+            anchors = {key: float(value) for key, value in anchors_fn(financials, params).items()}
+            # CAPM then the WACC weights: the rate is linear in beta, two evaluations give the slope
+            with applied_driver(params, beta_driver, beta_base):
+                rate_low = float(anchors_fn(financials, params)['wacc'])
+            with applied_driver(params, beta_driver, beta_base + 1.0):
+                rate_high = float(anchors_fn(financials, params)['wacc'])
+        except (CalculationError, ValueError, AttributeError, TypeError, KeyError, ZeroDivisionError) as e:
+            logger.warning("Monte Carlo: kernel anchors unavailable, using generic centres: %s", e)
+            return None, 0.0
+        return anchors, rate_high - rate_low
+
+    def _simulate(
+            self,
+            params: Parameters,
+            financials: Company,
+            num_simulations: int,
+            seed: int | np.random.SeedSequence,
+            ctx: dict[str, Any],
+    ) -> dict:
+        """
+        Draws and values one batch of paths.
+
+        Returns
+        -------
+        dict
+            values (raw kernel output), scenario_idx, cases, controls,
+            control_mean, violations (count of g >= WACC paths), and the
+            [YEARS, N] flows and growth_path of path-dependent runs (else None).
+        """
+        mc_cfg = params.extensions.monte_carlo
+        beta_base, base_wacc, anchors = ctx['beta_base'], ctx['base_wacc'], ctx['anchors']
+
         # 2. Generate Stochastic Vectors (NumPy)
         # --------------------------------------
-        vectors = self._generate_vectors(
-            params, num_simulations, seed,
-            base_beta=beta_base,
-            base_wacc=base_wacc
-        )
+        with tracer.span("mc.generate_vectors", category="monte_carlo", n_sims=num_simulations):
+            vectors = self._generate_vectors(
+                params, num_simulations, seed,
+                base_beta=beta_base,
+                base_wacc=base_wacc,
+                anchors=anchors,
+            )
+
+        # 2b. Scenario Mixture (optional)
+        # -------------------------------
+        scenario_idx, cases = None, []
+        if mc_cfg.scenario_mixture and params.extensions.scenarios.cases:
+            cases = params.extensions.scenarios.cases
+            scenario_idx = self._draw_scenarios(cases, num_simulations, seed)
+            self._apply_scenario_overrides(params, financials, vectors, cases, scenario_idx, base_wacc, anchors)
+
+        # 2c. Path-Dependent Growth & Flow Noise (optional)
+        # -------------------------------------------------
+        path_dependent = mc_cfg.growth_process != "constant" or mc_cfg.flow_noise_volatility > 0
+        if path_dependent and not hasattr(self.strategy, 'stochastic_flows'):
+            logger.warning("Monte Carlo: %s has no path-dependent kernel; using one growth draw per path.",
+                           type(self.strategy).__name__)
+            path_dependent = False
+        if path_dependent:
+            self._generate_paths(params, vectors, num_simulations, seed, beta_base)
 
         # 3. Vectorized WACC Calculation
         # ------------------------------
         # Ke_vec = Rf + Beta_vec * MRP
-        ke_vec = rf + vectors['beta'] * mrp
+        ke_vec = ctx['rf'] + vectors['beta'] * ctx['mrp']
 
         # WACC_vec = Ke_vec * We + Kd * Wd
-        wacc_vec = ke_vec * weight_e + kd_post_tax * weight_d
+        wacc_vec = ke_vec * ctx['weight_e'] + ctx['kd_post_tax'] * ctx['weight_d']
+
+        wacc_mean = (ctx['rf'] + beta_base * ctx['mrp']) * ctx['weight_e'] + ctx['kd_post_tax'] * ctx['weight_d']
+        if anchors is not None:
+            # The strategy's own rate (WACC, or Ke for equity models), moved by the beta draws
+            wacc_vec = anchors['wacc'] + ctx['rate_beta_slope'] * (vectors['beta'] - beta_base)
+            wacc_mean = anchors['wacc']
 
         # Add WACC to vectors bundle for strategy use
         vectors['wacc'] = wacc_vec
 
+        # Path-level guardrail: share of draws where g >= WACC (the kernels return NaN, dropped by `_valid_mask`).
+        violation_rate = validate_terminal_growth_batch(vectors['terminal_growth'], wacc_vec).share(SEVERITY_ERROR)
+
         # 4. Fast-Path Execution
         # ----------------------
         if hasattr(self.strategy, 'execute_stochastic'):
-            sim_values_array = self.strategy.execute_stochastic(financials, params, vectors)
+            with tracer.span("mc.execute_stochastic", category="monte_carlo",
+                             strategy=type(self.strategy).__name__, n_sims=num_simulations):
+                sim_values_array = self.strategy.execute_stochastic(financials, params, vectors)
         else:
             # Fallback for strategies not yet optimized (Legacy Loop)
             logger.warning(
-                f"Strategy {type(self.strategy).__name__} does not support vectorization. Falling back to slow loop.")
+                "Strategy %s does not support vectorization. Falling back to slow loop.", type(self.strategy).__name__)
             sim_values_array = self._run_legacy_loop(financials, params, vectors, num_simulations)
 
+        # 4a. Fan Chart Inputs (path-dependent runs)
+        # ------------------------------------------
+        flows = None
+        if path_dependent:
+            with tracer.span("mc.fan_chart", category="monte_carlo", n_sims=num_simulations):
+                flows = np.array(self.strategy.stochastic_flows(financials, params, vectors))  # copy of the workspace
+
+        # 4b. Control Variate (optional)
+        # ------------------------------
+        controls, control_mean = None, None
+        if mc_cfg.variance_reduction == "control_variate" and hasattr(self.strategy, 'execute_stochastic'):
+            if scenario_idx is not None:
+                logger.warning("Monte Carlo: control variate disabled in scenario mixture mode.")
+            else:
+                means = {
+                    key: loc for key, (loc, _) in self._driver_moments(params, beta_base, anchors).items()
+                }
+                means['terminal_growth'] = min(means['terminal_growth'], base_wacc - 0.01)
+                means['wacc'] = wacc_mean
+                controls, control_mean = self._linear_control(financials, params, vectors, means)
+
+        return {
+            'n_sims': num_simulations,
+            'values': np.asarray(sim_values_array, dtype=float),
+            'scenario_idx': scenario_idx,
+            'cases': cases,
+            'controls': controls,
+            'control_mean': control_mean,
+            'violations': violation_rate * num_simulations,
+            'flows': flows,
+            'growth_path': vectors.get('growth_path'),
+        }
+
+    def _execute_adaptive(
+            self,
+            params: Parameters,
+            financials: Company,
+            seed: int,
+            ctx: dict[str, Any],
+    ) -> MCResults | None:
+        """
+        Runs batches until the 95% confidence intervals are tight enough.
+
+        Each batch draws from its own child of `SeedSequence(seed)`, so runs
+        are reproducible and batches are independent replications. The run
+        stops when the relative half-width of the mean and of P10/P50/P90
+        falls under `tolerance` (checked once `ADAPTIVE_MIN_BATCHES` batches
+        are in), when
+        `time_budget_s` is spent, or at `max_iterations` paths.
+        """
+        mc_cfg = params.extensions.monte_carlo
+        batch_size = MonteCarloDefaults.ADAPTIVE_BATCH_SIZE
+        root = np.random.SeedSequence(seed)
+        start = time.perf_counter()
+
+        batches: list[dict] = []
+        trace: list[MCConvergencePoint] = []
+        total, stop_reason = 0, "max_iterations"
+        while total < mc_cfg.max_iterations:
+            n = min(batch_size, mc_cfg.max_iterations - total)
+            batches.append(self._simulate(params, financials, n, root.spawn(1)[0], ctx))
+            total += n
+
+            precision = self._relative_precision(batches)
+            elapsed = time.perf_counter() - start
+            if precision:
+                trace.append(MCConvergencePoint(
+                    paths=total, elapsed_s=elapsed, relative_half_widths=precision))
+                if (len(batches) >= MonteCarloDefaults.ADAPTIVE_MIN_BATCHES
+                        and max(precision.values()) <= mc_cfg.tolerance):
+                    stop_reason = "tolerance"
+                    break
+            if mc_cfg.time_budget_s is not None and elapsed >= mc_cfg.time_budget_s:
+                stop_reason = "time_budget"
+                break
+
+        logger.info("Monte Carlo (adaptive): stopped on %s after %d paths.", stop_reason, total)
+        result = self._package(params, batches)
+        if result is None:
+            return None
+        return result.model_copy(update={
+            'stop_reason': stop_reason,
+            'achieved_precision': trace[-1].relative_half_widths if trace else {},
+            'convergence_trace': trace,
+        })
+
+    def _relative_precision(self, batches: list[dict]) -> dict[str, float]:
+        """95% CI half-width over |estimate| per statistic, from batch replications."""
+        estimates = [e for e in (self._batch_estimate(b) for b in batches) if e is not None]
+        if len(estimates) < 2:
+            return {}
+        precision = {}
+        for key in estimates[0]:
+            column = np.array([e[key] for e in estimates])
+            half_width = 1.96 * column.std(ddof=1) / np.sqrt(len(column))
+            centre = abs(column.mean())
+            precision[key] = float(half_width / centre) if centre > 0 else float('inf')
+        return precision
+
+    def _batch_estimate(self, batch: dict) -> dict[str, float] | None:
+        values = batch['values']
+        if len(values) != batch['n_sims']:
+            return None
+        mask = self._valid_mask(values)
+        if not mask.any():
+            return None
+        controls = None if batch['controls'] is None else batch['controls'][mask]
+        return self._estimate(values[mask], controls, batch['control_mean'])
+
+    # =========================================================================
+    # PACKAGING
+    # =========================================================================
+
+    @staticmethod
+    def _valid_mask(values: np.ndarray) -> np.ndarray:
+        with np.errstate(invalid='ignore'):
+            return (values > 0) & (values < 1_000_000)  # Sanity bounds (drops NaN)
+
+    def _package(self, params: Parameters, batches: list[dict]) -> MCResults | None:
+        """Filters the simulated values and builds MCResults from one or more batches."""
         # 5. Filtering & Result Packaging
         # -------------------------------
-        valid_values = sim_values_array[np.isfinite(sim_values_array)]
-        valid_values = valid_values[(valid_values > 0) & (valid_values < 1_000_000)]  # Sanity bounds
+        sim_values_array = np.concatenate([b['values'] for b in batches])
+        valid_mask = self._valid_mask(sim_values_array)
+        valid_values = sim_values_array[valid_mask]
 
         if len(valid_values) == 0:
             return None
 
+        n_total = sum(b['n_sims'] for b in batches)
+        violation_rate = sum(b['violations'] for b in batches) / n_total
+        if violation_rate > 0:
+            logger.warning("Monte Carlo: %.2f%% of paths have terminal growth >= WACC.", violation_rate * 100)
+
+        scenario_mix: dict[str, float] = {}
+        cases = batches[0]['cases']
+        if batches[0]['scenario_idx'] is not None and len(sim_values_array) == n_total:
+            scenario_idx = np.concatenate([b['scenario_idx'] for b in batches])
+            counts = np.bincount(scenario_idx[valid_mask], minlength=len(cases))
+            scenario_mix = {case.name: float(c) / len(valid_values) for case, c in zip(cases, counts)}
+
+        controls, control_mean = None, batches[0]['control_mean']
+        if all(b['controls'] is not None for b in batches):
+            controls = np.concatenate([b['controls'] for b in batches])
+
+        estimates = self._estimate(valid_values, None if controls is None else controls[valid_mask], control_mean)
+        standard_errors, efficiency_gains = {}, {}
+        if len(sim_values_array) == n_total:  # legacy loop returns filtered values only
+            if len(batches) > 1:
+                bounds = np.cumsum([0] + [b['n_sims'] for b in batches])
+            else:
+                bounds = self._batch_bounds(n_total)
+            standard_errors, efficiency_gains = self._standard_errors(
+                sim_values_array, valid_mask, controls, control_mean, bounds)
+
         return MCResults(
             simulation_values=valid_values.tolist(),
-            quantiles={
-                "P10": float(np.percentile(valid_values, 10)),
-                "P50": float(np.percentile(valid_values, 50)),
-                "P90": float(np.percentile(valid_values, 90))
-            },
-            mean=float(np.mean(valid_values)),
-            std_dev=float(np.std(valid_values))
+            quantiles={label: estimates[label] for label in QUANTILE_LEVELS},
+            mean=estimates["mean"],
+            std_dev=float(np.std(valid_values)),
+            terminal_growth_violation_rate=violation_rate,
+            scenario_mix=scenario_mix,
+            variance_reduction=params.extensions.monte_carlo.variance_reduction,
+            standard_errors=standard_errors,
+            efficiency_gains=efficiency_gains,
+            flow_fan_chart=self._fan_chart(batches, 'flows', valid_mask),
+            growth_fan_chart=self._fan_chart(batches, 'growth_path', valid_mask),
         )
 
     @staticmethod
-    def _generate_vectors(params: Parameters, n_sims: int, seed: int, base_beta: float, base_wacc: float) -> dict[
-        str, np.ndarray]:
-        """Generates all random vectors in one go using NumPy Generator."""
+    def _fan_chart(batches: list[dict], key: str, valid_mask: np.ndarray) -> dict[str, list[float]]:
+        """Yearly P10/P50/P90 over the retained paths of the [YEARS, N] matrix `key` of every batch."""
+        if any(b[key] is None for b in batches):
+            return {}
+        matrix = np.concatenate([b[key] for b in batches], axis=1)
+        if matrix.shape[1] != valid_mask.size:  # legacy loop returns filtered values only
+            return {}
+        levels = [p * 100 for p in QUANTILE_LEVELS.values()]
+        quantiles = np.percentile(matrix[:, valid_mask].astype(float), levels, axis=1)
+        return {label: q.tolist() for label, q in zip(QUANTILE_LEVELS, quantiles)}
+
+    # =========================================================================
+    # ESTIMATION
+    # =========================================================================
+
+    @staticmethod
+    def _estimate(values: np.ndarray, controls: np.ndarray | None, control_mean: float | None) -> dict[str, float]:
+        """Mean and P10/P50/P90, control-variate weighted when a control is given."""
+        if controls is None:
+            estimates = {"mean": float(np.mean(values))}
+            estimates.update({label: float(np.percentile(values, p * 100)) for label, p in QUANTILE_LEVELS.items()})
+            return estimates
+        weights = control_variate_weights(controls, control_mean)
+        quantiles = weighted_quantiles(values, weights, list(QUANTILE_LEVELS.values()))
+        estimates = {"mean": float(weights @ values)}
+        estimates.update({label: float(q) for label, q in zip(QUANTILE_LEVELS, quantiles)})
+        return estimates
+
+    @staticmethod
+    def _batch_bounds(n_sims: int) -> np.ndarray | None:
+        """
+        Boundaries of the contiguous path batches used for standard errors.
+
+        Boundaries are even so antithetic pairs never straddle two batches.
+        None when the run is too small for at least two batches.
+        """
+        n_batches = min(MonteCarloDefaults.SE_BATCHES, n_sims // MonteCarloDefaults.MIN_BATCH_PATHS)
+        if n_batches < 2:
+            return None
+        bounds = (np.linspace(0, n_sims, n_batches + 1) // 2 * 2).astype(int)
+        bounds[-1] = n_sims
+        return bounds
+
+    def _standard_errors(
+            self,
+            values: np.ndarray,
+            valid_mask: np.ndarray,
+            controls: np.ndarray | None,
+            control_mean: float | None,
+            bounds: np.ndarray | None,
+    ) -> tuple[dict[str, float], dict[str, float]]:
+        """
+        Batch-replication standard errors and their i.i.d. equivalents.
+
+        `bounds` delimits the replications (see `_batch_bounds`); None when the
+        run is too small to be split.
+
+        Returns
+        -------
+        tuple[dict[str, float], dict[str, float]]
+            Standard errors per statistic, and efficiency gains (SE_iid / SE)^2.
+        """
+        if bounds is None:
+            return {}, {}
+
+        batches = []
+        for start, stop in zip(bounds[:-1], bounds[1:]):
+            mask = valid_mask[start:stop]
+            if not mask.any():
+                continue
+            batch_controls = None if controls is None else controls[start:stop][mask]
+            batches.append(self._estimate(values[start:stop][mask], batch_controls, control_mean))
+        if len(batches) < 2:
+            return {}, {}
+
+        standard_errors = {
+            key: float(np.std([b[key] for b in batches], ddof=1) / np.sqrt(len(batches)))
+            for key in batches[0]
+        }
+
+        valid = values[valid_mask]
+        iid = {"mean": float(np.std(valid, ddof=1) / np.sqrt(valid.size))}
+        iid.update({label: iid_quantile_standard_error(valid, p) for label, p in QUANTILE_LEVELS.items()})
+        efficiency_gains = {
+            key: float((iid[key] / se) ** 2) for key, se in standard_errors.items() if se > 0 and np.isfinite(iid[key])
+        }
+        return standard_errors, efficiency_gains
+
+    def _linear_control(
+            self,
+            financials: Company,
+            params: Parameters,
+            vectors: dict[str, np.ndarray],
+            means: dict[str, float],
+    ) -> tuple[np.ndarray | None, float | None]:
+        """
+        Builds the control variate: the kernel linearised around the mean inputs.
+
+        The kernel is evaluated once on a small stacked batch (the mean point
+        plus a central difference per input); the control's expectation is the
+        kernel value at the mean point.
+        """
+        keys = [key for key in vectors if key in means]
+        steps = {key: 1e-4 * max(abs(means[key]), 1.0) for key in keys}
+        probe = {key: np.full(1 + 2 * len(keys), means[key]) for key in keys}
+        for i, key in enumerate(keys):
+            probe[key][1 + 2 * i] += steps[key]
+            probe[key][2 + 2 * i] -= steps[key]
+
+        try:
+            f = np.asarray(self.strategy.execute_stochastic(financials, params, probe), dtype=float)
+        except (CalculationError, ValueError, KeyError, ZeroDivisionError) as e:
+            logger.warning("Monte Carlo: control variate unavailable: %s", e)
+            return None, None
+        if not np.all(np.isfinite(f)):
+            logger.warning("Monte Carlo: control variate unavailable (non-finite kernel probe).")
+            return None, None
+
+        control_mean = float(f[0])
+        controls = np.full(len(vectors[keys[0]]), control_mean)
+        for i, key in enumerate(keys):
+            gradient = (f[1 + 2 * i] - f[2 + 2 * i]) / (2.0 * steps[key])
+            controls += gradient * (vectors[key] - means[key])
+        return controls, control_mean
+
+    # =========================================================================
+    # SAMPLING
+    # =========================================================================
+
+    @staticmethod
+    def _generate_vectors(params: Parameters, n_sims: int, seed: int | np.random.SeedSequence, base_beta: float,
+                          base_wacc: float, anchors: dict[str, float] | None = None) -> dict[str, np.ndarray]:
+        """
+        Generates all random vectors in one go using NumPy Generator.
+
+        Plain float64 runs without correlation keep the historical independent
+        draws. Otherwise one (4, n) standard normal block is drawn with the
+        selected sampler in the configured precision, correlated in place with
+        a cached Cholesky factor (if `MCParameters.correlation` is set), then
+        scaled row by row in place. Draws are centred on `anchors` when given
+        (see `_driver_moments`).
+        """
         rng = np.random.default_rng(seed)
+        mc_cfg = params.extensions.monte_carlo
+        moments = MonteCarloRunner._driver_moments(params, base_beta, anchors)
+        drivers = MonteCarloDefaults.SHOCK_DRIVERS
+        dtype = np.dtype(mc_cfg.precision)
+
+        if (mc_cfg.correlation is not None or mc_cfg.variance_reduction in ("antithetic", "sobol")
+                or dtype != np.float64):
+            block = MonteCarloRunner._standard_normal_block(
+                mc_cfg.variance_reduction, rng, n_sims, len(drivers), dtype=dtype)
+            if mc_cfg.correlation is not None:
+                CorrelatedShockSampler(mc_cfg.correlation).correlate(block)
+            vectors = {}
+            for row, driver in enumerate(drivers):
+                loc, scale = moments[driver]
+                block[row] *= scale
+                block[row] += loc
+                vectors[driver] = block[row]
+        else:
+            # Independent draws, kept in the historical order for seed reproducibility.
+            flow_loc, flow_scale = moments['base_flow']
+            sig_flow = flow_scale / abs(flow_loc) if flow_loc else 0.0
+            vectors = {
+                # 1. Beta Vector (Normal)
+                'beta': rng.normal(*moments['beta'], n_sims),
+                # 2. Growth Vector (Normal)
+                'growth': rng.normal(*moments['growth'], n_sims),
+                # 3. Terminal Growth Vector (Normal)
+                'terminal_growth': rng.normal(*moments['terminal_growth'], n_sims),
+                # 4. Base Flow Shock Vector (Normal centered on 1.0)
+                'base_flow': moments['base_flow'][0] * rng.normal(1.0, sig_flow, n_sims),
+            }
+
+        # Clip g_n to be < WACC - epsilon (Guardrail)
+        np.minimum(vectors['terminal_growth'], base_wacc - 0.01, out=vectors['terminal_growth'])
+        return vectors
+
+    @staticmethod
+    def _standard_normal_block(mode: str, rng: np.random.Generator, n_sims: int, dim: int,
+                               dtype: np.dtype = np.dtype(np.float64)) -> np.ndarray:
+        """
+        (dim, n_sims) block of N(0, 1) draws for the selected sampler.
+
+        Antithetic pairs are interleaved (z, -z) and Sobol points are drawn as
+        one independently shifted set per SE batch, so every batch of
+        `_batch_bounds` is a self-contained replication.
+        """
+        if mode == "antithetic":
+            half = rng.standard_normal((dim, (n_sims + 1) // 2), dtype=dtype)
+            block = np.empty((dim, 2 * half.shape[1]), dtype=dtype)
+            block[:, 0::2] = half
+            np.negative(half, out=block[:, 1::2])
+            return block[:, :n_sims]
+        if mode == "sobol":
+            bounds = MonteCarloRunner._batch_bounds(n_sims)
+            if bounds is None:
+                bounds = np.array([0, n_sims])
+            block = np.empty((dim, n_sims), dtype=dtype)
+            for start, stop in zip(bounds[:-1], bounds[1:]):
+                block[:, start:stop] = inverse_normal_cdf(sobol_points(stop - start, dim, rng)).T
+            return block
+        return rng.standard_normal((dim, n_sims), dtype=dtype)
+
+    @staticmethod
+    def _driver_moments(params: Parameters, base_beta: float,
+                        anchors: dict[str, float] | None = None) -> dict[str, tuple[float, float]]:
+        """
+        (mean, std) of every shock driver, before the terminal growth clip.
+
+        Base flow, growth and terminal growth are centred on the strategy's
+        `stochastic_anchors` when given, the inputs at which the kernel
+        reproduces `execute`; otherwise on generic defaults.
+        """
         shocks = params.extensions.monte_carlo.shocks
 
         # Volatilities
@@ -149,34 +675,151 @@ class MonteCarloRunner:
         sig_growth = getattr(shocks, 'growth_volatility', 0.015) or 0.015
         sig_flow = getattr(shocks, 'fcf_volatility', 0.10) or 0.10
 
-        # 1. Beta Vector (Normal)
-        betas = rng.normal(base_beta, base_beta * sig_beta, n_sims)
-
-        # 2. Growth Vector (Normal)
         st = params.strategy
-        base_g = getattr(st, 'growth_rate_p1', 0.05) or 0.05
-        growths = rng.normal(base_g, sig_growth, n_sims)
+        centers = MonteCarloRunner._vector_centers(params, anchors)
+        if anchors is not None:
+            anchor_val = anchors['base_flow']
+        else:
+            anchor_val = getattr(st, 'fcf_anchor', None) or getattr(st, 'revenue_ttm', 0.0) or 100.0
 
-        # 3. Terminal Growth Vector (Normal, Clipped)
+        return {
+            'beta': (base_beta, base_beta * sig_beta),
+            'growth': (centers['growth'], sig_growth),
+            'terminal_growth': (centers['terminal_growth'], 0.005),
+            'base_flow': (anchor_val, abs(anchor_val) * sig_flow),
+        }
+
+    @staticmethod
+    def _vector_centers(params: Parameters, anchors: dict[str, float] | None = None) -> dict[str, float]:
+        """Means around which `_generate_vectors` draws the growth vectors."""
+        if anchors is not None:
+            return {'growth': anchors['growth'], 'terminal_growth': anchors['terminal_growth']}
+        st = params.strategy
         base_gn = 0.02
         if hasattr(st, 'terminal_value'):
             base_gn = st.terminal_value.perpetual_growth_rate or 0.02
+        return {
+            'growth': getattr(st, 'growth_rate_p1', 0.05) or 0.05,
+            'terminal_growth': base_gn,
+        }
 
-        term_growths = rng.normal(base_gn, 0.005, n_sims)
-        # Clip g_n to be < WACC - epsilon (Guardrail)
-        term_growths = np.minimum(term_growths, base_wacc - 0.01)
+    @staticmethod
+    def _generate_paths(
+            params: Parameters,
+            vectors: dict[str, np.ndarray],
+            n_sims: int,
+            seed: int | np.random.SeedSequence,
+            base_beta: float,
+    ) -> None:
+        """
+        Adds the time-major [YEARS, N_SIMS] matrices of path-dependent runs.
+
+        - 'growth_path' ("ar1"): year 1 is the path's growth draw, then
+          g_t = g_n + phi * (g_{t-1} - g_n) + sigma * eps_t, mean-reverting to
+          the path's terminal growth with innovations of the growth volatility.
+        - 'flow_noise' (`flow_noise_volatility` > 0): 1 + sigma_f * eps_t, a
+          transitory factor on each year's flow.
+
+        Draws come from a dedicated substream of the run seed, so the scalar
+        shocks are unchanged. Must run after the scenario overrides, which
+        move the growth draws the paths start from.
+        """
+        mc_cfg = params.extensions.monte_carlo
+        years = MonteCarloRunner._path_horizon(params)
+        dtype = vectors['growth'].dtype
+        rng = np.random.default_rng(MonteCarloRunner._substream(seed, PATH_STREAM))
+
+        if mc_cfg.growth_process == "ar1":
+            phi = mc_cfg.growth_persistence
+            g_n = vectors['terminal_growth']
+            path = rng.standard_normal((years, n_sims), dtype=dtype)
+            path *= MonteCarloRunner._driver_moments(params, base_beta)['growth'][1]
+            path[0] = vectors['growth']
+            gap = np.empty(n_sims, dtype=dtype)
+            for t in range(1, years):
+                # Innovation already in the row: add the persistent part of last year's gap
+                np.subtract(path[t - 1], g_n, out=gap)
+                gap *= phi
+                path[t] += gap
+                path[t] += g_n
+            vectors['growth_path'] = path
+
+        if mc_cfg.flow_noise_volatility > 0:
+            noise = rng.standard_normal((years, n_sims), dtype=dtype)
+            noise *= mc_cfg.flow_noise_volatility
+            noise += 1.0
+            vectors['flow_noise'] = noise
 
-        # 4. Base Flow Shock Vector (Normal centered on 1.0)
-        base_flow_mults = rng.normal(1.0, sig_flow, n_sims)
-        anchor_val = getattr(st, 'fcf_anchor', None) or getattr(st, 'revenue_ttm', 0.0) or 100.0
-        base_flows = anchor_val * base_flow_mults
+    @staticmethod
+    def _path_horizon(params: Parameters) -> int:
+        """Years covered by the path matrices: the projection horizon, or a longer manual growth vector."""
+        st = params.strategy
+        years = getattr(st, 'projection_years', None) or ModelDefaults.DEFAULT_PROJECTION_YEARS
+        return max(years, len(getattr(st, 'manual_growth_vector', None) or []))
 
-        return {
-            'beta': betas,
-            'growth': growths,
-            'terminal_growth': term_growths,
-            'base_flow': base_flows
-        }
+    @staticmethod
+    def _substream(seed: int | np.random.SeedSequence, index: int) -> np.random.SeedSequence:
+        """Child `index` of the run (or batch) seed, independent of the spawn counter."""
+        seed_seq = seed if isinstance(seed, np.random.SeedSequence) else np.random.SeedSequence(seed)
+        return np.random.SeedSequence(seed_seq.entropy, spawn_key=(*seed_seq.spawn_key, index))
+
+    @staticmethod
+    def _draw_scenarios(cases: list, n_sims: int, seed: int | np.random.SeedSequence) -> np.ndarray:
+        """
+        Assigns a scenario index to every path.
+
+        Draws come from a stream spawned off the run seed, so the base shocks
+        are identical with and without mixture. Missing probabilities count as
+        zero; if no case carries a weight, cases are equally likely.
+        """
+        weights = np.array([case.probability or 0.0 for case in cases], dtype=float)
+        if weights.sum() <= 0:
+            weights = np.ones(len(cases))
+        seed_seq = seed if isinstance(seed, np.random.SeedSequence) else np.random.SeedSequence(seed)
+        rng = np.random.default_rng(seed_seq.spawn(1)[0])
+        return rng.choice(len(cases), size=n_sims, p=weights / weights.sum())
+
+    def _apply_scenario_overrides(
+            self,
+            params: Parameters,
+            financials: Company,
+            vectors: dict[str, np.ndarray],
+            cases: list,
+            scenario_idx: np.ndarray,
+            base_wacc: float,
+            anchors: dict[str, float] | None = None,
+    ) -> None:
+        """
+        Re-centers the shocked vectors on each path's scenario overrides.
+
+        Growth overrides shift the drawn values (the shock around the override
+        is kept); margin overrides set a per-path `target_margin` vector.
+        Override keys follow `ScenariosRunner._case_overrides`.
+        """
+        centers = self._vector_centers(params, anchors)
+        for i, case in enumerate(cases):
+            overrides = ScenariosRunner._case_overrides(params, case)
+            if not overrides:
+                continue
+            mask = scenario_idx == i
+            for key, value in overrides.items():
+                if key in centers:
+                    vectors[key][mask] += value - centers[key]
+                elif key == 'target_margin':
+                    if key not in vectors:
+                        vectors[key] = np.full(len(scenario_idx), self._base_target_margin(params, financials),
+                                               dtype=vectors['growth'].dtype)
+                    vectors[key][mask] = value
+
+        # Guardrail clip re-applied after the shift (see `_generate_vectors`).
+        np.minimum(vectors['terminal_growth'], base_wacc - 0.01, out=vectors['terminal_growth'])
+
+    def _base_target_margin(self, params: Parameters, financials: Company) -> float:
+        """Target margin for paths whose scenario has no margin override."""
+        anchors_fn = getattr(self.strategy, 'stochastic_anchors', None)
+        if anchors_fn is not None:
+            return float(anchors_fn(financials, params)['target_margin'])
+        return float(params.strategy.target_fcf_margin)
 
     def _run_legacy_loop(self, financials, params, vectors, num_sims):
         """Fallback method for non-vectorized strategies."""
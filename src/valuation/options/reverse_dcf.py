@@ -0,0 +1,273 @@
+"""
+src/valuation/options/reverse_dcf.py
+
+REVERSE DCF RUNNER
+==================
+Role: Solves IV(x) = market price for one kernel input x ('growth',
+'terminal_growth' or 'wacc'): the growth or discount rate the current price
+implies.
+Logic: Safeguarded Newton iterations run in lockstep over a whole universe
+of tickers. The iterate, bracket, step and convergence state are arrays
+(one entry per ticker) updated with numpy; each iteration values every
+still-active ticker with one complex kernel call whose real part is IV(x)
+and whose imaginary part gives IV'(x) (complex step, see `GreeksRunner`).
+A Newton step leaving the sign-change bracket falls back to bisection, so
+every bracketed solve converges.
+Architecture: Runner Pattern.
+
+Fast path contract: as `ScenariosRunner`, a ticker is solved only when its
+kernel at the anchors matches `execute` within `PARITY_RTOL` (RIM included,
+once its book value anchor is set); otherwise (a kernel that drifts from
+`execute`, no kernel, no price, no sign change over the bracket) it is
+reported as not converged.
+
+Style: Numpy docstrings.
+"""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Mapping
+from dataclasses import dataclass
+
+import numpy as np
+
+from src.config.constants import SensitivityDefaults, ValuationEngineDefaults
+from src.core.exceptions import CalculationError
+from src.models.company import Company
+from src.models.parameters.base_parameter import Parameters
+from src.models.results.options import ReverseDCFResults
+from src.valuation.library.dcf_vector import GORDON_MIN_SPREAD
+from src.valuation.options.drivers import kernel_inputs
+from src.valuation.options.scenarios import PARITY_RTOL
+from src.valuation.strategies.interface import IValuationRunner
+
+logger = logging.getLogger(__name__)
+
+TARGETS = ("growth", "terminal_growth", "wacc")
+
+# Bracket width below which a solve stops even if the price is not matched (kinked kernels).
+BRACKET_TOLERANCE = 1e-12
+
+
+@dataclass
+class _Case:
+    """One ticker's kernel, working parameters and base kernel inputs."""
+    strategy: IValuationRunner
+    params: Parameters
+    financials: Company
+    inputs: dict[str, float]
+    price: float
+
+
+class ReverseDCFRunner:
+    """
+    Orchestrates the market-implied solve of a valuation.
+
+    Attributes
+    ----------
+    strategy : IValuationRunner
+        The valuation engine being inverted.
+    """
+
+    def __init__(self, strategy: IValuationRunner):
+        self.strategy = strategy
+
+    def execute(self, params: Parameters, financials: Company) -> ReverseDCFResults | None:
+        """
+        Solves for the configured target when enabled in the extension settings.
+
+        Parameters
+        ----------
+        params : Parameters
+            Resolved parameters (left untouched).
+        financials : Company
+            The financial dataset used for valuation.
+
+        Returns
+        -------
+        ReverseDCFResults | None
+            None if disabled.
+        """
+        cfg = params.extensions.reverse_dcf
+        if not cfg.enabled:
+            return None
+        ticker = params.structure.ticker
+        return self.solve_universe({ticker: (self.strategy, params, financials)}, cfg.target)[ticker]
+
+    @classmethod
+    def solve_universe(
+            cls,
+            cases: Mapping[str, tuple[IValuationRunner, Parameters, Company]],
+            target: str,
+            prices: Mapping[str, float] | None = None,
+    ) -> dict[str, ReverseDCFResults]:
+        """
+        Market-implied value of `target` for every ticker, solved in lockstep.
+
+        Parameters
+        ----------
+        cases : Mapping[str, tuple[IValuationRunner, Parameters, Company]]
+            Strategy, resolved parameters and financials per ticker.
+        target : str
+            'growth', 'terminal_growth' or 'wacc'.
+        prices : Mapping[str, float], optional
+            Prices to match; defaults to each ticker's `current_price`.
+
+        Returns
+        -------
+        dict[str, ReverseDCFResults]
+            One result per ticker, in input order.
+        """
+        if target not in TARGETS:
+            raise ValueError(f"target must be one of {TARGETS}, got '{target}'.")
+
+        tickers = list(cases)
+        market = {ticker: float((prices or {}).get(ticker, cases[ticker][1].structure.current_price or 0.0))
+                  for ticker in tickers}
+        states = []
+        for ticker in tickers:
+            strategy, params, financials = cases[ticker]
+            original_audit_state = getattr(strategy, 'glass_box_enabled', True)
+            strategy.glass_box_enabled = False
+            try:
+                states.append(cls._prepare(strategy, params, financials, market[ticker]))
+            finally:
+                strategy.glass_box_enabled = original_audit_state
+
+        solvable = [i for i, case in enumerate(states) if case is not None]
+        solved = cls._solve([states[i] for i in solvable], target)
+
+        results = {}
+        for ticker, case in zip(tickers, states, strict=True):
+            if case is None:
+                results[ticker] = ReverseDCFResults(target=target, market_price=market[ticker])
+        for j, i in enumerate(solvable):
+            case = states[i]
+            implied, converged, iterations, residual = (column[j] for column in solved)
+            results[tickers[i]] = ReverseDCFResults(
+                target=target,
+                model_value=case.inputs.get(target),
+                implied_value=float(implied) if converged else None,
+                market_price=case.price,
+                converged=bool(converged),
+                iterations=int(iterations),
+                residual=float(residual) if np.isfinite(residual) else None,
+            )
+        return {ticker: results[ticker] for ticker in tickers}
+
+    # =========================================================================
+    # SOLVER
+    # =========================================================================
+
+    @staticmethod
+    def _prepare(strategy: IValuationRunner, params: Parameters, financials: Company, price: float) -> _Case | None:
+        """Working copy and base kernel inputs of one ticker, or None if it cannot be solved by kernel."""
+        anchors_fn = getattr(strategy, 'stochastic_anchors', None)
+        kernel = getattr(strategy, 'execute_stochastic', None)
+        if anchors_fn is None or kernel is None or not price or price <= 0:
+            return None
+
+        work = params.model_copy(deep=True)
+        try:
+            inputs, _ = kernel_inputs(anchors_fn, work, financials)
+            value = kernel(financials, work, {key: np.array([x]) for key, x in inputs.items()})[0]
+            reference = strategy.execute(financials, work).results.common.intrinsic_value_per_share
+        except (CalculationError, ValueError, AttributeError, TypeError, KeyError, ZeroDivisionError) as e:
+            logger.debug("[ReverseDCF] %s cannot be solved by kernel: %s", params.structure.ticker, e)
+            return None
+        if not np.isclose(value, reference, rtol=PARITY_RTOL, atol=PARITY_RTOL):
+            logger.debug("[ReverseDCF] %s kernel differs from execute (%.6f vs %.6f).",
+                         params.structure.ticker, value, reference)
+            return None
+        return _Case(strategy, work, financials, inputs, float(price))
+
+    @staticmethod
+    def _bounds(cases: list[_Case], target: str) -> tuple[np.ndarray, np.ndarray]:
+        """Search bracket per ticker; the Gordon spread floor caps g below the rate."""
+        lo = np.full(len(cases), ValuationEngineDefaults.REVERSE_DCF_LOW_BOUND)
+        hi = np.full(len(cases), ValuationEngineDefaults.REVERSE_DCF_HIGH_BOUND)
+        if target == "terminal_growth":
+            hi = np.array([case.inputs['wacc'] - GORDON_MIN_SPREAD for case in cases])
+        elif target == "wacc":
+            lo = np.array([case.inputs['terminal_growth'] + GORDON_MIN_SPREAD for case in cases])
+        return lo, hi
+
+    @staticmethod
+    def _evaluate(cases: list[_Case], target: str, points: np.ndarray, active: np.ndarray) -> np.ndarray:
+        """
+        IV - price at `points` [M, P] (complex) for the active tickers, one kernel call each.
+
+        Returns
+        -------
+        np.ndarray
+            Complex [M, P]; NaN rows for inactive tickers.
+        """
+        out = np.full(points.shape, np.nan, dtype=np.complex128)
+        for i in np.flatnonzero(active):
+            case = cases[i]
+            vectors = {key: np.full(points.shape[1], x, dtype=np.complex128) for key, x in case.inputs.items()}
+            vectors[target] = points[i]
+            out[i] = case.strategy.execute_stochastic(case.financials, case.params, vectors) - case.price
+        return out
+
+    @classmethod
+    def _solve(cls, cases: list[_Case], target: str) -> tuple[np.ndarray, ...]:
+        """
+        Safeguarded Newton over all tickers at once.
+
+        Returns
+        -------
+        tuple[np.ndarray, ...]
+            (implied value, converged, iterations, residual), one entry per case.
+        """
+        m = len(cases)
+        x = np.full(m, np.nan)
+        converged = np.zeros(m, dtype=bool)
+        iterations = np.zeros(m, dtype=int)
+        residual = np.full(m, np.nan)
+        if m == 0:
+            return x, converged, iterations, residual
+
+        h = SensitivityDefaults.GREEKS_COMPLEX_STEP
+        tolerance = ValuationEngineDefaults.CONVERGENCE_TOLERANCE * np.array([case.price for case in cases])
+
+        # 1. Bracket: a sign change of IV - price between the bounds
+        lo, hi = cls._bounds(cases, target)
+        try:
+            ends = cls._evaluate(cases, target, np.stack([lo, hi], axis=1).astype(np.complex128),
+                                 np.ones(m, dtype=bool)).real
+        except (CalculationError, ValueError, ZeroDivisionError) as e:
+            logger.debug("[ReverseDCF] Bracket evaluation failed: %s", e)
+            return x, converged, iterations, residual
+        f_lo = ends[:, 0]
+        active = (lo < hi) & np.isfinite(ends).all(axis=1) & (np.sign(f_lo) != np.sign(ends[:, 1]))
+
+        # 2. Start from the model value (inside the bracket)
+        model = np.array([case.inputs[target] for case in cases])
+        x = np.where(active, np.clip(model, lo, hi), np.nan)
+
+        for _ in range(ValuationEngineDefaults.MAX_ITERATIONS):
+            if not active.any():
+                break
+            values = cls._evaluate(cases, target, (x + 1j * h)[:, np.newaxis], active)[:, 0]
+            f, df = values.real, values.imag / h
+            iterations[active] += 1
+            residual = np.where(active, f, residual)
+
+            done = active & ((np.abs(f) <= tolerance) | (hi - lo <= BRACKET_TOLERANCE))
+            converged |= done & (np.abs(f) <= tolerance)
+            active &= ~done & np.isfinite(f)
+
+            # Shrink the bracket around the sign change
+            left = active & (np.sign(f) == np.sign(f_lo))
+            lo, f_lo = np.where(left, x, lo), np.where(left, f, f_lo)
+            hi = np.where(active & ~left, x, hi)
+
+            # Newton step, bisection when it leaves the bracket
+            with np.errstate(divide='ignore', invalid='ignore'):
+                newton = x - f / df
+            inside = np.isfinite(newton) & (newton > lo) & (newton < hi)
+            x = np.where(active, np.where(inside, newton, 0.5 * (lo + hi)), x)
+
+        return x, converged, iterations, residual
@@ -4,32 +4,47 @@ src/valuation/options/scenarios.py
 SCENARIO ANALYSIS RUNNER
 ========================
 Role: Evaluates discrete deterministic cases (Bear/Base/Bull).
-Logic: Iterates through defined scenarios, applying overrides and computing weighted average.
+Logic: Stacks the scenario overrides into input vectors and evaluates every
+case in one call of the strategy's vectorized kernel, then computes the
+probability-weighted average.
 Architecture: Runner Pattern.
 
+Fast path contract: the strategy exposes `stochastic_anchors` and
+`execute_stochastic`, and the kernel reproduces `execute` on the base case
+(parity probe). Otherwise each case is cloned and run through `execute`.
+
 Standard: SOLID, i18n Secured, NumPy Style.
 """
 
 from __future__ import annotations
 
 import logging
+from typing import Any
+
+import numpy as np
 
+from src.config.constants import ModelDefaults
 from src.core.exceptions import CalculationError
 from src.models.company import Company
 from src.models.parameters.base_parameter import Parameters
+from src.models.parameters.options import ScenarioParameters
 from src.models.results.options import ScenarioOutcome, ScenariosResults
 from src.valuation.strategies.interface import IValuationRunner
 
 logger = logging.getLogger(__name__)
 
+# Relative tolerance between the kernel and `execute` on the base case.
+PARITY_RTOL = 1e-9
+
 
 class ScenariosRunner:
     """
     Executes multiple deterministic valuation runs based on scenario overrides.
 
-    This runner clones the base parameters for each defined case, applies
-    specific overrides (growth, margins), and computes a probability-weighted
-    intrinsic value.
+    Cases are evaluated in a single vectorized kernel call when the strategy
+    supports it, otherwise by cloning the base parameters for each case.
+    Overrides (growth, margin) are applied identically on both paths, and the
+    runner computes a probability-weighted intrinsic value.
 
     Attributes
     ----------
@@ -52,8 +67,8 @@ class ScenariosRunner:
         """
         Execute the scenario analysis.
 
-        Iterates through the scenarios defined in parameters, applies overrides,
-        calculates intrinsic values, and aggregates results.
+        Evaluates every scenario defined in parameters (with its overrides)
+        and aggregates the results.
 
         Parameters
         ----------
@@ -73,57 +88,170 @@ class ScenariosRunner:
         if not sc_cfg.enabled or not sc_cfg.cases:
             return None
 
-        outcomes: list[ScenarioOutcome] = []
-        weighted_sum = 0.0
-        total_prob = 0.0
-        market_price = params.structure.current_price or 1.0
-
         # Optimization: Temporarily disable step-by-step audit for sub-runs
         original_audit_state = getattr(self.strategy, 'glass_box_enabled', True)
         self.strategy.glass_box_enabled = False
+        try:
+            values = self._evaluate_vectorized(params, financials, sc_cfg.cases)
+            if values is None:
+                values = self._evaluate_loop(params, financials, sc_cfg.cases)
+        finally:
+            # Restore original audit state
+            self.strategy.glass_box_enabled = original_audit_state
+
+        return self._aggregate(params, sc_cfg.cases, values)
+
+    # =========================================================================
+    # EVALUATION PATHS
+    # =========================================================================
+
+    def _evaluate_vectorized(
+            self,
+            params: Parameters,
+            financials: Company,
+            cases: list[ScenarioParameters],
+    ) -> list[float | None] | None:
+        """
+        Evaluates all cases in one kernel call.
+
+        Row 0 of the input vectors is the un-overridden base case; its kernel
+        value must match `execute` before the other rows are trusted.
+
+        Returns
+        -------
+        list[float | None] | None
+            One value per case (None for non-finite results, e.g. the NaN rows
+            of cases with g >= r, where `execute` raises), or None when the
+            strategy has no usable fast path.
+        """
+        anchors_fn = getattr(self.strategy, 'stochastic_anchors', None)
+        kernel = getattr(self.strategy, 'execute_stochastic', None)
+        if anchors_fn is None or kernel is None:
+            return None
+
+        try:
+            anchors = anchors_fn(financials, params)
+            vectors = {key: np.full(len(cases) + 1, float(value)) for key, value in anchors.items()}
+            for row, case in enumerate(cases, start=1):
+                for key, value in self._case_overrides(params, case).items():
+                    if key in vectors:
+                        vectors[key][row] = value
+
+            values = np.asarray(kernel(financials, params, vectors), dtype=float)
+            reference = self.strategy.execute(financials, params).results.common.intrinsic_value_per_share
+        except (CalculationError, ValueError, AttributeError, TypeError, ZeroDivisionError) as e:
+            logger.debug("[Scenarios] Vectorized path unavailable: %s", e)
+            return None
 
-        for case in sc_cfg.cases:
+        if not np.isclose(values[0], reference, rtol=PARITY_RTOL, atol=PARITY_RTOL):
+            logger.debug(
+                "[Scenarios] %s kernel differs from execute (%.6f vs %.6f), using per-case runs.",
+                type(self.strategy).__name__, values[0], reference,
+            )
+            return None
+
+        return [float(v) if np.isfinite(v) else None for v in values[1:]]
+
+    def _evaluate_loop(
+            self,
+            params: Parameters,
+            financials: Company,
+            cases: list[ScenarioParameters],
+    ) -> list[float | None]:
+        """Legacy path: one deep copy and one full `execute` per case."""
+        values: list[float | None] = []
+        for case in cases:
             try:
                 # 1. Environment Isolation
                 case_params = params.model_copy(deep=True)
 
                 # 2. Apply Overrides
-                # Growth override: applies to terminal value if applicable
-                if case.growth_override is not None:
-                    if hasattr(case_params.strategy, 'terminal_value'):
-                        case_params.strategy.terminal_value.perpetual_growth_rate = case.growth_override
-                    # Fallback for strategies without explicit terminal value (e.g. Graham)
-                    elif hasattr(case_params.strategy, 'growth_estimate'):
-                        case_params.strategy.growth_estimate = case.growth_override
+                self._apply_overrides(case_params, case)
 
                 # 3. Strategy Execution
                 # Note: results are extracted from the common results block
                 valuation_res = self.strategy.execute(financials, case_params)
-                iv = valuation_res.results.common.intrinsic_value_per_share
-                prob = case.probability or 0.0
-
-                # 4. Results Aggregation
-                outcomes.append(ScenarioOutcome(
-                    label=case.name,
-                    intrinsic_value=iv,
-                    upside_pct=(iv / market_price) - 1.0,
-                    probability=prob
-                ))
-
-                weighted_sum += iv * prob
-                total_prob += prob
+                values.append(valuation_res.results.common.intrinsic_value_per_share)
 
             except (CalculationError, ValueError, AttributeError) as e:
                 logger.warning("[Scenarios] Failed to calculate case '%s': %s", case.name, str(e))
-                continue
+                values.append(None)
+        return values
+
+    # =========================================================================
+    # OVERRIDES
+    # =========================================================================
+
+    @staticmethod
+    def _case_overrides(params: Parameters, case: ScenarioParameters) -> dict[str, Any]:
+        """
+        Maps a case's overrides onto kernel vector keys.
+
+        Growth override: applies to terminal growth if applicable, else to
+        Graham's growth estimate. Margin override: applies to the target FCF
+        margin of revenue-driven models.
 
-        # Restore original audit state
-        self.strategy.glass_box_enabled = original_audit_state
+        A growth override of 0.0 resolves to the model default, as `execute`
+        does (`DCFLibrary.compute_terminal_value`, `GrahamLibrary` read the
+        rate with a falsy default), so the kernel rows match the loop.
+        """
+        strategy = params.strategy
+        overrides: dict[str, Any] = {}
+        if case.growth_override is not None:
+            if hasattr(strategy, 'terminal_value'):
+                overrides['terminal_growth'] = case.growth_override or ModelDefaults.DEFAULT_TERMINAL_GROWTH
+            # Fallback for strategies without explicit terminal value (e.g. Graham)
+            elif hasattr(strategy, 'growth_estimate'):
+                overrides['growth'] = case.growth_override or ModelDefaults.DEFAULT_GROWTH_RATE
+        if case.margin_override is not None and hasattr(strategy, 'target_fcf_margin'):
+            overrides['target_margin'] = case.margin_override
+        return overrides
+
+    @classmethod
+    def _apply_overrides(cls, case_params: Parameters, case: ScenarioParameters) -> None:
+        """Writes the overrides of `_case_overrides` into a cloned parameter set."""
+        strategy = case_params.strategy
+        for key, value in cls._case_overrides(case_params, case).items():
+            if key == 'terminal_growth':
+                strategy.terminal_value.perpetual_growth_rate = value
+            elif key == 'growth':
+                strategy.growth_estimate = value
+            elif key == 'target_margin':
+                strategy.target_fcf_margin = value
+
+    # =========================================================================
+    # AGGREGATION
+    # =========================================================================
+
+    @staticmethod
+    def _aggregate(
+            params: Parameters,
+            cases: list[ScenarioParameters],
+            values: list[float | None],
+    ) -> ScenariosResults | None:
+        """Builds outcomes and the probability-weighted expected value."""
+        outcomes: list[ScenarioOutcome] = []
+        weighted_sum = 0.0
+        total_prob = 0.0
+        market_price = params.structure.current_price or 1.0
+
+        for case, iv in zip(cases, values):
+            if iv is None:
+                continue
+            prob = case.probability or 0.0
+            outcomes.append(ScenarioOutcome(
+                label=case.name,
+                intrinsic_value=iv,
+                upside_pct=(iv / market_price) - 1.0,
+                probability=prob
+            ))
+            weighted_sum += iv * prob
+            total_prob += prob
 
         if not outcomes:
             return None
 
-        # 5. Probability Normalization
+        # Probability Normalization
         # Ensures a valid expected value even if weights do not sum to 100%
         expected_iv = weighted_sum / total_prob if total_prob > 0 else 0.0
 
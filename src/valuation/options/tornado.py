@@ -0,0 +1,205 @@
+"""
+src/valuation/options/tornado.py
+
+TORNADO SENSITIVITY RUNNER
+==========================
+Role: Ranks every numeric driver by the value swing of a down / up move,
+all else equal (one-at-a-time sensitivity).
+Drivers: see `src.valuation.options.drivers`.
+Logic: Each variant is a scalar re-resolution of the kernel anchors on a
+single working copy of the parameters. The base case and the 2 x K variants
+are stacked into input vectors and valued by the strategy's vectorized
+kernel: one call per distinct projection horizon (three at most).
+Architecture: Runner Pattern.
+
+Fast path contract: as `ScenariosRunner` (parity probe on the base case),
+plus a probe on a share-count variant, since capital-structure drivers
+reach the kernel through the optional 'total_debt', 'cash_and_equivalents'
+and 'shares_outstanding' vectors. Otherwise every variant runs through
+`execute` on the same working copy (no per-variant deep copy).
+
+Style: Numpy docstrings.
+"""
+
+from __future__ import annotations
+
+import logging
+
+import numpy as np
+
+from src.core.exceptions import CalculationError
+from src.models.company import Company
+from src.models.parameters.base_parameter import Parameters
+from src.models.parameters.options import TornadoParameters
+from src.models.results.options import TornadoBar, TornadoResults
+from src.valuation.options.drivers import Driver, applied_driver, collect_drivers, kernel_inputs
+from src.valuation.options.scenarios import PARITY_RTOL
+from src.valuation.strategies.interface import IValuationRunner
+
+logger = logging.getLogger(__name__)
+
+
+class TornadoRunner:
+    """
+    Orchestrates the one-at-a-time sensitivity of every numeric driver.
+
+    Attributes
+    ----------
+    strategy : IValuationRunner
+        The valuation engine whose drivers are shocked.
+    """
+
+    def __init__(self, strategy: IValuationRunner):
+        self.strategy = strategy
+
+    def execute(self, params: Parameters, financials: Company) -> TornadoResults | None:
+        """
+        Values the down / up move of every driver and ranks them by swing.
+
+        Parameters
+        ----------
+        params : Parameters
+            Resolved parameters (left untouched).
+        financials : Company
+            The financial dataset used for valuation.
+
+        Returns
+        -------
+        TornadoResults | None
+            Bars sorted by decreasing swing, or None if disabled or if the base
+            case cannot be valued.
+        """
+        cfg = params.extensions.tornado
+        if not cfg.enabled:
+            return None
+
+        work = params.model_copy(deep=True)
+        drivers = collect_drivers(self.strategy, work, financials)
+        variants = [(driver, value) for driver in drivers for value in self._moves(driver, cfg)]
+
+        original_audit_state = getattr(self.strategy, 'glass_box_enabled', True)
+        self.strategy.glass_box_enabled = False
+        try:
+            values = self._evaluate_vectorized(work, financials, variants)
+            vectorized = values is not None
+            if values is None:
+                values = self._evaluate_loop(work, financials, variants)
+        finally:
+            self.strategy.glass_box_enabled = original_audit_state
+
+        if not np.isfinite(values[0]):
+            logger.warning("[Tornado] Base case could not be valued.")
+            return None
+
+        bars = []
+        for i, driver in enumerate(drivers):
+            (_, low_input), (_, high_input) = variants[2 * i], variants[2 * i + 1]
+            low_value, high_value = values[1 + 2 * i], values[2 + 2 * i]
+            # NaN from the kernel (e.g. g >= WACC) or the loop's CalculationError: no bar either way
+            if not (np.isfinite(low_value) and np.isfinite(high_value)):
+                logger.debug("[Tornado] Driver '%s' skipped (non-finite value).", driver[1])
+                continue
+            bars.append(TornadoBar(
+                driver=driver[1],
+                base_input=driver[3],
+                low_input=low_input,
+                high_input=high_input,
+                low_value=float(low_value),
+                high_value=float(high_value),
+                swing=float(abs(high_value - low_value)),
+            ))
+        bars.sort(key=lambda bar: bar.swing, reverse=True)
+
+        return TornadoResults(base_value=float(values[0]), bars=bars, vectorized=vectorized)
+
+    # =========================================================================
+    # DRIVERS
+    # =========================================================================
+
+    @staticmethod
+    def _moves(driver: Driver, cfg: TornadoParameters) -> tuple[float, float]:
+        """(down, up) values of a driver."""
+        _, _, kind, base = driver
+        if kind == "relative":
+            return base * (1.0 - cfg.relative_shock), base * (1.0 + cfg.relative_shock)
+        if kind == "years":
+            return float(max(1, int(base) - cfg.years_shock)), float(int(base) + cfg.years_shock)
+        return base - cfg.rate_shock, base + cfg.rate_shock
+
+    # =========================================================================
+    # EVALUATION PATHS
+    # =========================================================================
+
+    def _evaluate_vectorized(
+            self,
+            work: Parameters,
+            financials: Company,
+            variants: list[tuple[Driver, float]],
+    ) -> np.ndarray | None:
+        """
+        Values the base case and every variant in batched kernel calls.
+
+        Returns
+        -------
+        np.ndarray | None
+            Base value followed by the variant values, or None when the
+            strategy has no usable fast path.
+        """
+        anchors_fn = getattr(self.strategy, 'stochastic_anchors', None)
+        kernel = getattr(self.strategy, 'execute_stochastic', None)
+        if anchors_fn is None or kernel is None:
+            return None
+
+        years_driver = next(((d, v) for d, v in variants if d[2] == "years"), None)
+        try:
+            rows = [kernel_inputs(anchors_fn, work, financials)]
+            for driver, value in variants:
+                with applied_driver(work, driver, value):
+                    rows.append(kernel_inputs(anchors_fn, work, financials))
+
+            values = np.empty(len(rows))
+            for years in sorted({horizon for _, horizon in rows}):
+                idx = [i for i, (_, horizon) in enumerate(rows) if horizon == years]
+                vectors = {key: np.array([rows[i][0][key] for i in idx]) for key in rows[0][0]}
+                if years_driver is None:
+                    values[idx] = kernel(financials, work, vectors)
+                else:
+                    with applied_driver(work, years_driver[0], years):
+                        values[idx] = kernel(financials, work, vectors)
+
+            probes = [0] + [1 + i for i, (d, _) in enumerate(variants) if d[1] == "shares_outstanding"][-1:]
+            for i in probes:
+                reference = self._execute_variant(work, financials, variants[i - 1] if i else None)
+                if not np.isclose(values[i], reference, rtol=PARITY_RTOL, atol=PARITY_RTOL):
+                    logger.debug("[Tornado] %s kernel differs from execute (%.6f vs %.6f), using per-variant runs.",
+                                 type(self.strategy).__name__, values[i], reference)
+                    return None
+        except (CalculationError, ValueError, AttributeError, TypeError, KeyError, ZeroDivisionError) as e:
+            logger.debug("[Tornado] Vectorized path unavailable: %s", e)
+            return None
+
+        return values
+
+    def _execute_variant(self, work: Parameters, financials: Company,
+                         variant: tuple[Driver, float] | None) -> float:
+        """Intrinsic value of `execute` for the base case (None) or one variant."""
+        if variant is None:
+            return self.strategy.execute(financials, work).results.common.intrinsic_value_per_share
+        with applied_driver(work, *variant):
+            return self.strategy.execute(financials, work).results.common.intrinsic_value_per_share
+
+    def _evaluate_loop(
+            self,
+            work: Parameters,
+            financials: Company,
+            variants: list[tuple[Driver, float]],
+    ) -> np.ndarray:
+        """Fallback: one `execute` per variant on the shared working copy."""
+        values = np.full(len(variants) + 1, np.nan)
+        for i, variant in enumerate([None, *variants]):
+            try:
+                values[i] = self._execute_variant(work, financials, variant)
+            except (CalculationError, ValueError, AttributeError, ZeroDivisionError) as e:
+                label = "base case" if variant is None else variant[0][1]
+                logger.warning("[Tornado] Failed to value %s: %s", label, e)
+        return values
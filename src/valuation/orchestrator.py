@@ -25,6 +25,8 @@ from src.computation.financial_math import calculate_wacc
 from src.core.diagnostics import DiagnosticDomain, DiagnosticEvent, SeverityLevel
 from src.core.exceptions import CalculationError, ValuationError
 from src.core.quant_logger import QuantLogger
+from src.core.resource_accounting import ResourceAccountant, resource_accounting_requested
+from src.core.tracing import tracer
 from src.models import Parameters
 from src.models.benchmarks import CompanyStats, MarketContext, SectorMultiples, SectorPerformance
 from src.models.company import CompanySnapshot
@@ -40,10 +42,13 @@ from src.valuation.guardrails import (
 )
 
 # Options/Extensions Runners
+from src.valuation.options.greeks import GreeksRunner
 from src.valuation.options.monte_carlo import MonteCarloRunner
+from src.valuation.options.reverse_dcf import ReverseDCFRunner
 from src.valuation.options.scenarios import ScenariosRunner
 from src.valuation.options.sensitivity import SensitivityRunner
 from src.valuation.options.sotp import SOTPRunner
+from src.valuation.options.tornado import TornadoRunner
 
 # Registry & Interface
 from src.valuation.registry import get_strategy
@@ -63,10 +68,19 @@ class ValuationOrchestrator:
     layer to trigger complex financial simulations.
     """
 
-    def __init__(self):
-        """Initializes the required resolvers for hydration."""
+    def __init__(self, track_resources: bool | None = None):
+        """
+        Initializes the required resolvers for hydration.
+
+        Parameters
+        ----------
+        track_resources : bool, optional
+            Records CPU time, peak traced memory and allocations per stage into
+            `ValuationRunMetadata`. Defaults to the VALUATION_RESOURCE_ACCOUNTING flag.
+        """
         self.resolver = Resolver()
         self.extension_resolver = ExtensionResolver()
+        self.track_resources = resource_accounting_requested() if track_resources is None else track_resources
 
     @staticmethod
     def _run_guardrails(params: Parameters) -> tuple[list[DiagnosticEvent], bool]:
@@ -92,7 +106,7 @@ class ValuationOrchestrator:
             wacc_breakdown = calculate_wacc(financials, params)
             wacc = wacc_breakdown.wacc
         except Exception as e:
-            logger.warning(f"Could not calculate WACC for guardrails: {e}. Using default.")
+            logger.warning("Could not calculate WACC for guardrails: %s. Using default.", e)
             wacc = 0.10  # Fallback default
 
         # Run each guardrail
@@ -123,11 +137,11 @@ class ValuationOrchestrator:
             events.append(event)
 
             if check.type == "error":
-                logger.error(f"[Guardrail] {check.code}: {check.message}")
+                logger.error("[Guardrail] %s: %s", check.code, check.message)
             elif check.type == "warning":
-                logger.warning(f"[Guardrail] {check.code}: {check.message}")
+                logger.warning("[Guardrail] %s: %s", check.code, check.message)
             else:
-                logger.info(f"[Guardrail] {check.code}: {check.message}")
+                logger.info("[Guardrail] %s: %s", check.code, check.message)
 
         return events, has_errors
 
@@ -189,20 +203,32 @@ class ValuationOrchestrator:
         ValuationResult
             The complete result envelope with core results and extensions.
         """
+        with tracer.span("valuation.run", ticker=request.parameters.structure.ticker, mode=request.mode.value), \
+                ResourceAccountant(enabled=self.track_resources) as accountant:
+            return self._run(request, snapshot, accountant)
+
+    def _run(
+            self,
+            request: ValuationRequest,
+            snapshot: CompanySnapshot,
+            accountant: ResourceAccountant,
+    ) -> ValuationResult:
+        """Pipeline body of `run` (wrapped in the root trace span)."""
         start_time = time.time()
         ticker = request.parameters.structure.ticker
-        logger.info(f"[Orchestrator] Starting pipeline for {ticker}")
+        logger.info("[Orchestrator] Starting pipeline for %s", ticker)
         QuantLogger.log_stage_start(ticker, "HYDRATION")
 
         # --- PHASE 1: HYDRATION (Ghost -> Solid) ---
-        # Arbitrate between User Overrides, Snapshot Data, and Defaults.
-        params = self.resolver.resolve(request.parameters, snapshot)
+        with tracer.span("hydration"), accountant.stage("hydration"):
+            # Arbitrate between User Overrides, Snapshot Data, and Defaults.
+            params = self.resolver.resolve(request.parameters, snapshot)
 
-        # Hydrate Extension configurations (Monte Carlo, Sensitivity, etc.).
-        params.extensions = self.extension_resolver.resolve(params.extensions)
+            # Hydrate Extension configurations (Monte Carlo, Sensitivity, etc.).
+            params.extensions = self.extension_resolver.resolve(params.extensions)
 
-        # Compute input hash for provenance
-        input_hash = hashlib.sha256(params.model_dump_json().encode()).hexdigest()
+            # Compute input hash for provenance
+            input_hash = hashlib.sha256(params.model_dump_json().encode()).hexdigest()
         hydration_ms = int((time.time() - start_time) * 1000)
         QuantLogger.log_stage_complete(ticker, "HYDRATION", duration_ms=hydration_ms)
 
@@ -237,8 +263,9 @@ class ValuationOrchestrator:
         )
 
         # --- PHASE 1.7: ECONOMIC GUARDRAILS ---
-        logger.info(f"[Orchestrator] Running economic guardrails for {ticker}")
-        guardrail_events, has_blocking_errors = self._run_guardrails(params)
+        logger.info("[Orchestrator] Running economic guardrails for %s", ticker)
+        with tracer.span("guardrails"), accountant.stage("guardrails"):
+            guardrail_events, has_blocking_errors = self._run_guardrails(params)
 
         if has_blocking_errors:
             error_messages = [
@@ -260,12 +287,14 @@ class ValuationOrchestrator:
         try:
             # Execute the core deterministic valuation logic.
             strategy_start = time.time()
-            valuation_output = strategy_runner.execute(params.structure, params)
+            with tracer.span("strategy.execute", category="strategy", strategy=type(strategy_runner).__name__), \
+                    accountant.stage("strategy"):
+                valuation_output = strategy_runner.execute(params.structure, params)
             strategy_ms = int((time.time() - strategy_start) * 1000)
             QuantLogger.log_stage_complete(ticker, "STRATEGY_EXECUTION", duration_ms=strategy_ms)
 
             # --- PHASE 3: EXTENSIONS (The Risk & Market Pillars) ---
-            self._process_extensions(valuation_output, strategy_runner, params, ticker)
+            self._process_extensions(valuation_output, strategy_runner, params, ticker, accountant)
 
             # Post-calculation metadata (Upside/Downside).
             valuation_output.compute_upside()
@@ -288,19 +317,23 @@ class ValuationOrchestrator:
             valuation_output.company_stats = CompanyStats.compute(snapshot)
 
             execution_time = int((time.time() - start_time) * 1000)
-            logger.info(f"[Orchestrator] Execution successful for {ticker} in {execution_time}ms")
+            logger.info("[Orchestrator] Execution successful for %s in %dms", ticker, execution_time)
 
             # --- PHASE 4: METADATA ATTACHMENT ---
             random_seed = None
             if params.extensions.monte_carlo and params.extensions.monte_carlo.enabled:
                 random_seed = params.extensions.monte_carlo.random_seed
 
+            totals = accountant.totals()
             metadata = ValuationRunMetadata(
                 model_name=request.mode.value,
                 ticker=ticker,
                 random_seed=random_seed,
                 input_hash=input_hash,
-                execution_time_ms=execution_time
+                execution_time_ms=execution_time,
+                cpu_time_ms=totals["cpu_time_ms"] if totals else None,
+                peak_memory_bytes=totals["peak_memory_bytes"] if totals else None,
+                stage_resources=accountant.stages,
             )
             valuation_output.metadata = metadata
 
@@ -318,10 +351,10 @@ class ValuationOrchestrator:
             return valuation_output
 
         except ValuationError as e:
-            logger.error(f"[Orchestrator] Known valuation failure: {e}")
+            logger.error("[Orchestrator] Known valuation failure: %s", e)
             raise e
         except Exception as e:
-            logger.critical(f"[Orchestrator] Unexpected system failure: {e}")
+            logger.critical("[Orchestrator] Unexpected system failure: %s", e)
             raise CalculationError(f"Internal Engine Failure: {str(e)}")
 
     @staticmethod
@@ -330,10 +363,14 @@ class ValuationOrchestrator:
             strategy_runner: IValuationRunner,
             params: Parameters,
             ticker: str = "N/A",
+            accountant: ResourceAccountant | None = None,
     ) -> None:
         """
         Executes enabled analytical modules and attaches results to the envelope.
+        Each extension is metered as an "extension.<name>" stage when an enabled
+        accountant is given.
         """
+        accountant = accountant or ResourceAccountant()
         ext_params = params.extensions
         ext_results = base_result.results.extensions
         financials = params.structure
@@ -341,30 +378,58 @@ class ValuationOrchestrator:
         # 1. Monte Carlo Simulation (Stochastic Analysis).
         if ext_params.monte_carlo.enabled:
             ext_start = time.time()
-            mc_runner = MonteCarloRunner(strategy_runner)
-            ext_results.monte_carlo = mc_runner.execute(params, financials)
+            with tracer.span("extension.monte_carlo", category="extension"), accountant.stage("extension.monte_carlo"):
+                mc_runner = MonteCarloRunner(strategy_runner)
+                ext_results.monte_carlo = mc_runner.execute(params, financials)
             ext_ms = int((time.time() - ext_start) * 1000)
             QuantLogger.log_extension_processing(ticker, "MONTE_CARLO", duration_ms=ext_ms)
 
         # 2. Sensitivity Analysis (Deterministic 2D Heatmap).
         if ext_params.sensitivity.enabled:
             ext_start = time.time()
-            sensi_runner = SensitivityRunner(strategy_runner)
-            ext_results.sensitivity = sensi_runner.execute(params, financials)
+            with tracer.span("extension.sensitivity", category="extension"), accountant.stage("extension.sensitivity"):
+                sensi_runner = SensitivityRunner(strategy_runner)
+                ext_results.sensitivity = sensi_runner.execute(params, financials)
             ext_ms = int((time.time() - ext_start) * 1000)
             QuantLogger.log_extension_processing(ticker, "SENSITIVITY", duration_ms=ext_ms)
 
+        # 2b. Tornado Sensitivity (One-at-a-time driver ranking).
+        if ext_params.tornado.enabled:
+            ext_start = time.time()
+            with tracer.span("extension.tornado", category="extension"), accountant.stage("extension.tornado"):
+                ext_results.tornado = TornadoRunner(strategy_runner).execute(params, financials)
+            ext_ms = int((time.time() - ext_start) * 1000)
+            QuantLogger.log_extension_processing(ticker, "TORNADO", duration_ms=ext_ms)
+
+        # 2c. Greeks (Gradient of the intrinsic value).
+        if ext_params.greeks.enabled:
+            ext_start = time.time()
+            with tracer.span("extension.greeks", category="extension"), accountant.stage("extension.greeks"):
+                ext_results.greeks = GreeksRunner(strategy_runner).execute(params, financials)
+            ext_ms = int((time.time() - ext_start) * 1000)
+            QuantLogger.log_extension_processing(ticker, "GREEKS", duration_ms=ext_ms)
+
+        # 2d. Reverse DCF (Market-implied growth / discount rate).
+        if ext_params.reverse_dcf.enabled:
+            ext_start = time.time()
+            with tracer.span("extension.reverse_dcf", category="extension"), accountant.stage("extension.reverse_dcf"):
+                ext_results.reverse_dcf = ReverseDCFRunner(strategy_runner).execute(params, financials)
+            ext_ms = int((time.time() - ext_start) * 1000)
+            QuantLogger.log_extension_processing(ticker, "REVERSE_DCF", duration_ms=ext_ms)
+
         # 3. Scenario Analysis (Weighted deterministic cases).
         if ext_params.scenarios.enabled:
             ext_start = time.time()
-            scenario_runner = ScenariosRunner(strategy_runner)
-            ext_results.scenarios = scenario_runner.execute(params, financials)
+            with tracer.span("extension.scenarios", category="extension"), accountant.stage("extension.scenarios"):
+                scenario_runner = ScenariosRunner(strategy_runner)
+                ext_results.scenarios = scenario_runner.execute(params, financials)
             ext_ms = int((time.time() - ext_start) * 1000)
             QuantLogger.log_extension_processing(ticker, "SCENARIOS", duration_ms=ext_ms)
 
         # 4. Sum-of-the-parts (SOTP / Conglomerate Bridge).
         if ext_params.sotp.enabled:
             ext_start = time.time()
-            ext_results.sotp = SOTPRunner.execute(params)
+            with tracer.span("extension.sotp", category="extension"), accountant.stage("extension.sotp"):
+                ext_results.sotp = SOTPRunner.execute(params)
             ext_ms = int((time.time() - ext_start) * 1000)
             QuantLogger.log_extension_processing(ticker, "SOTP", duration_ms=ext_ms)
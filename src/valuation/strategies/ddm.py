@@ -22,6 +22,7 @@ from src.computation.financial_math import calculate_discount_factors
 
 # Config & i18n
 from src.config.constants import ModelDefaults
+from src.core.tracing import tracer
 from src.i18n import RegistryTexts, SharedTexts, StrategyFormulas, StrategyInterpretations, StrategySources
 from src.models.company import Company
 from src.models.enums import ValuationMethodology, VariableSource
@@ -39,6 +40,7 @@ from src.models.valuation import ValuationRequest, ValuationResult
 # Libraries
 from src.valuation.library.common import CommonLibrary
 from src.valuation.library.dcf import DCFLibrary
+from src.valuation.library.dcf_vector import DCFVectorLibrary
 from src.valuation.strategies.interface import IValuationRunner
 
 
@@ -208,6 +210,34 @@ class DividendDiscountStrategy(IValuationRunner):
             )
         )
 
+    @staticmethod
+    def stochastic_anchors(financials: Company, params: Parameters) -> dict[str, float]:
+        """
+        Deterministic centre of the `execute_stochastic` input vectors.
+        'wacc' holds Ke and 'base_flow' the total dividend mass (D0 × shares).
+        """
+        ke, _ = CommonLibrary.resolve_discount_rate(financials, params, use_cost_of_equity_only=True)
+        g_start, g_term, _ = DCFLibrary.resolve_projection_inputs(params)
+        user_div = cast(DDMParameters, params.strategy).dividend_per_share
+        d0_per_share = user_div if user_div is not None else (getattr(financials, 'dividend_share', None) or 0.0)
+        shares = params.common.capital.shares_outstanding or ModelDefaults.DEFAULT_SHARES_OUTSTANDING
+        return {'wacc': ke, 'growth': g_start, 'terminal_growth': g_term, 'base_flow': d0_per_share * shares}
+
+    @staticmethod
+    def stochastic_flows(_financials: Company, params: Parameters, vectors: dict[str, np.ndarray]) -> np.ndarray:
+        """
+        Projected dividend mass [YEARS, N_SIMS] of `execute_stochastic` (workspace view).
+
+        Follows the projection branch of `execute`, or the optional 'growth_path'
+        and 'flow_noise' matrices of path-dependent Monte Carlo. Also feeds the
+        Monte Carlo fan chart.
+        """
+        years, manual_vector, g_centre = DCFVectorLibrary.resolve_projection(params)
+        return DCFVectorLibrary.project_flows(
+            vectors['base_flow'], vectors['growth'], vectors['terminal_growth'], years, manual_vector, g_centre,
+            vectors.get('growth_path'), vectors.get('flow_noise'),
+        )
+
     @staticmethod
     def execute_stochastic(_financials: Company, params: Parameters, vectors: dict[str, np.ndarray]) -> np.ndarray:
         """
@@ -239,50 +269,20 @@ class DividendDiscountStrategy(IValuationRunner):
         # Note: For DDM, the 'wacc' vector from MC engine contains the Cost of Equity (Ke)
         # because resolve_discount_rate logic in MC is generic but driven by Beta shocks.
         ke_vec = vectors['wacc']
-        g_p1 = vectors['growth']
         g_n  = vectors['terminal_growth']
 
-        # Base Flow is Total Dividend Mass here (D0 * Shares)
-        div_0 = vectors['base_flow']
-
-        # 2. Vectorized Projection (Phase 1)
-        years = getattr(params.strategy, 'projection_years', 5) or 5
-
-        # Create a time matrix [N_SIMS, YEARS] -> e.g. [1, 2, 3, 4, 5]
-        time_exponents = np.arange(1, years + 1)
-
-        # Growth factors matrix: [N_SIMS, YEARS]
-        growth_factors = (1 + g_p1)[:, np.newaxis] ** time_exponents
-        projected_divs = div_0[:, np.newaxis] * growth_factors
-
-        # 3. Vectorized Discounting
-        # Discount factors: 1 / (1 + Ke)^t
-        discount_factors = 1.0 / ((1 + ke_vec)[:, np.newaxis] ** time_exponents)
-
-        # PV of Explicit Dividends
-        pv_explicit = np.sum(projected_divs * discount_factors, axis=1)
-
-        # 4. Vectorized Terminal Value
-        # TV = Div_n * (1 + g_n) / (Ke - g_n)
-        final_div = projected_divs[:, -1]
-
-        # Safety guardrail: Ensure Ke > g_n
-        denominator = np.maximum(ke_vec - g_n, 0.001)
-
-        tv_nominal = final_div * (1 + g_n) / denominator
-
-        # Discount TV back to T0
-        pv_tv = tv_nominal / ((1 + ke_vec) ** years)
+        with tracer.span("kernel.projection", category="kernel"):
+            # 2. Vectorized Projection: dividends [YEARS, N_SIMS]
+            projected_divs = DividendDiscountStrategy.stochastic_flows(_financials, params, vectors)
 
-        # 5. Total Equity Value
-        # DDM calculates Equity Value directly.
-        # Typically DDM does not add Cash separately as it values the payout stream directly.
-        # We align with the main execute() logic which sums discounted flows.
-        total_equity = pv_explicit + pv_tv
+        with tracer.span("kernel.terminal_value", category="kernel"):
+            # 3. Vectorized Terminal Value (at Ke)
+            tv = DCFVectorLibrary.compute_terminal_value(projected_divs[-1], ke_vec, g_n, params)
 
-        # 6. Intrinsic Value Per Share
-        shares = params.common.capital.shares_outstanding or 1.0
-        iv_per_share = total_equity / shares
+        with tracer.span("kernel.discounting", category="kernel"):
+            # 4. Discount at Ke. Result is Total Equity Value.
+            # DDM does not add Cash separately as it values the payout stream directly.
+            total_equity = DCFVectorLibrary.compute_discounting(projected_divs, tv, ke_vec)
 
-        iv_result: np.ndarray = iv_per_share
-        return iv_result
+        # 5. Intrinsic Value Per Share
+        return DCFVectorLibrary.compute_value_per_share(total_equity, params, vectors.get('shares_outstanding'))
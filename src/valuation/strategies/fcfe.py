@@ -20,6 +20,7 @@ import numpy as np
 from src.computation.financial_math import calculate_discount_factors
 
 # Config & i18n
+from src.core.tracing import tracer
 from src.i18n import KPITexts, RegistryTexts, StrategyFormulas, StrategyInterpretations, StrategySources
 from src.models.company import Company
 from src.models.enums import ValuationMethodology, VariableSource
@@ -37,6 +38,7 @@ from src.models.valuation import ValuationRequest, ValuationResult
 # Libraries
 from src.valuation.library.common import CommonLibrary
 from src.valuation.library.dcf import DCFLibrary
+from src.valuation.library.dcf_vector import DCFVectorLibrary
 from src.valuation.strategies.interface import IValuationRunner
 
 
@@ -200,6 +202,29 @@ class FCFEStrategy(IValuationRunner):
             )
         )
 
+    @staticmethod
+    def stochastic_anchors(financials: Company, params: Parameters) -> dict[str, float]:
+        """Deterministic centre of the `execute_stochastic` input vectors ('wacc' holds Ke)."""
+        ke, _ = CommonLibrary.resolve_discount_rate(financials, params, use_cost_of_equity_only=True)
+        g_start, g_term, _ = DCFLibrary.resolve_projection_inputs(params)
+        fcfe_base = cast(FCFEParameters, params.strategy).fcfe_anchor or 0.0
+        return {'wacc': ke, 'growth': g_start, 'terminal_growth': g_term, 'base_flow': fcfe_base}
+
+    @staticmethod
+    def stochastic_flows(_financials: Company, params: Parameters, vectors: dict[str, np.ndarray]) -> np.ndarray:
+        """
+        Projected FCFE [YEARS, N_SIMS] of `execute_stochastic` (workspace view).
+
+        Follows the projection branch of `execute`, or the optional 'growth_path'
+        and 'flow_noise' matrices of path-dependent Monte Carlo. Also feeds the
+        Monte Carlo fan chart.
+        """
+        years, manual_vector, g_centre = DCFVectorLibrary.resolve_projection(params)
+        return DCFVectorLibrary.project_flows(
+            vectors['base_flow'], vectors['growth'], vectors['terminal_growth'], years, manual_vector, g_centre,
+            vectors.get('growth_path'), vectors.get('flow_noise'),
+        )
+
     @staticmethod
     def execute_stochastic(_financials: Company, params: Parameters, vectors: dict[str, np.ndarray]) -> np.ndarray:
         """
@@ -210,35 +235,24 @@ class FCFEStrategy(IValuationRunner):
         """
         # 1. Unpack Vectors
         ke_vec = vectors['wacc'] # Maps to Ke for FCFE
-        g_p1 = vectors['growth']
         g_n  = vectors['terminal_growth']
-        fcfe_0 = vectors['base_flow']
-
-        # 2. Vectorized Projection
-        years = getattr(params.strategy, 'projection_years', 5) or 5
-        time_exponents = np.arange(1, years + 1)
 
-        # Growth
-        growth_factors = (1 + g_p1)[:, np.newaxis] ** time_exponents
-        projected_flows = fcfe_0[:, np.newaxis] * growth_factors
+        with tracer.span("kernel.projection", category="kernel"):
+            # 2. Vectorized Projection
+            flows = FCFEStrategy.stochastic_flows(_financials, params, vectors)
 
-        # 3. Discounting (at Ke)
-        discount_factors = 1.0 / ((1 + ke_vec)[:, np.newaxis] ** time_exponents)
-        pv_explicit = np.sum(projected_flows * discount_factors, axis=1)
+        with tracer.span("kernel.terminal_value", category="kernel"):
+            # 3. Terminal Value (at Ke)
+            tv = DCFVectorLibrary.compute_terminal_value(flows[-1], ke_vec, g_n, params)
 
-        # 4. Terminal Value
-        final_flow = projected_flows[:, -1]
-        denominator = np.maximum(ke_vec - g_n, 0.001)
-        tv_nominal = final_flow * (1 + g_n) / denominator
-        pv_tv = tv_nominal / ((1 + ke_vec) ** years)
+        with tracer.span("kernel.discounting", category="kernel"):
+            # 4. Discounting (at Ke)
+            pv_equity = DCFVectorLibrary.compute_discounting(flows, tv, ke_vec)
 
         # 5. Total Equity Value
         # Equity = PV(FCFE) + Cash
-        cash = params.common.capital.cash_and_equivalents or 0.0
-        total_equity = pv_explicit + pv_tv + cash
+        cash = vectors.get('cash_and_equivalents', params.common.capital.cash_and_equivalents or 0.0)
+        pv_equity += cash
 
         # 6. Intrinsic Value Per Share
-        shares = params.common.capital.shares_outstanding or 1.0
-        iv_per_share: np.ndarray = total_equity / shares
-
-        return iv_per_share
+        return DCFVectorLibrary.compute_value_per_share(pv_equity, params, vectors.get('shares_outstanding'))
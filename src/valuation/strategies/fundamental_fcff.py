@@ -20,6 +20,7 @@ import numpy as np
 from src.computation.financial_math import calculate_discount_factors
 
 # Config & i18n
+from src.core.tracing import tracer
 from src.i18n import RegistryTexts, StrategyFormulas, StrategyInterpretations, StrategySources
 from src.models.company import Company
 from src.models.enums import ValuationMethodology, VariableSource
@@ -37,6 +38,7 @@ from src.models.valuation import ValuationRequest, ValuationResult
 # Libraries (DRY Logic)
 from src.valuation.library.common import CommonLibrary
 from src.valuation.library.dcf import DCFLibrary
+from src.valuation.library.dcf_vector import DCFVectorLibrary
 from src.valuation.strategies.interface import IValuationRunner
 
 
@@ -187,6 +189,29 @@ class FundamentalFCFFStrategy(IValuationRunner):
             )
         )
 
+    @staticmethod
+    def stochastic_anchors(financials: Company, params: Parameters) -> dict[str, float]:
+        """Deterministic centre of the `execute_stochastic` input vectors (see StandardFCFFStrategy)."""
+        wacc, _ = CommonLibrary.resolve_discount_rate(financials, params, use_cost_of_equity_only=False)
+        g_start, g_term, _ = DCFLibrary.resolve_projection_inputs(params)
+        fcf_anchor = cast(FCFFNormalizedParameters, params.strategy).fcf_norm or 0.0
+        return {'wacc': wacc, 'growth': g_start, 'terminal_growth': g_term, 'base_flow': fcf_anchor}
+
+    @staticmethod
+    def stochastic_flows(_financials: Company, params: Parameters, vectors: dict[str, np.ndarray]) -> np.ndarray:
+        """
+        Projected normalized free cash flows [YEARS, N_SIMS] of `execute_stochastic` (workspace view).
+
+        Follows the projection branch of `execute`, or the optional 'growth_path'
+        and 'flow_noise' matrices of path-dependent Monte Carlo. Also feeds the
+        Monte Carlo fan chart.
+        """
+        years, manual_vector, g_centre = DCFVectorLibrary.resolve_projection(params)
+        return DCFVectorLibrary.project_flows(
+            vectors['base_flow'], vectors['growth'], vectors['terminal_growth'], years, manual_vector, g_centre,
+            vectors.get('growth_path'), vectors.get('flow_noise'),
+        )
+
     @staticmethod
     def execute_stochastic(_financials: Company, params: Parameters, vectors: dict[str, np.ndarray]) -> np.ndarray:
         """
@@ -195,35 +220,21 @@ class FundamentalFCFFStrategy(IValuationRunner):
         """
         # 1. Unpack Vectors
         wacc = vectors['wacc']
-        g_p1 = vectors['growth']
         g_n  = vectors['terminal_growth']
-        fcf_0 = vectors['base_flow'] # Represents the shocked Normalized FCF
-
-        # 2. Vectorized Projection
-        years = getattr(params.strategy, 'projection_years', 5) or 5
-        time_exponents = np.arange(1, years + 1)
 
-        # Growth factors: (1+g)^t
-        growth_factors = (1 + g_p1)[:, np.newaxis] ** time_exponents
-        projected_flows = fcf_0[:, np.newaxis] * growth_factors
+        with tracer.span("kernel.projection", category="kernel"):
+            # 2. Vectorized Projection
+            flows = FundamentalFCFFStrategy.stochastic_flows(_financials, params, vectors)
 
-        # 3. Discounting
-        discount_factors = 1.0 / ((1 + wacc)[:, np.newaxis] ** time_exponents)
-        pv_explicit = np.sum(projected_flows * discount_factors, axis=1)
+        with tracer.span("kernel.terminal_value", category="kernel"):
+            # 3. Terminal Value
+            tv = DCFVectorLibrary.compute_terminal_value(flows[-1], wacc, g_n, params)
 
-        # 4. Terminal Value
-        final_flow = projected_flows[:, -1]
-        denominator = np.maximum(wacc - g_n, 0.001)
-        tv_nominal = final_flow * (1 + g_n) / denominator
-        pv_tv = tv_nominal / ((1 + wacc) ** years)
+        with tracer.span("kernel.discounting", category="kernel"):
+            # 4. Discounting
+            ev = DCFVectorLibrary.compute_discounting(flows, tv, wacc)
 
         # 5. Equity Bridge
-        ev = pv_explicit + pv_tv
-
-        shares = params.common.capital.shares_outstanding or 1.0
-        net_debt = (params.common.capital.total_debt or 0.0) - (params.common.capital.cash_and_equivalents or 0.0)
-
-        equity_value = ev - net_debt
-        iv_per_share: np.ndarray = equity_value / shares
-
-        return iv_per_share
+        equity_value = DCFVectorLibrary.compute_equity_bridge(
+            ev, params, vectors.get('total_debt'), vectors.get('cash_and_equivalents'))
+        return DCFVectorLibrary.compute_value_per_share(equity_value, params, vectors.get('shares_outstanding'))
@@ -164,6 +164,21 @@ class GrahamNumberStrategy(IValuationRunner):
             )
         )
 
+    @staticmethod
+    def stochastic_anchors(financials: Company, params: Parameters) -> dict[str, float]:
+        """
+        Deterministic centre of the `execute_stochastic` input vectors.
+        'base_flow' is the EPS, 'growth' the growth estimate and 'wacc' the AAA yield.
+        """
+        s = cast(GrahamParameters, params.strategy)
+        aaa_yield = params.common.rates.corporate_aaa_yield or MacroDefaults.DEFAULT_CORPORATE_AAA_YIELD
+        return {
+            'wacc': aaa_yield,
+            'growth': s.growth_estimate or ModelDefaults.DEFAULT_GROWTH_RATE,
+            'terminal_growth': 0.0,
+            'base_flow': s.eps_normalized or 0.0,
+        }
+
     @staticmethod
     def execute_stochastic(_financials: Company, params: Parameters, vectors: dict[str, np.ndarray]) -> np.ndarray:
         """
@@ -28,6 +28,7 @@ from src.computation.financial_math import calculate_discount_factors
 
 # Config & i18n
 from src.config.constants import ModelDefaults
+from src.core.tracing import tracer
 from src.i18n import RegistryTexts, StrategyFormulas, StrategyInterpretations, StrategySources
 from src.models.company import Company
 from src.models.enums import ValuationMethodology, VariableSource
@@ -45,6 +46,7 @@ from src.models.valuation import ValuationRequest, ValuationResult
 # Libraries (DRY Logic)
 from src.valuation.library.common import CommonLibrary
 from src.valuation.library.dcf import DCFLibrary
+from src.valuation.library.dcf_vector import DCFVectorLibrary
 from src.valuation.strategies.interface import IValuationRunner
 
 
@@ -198,6 +200,57 @@ class RevenueGrowthFCFFStrategy(IValuationRunner):
             )
         )
 
+    @staticmethod
+    def stochastic_anchors(financials: Company, params: Parameters) -> dict[str, float]:
+        """
+        Deterministic centre of the `execute_stochastic` input vectors (see StandardFCFFStrategy).
+        Adds 'target_margin', the FCF margin reached at the end of the projection.
+        """
+        strategy_params = cast(FCFFGrowthParameters, params.strategy)
+        wacc, _ = CommonLibrary.resolve_discount_rate(financials, params, use_cost_of_equity_only=False)
+        user_rev = strategy_params.revenue_ttm
+        rev_anchor = user_rev if user_rev is not None else (getattr(financials, 'revenue_ttm', None) or 0.0)
+        g_term = strategy_params.terminal_value.perpetual_growth_rate
+        return {
+            'wacc': wacc,
+            'growth': strategy_params.revenue_growth_rate or ModelDefaults.DEFAULT_GROWTH_RATE,
+            'terminal_growth': g_term if g_term is not None else ModelDefaults.DEFAULT_TERMINAL_GROWTH,
+            'base_flow': rev_anchor,
+            'target_margin': strategy_params.target_fcf_margin or ModelDefaults.DEFAULT_FCF_MARGIN_TARGET,
+        }
+
+    @staticmethod
+    def stochastic_flows(financials: Company, params: Parameters, vectors: dict[str, np.ndarray]) -> np.ndarray:
+        """
+        Projected FCF [YEARS, N_SIMS] of `execute_stochastic` (workspace view).
+
+        Revenue (shocked 'base_flow' and 'growth', or the optional 'growth_path'
+        and 'flow_noise' matrices of path-dependent Monte Carlo) times the
+        margin curve (linear convergence from current to target, per path when
+        vectors carry an optional 'target_margin'). Also feeds the Monte Carlo
+        fan chart.
+        """
+        # Horizon and Margins resolved exactly as `execute`
+        strategy_params = cast(FCFFGrowthParameters, params.strategy)
+        years = strategy_params.projection_years or ModelDefaults.DEFAULT_PROJECTION_YEARS
+        g_centre = strategy_params.revenue_growth_rate or ModelDefaults.DEFAULT_GROWTH_RATE
+
+        # Current Margin (Scalar), anchored on the deterministic revenue
+        user_rev = strategy_params.revenue_ttm
+        rev_anchor = user_rev if user_rev is not None else (getattr(financials, 'revenue_ttm', None) or 0.0)
+        fcf_ttm = getattr(financials, 'fcf_ttm', None) or 0.0
+        current_margin = (fcf_ttm / rev_anchor) if rev_anchor > 0 else 0.0
+
+        # Target Margin: per path (scenario margin overrides) when vectors carry 'target_margin'
+        target_margin = vectors.get(
+            'target_margin', strategy_params.target_fcf_margin or ModelDefaults.DEFAULT_FCF_MARGIN_TARGET)
+
+        return DCFVectorLibrary.project_flows_revenue_model(
+            vectors['base_flow'], current_margin, target_margin, vectors['growth'], vectors['terminal_growth'],
+            years, strategy_params.manual_growth_vector, g_centre,
+            vectors.get('growth_path'), vectors.get('flow_noise'),
+        )
+
     @staticmethod
     def execute_stochastic(financials: Company, params: Parameters, vectors: dict[str, np.ndarray]) -> np.ndarray:
         """
@@ -205,63 +258,28 @@ class RevenueGrowthFCFFStrategy(IValuationRunner):
 
         Logic:
         1. Project Revenue (using shocked base_flow and growth vector).
-        2. Apply Margin Curve (Linear convergence from current to target).
+        2. Apply Margin Curve (Linear convergence from current to target,
+           per path when vectors carry an optional 'target_margin').
         3. FCF = Revenue * Margin.
         4. Discount.
         """
         # 1. Unpack Vectors
         wacc = vectors['wacc']
-        g_p1 = vectors['growth'] # Revenue Growth
         g_n  = vectors['terminal_growth']
-        rev_0 = vectors['base_flow'] # Shocked Revenue TTM
 
-        # 2. Resolve Margins (Static Profile applied to Dynamic Revenue)
-        # We need to construct the margin curve [Years]
-        strategy_params = cast(FCFFGrowthParameters, params.strategy)
-        years = strategy_params.projection_years or 5
-
-        # Current Margin (Scalar)
-        # We use TTM values from financials as the anchor for margin calculation
-        # This keeps the margin profile consistent with the fundamental view
-        base_rev_static = getattr(financials, 'revenue_ttm', None) or 1.0
-        fcf_ttm = getattr(financials, 'fcf_ttm', None) or 0.0
-        current_margin = fcf_ttm / base_rev_static
-
-        target_margin = strategy_params.target_fcf_margin or ModelDefaults.DEFAULT_FCF_MARGIN_TARGET
+        with tracer.span("kernel.projection", category="kernel"):
+            # 2-3. Revenue Projection x Margin Convergence: FCF [YEARS, N_SIMS]
+            flows = RevenueGrowthFCFFStrategy.stochastic_flows(financials, params, vectors)
 
-        # Create Margin Vector [Years] via linear interpolation
-        # shape: (Years,) e.g. [0.12, 0.14, 0.16, 0.18, 0.20]
-        margin_curve = np.linspace(current_margin, target_margin, years + 1)[1:] # Skip index 0 (current)
-
-        # 3. Vectorized Revenue Projection
-        time_exponents = np.arange(1, years + 1)
-
-        # Revenue Factors [N_SIMS, YEARS]
-        growth_factors = (1 + g_p1)[:, np.newaxis] ** time_exponents
-        projected_revenue = rev_0[:, np.newaxis] * growth_factors
-
-        # 4. Derive FCF [N_SIMS, YEARS]
-        # Broadcasting: [N, Y] * [Y] -> [N, Y]
-        projected_flows = projected_revenue * margin_curve
-
-        # 5. Discounting
-        discount_factors = 1.0 / ((1 + wacc)[:, np.newaxis] ** time_exponents)
-        pv_explicit = np.sum(projected_flows * discount_factors, axis=1)
-
-        # 6. Terminal Value
-        # Uses last year FCF and Revenue Growth? No, Gordon Growth on FCF.
-        final_flow = projected_flows[:, -1]
-        denominator = np.maximum(wacc - g_n, 0.001)
-        tv_nominal = final_flow * (1 + g_n) / denominator
-        pv_tv = tv_nominal / ((1 + wacc) ** years)
-
-        # 7. Equity Bridge
-        ev = pv_explicit + pv_tv
-
-        shares = params.common.capital.shares_outstanding or 1.0
-        net_debt = (params.common.capital.total_debt or 0.0) - (params.common.capital.cash_and_equivalents or 0.0)
+        with tracer.span("kernel.terminal_value", category="kernel"):
+            # 4. Terminal Value
+            tv = DCFVectorLibrary.compute_terminal_value(flows[-1], wacc, g_n, params)
 
-        equity_value = ev - net_debt
-        iv_per_share: np.ndarray = equity_value / shares
+        with tracer.span("kernel.discounting", category="kernel"):
+            # 5. Discounting
+            ev = DCFVectorLibrary.compute_discounting(flows, tv, wacc)
 
-        return iv_per_share
+        # 6. Equity Bridge
+        equity_value = DCFVectorLibrary.compute_equity_bridge(
+            ev, params, vectors.get('total_debt'), vectors.get('cash_and_equivalents'))
+        return DCFVectorLibrary.compute_value_per_share(equity_value, params, vectors.get('shares_outstanding'))
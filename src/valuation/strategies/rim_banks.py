@@ -18,8 +18,11 @@ from typing import cast
 import numpy as np
 
 from src.computation.financial_math import calculate_discount_factors
+from src.computation.workspace import get_workspace
 
 # Config & i18n
+from src.config.constants import ModelDefaults
+from src.core.tracing import tracer
 from src.i18n import RegistryTexts, StrategyFormulas, StrategyInterpretations, StrategySources
 from src.models.company import Company
 from src.models.enums import ValuationMethodology, VariableSource
@@ -37,6 +40,7 @@ from src.models.valuation import ValuationRequest, ValuationResult
 # Libraries
 from src.valuation.library.common import CommonLibrary
 from src.valuation.library.dcf import DCFLibrary  # Used for Per Share Dilution
+from src.valuation.library.dcf_vector import DCFVectorLibrary
 from src.valuation.library.rim import RIMLibrary
 from src.valuation.strategies.interface import IValuationRunner
 
@@ -206,6 +210,22 @@ class RIMBankingStrategy(IValuationRunner):
             )
         )
 
+    @staticmethod
+    def stochastic_anchors(financials: Company, params: Parameters) -> dict[str, float]:
+        """
+        Deterministic centre of the `execute_stochastic` input vectors.
+        'wacc' holds Ke and 'base_flow' the EPS anchor; 'terminal_growth' is unused by RIM.
+        """
+        ke, _ = CommonLibrary.resolve_discount_rate(financials, params, use_cost_of_equity_only=True)
+        strategy_params = cast(RIMParameters, params.strategy)
+        g_term = strategy_params.terminal_value.perpetual_growth_rate
+        return {
+            'wacc': ke,
+            'growth': getattr(strategy_params, 'growth_rate', None) or ModelDefaults.DEFAULT_GROWTH_RATE,
+            'terminal_growth': g_term if g_term is not None else ModelDefaults.DEFAULT_TERMINAL_GROWTH,
+            'base_flow': getattr(financials, 'eps_ttm', None) or 0.0,
+        }
+
     @staticmethod
     def execute_stochastic(financials: Company, params: Parameters, vectors: dict[str, np.ndarray]) -> np.ndarray:
         """
@@ -228,7 +248,7 @@ class RIMBankingStrategy(IValuationRunner):
         Returns
         -------
         np.ndarray
-            Array of Intrinsic Values per Share.
+            Array of Intrinsic Values per Share, net of SBC dilution like `execute`.
         """
         # Type narrowing for mypy
         strategy_params = cast(RIMParameters, params.strategy)
@@ -250,41 +270,63 @@ class RIMBankingStrategy(IValuationRunner):
         years = getattr(params.strategy, 'projection_years', 5) or 5
         payout = 0.0 # Conservative assumption: Retain all earnings to grow Book
 
-        # Initialize state vectors [N_SIMS]
-        current_b = np.full_like(ke_vec, b0)
-        current_eps = eps_vec
+        with tracer.span("kernel.clean_surplus", category="kernel"):
+            # Initialize state vectors [N_SIMS] in pooled buffers, updated in place each year
+            ws = get_workspace()
+            shape, dtype = ke_vec.shape, ke_vec.dtype
+
+            growth_step = ws.buffer("rim.growth_step", shape, dtype)
+            np.add(g_p1, 1.0, out=growth_step)
+            discount_step = ws.buffer("rim.discount_step", shape, dtype)
+            np.add(ke_vec, 1.0, out=discount_step)
+            np.reciprocal(discount_step, out=discount_step)
 
-        pv_ri_sum = np.zeros_like(ke_vec)
+            current_b = ws.buffer("rim.book", shape, dtype)
+            current_b.fill(b0)
+            current_eps = ws.buffer("rim.eps", shape, dtype)
+            np.copyto(current_eps, eps_vec)
 
-        ri = np.zeros_like(ke_vec)
+            discount_factor = ws.buffer("rim.discount", shape, dtype)
+            discount_factor.fill(1.0)
+            pv_ri_sum = ws.buffer("rim.pv_ri", shape, dtype)
+            pv_ri_sum.fill(0.0)
 
-        for t in range(1, years + 1):
-            # A. Project Earnings: EPS_t = EPS_{t-1} * (1 + g)
-            current_eps = current_eps * (1 + g_p1)
+            ri = ws.buffer("rim.ri", shape, dtype)
+            ri.fill(0.0)
+            scratch = ws.buffer("rim.scratch", shape, dtype)
 
-            # B. Calculate Residual Income: RI_t = EPS_t - (Ke * B_{t-1})
-            ri = current_eps - (ke_vec * current_b)
+            for _ in range(years):
+                # A. Project Earnings: EPS_t = EPS_{t-1} * (1 + g)
+                np.multiply(current_eps, growth_step, out=current_eps)
 
-            # C. Discount RI: PV = RI / (1+Ke)^t
-            discount_factor = 1.0 / ((1 + ke_vec) ** t)
-            pv_ri_sum += ri * discount_factor
+                # B. Calculate Residual Income: RI_t = EPS_t - (Ke * B_{t-1})
+                np.multiply(ke_vec, current_b, out=ri)
+                np.subtract(current_eps, ri, out=ri)
 
-            # D. Update Book Value (Clean Surplus): B_t = B_{t-1} + EPS_t - Div_t
-            div = current_eps * payout
-            current_b = current_b + current_eps - div
+                # C. Discount RI: PV = RI / (1+Ke)^t (running product of 1 / (1+Ke))
+                np.multiply(discount_factor, discount_step, out=discount_factor)
+                np.multiply(ri, discount_factor, out=scratch)
+                pv_ri_sum += scratch
 
-        # 4. Terminal Value (Ohlson Persistence)
-        # TV = RI_n * omega / (1 + Ke - omega)
-        omega = getattr(params.strategy, 'persistence_factor', 0.6) or 0.6
+                # D. Update Book Value (Clean Surplus): B_t = B_{t-1} + EPS_t - Div_t
+                np.multiply(current_eps, 1.0 - payout, out=scratch)
+                current_b += scratch
 
-        # Guardrail for denominator
-        denom = np.maximum(1 + ke_vec - omega, 0.001)
+        with tracer.span("kernel.terminal_value", category="kernel"):
+            # 4. Terminal Value (Ohlson Persistence)
+            # TV = RI_n * omega / (1 + Ke - omega)
+            omega = getattr(params.strategy, 'persistence_factor', 0.6) or 0.6
 
-        # Last RI from loop is used here
-        tv_nominal = ri * omega / denom
-        pv_tv = tv_nominal / ((1 + ke_vec) ** years)
+            # Guardrail for denominator
+            denom = np.maximum(1 + ke_vec - omega, 0.001)
+
+            # Last RI from loop is used here
+            tv_nominal = ri * omega / denom
+            pv_tv = tv_nominal * discount_factor
 
         # 5. Total Value Per Share = B0 + Sum(PV_RI) + PV_TV
-        iv_per_share = b0 + pv_ri_sum + pv_tv
+        iv_raw = b0 + pv_ri_sum + pv_tv
 
-        return iv_per_share
+        # 6. SBC dilution, through the same per-share conversion as `execute`
+        shares = params.common.capital.shares_outstanding or 1.0
+        return DCFVectorLibrary.compute_value_per_share(iv_raw * shares, params)
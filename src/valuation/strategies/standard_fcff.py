@@ -20,6 +20,7 @@ from src.computation.financial_math import calculate_discount_factors
 
 # Config
 from src.config.constants import ModelDefaults
+from src.core.tracing import tracer
 from src.models.company import Company
 from src.models.enums import ValuationMethodology
 from src.models.glass_box import CalculationStep
@@ -36,6 +37,7 @@ from src.models.valuation import ValuationRequest, ValuationResult
 # Libraries (DRY Logic)
 from src.valuation.library.common import CommonLibrary
 from src.valuation.library.dcf import DCFLibrary
+from src.valuation.library.dcf_vector import DCFVectorLibrary
 from src.valuation.strategies.interface import IValuationRunner
 
 
@@ -172,6 +174,39 @@ class StandardFCFFStrategy(IValuationRunner):
             )
         )
 
+    @staticmethod
+    def stochastic_anchors(financials: Company, params: Parameters) -> dict[str, float]:
+        """
+        Deterministic centre of the `execute_stochastic` input vectors.
+
+        Resolves the same anchors as `execute`, so that a kernel fed with these
+        scalars reproduces the deterministic value where the kernel is exact.
+
+        Returns
+        -------
+        dict[str, float]
+            'wacc', 'growth', 'terminal_growth' and 'base_flow' (FCF anchor).
+        """
+        wacc, _ = CommonLibrary.resolve_discount_rate(financials, params, use_cost_of_equity_only=False)
+        g_start, g_term, _ = DCFLibrary.resolve_projection_inputs(params)
+        fcf_base = cast(FCFFStandardParameters, params.strategy).fcf_anchor or ModelDefaults.DEFAULT_FCF_TTM
+        return {'wacc': wacc, 'growth': g_start, 'terminal_growth': g_term, 'base_flow': fcf_base}
+
+    @staticmethod
+    def stochastic_flows(_financials: Company, params: Parameters, vectors: dict[str, np.ndarray]) -> np.ndarray:
+        """
+        Projected free cash flows [YEARS, N_SIMS] of `execute_stochastic` (workspace view).
+
+        Follows the projection branch of `execute`, or the optional 'growth_path'
+        and 'flow_noise' matrices of path-dependent Monte Carlo. Also feeds the
+        Monte Carlo fan chart.
+        """
+        years, manual_vector, g_centre = DCFVectorLibrary.resolve_projection(params)
+        return DCFVectorLibrary.project_flows(
+            vectors['base_flow'], vectors['growth'], vectors['terminal_growth'], years, manual_vector, g_centre,
+            vectors.get('growth_path'), vectors.get('flow_noise'),
+        )
+
     @staticmethod
     def execute_stochastic(_financials: Company, params: Parameters,
                            vectors: dict[str, np.ndarray]) -> np.ndarray:
@@ -179,7 +214,8 @@ class StandardFCFFStrategy(IValuationRunner):
         High-Performance Vectorized Execution for Monte Carlo.
 
         Instead of looping through objects, this method uses NumPy algebra to compute
-        10,000 valuations in a single CPU cycle.
+        10,000 valuations in a single CPU cycle. Every step mirrors `execute` through
+        DCFVectorLibrary: fed with `stochastic_anchors`, it returns the deterministic value.
 
         Parameters
         ----------
@@ -191,9 +227,14 @@ class StandardFCFFStrategy(IValuationRunner):
         vectors : Dict[str, np.ndarray]
             Dictionary containing stochastic arrays:
             - 'wacc': Cost of capital vector.
-            - 'growth': Phase 1 growth rate vector.
+            - 'growth': Phase 1 growth rate vector (start of the fade-down, or
+              parallel shift of the manual growth vector).
             - 'terminal_growth': Perpetual growth vector.
             - 'base_flow': Initial FCF vector.
+            - 'growth_path', 'flow_noise' (optional): time-varying growth and
+              yearly flow noise matrices [YEARS, N_SIMS] (see `stochastic_flows`).
+            - 'total_debt', 'cash_and_equivalents', 'shares_outstanding'
+              (optional): per-path capital structure (batched tornado runs).
 
         Returns
         -------
@@ -202,58 +243,21 @@ class StandardFCFFStrategy(IValuationRunner):
         """
         # 1. Unpack Vectors (All shape: [N_SIMS])
         wacc = vectors['wacc']
-        g_p1 = vectors['growth']
         g_n = vectors['terminal_growth']
-        fcf_0 = vectors['base_flow']
-
-        # 2. Vectorized Projection (Phase 1)
-        # We assume a fixed projection period (e.g. 5 years) for all sims to allow matrix operations
-        years = getattr(params.strategy, 'projection_years', 5) or 5
-
-        # Create a time matrix [N_SIMS, YEARS] -> e.g. [1, 2, 3, 4, 5]
-        # (1 + g)^t
-        time_exponents = np.arange(1, years + 1)
-
-        # Growth factors matrix: [N_SIMS, YEARS]
-        # We use outer product or broadcasting
-        # flows[i, t] = fcf_0[i] * (1 + g_p1[i])^t
-        growth_factors = (1 + g_p1)[:, np.newaxis] ** time_exponents
-        projected_flows = fcf_0[:, np.newaxis] * growth_factors
-
-        # 3. Vectorized Discounting
-        # Discount factors: 1 / (1 + wacc)^t
-        discount_factors = 1.0 / ((1 + wacc)[:, np.newaxis] ** time_exponents)
-
-        # PV of Explicit Flows: Sum(Flow * Discount) along time axis
-        pv_explicit = np.sum(projected_flows * discount_factors, axis=1)
-
-        # 4. Vectorized Terminal Value
-        # TV = FCF_n * (1 + g_n) / (wacc - g_n)
-        final_flow = projected_flows[:, -1]
 
-        # Safety guardrail: Ensure wacc > g_n to avoid infinity/negatives
-        # We clip the denominator to a small epsilon
-        denominator = np.maximum(wacc - g_n, 0.001)
-
-        tv_nominal = final_flow * (1 + g_n) / denominator
-
-        # Discount TV back to T0: TV / (1 + wacc)^N
-        pv_tv = tv_nominal / ((1 + wacc) ** years)
-
-        # 5. Enterprise Value
-        ev = pv_explicit + pv_tv
-
-        # 6. Equity Bridge (Vectorized)
-        # Equity = EV + Cash - Debt
-        # Note: Debt/Cash are scalars here (unless we shock them, but usually we shock Ops/Rates)
-        shares = params.common.capital.shares_outstanding or 1.0
-        debt = params.common.capital.total_debt or 0.0
-        cash = params.common.capital.cash_and_equivalents or 0.0
-        net_debt = debt - cash
+        with tracer.span("kernel.projection", category="kernel"):
+            # 2. Vectorized Projection: flows [YEARS, N_SIMS]
+            flows = StandardFCFFStrategy.stochastic_flows(_financials, params, vectors)
 
-        equity_value = ev - net_debt
+        with tracer.span("kernel.terminal_value", category="kernel"):
+            # 3. Vectorized Terminal Value (Gordon or Exit Multiple)
+            tv = DCFVectorLibrary.compute_terminal_value(flows[-1], wacc, g_n, params)
 
-        # 7. Intrinsic Value Per Share
-        iv_per_share = equity_value / shares
+        with tracer.span("kernel.discounting", category="kernel"):
+            # 4. Enterprise Value: NPV of flows + PV of TV
+            ev = DCFVectorLibrary.compute_discounting(flows, tv, wacc)
 
-        return iv_per_share
+        # 5. Equity Bridge and Per-Share Value (with SBC dilution)
+        equity_value = DCFVectorLibrary.compute_equity_bridge(
+            ev, params, vectors.get('total_debt'), vectors.get('cash_and_equivalents'))
+        return DCFVectorLibrary.compute_value_per_share(equity_value, params, vectors.get('shares_outstanding'))
@@ -0,0 +1,13 @@
+"""
+tests/benchmarks/
+Benchmarks de performance — opt-in (`--run-benchmarks` ou `RUN_BENCHMARKS=1`).
+
+Chaque mesure est comparée à `baselines.json` avec un seuil de régression
+configurable (`--benchmark-threshold` ou `BENCHMARK_THRESHOLD`).
+`--benchmark-update` ré-enregistre les références. Exécution 100 % hors ligne.
+
+Organisation :
+- test_bench_strategies.py  → execute / execute_stochastic de chaque stratégie
+- test_bench_extensions.py  → SensitivityRunner, ScenariosRunner
+- test_bench_pipeline.py    → Resolver, YahooSnapshotMapper, ValuationOrchestrator.run
+"""
@@ -0,0 +1,287 @@
+"""
+tests/benchmarks/conftest.py
+
+BENCHMARK HARNESS
+=================
+Role: Times hot paths and gates them against stored JSON baselines.
+Scope: tests/benchmarks only (opt-in, see the switches in tests/conftest.py).
+
+Usage:
+    pytest tests/benchmarks --run-benchmarks                   # compare to baselines.json
+    pytest tests/benchmarks --benchmark-update                 # re-record baselines.json
+    pytest tests/benchmarks --run-benchmarks --benchmark-threshold 0.3
+
+A benchmark fails when its median time exceeds ``baseline * (1 + threshold)`` and
+``baseline + MIN_REGRESSION_SECONDS``, on a first series of rounds and again on a
+confirmation series. Cheap cases are timed over extra rounds.
+Benchmarks without a stored baseline only record their timing.
+Everything runs offline: market data comes from the recorded payloads in ``payloads/``.
+"""
+
+from __future__ import annotations
+
+import json
+import math
+import os
+import platform
+import statistics
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from infra.data_providers.yahoo_raw_fetcher import RawFinancialData
+from src.models.company import Company, CompanySnapshot
+from src.models.enums import ValuationMethodology
+from src.models.parameters.base_parameter import Parameters
+from src.models.parameters.strategies import (
+    DDMParameters,
+    FCFEParameters,
+    FCFFGrowthParameters,
+    FCFFNormalizedParameters,
+    FCFFStandardParameters,
+    GrahamParameters,
+    RIMParameters,
+    TerminalValueParameters,
+)
+from src.valuation.options.monte_carlo import MonteCarloRunner
+from src.valuation.resolvers.base_resolver import Resolver
+
+BENCHMARK_DIR = Path(__file__).parent
+BASELINE_FILE = BENCHMARK_DIR / "baselines.json"
+PAYLOAD_DIR = BENCHMARK_DIR / "payloads"
+
+DEFAULT_THRESHOLD = 0.5       # +50%: wall-clock timings are noisy across machines
+DEFAULT_ROUNDS = 5
+MIN_ROUND_SECONDS = 0.02      # fast calls are looped until one round lasts at least this long
+MAX_LOOPS = 1_000
+MIN_TIMED_SECONDS = 0.25      # cheap cases get extra rounds until the timed total reaches this
+MAX_ROUNDS = 25
+MIN_REGRESSION_SECONDS = 1e-3  # slowdowns below 1 ms are scheduler noise, not regressions
+
+MC_PATH_COUNTS = (1_000, 10_000, 100_000)
+
+
+# ==============================================================================
+# TIMING HARNESS
+# ==============================================================================
+
+class BenchmarkRunner:
+    """
+    Times a callable and compares its median to the stored baseline.
+
+    Parameters
+    ----------
+    name : str
+        Baseline key (``<module>::<test id>``).
+    baseline : dict[str, Any] | None
+        Stored entry for ``name``, if any.
+    threshold : float
+        Allowed relative slowdown.
+    results : dict[str, dict[str, Any]]
+        Session-wide sink for the measured timings.
+    rounds : int
+        Minimum number of timed rounds after one warm-up call.
+    """
+
+    def __init__(self, name: str, baseline: dict[str, Any] | None, threshold: float,
+                 results: dict[str, dict[str, Any]], rounds: int = DEFAULT_ROUNDS):
+        self.name = name
+        self.baseline = baseline
+        self.threshold = threshold
+        self.results = results
+        self.rounds = rounds
+        self.stats: dict[str, Any] | None = None
+
+    def __call__(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        # Warm-up (imports, caches) and loop calibration.
+        start = time.perf_counter()
+        result = func(*args, **kwargs)
+        first = time.perf_counter() - start
+        loops = 1 if first >= MIN_ROUND_SECONDS else min(MAX_LOOPS, int(MIN_ROUND_SECONDS / max(first, 1e-9)) + 1)
+        rounds = max(self.rounds, min(MAX_ROUNDS, math.ceil(MIN_TIMED_SECONDS / max(first * loops, 1e-9))))
+
+        self.stats = self._measure(func, args, kwargs, loops, rounds)
+        if self._regressed():
+            # Confirm on a second series before failing: a burst of machine load is not a regression.
+            retry = self._measure(func, args, kwargs, loops, rounds)
+            self.stats = min(self.stats, retry, key=lambda stats: stats["median_s"])
+        self.results[self.name] = self.stats
+        self._check_regression()
+        return result
+
+    @staticmethod
+    def _measure(func: Callable[..., Any], args: tuple, kwargs: dict, loops: int, rounds: int) -> dict[str, Any]:
+        timings = []
+        for _ in range(rounds):
+            start = time.perf_counter()
+            for _ in range(loops):
+                func(*args, **kwargs)
+            timings.append((time.perf_counter() - start) / loops)
+        return {
+            "median_s": statistics.median(timings),
+            "min_s": min(timings),
+            "rounds": rounds,
+            "loops": loops,
+        }
+
+    def _limit(self) -> float | None:
+        if not self.baseline:
+            return None
+        reference = self.baseline["median_s"]
+        return max(reference * (1.0 + self.threshold), reference + MIN_REGRESSION_SECONDS)
+
+    def _regressed(self) -> bool:
+        limit = self._limit()
+        return limit is not None and self.stats is not None and self.stats["median_s"] > limit
+
+    def _check_regression(self) -> None:
+        if self._regressed():
+            pytest.fail(
+                f"Benchmark regression on {self.name}: median {self.stats['median_s'] * 1e3:.3f} ms "
+                f"> baseline {self.baseline['median_s'] * 1e3:.3f} ms (+{self.threshold:.0%} and at least "
+                f"{MIN_REGRESSION_SECONDS * 1e3:.0f} ms allowed)",
+                pytrace=False,
+            )
+
+
+def _load_baselines() -> dict[str, dict[str, Any]]:
+    if not BASELINE_FILE.exists():
+        return {}
+    return json.loads(BASELINE_FILE.read_text(encoding="utf-8")).get("benchmarks", {})
+
+
+def _write_baselines(results: dict[str, dict[str, Any]]) -> None:
+    merged = {**_load_baselines(), **results}
+    payload = {
+        "meta": {
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "machine": platform.machine(),
+            "recorded_utc": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        },
+        "benchmarks": dict(sorted(merged.items())),
+    }
+    BASELINE_FILE.write_text(json.dumps(payload, indent=2) + "\n", encoding="utf-8")
+
+
+@pytest.fixture(scope="session")
+def benchmark_results(request):
+    """Collects every timing of the session; rewrites the baselines in update mode."""
+    results: dict[str, dict[str, Any]] = {}
+    yield results
+    if request.config.getoption("--benchmark-update") and results:
+        _write_baselines(results)
+
+
+@pytest.fixture(scope="session")
+def benchmark_threshold(request) -> float:
+    option = request.config.getoption("--benchmark-threshold")
+    if option is not None:
+        return option
+    return float(os.environ.get("BENCHMARK_THRESHOLD", DEFAULT_THRESHOLD))
+
+
+@pytest.fixture
+def bench(request, benchmark_results, benchmark_threshold) -> BenchmarkRunner:
+    """Per-test timer: ``bench(func, *args)`` runs, times and gates ``func``."""
+    name = f"{Path(request.node.fspath).stem}::{request.node.name}"
+    update = request.config.getoption("--benchmark-update")
+    baseline = None if update else _load_baselines().get(name)
+    return BenchmarkRunner(name, baseline, benchmark_threshold, benchmark_results)
+
+
+# ==============================================================================
+# OFFLINE PAYLOADS
+# ==============================================================================
+
+def load_raw_payload(name: str) -> RawFinancialData:
+    """
+    Rebuilds a RawFinancialData bundle from a recorded JSON payload.
+
+    Statements are stored as ``{line item: {date: value}}`` in Yahoo order (newest first).
+    """
+    data = json.loads((PAYLOAD_DIR / f"{name}.json").read_text(encoding="utf-8"))
+
+    def _frame(key: str) -> pd.DataFrame:
+        frame = pd.DataFrame.from_dict(data.get(key, {}), orient="index", dtype=float)
+        frame.columns = pd.to_datetime(frame.columns)
+        return frame
+
+    return RawFinancialData(
+        ticker=data["ticker"],
+        info=data["info"],
+        balance_sheet=_frame("balance_sheet"),
+        income_stmt=_frame("income_stmt"),
+        cash_flow=_frame("cash_flow"),
+        quarterly_income_stmt=_frame("quarterly_income_stmt"),
+        quarterly_cash_flow=_frame("quarterly_cash_flow"),
+        is_valid=True,
+    )
+
+
+@pytest.fixture(scope="session")
+def raw_payload() -> RawFinancialData:
+    return load_raw_payload("aapl_raw")
+
+
+@pytest.fixture(scope="session")
+def bench_snapshot() -> CompanySnapshot:
+    """Snapshot covering the inputs of every strategy (figures in millions, Apple-like)."""
+    return CompanySnapshot(
+        ticker="BNCH",
+        name="Benchmark Corp",
+        sector="Technology",
+        current_price=180.0,
+        total_debt=120_000.0,
+        cash_and_equivalents=50_000.0,
+        shares_outstanding=16_000.0,
+        revenue_ttm=400_000.0,
+        ebit_ttm=120_000.0,
+        net_income_ttm=100_000.0,
+        interest_expense=3_000.0,
+        fcf_ttm=110_000.0,
+        capex_ttm=12_000.0,
+        eps_ttm=6.2,
+        dividend_share=0.96,
+        book_value_ps=4.0,
+        beta=1.2,
+        risk_free_rate=0.04,
+        market_risk_premium=0.05,
+        tax_rate=0.21,
+    )
+
+
+def ghost_strategy(mode: ValuationMethodology):
+    """Strategy parameters for ``mode`` with the growth inputs the snapshot cannot supply."""
+    tv = TerminalValueParameters(perpetual_growth_rate=0.025)
+    return {
+        ValuationMethodology.FCFF_STANDARD: lambda: FCFFStandardParameters(growth_rate_p1=0.05, terminal_value=tv),
+        ValuationMethodology.FCFF_NORMALIZED: lambda: FCFFNormalizedParameters(
+            cycle_growth_rate=0.04, terminal_value=tv),
+        ValuationMethodology.FCFF_GROWTH: lambda: FCFFGrowthParameters(
+            revenue_growth_rate=0.08, target_fcf_margin=0.25, terminal_value=tv),
+        ValuationMethodology.FCFE: lambda: FCFEParameters(growth_rate=0.05, terminal_value=tv),
+        ValuationMethodology.DDM: lambda: DDMParameters(dividend_growth_rate=0.05, terminal_value=tv),
+        ValuationMethodology.RIM: lambda: RIMParameters(growth_rate=0.05, persistence_factor=0.6, terminal_value=tv),
+        ValuationMethodology.GRAHAM: lambda: GrahamParameters(growth_estimate=0.06),
+    }[mode]()
+
+
+def resolved_params(mode: ValuationMethodology, snapshot: CompanySnapshot) -> Parameters:
+    """Hydrated parameters for ``mode``, as the orchestrator would hand them to the strategy."""
+    ghost = Parameters(structure=Company(ticker=snapshot.ticker), strategy=ghost_strategy(mode))
+    return Resolver().resolve(ghost, snapshot)
+
+
+def stochastic_vectors(params: Parameters, n_sims: int, seed: int = 42) -> dict[str, np.ndarray]:
+    """Shock vectors built the way MonteCarloRunner builds them (including the WACC vector)."""
+    r = params.common.rates
+    base_wacc = r.wacc or 0.09
+    vectors = MonteCarloRunner._generate_vectors(params, n_sims, seed, base_beta=r.beta, base_wacc=base_wacc)
+    vectors["wacc"] = r.risk_free_rate + vectors["beta"] * r.market_risk_premium
+    return vectors
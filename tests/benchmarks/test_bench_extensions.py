@@ -0,0 +1,46 @@
+"""
+tests/benchmarks/test_bench_extensions.py
+
+EXTENSION BENCHMARKS
+====================
+Role: Times the deterministic extension runners (sensitivity grid, scenarios).
+"""
+
+import pytest
+
+from src.models.enums import ValuationMethodology
+from src.models.parameters.options import ScenarioParameters, ScenariosParameters, SensitivityParameters
+from src.valuation.options.scenarios import ScenariosRunner
+from src.valuation.options.sensitivity import SensitivityRunner
+from src.valuation.registry import get_strategy
+from tests.benchmarks.conftest import resolved_params
+
+pytestmark = pytest.mark.benchmark
+
+MODES = [ValuationMethodology.FCFF_STANDARD, ValuationMethodology.FCFF_GROWTH, ValuationMethodology.DDM]
+
+
+@pytest.mark.parametrize("mode", MODES, ids=lambda m: m.value)
+def test_bench_sensitivity(bench, bench_snapshot, mode):
+    params = resolved_params(mode, bench_snapshot)
+    params.extensions.sensitivity = SensitivityParameters(enabled=True, steps=5)
+    runner = SensitivityRunner(get_strategy(mode)())
+
+    result = bench(runner.execute, params, params.structure)
+
+    assert result is not None
+
+
+@pytest.mark.parametrize("mode", MODES, ids=lambda m: m.value)
+def test_bench_scenarios(bench, bench_snapshot, mode):
+    params = resolved_params(mode, bench_snapshot)
+    params.extensions.scenarios = ScenariosParameters(enabled=True, cases=[
+        ScenarioParameters(name="Bear", probability=0.25, growth_override=0.01, margin_override=0.18),
+        ScenarioParameters(name="Base", probability=0.50),
+        ScenarioParameters(name="Bull", probability=0.25, growth_override=0.09, margin_override=0.30),
+    ])
+    runner = ScenariosRunner(get_strategy(mode)())
+
+    result = bench(runner.execute, params, params.structure)
+
+    assert result is not None
@@ -0,0 +1,97 @@
+"""
+tests/benchmarks/test_bench_pipeline.py
+
+PIPELINE BENCHMARKS
+===================
+Role: Times data mapping, hydration and the end-to-end orchestrator run
+      on offline inputs (recorded Yahoo payload, fixed snapshot), and the
+      full fetch -> map -> value pipeline replayed from a raw archive.
+"""
+
+import pytest
+
+from infra.data_providers.raw_store import RawDataStore
+from infra.data_providers.record_replay import RecordReplayProvider
+from infra.data_providers.yahoo_snapshot_mapper import YahooSnapshotMapper
+from infra.macro.default_macro_provider import DefaultMacroProvider
+from src.models.company import Company
+from src.models.enums import ValuationMethodology
+from src.models.parameters.base_parameter import Parameters
+from src.models.parameters.options import (
+    ExtensionBundleParameters,
+    MCParameters,
+    ScenarioParameters,
+    ScenariosParameters,
+    SensitivityParameters,
+)
+from src.models.valuation import ValuationRequest
+from src.valuation.orchestrator import ValuationOrchestrator
+from src.valuation.resolvers.base_resolver import Resolver
+from tests.benchmarks.conftest import ghost_strategy
+
+pytestmark = pytest.mark.benchmark
+
+
+def test_bench_snapshot_mapper(bench, raw_payload):
+    snapshot = bench(YahooSnapshotMapper().map_to_snapshot, raw_payload)
+
+    assert snapshot.revenue_ttm is not None
+    assert snapshot.fcf_ttm is not None
+
+
+@pytest.mark.parametrize("mode", list(ValuationMethodology), ids=lambda m: m.value)
+def test_bench_resolver(bench, bench_snapshot, mode):
+    ghost = Parameters(structure=Company(ticker=bench_snapshot.ticker), strategy=ghost_strategy(mode))
+
+    resolved = bench(Resolver().resolve, ghost, bench_snapshot)
+
+    assert resolved.common.rates.risk_free_rate is not None
+
+
+@pytest.mark.parametrize("extensions", ["core", "full"])
+def test_bench_orchestrator_run(bench, bench_snapshot, extensions):
+    bundle = ExtensionBundleParameters()
+    if extensions == "full":
+        bundle = ExtensionBundleParameters(
+            monte_carlo=MCParameters(enabled=True, iterations=5_000),
+            sensitivity=SensitivityParameters(enabled=True),
+            scenarios=ScenariosParameters(enabled=True, cases=[
+                ScenarioParameters(name="Bear", probability=0.3, growth_override=0.01),
+                ScenarioParameters(name="Base", probability=0.4),
+                ScenarioParameters(name="Bull", probability=0.3, growth_override=0.09),
+            ]),
+        )
+    request = ValuationRequest(
+        mode=ValuationMethodology.FCFF_STANDARD,
+        parameters=Parameters(
+            structure=Company(ticker=bench_snapshot.ticker),
+            strategy=ghost_strategy(ValuationMethodology.FCFF_STANDARD),
+            extensions=bundle,
+        ),
+    )
+    orchestrator = ValuationOrchestrator()
+
+    result = bench(orchestrator.run, request, bench_snapshot)
+
+    assert result.results.common.intrinsic_value_per_share > 0
+
+
+def test_bench_replayed_fetch_map_value(bench, raw_payload, tmp_path):
+    archive = RawDataStore(tmp_path)
+    archive.save(raw_payload)
+    provider = RecordReplayProvider(archive, DefaultMacroProvider(), mode="replay")
+    request = ValuationRequest(
+        mode=ValuationMethodology.FCFF_STANDARD,
+        parameters=Parameters(
+            structure=Company(ticker=raw_payload.ticker),
+            strategy=ghost_strategy(ValuationMethodology.FCFF_STANDARD),
+        ),
+    )
+    orchestrator = ValuationOrchestrator()
+
+    def pipeline():
+        return orchestrator.run(request, provider.get_company_snapshot(raw_payload.ticker))
+
+    result = bench(pipeline)
+
+    assert result.results.common.intrinsic_value_per_share > 0
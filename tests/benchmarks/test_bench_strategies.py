@@ -0,0 +1,60 @@
+"""
+tests/benchmarks/test_bench_strategies.py
+
+STRATEGY KERNEL BENCHMARKS
+==========================
+Role: Times the deterministic `execute` and the vectorized `execute_stochastic`
+      of every registered strategy (1k / 10k / 100k Monte Carlo paths).
+"""
+
+import numpy as np
+import pytest
+
+from src.models.enums import ValuationMethodology
+from src.valuation.options.monte_carlo import MonteCarloRunner
+from src.valuation.registry import get_strategy
+from tests.benchmarks.conftest import MC_PATH_COUNTS, resolved_params, stochastic_vectors
+
+pytestmark = pytest.mark.benchmark
+
+MODES = list(ValuationMethodology)
+
+
+@pytest.mark.parametrize("mode", MODES, ids=lambda m: m.value)
+def test_bench_execute(bench, bench_snapshot, mode):
+    params = resolved_params(mode, bench_snapshot)
+    strategy = get_strategy(mode)()
+
+    result = bench(strategy.execute, params.structure, params)
+
+    assert result.results.common.intrinsic_value_per_share is not None
+
+
+@pytest.mark.parametrize("n_sims", MC_PATH_COUNTS)
+@pytest.mark.parametrize("mode", MODES, ids=lambda m: m.value)
+def test_bench_execute_stochastic(bench, bench_snapshot, mode, n_sims):
+    params = resolved_params(mode, bench_snapshot)
+    strategy = get_strategy(mode)()
+    vectors = stochastic_vectors(params, n_sims)
+
+    values = bench(strategy.execute_stochastic, params.structure, params, vectors)
+
+    assert np.shape(values) == (n_sims,)
+
+
+CORRELATION = [
+    [1.0, -0.3, 0.0, 0.2],
+    [-0.3, 1.0, 0.4, 0.3],
+    [0.0, 0.4, 1.0, 0.0],
+    [0.2, 0.3, 0.0, 1.0],
+]
+
+
+@pytest.mark.parametrize("correlated", [False, True], ids=["independent", "correlated"])
+def test_bench_generate_vectors_1m(bench, bench_snapshot, correlated):
+    params = resolved_params(ValuationMethodology.FCFF_STANDARD, bench_snapshot)
+    params.extensions.monte_carlo.correlation = CORRELATION if correlated else None
+
+    vectors = bench(MonteCarloRunner._generate_vectors, params, 1_000_000, 42, base_beta=1.2, base_wacc=0.09)
+
+    assert vectors["beta"].shape == (1_000_000,)
@@ -5,8 +5,11 @@ SHARED TEST FIXTURES
 ====================
 Role: Provides distinct reusable data objects for testing.
 Scope: Global (available to all tests automatically).
+Also registers the command-line switches of the opt-in benchmark suite (tests/benchmarks).
 """
 
+import os
+
 import pytest
 from datetime import datetime, timezone
 
@@ -17,6 +20,57 @@ from src.models.parameters.strategies import FCFFStandardParameters
 from src.models.parameters.common import CommonParameters, FinancialRatesParameters
 from src.models.enums import ValuationMethodology, CompanySector
 
+
+# ==============================================================================
+# BENCHMARK SUITE SWITCHES
+# ==============================================================================
+# Declared here (root conftest) so that the options are known whatever
+# sub-directory pytest is pointed at.
+
+def pytest_addoption(parser):
+    group = parser.getgroup("benchmarks", "performance benchmarks (tests/benchmarks)")
+    group.addoption(
+        "--run-benchmarks", action="store_true", default=False,
+        help="Run tests marked 'benchmark' (also enabled by RUN_BENCHMARKS=1).",
+    )
+    group.addoption(
+        "--benchmark-update", action="store_true", default=False,
+        help="Rewrite tests/benchmarks/baselines.json with the timings of this run.",
+    )
+    group.addoption(
+        "--benchmark-threshold", type=float, default=None,
+        help="Allowed slowdown vs. baseline as a fraction (default: BENCHMARK_THRESHOLD or 0.5).",
+    )
+
+
+def benchmarks_enabled(config) -> bool:
+    """True when the benchmark suite was requested on the command line or through the environment."""
+    env = os.environ.get("RUN_BENCHMARKS", "").lower() in ("1", "true", "yes")
+    return env or config.getoption("--run-benchmarks") or config.getoption("--benchmark-update")
+
+
+def pytest_collection_modifyitems(config, items):
+    """Benchmarks are opt-in: skip them in the regular test run."""
+    if benchmarks_enabled(config):
+        return
+    skip = pytest.mark.skip(reason="benchmark suite disabled (use --run-benchmarks or RUN_BENCHMARKS=1)")
+    for item in items:
+        if "benchmark" in item.keywords:
+            item.add_marker(skip)
+
+
+# ==============================================================================
+# PROVIDER ISOLATION
+# ==============================================================================
+
+@pytest.fixture(autouse=True, scope="session")
+def offline_rate_limit():
+    """Tests never reach Yahoo: no request budget, and no shared state file written."""
+    from infra.data_providers.rate_limiter import set_rate_limiter
+
+    set_rate_limiter(None)
+
+
 @pytest.fixture
 def mock_apple_identity():
     """Returns a basic identity for Apple Inc with timezone-aware datetime."""
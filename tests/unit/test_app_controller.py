@@ -40,11 +40,10 @@ class TestAppControllerErrorHandling:
     @patch("app.controllers.app_controller.st")
     @patch("app.controllers.app_controller.get_state")
     @patch("app.controllers.app_controller.InputFactory")
-    @patch("app.controllers.app_controller.YahooFinancialProvider")
-    @patch("app.controllers.app_controller.DefaultMacroProvider")
+    @patch("app.controllers.app_controller.get_yahoo_provider")
     @patch("app.controllers.app_controller.SessionManager")
     def test_snapshot_none_sets_error(
-        self, mock_sm, mock_macro, mock_yahoo, mock_factory, mock_state, mock_st
+        self, mock_sm, mock_yahoo, mock_factory, mock_state, mock_st
     ):
         """When provider returns None, error should be set."""
         state = MagicMock()
@@ -69,11 +68,10 @@ class TestAppControllerErrorHandling:
     @patch("app.controllers.app_controller.st")
     @patch("app.controllers.app_controller.get_state")
     @patch("app.controllers.app_controller.InputFactory")
-    @patch("app.controllers.app_controller.YahooFinancialProvider")
-    @patch("app.controllers.app_controller.DefaultMacroProvider")
+    @patch("app.controllers.app_controller.get_yahoo_provider")
     @patch("app.controllers.app_controller.SessionManager")
     def test_generic_exception_sets_error(
-        self, mock_sm, mock_macro, mock_yahoo, mock_factory, mock_state, mock_st
+        self, mock_sm, mock_yahoo, mock_factory, mock_state, mock_st
     ):
         """Generic exceptions should set an error message."""
         state = MagicMock()
@@ -92,12 +90,11 @@ class TestAppControllerErrorHandling:
     @patch("app.controllers.app_controller.st")
     @patch("app.controllers.app_controller.get_state")
     @patch("app.controllers.app_controller.InputFactory")
-    @patch("app.controllers.app_controller.YahooFinancialProvider")
-    @patch("app.controllers.app_controller.DefaultMacroProvider")
+    @patch("app.controllers.app_controller.get_yahoo_provider")
     @patch("app.controllers.app_controller.ValuationOrchestrator")
     @patch("app.controllers.app_controller.SessionManager")
     def test_success_flow_updates_state(
-        self, mock_sm, mock_orch, mock_macro, mock_yahoo, mock_factory, mock_state, mock_st
+        self, mock_sm, mock_orch, mock_yahoo, mock_factory, mock_state, mock_st
     ):
         """Successful flow should update state with result."""
         state = MagicMock()
@@ -128,10 +125,9 @@ class TestAppControllerErrorHandling:
     @patch("app.controllers.app_controller.st")
     @patch("app.controllers.app_controller.get_state")
     @patch("app.controllers.app_controller.InputFactory")
-    @patch("app.controllers.app_controller.DefaultMacroProvider")
     @patch("app.controllers.app_controller.SessionManager")
     def test_ticker_not_found_error(
-        self, mock_sm, mock_macro, mock_factory, mock_state, mock_st
+        self, mock_sm, mock_factory, mock_state, mock_st
     ):
         """TickerNotFoundError should set a specific error message."""
         from src.core.exceptions import TickerNotFoundError
@@ -159,10 +155,9 @@ class TestAppControllerErrorHandling:
     @patch("app.controllers.app_controller.st")
     @patch("app.controllers.app_controller.get_state")
     @patch("app.controllers.app_controller.InputFactory")
-    @patch("app.controllers.app_controller.DefaultMacroProvider")
     @patch("app.controllers.app_controller.SessionManager")
     def test_valuation_error_sets_error(
-        self, mock_sm, mock_macro, mock_factory, mock_state, mock_st
+        self, mock_sm, mock_factory, mock_state, mock_st
     ):
         """ValuationError should set a specific error message."""
         from src.core.exceptions import ValuationError
@@ -188,11 +183,10 @@ class TestAppControllerErrorHandling:
     @patch("app.controllers.app_controller.st")
     @patch("app.controllers.app_controller.get_state")
     @patch("app.controllers.app_controller.InputFactory")
-    @patch("app.controllers.app_controller.YahooFinancialProvider")
-    @patch("app.controllers.app_controller.DefaultMacroProvider")
+    @patch("app.controllers.app_controller.get_yahoo_provider")
     @patch("app.controllers.app_controller.SessionManager")
     def test_external_service_error(
-        self, mock_sm, mock_macro, mock_yahoo, mock_factory, mock_state, mock_st
+        self, mock_sm, mock_yahoo, mock_factory, mock_state, mock_st
     ):
         """ExternalServiceError should set error via SessionManager."""
         from src.core.exceptions import ExternalServiceError
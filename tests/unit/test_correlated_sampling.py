@@ -0,0 +1,104 @@
+"""
+tests/unit/test_correlated_sampling.py
+
+CORRELATED SHOCK SAMPLER TESTS
+==============================
+Role: Validates CorrelatedShockSampler (cached factor, in-place transform,
+      PSD repair) and the correlated path of MonteCarloRunner._generate_vectors.
+"""
+
+import numpy as np
+import pytest
+from pydantic import ValidationError
+
+from src.computation.statistics import CorrelatedShockSampler, _cholesky_factor
+from src.config.constants import MonteCarloDefaults
+from src.models.parameters.options import MCParameters
+from src.valuation.options.monte_carlo import MonteCarloRunner
+
+CORR = np.array([
+    [1.0, -0.3, 0.0, 0.2],
+    [-0.3, 1.0, 0.4, 0.3],
+    [0.0, 0.4, 1.0, 0.0],
+    [0.2, 0.3, 0.0, 1.0],
+])
+
+
+def test_output_reproduces_target_correlation():
+    block = CorrelatedShockSampler(CORR).standard_normals(np.random.default_rng(0), 200_000)
+    np.testing.assert_allclose(np.corrcoef(block), CORR, atol=0.01)
+    np.testing.assert_allclose(block.std(axis=1), 1.0, atol=0.01)
+
+
+def test_transform_is_in_place():
+    block = np.random.default_rng(1).standard_normal((4, 1_000))
+    expected = np.linalg.cholesky(CORR) @ block
+
+    out = CorrelatedShockSampler(CORR).correlate(block)
+
+    assert out is block
+    np.testing.assert_allclose(out, expected, atol=1e-12)
+
+
+def test_factor_is_cached_per_configuration():
+    _cholesky_factor.cache_clear()
+    first = CorrelatedShockSampler(CORR)
+    second = CorrelatedShockSampler(CORR.tolist())
+
+    assert first.factor is second.factor
+    assert _cholesky_factor.cache_info().hits == 1
+    assert not first.factor.flags.writeable
+
+
+def test_identity_is_a_no_op():
+    sampler = CorrelatedShockSampler(np.eye(3))
+    block = np.random.default_rng(2).standard_normal((3, 10))
+    reference = block.copy()
+
+    assert sampler.is_identity and sampler.factor is None
+    np.testing.assert_array_equal(sampler.correlate(block), reference)
+
+
+def test_inconsistent_matrix_is_repaired():
+    # Pairwise-valid but jointly impossible correlations (not PSD).
+    corr = np.array([[1.0, 0.9, -0.9], [0.9, 1.0, 0.9], [-0.9, 0.9, 1.0]])
+    block = CorrelatedShockSampler(corr).standard_normals(np.random.default_rng(3), 50_000)
+    np.testing.assert_allclose(block.std(axis=1), 1.0, atol=0.02)
+
+
+@pytest.mark.parametrize("matrix, match", [
+    ([[1.0, 0.2]], "square"),
+    ([[1.0, 0.2], [0.3, 1.0]], "symmetric"),
+    ([[2.0, 0.0], [0.0, 1.0]], "unit diagonal"),
+    ([[1.0, 1.5], [1.5, 1.0]], "within"),
+])
+def test_invalid_matrices_raise(matrix, match):
+    with pytest.raises(ValueError, match=match):
+        CorrelatedShockSampler(matrix)
+
+
+def test_mc_parameters_require_one_row_per_driver():
+    with pytest.raises(ValidationError):
+        MCParameters(correlation=np.eye(3).tolist())
+    assert len(MCParameters(correlation=CORR.tolist()).correlation) == len(MonteCarloDefaults.SHOCK_DRIVERS)
+
+
+def test_generate_vectors_applies_correlation(fcff_request_standard):
+    params = fcff_request_standard.parameters
+    params.extensions.monte_carlo = MCParameters(enabled=True, correlation=CORR.tolist())
+
+    vectors = MonteCarloRunner._generate_vectors(params, 100_000, 42, base_beta=1.2, base_wacc=0.20)
+
+    stacked = np.vstack([vectors[d] for d in MonteCarloDefaults.SHOCK_DRIVERS])
+    np.testing.assert_allclose(np.corrcoef(stacked), CORR, atol=0.015)
+    assert vectors["beta"].mean() == pytest.approx(1.2, rel=0.01)
+
+
+def test_generate_vectors_without_correlation_keeps_seed_stream(fcff_request_standard):
+    params = fcff_request_standard.parameters
+    params.extensions.monte_carlo = MCParameters(enabled=True)
+
+    vectors = MonteCarloRunner._generate_vectors(params, 1_000, 7, base_beta=1.2, base_wacc=0.20)
+
+    rng = np.random.default_rng(7)
+    np.testing.assert_array_equal(vectors["beta"], rng.normal(1.2, 1.2 * 0.10, 1_000))
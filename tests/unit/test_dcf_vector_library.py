@@ -0,0 +1,194 @@
+"""
+tests/unit/test_dcf_vector_library.py
+
+VECTORIZED DCF LIBRARY TESTS
+============================
+Role: Checks that every branch of DCFVectorLibrary matches its DCFLibrary
+      twin path by path, and that the DCF-family kernels fed with
+      `stochastic_anchors` reproduce `execute`.
+"""
+
+import numpy as np
+import pytest
+
+from src.core.exceptions import CalculationError
+from src.models.company import Company
+from src.models.enums import TerminalValueMethod, ValuationMethodology
+from src.models.parameters.base_parameter import Parameters
+from src.models.parameters.strategies import (
+    DDMParameters,
+    FCFEParameters,
+    FCFFGrowthParameters,
+    FCFFNormalizedParameters,
+    FCFFStandardParameters,
+    RIMParameters,
+    TerminalValueParameters,
+)
+from src.valuation.library.common import CommonLibrary
+from src.valuation.library.dcf import DCFLibrary
+from src.valuation.library.dcf_vector import DCFVectorLibrary
+from src.valuation.registry import get_strategy
+from src.valuation.resolvers.base_resolver import Resolver
+
+DCF_MODES = {
+    ValuationMethodology.FCFF_STANDARD: lambda tv, **kw: FCFFStandardParameters(
+        fcf_anchor=100.0, growth_rate_p1=0.08, terminal_value=tv, **kw),
+    ValuationMethodology.FCFF_NORMALIZED: lambda tv, **kw: FCFFNormalizedParameters(
+        fcf_norm=100.0, terminal_value=tv, **kw),
+    ValuationMethodology.FCFF_GROWTH: lambda tv, **kw: FCFFGrowthParameters(
+        revenue_growth_rate=0.08, target_fcf_margin=0.25, terminal_value=tv, **kw),
+    ValuationMethodology.FCFE: lambda tv, **kw: FCFEParameters(growth_rate=0.06, terminal_value=tv, **kw),
+    ValuationMethodology.DDM: lambda tv, **kw: DDMParameters(
+        dividend_per_share=1.0, dividend_growth_rate=0.05, terminal_value=tv, **kw),
+}
+
+VARIANTS = {
+    "gordon": ({"perpetual_growth_rate": 0.025}, {}),
+    "exit_multiple": ({"method": TerminalValueMethod.EXIT_MULTIPLE, "exit_multiple": 12.0,
+                       "perpetual_growth_rate": 0.025}, {}),
+    "manual_vector": ({"perpetual_growth_rate": 0.025}, {"manual_growth_vector": [0.10, 0.08, 0.06]}),
+    "one_year": ({"perpetual_growth_rate": 0.025}, {"projection_years": 1}),
+    "ten_years": ({"perpetual_growth_rate": 0.025}, {"projection_years": 10}),
+}
+
+
+def _params(mode, snapshot, tv_kwargs, strategy_kwargs):
+    strategy = DCF_MODES[mode](TerminalValueParameters(**tv_kwargs), **strategy_kwargs)
+    params = Resolver().resolve(Parameters(structure=Company(ticker=snapshot.ticker), strategy=strategy), snapshot)
+    params.common.capital.annual_dilution_rate = 0.02
+    params.common.capital.minority_interests = 1_000.0
+    params.common.capital.pension_provisions = 500.0
+    return params
+
+
+# ------------------------------------------------------------------
+# Kernel parity
+# ------------------------------------------------------------------
+
+@pytest.mark.parametrize("variant", list(VARIANTS))
+@pytest.mark.parametrize("mode", list(DCF_MODES), ids=lambda m: m.value)
+def test_kernel_at_anchors_reproduces_execute(mode, variant, mock_apple_snapshot):
+    params = _params(mode, mock_apple_snapshot, *VARIANTS[variant])
+    strategy = get_strategy(mode)()
+
+    reference = strategy.execute(params.structure, params).results.common.intrinsic_value_per_share
+    anchors = strategy.stochastic_anchors(params.structure, params)
+    values = strategy.execute_stochastic(
+        params.structure, params, {key: np.full(3, float(value)) for key, value in anchors.items()})
+
+    assert reference != 0.0
+    np.testing.assert_allclose(values, reference, rtol=1e-12)
+
+
+@pytest.mark.parametrize("dilution", [0.0, 0.02])
+def test_rim_kernel_at_anchors_applies_dilution_like_execute(dilution, mock_apple_snapshot):
+    """RIM finishes through `DCFVectorLibrary.compute_value_per_share`, SBC dilution included."""
+    strategy_params = RIMParameters(book_value_anchor=0.01, growth_rate=0.05, persistence_factor=0.6,
+                                    terminal_value=TerminalValueParameters(perpetual_growth_rate=0.025))
+    params = Resolver().resolve(Parameters(structure=Company(ticker=mock_apple_snapshot.ticker),
+                                           strategy=strategy_params), mock_apple_snapshot)
+    params.common.capital.annual_dilution_rate = dilution
+    strategy = get_strategy(ValuationMethodology.RIM)()
+
+    result = strategy.execute(params.structure, params.model_copy(deep=True))
+    anchors = strategy.stochastic_anchors(params.structure, params)
+    values = strategy.execute_stochastic(
+        params.structure, params, {key: np.full(3, float(value)) for key, value in anchors.items()})
+
+    np.testing.assert_allclose(values, result.results.common.intrinsic_value_per_share, rtol=1e-12)
+
+
+# ------------------------------------------------------------------
+# Branches, path by path
+# ------------------------------------------------------------------
+
+G_START = np.array([0.02, 0.06, 0.12])
+G_TERM = np.array([0.015, 0.02, 0.03])
+
+
+def test_fade_down_matches_scalar_projection(mock_apple_snapshot):
+    params = _params(ValuationMethodology.FCFF_STANDARD, mock_apple_snapshot, *VARIANTS["gordon"])
+    base = np.array([80.0, 100.0, 120.0])
+    flows = DCFVectorLibrary.project_flows(base, G_START, G_TERM, 5)
+
+    for i in range(3):
+        path = params.model_copy(deep=True)
+        path.strategy.growth_rate_p1 = float(G_START[i])
+        path.strategy.terminal_value.perpetual_growth_rate = float(G_TERM[i])
+        expected, _ = DCFLibrary.project_flows_simple(float(base[i]), path)
+        np.testing.assert_allclose(flows[:, i], expected, rtol=1e-14)
+
+
+def test_manual_vector_is_shifted_by_the_growth_shock():
+    manual = [0.10, 0.07, 0.05]
+    flows = DCFVectorLibrary.project_flows(np.full(3, 100.0), G_START, G_TERM, 3, manual, growth_centre=0.06)
+
+    for i in range(3):
+        shifted = [g + G_START[i] - 0.06 for g in manual]
+        expected, _ = DCFLibrary.project_flows_manual(100.0, shifted)
+        np.testing.assert_allclose(flows[:, i], expected, rtol=1e-14)
+
+
+def test_revenue_model_matches_scalar_projection(mock_apple_snapshot):
+    params = _params(ValuationMethodology.FCFF_GROWTH, mock_apple_snapshot, *VARIANTS["gordon"])
+    params.strategy.manual_growth_vector = [0.15, 0.12]  # shorter than the horizon: fade afterwards
+    targets = np.array([0.10, 0.20, 0.30])
+    flows = DCFVectorLibrary.project_flows_revenue_model(
+        np.full(3, 1_000.0), 0.12, targets, np.full(3, 0.08), G_TERM, 5, [0.15, 0.12], growth_centre=0.08)
+
+    for i in range(3):
+        path = params.model_copy(deep=True)
+        path.strategy.terminal_value.perpetual_growth_rate = float(G_TERM[i])
+        expected, _, _, _ = DCFLibrary.project_flows_revenue_model(1_000.0, 0.12, float(targets[i]), path)
+        np.testing.assert_allclose(flows[:, i], expected, rtol=1e-14)
+
+
+@pytest.mark.parametrize("variant", ["gordon", "exit_multiple"])
+def test_terminal_value_matches_scalar(variant, mock_apple_snapshot):
+    params = _params(ValuationMethodology.FCFF_STANDARD, mock_apple_snapshot, *VARIANTS[variant])
+    rates = np.array([0.07, 0.09, 0.11])
+    g_perp = np.full(3, 0.025)
+
+    tv = DCFVectorLibrary.compute_terminal_value(np.full(3, 100.0), rates, g_perp, params)
+
+    expected = [DCFLibrary.compute_terminal_value(100.0, float(r), params)[0] for r in rates]
+    np.testing.assert_allclose(tv, expected, rtol=1e-14)
+
+
+def test_gordon_paths_with_growth_at_or_above_rate_are_nan(mock_apple_snapshot):
+    """Where the scalar Gordon formula raises, the vector one returns NaN for the path."""
+    params = _params(ValuationMethodology.FCFF_STANDARD, mock_apple_snapshot, *VARIANTS["gordon"])
+    rates, g_perp = np.array([0.03, 0.04, 0.05]), np.array([0.04, 0.04, 0.02])
+
+    tv = DCFVectorLibrary.compute_terminal_value(np.full(3, 100.0), rates, g_perp, params)
+
+    for r, g in zip(rates[:2], g_perp[:2]):
+        params.strategy.terminal_value.perpetual_growth_rate = float(g)
+        with pytest.raises(CalculationError):
+            DCFLibrary.compute_terminal_value(100.0, float(r), params)
+    assert np.isnan(tv[:2]).all()
+    assert tv[2] == pytest.approx(100.0 * 1.02 / 0.03)
+
+
+def test_negative_exit_multiple_is_rejected(mock_apple_snapshot):
+    params = _params(ValuationMethodology.FCFF_STANDARD, mock_apple_snapshot, *VARIANTS["exit_multiple"])
+    params.strategy.terminal_value.exit_multiple = -3.0
+    with pytest.raises(CalculationError):
+        DCFVectorLibrary.compute_terminal_value(np.full(2, 100.0), np.full(2, 0.08), np.full(2, 0.02), params)
+
+
+def test_discounting_bridge_and_dilution_match_scalar(mock_apple_snapshot):
+    params = _params(ValuationMethodology.FCFF_STANDARD, mock_apple_snapshot, *VARIANTS["gordon"])
+    flows = np.array([[100.0, 90.0], [110.0, 95.0], [120.0, 99.0]])
+    tv = np.array([2_000.0, 1_500.0])
+    rates = np.array([0.08, 0.10])
+
+    ev = DCFVectorLibrary.compute_discounting(flows, tv, rates)
+    iv = DCFVectorLibrary.compute_value_per_share(DCFVectorLibrary.compute_equity_bridge(ev, params), params)
+
+    for i in range(2):
+        ev_i, _ = DCFLibrary.compute_discounting(list(flows[:, i]), float(tv[i]), float(rates[i]))
+        equity_i, _ = CommonLibrary.compute_equity_bridge(ev_i, params)
+        iv_i, _ = DCFLibrary.compute_value_per_share(equity_i, params)
+        assert ev[i] == pytest.approx(ev_i, rel=1e-14)
+        assert iv[i] == pytest.approx(iv_i, rel=1e-14)
@@ -0,0 +1,120 @@
+"""
+tests/unit/test_float32_kernels.py
+
+FLOAT32 PRECISION MODE TESTS
+============================
+Role: Checks that every `execute_stochastic` kernel keeps float32 inputs in
+      float32 and stays within tolerance of float64, and that the
+      MonteCarloRunner float32 mode halves the kernel memory footprint.
+"""
+
+import tracemalloc
+
+import numpy as np
+import pytest
+from pydantic import ValidationError
+
+from src.models.company import Company
+from src.models.enums import ValuationMethodology
+from src.models.parameters.base_parameter import Parameters
+from src.models.parameters.options import MCParameters
+from src.models.parameters.strategies import (
+    DDMParameters,
+    FCFEParameters,
+    FCFFGrowthParameters,
+    FCFFNormalizedParameters,
+    FCFFStandardParameters,
+    GrahamParameters,
+    RIMParameters,
+    TerminalValueParameters,
+)
+from src.valuation.options.monte_carlo import MonteCarloRunner
+from src.valuation.registry import get_strategy
+from src.valuation.resolvers.base_resolver import Resolver
+
+N_SIMS = 50_000
+TV = TerminalValueParameters(perpetual_growth_rate=0.025)
+
+STRATEGY_PARAMS = {
+    ValuationMethodology.FCFF_STANDARD: lambda: FCFFStandardParameters(fcf_anchor=100.0, growth_rate_p1=0.05,
+                                                                       terminal_value=TV),
+    ValuationMethodology.FCFF_NORMALIZED: lambda: FCFFNormalizedParameters(fcf_norm=100.0, cycle_growth_rate=0.04,
+                                                                           terminal_value=TV),
+    ValuationMethodology.FCFF_GROWTH: lambda: FCFFGrowthParameters(revenue_growth_rate=0.08, target_fcf_margin=0.25,
+                                                                   terminal_value=TV),
+    ValuationMethodology.FCFE: lambda: FCFEParameters(growth_rate=0.05, terminal_value=TV),
+    ValuationMethodology.DDM: lambda: DDMParameters(dividend_growth_rate=0.05, terminal_value=TV),
+    ValuationMethodology.RIM: lambda: RIMParameters(growth_rate=0.05, persistence_factor=0.6, terminal_value=TV),
+    ValuationMethodology.GRAHAM: lambda: GrahamParameters(eps_normalized=6.0, growth_estimate=0.06),
+}
+
+
+def _params(mode, snapshot, precision="float64"):
+    ghost = Parameters(structure=Company(ticker=snapshot.ticker), strategy=STRATEGY_PARAMS[mode]())
+    params = Resolver().resolve(ghost, snapshot)
+    params.extensions.monte_carlo = MCParameters(enabled=True, precision=precision)
+    return params
+
+
+def _vectors(params, precision):
+    params.extensions.monte_carlo.precision = precision
+    vectors = MonteCarloRunner._generate_vectors(params, N_SIMS, 7, base_beta=1.2, base_wacc=0.09)
+    vectors["wacc"] = 0.04 + vectors["beta"] * 0.05
+    return vectors
+
+
+@pytest.mark.parametrize("mode", list(ValuationMethodology), ids=lambda m: m.value)
+def test_kernel_stays_float32_within_tolerance(mode, mock_apple_snapshot):
+    params = _params(mode, mock_apple_snapshot)
+    strategy = get_strategy(mode)()
+    vectors64 = _vectors(params, "float64")
+    vectors32 = {key: value.astype(np.float32) for key, value in vectors64.items()}
+
+    values64 = strategy.execute_stochastic(params.structure, params, vectors64)
+    values32 = strategy.execute_stochastic(params.structure, params, vectors32)
+
+    assert values32.dtype == np.float32
+    np.testing.assert_allclose(values32, values64, rtol=1e-5)
+
+
+def test_generated_vectors_follow_precision(mock_apple_snapshot):
+    params = _params(ValuationMethodology.FCFF_STANDARD, mock_apple_snapshot)
+    vectors = _vectors(params, "float32")
+
+    assert {v.dtype for v in vectors.values()} == {np.dtype(np.float32)}
+    assert vectors["beta"].mean() == pytest.approx(1.2, rel=0.01)
+
+
+@pytest.mark.parametrize("variance_reduction", ["none", "antithetic", "sobol"])
+def test_float32_run_matches_float64_distribution(variance_reduction, mock_apple_snapshot):
+    strategy = get_strategy(ValuationMethodology.FCFF_STANDARD)()
+    results = {}
+    for precision in ("float64", "float32"):
+        params = _params(ValuationMethodology.FCFF_STANDARD, mock_apple_snapshot, precision)
+        params.extensions.monte_carlo.iterations = 20_000
+        params.extensions.monte_carlo.variance_reduction = variance_reduction
+        results[precision] = MonteCarloRunner(strategy).execute(params, params.structure)
+
+    assert results["float32"].mean == pytest.approx(results["float64"].mean, rel=0.01)
+    assert results["float32"].quantiles["P50"] == pytest.approx(results["float64"].quantiles["P50"], rel=0.02)
+
+
+def test_float32_halves_kernel_peak_memory(mock_apple_snapshot):
+    params = _params(ValuationMethodology.FCFF_STANDARD, mock_apple_snapshot)
+    strategy = get_strategy(ValuationMethodology.FCFF_STANDARD)()
+    peaks = {}
+    for precision in ("float64", "float32"):
+        vectors = _vectors(params, precision)
+        tracemalloc.start()
+        try:
+            strategy.execute_stochastic(params.structure, params, vectors)
+            peaks[precision] = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+    assert peaks["float32"] < 0.6 * peaks["float64"]
+
+
+def test_unknown_precision_is_rejected():
+    with pytest.raises(ValidationError):
+        MCParameters(precision="float16")
@@ -0,0 +1,217 @@
+"""
+tests/unit/test_greeks.py
+
+GREEKS TESTS
+============
+Role: Validates the value-and-gradient runner: complex-step input gradient,
+      chain rule onto the drivers at parity with central differences of
+      `execute`, the finite-difference fallback and the cross-ticker
+      attribution matrix.
+"""
+
+import numpy as np
+import pytest
+
+from src.config.constants import MacroDefaults
+from src.models.company import Company
+from src.models.enums import ValuationMethodology
+from src.models.parameters.base_parameter import Parameters
+from src.models.parameters.options import GreeksParameters
+from src.models.parameters.strategies import (
+    DDMParameters,
+    FCFEParameters,
+    FCFFGrowthParameters,
+    FCFFNormalizedParameters,
+    FCFFStandardParameters,
+    GrahamParameters,
+    RIMParameters,
+    TerminalValueParameters,
+)
+from src.valuation.options.drivers import applied_driver, collect_drivers
+from src.valuation.options.greeks import GreeksRunner
+from src.valuation.registry import get_strategy
+from src.valuation.resolvers.base_resolver import Resolver
+
+TV = TerminalValueParameters(perpetual_growth_rate=0.025)
+
+MODES = {
+    ValuationMethodology.FCFF_STANDARD: lambda: FCFFStandardParameters(fcf_anchor=100.0, growth_rate_p1=0.08,
+                                                                       terminal_value=TV),
+    ValuationMethodology.FCFF_NORMALIZED: lambda: FCFFNormalizedParameters(fcf_norm=100.0, terminal_value=TV),
+    ValuationMethodology.FCFF_GROWTH: lambda: FCFFGrowthParameters(revenue_growth_rate=0.08, target_fcf_margin=0.25,
+                                                                   revenue_ttm=1_000.0, terminal_value=TV),
+    ValuationMethodology.FCFE: lambda: FCFEParameters(growth_rate=0.06, terminal_value=TV),
+    ValuationMethodology.DDM: lambda: DDMParameters(dividend_per_share=1.0, terminal_value=TV),
+    ValuationMethodology.GRAHAM: lambda: GrahamParameters(eps_normalized=6.0, growth_estimate=0.06),
+}
+
+
+def _params(snapshot, mode=ValuationMethodology.FCFF_STANDARD, strategy=None):
+    ghost = Parameters(structure=Company(ticker=snapshot.ticker), strategy=strategy or MODES[mode]())
+    params = Resolver().resolve(ghost, snapshot)
+    params.extensions.greeks = GreeksParameters(enabled=True)
+    return params
+
+
+def _execute_gradient(strategy, params, rel_step=1e-5):
+    """Reference: central differences of `execute` with a coarser step."""
+    work = params.model_copy(deep=True)
+    gradient = {}
+    for driver in collect_drivers(strategy, work, params.structure):
+        if driver[2] == "years":
+            continue
+        step = rel_step * max(abs(driver[3]), 1.0)
+        bumped = []
+        for x in (driver[3] - step, driver[3] + step):
+            with applied_driver(work, driver, x):
+                bumped.append(strategy.execute(params.structure, work).results.common.intrinsic_value_per_share)
+        gradient[driver[1]] = (bumped[1] - bumped[0]) / (2 * step)
+    return gradient
+
+
+# ------------------------------------------------------------------
+# Complex step
+# ------------------------------------------------------------------
+
+@pytest.mark.parametrize("mode", list(MODES), ids=lambda m: m.value)
+def test_gradient_matches_finite_differences_of_execute(mode, mock_apple_snapshot):
+    params = _params(mock_apple_snapshot, mode)
+    strategy = get_strategy(mode)()
+
+    greeks = GreeksRunner(strategy).execute(params, params.structure)
+    reference = _execute_gradient(strategy, params)
+
+    assert greeks.method == "complex_step"
+    assert greeks.value == pytest.approx(
+        strategy.execute(params.structure, params).results.common.intrinsic_value_per_share, rel=1e-12)
+    assert set(greeks.gradient) == set(reference)
+    scale = max(abs(d) for d in reference.values())
+    for name, d in reference.items():
+        assert greeks.gradient[name] == pytest.approx(d, rel=1e-4, abs=1e-7 * scale), name
+
+
+@pytest.mark.parametrize("mode", list(MODES), ids=lambda m: m.value)
+def test_input_gradient_matches_finite_differences_of_kernel(mode, mock_apple_snapshot):
+    params = _params(mock_apple_snapshot, mode)
+    strategy = get_strategy(mode)()
+    greeks = GreeksRunner(strategy).execute(params, params.structure)
+
+    anchors = strategy.stochastic_anchors(params.structure, params)
+    capital = params.common.capital
+    inputs = {**{k: float(v) for k, v in anchors.items()}, "total_debt": capital.total_debt,
+              "cash_and_equivalents": capital.cash_and_equivalents, "shares_outstanding": capital.shares_outstanding}
+    assert set(greeks.input_gradient) == set(inputs)
+
+    for key, x in inputs.items():
+        step = 1e-6 * max(abs(x), 1.0)
+        vectors = {k: np.array([v, v]) for k, v in inputs.items()}
+        vectors[key] = np.array([x - step, x + step])
+        low, high = strategy.execute_stochastic(params.structure, params, vectors)
+        assert greeks.input_gradient[key] == pytest.approx((high - low) / (2 * step), rel=1e-5, abs=1e-9), key
+
+
+def test_graham_gradient_is_closed_form(mock_apple_snapshot):
+    params = _params(mock_apple_snapshot, ValuationMethodology.GRAHAM)
+    greeks = GreeksRunner(get_strategy(ValuationMethodology.GRAHAM)()).execute(params, params.structure)
+
+    y = (params.common.rates.corporate_aaa_yield or MacroDefaults.DEFAULT_CORPORATE_AAA_YIELD) * 100.0
+    assert greeks.gradient["eps_normalized"] == pytest.approx((8.5 + 2.0 * 6.0) * 4.4 / y, rel=1e-9)
+    assert greeks.gradient["growth_estimate"] == pytest.approx(6.0 * 200.0 * 4.4 / y, rel=1e-9)
+    assert greeks.gradient["beta"] == 0.0
+    # IV is linear in EPS: unit elasticity
+    assert greeks.elasticities["eps_normalized"] == pytest.approx(1.0, rel=1e-9)
+
+
+def test_direct_parameter_dependence_is_included(mock_apple_snapshot):
+    # With a manual vector, execute ignores growth_rate_p1: the anchor shift and the
+    # kernel's growth centre cancel out.
+    params = _params(mock_apple_snapshot)
+    params.strategy.manual_growth_vector = [0.10, 0.08, 0.06, 0.05, 0.04]
+    greeks = GreeksRunner(get_strategy(ValuationMethodology.FCFF_STANDARD)()).execute(params, params.structure)
+
+    assert greeks.input_gradient["growth"] != 0.0
+    assert greeks.gradient["growth_rate_p1"] == pytest.approx(0.0, abs=1e-6 * abs(greeks.input_gradient["growth"]))
+
+
+def test_elasticities_scale_the_gradient(mock_apple_snapshot):
+    params = _params(mock_apple_snapshot)
+    greeks = GreeksRunner(get_strategy(ValuationMethodology.FCFF_STANDARD)()).execute(params, params.structure)
+
+    assert greeks.elasticities["beta"] == pytest.approx(
+        greeks.gradient["beta"] * params.common.rates.beta / greeks.value, rel=1e-12)
+    # WACC held fixed, the value per share is inversely proportional to the share count
+    shares = params.common.capital.shares_outstanding
+    assert greeks.input_gradient["shares_outstanding"] * shares / greeks.value == pytest.approx(-1.0, rel=1e-12)
+    # The driver also moves the market weights of the WACC
+    assert greeks.elasticities["shares_outstanding"] != pytest.approx(-1.0, rel=1e-6)
+
+
+# ------------------------------------------------------------------
+# Fallback and settings
+# ------------------------------------------------------------------
+
+def test_kernel_without_parity_uses_finite_differences(mock_apple_snapshot):
+    params = _params(mock_apple_snapshot, strategy=RIMParameters(persistence_factor=0.6, terminal_value=TV))
+    greeks = GreeksRunner(get_strategy(ValuationMethodology.RIM)()).execute(params, params.structure)
+
+    assert greeks.method == "finite_difference"
+    assert greeks.input_gradient == {}
+    assert "beta" in greeks.gradient
+
+
+def test_rim_at_kernel_parity_uses_the_complex_step(mock_apple_snapshot):
+    params = _params(mock_apple_snapshot, strategy=RIMParameters(book_value_anchor=0.01, growth_rate=0.05,
+                                                                 persistence_factor=0.6, terminal_value=TV))
+    strategy = get_strategy(ValuationMethodology.RIM)()
+    greeks = GreeksRunner(strategy).execute(params, params.structure)
+
+    assert greeks.method == "complex_step"
+    reference = _execute_gradient(strategy, params)
+    for name, derivative in greeks.gradient.items():
+        assert derivative == pytest.approx(reference[name], rel=1e-5, abs=1e-6)
+
+
+def test_parameters_are_left_untouched(mock_apple_snapshot):
+    params = _params(mock_apple_snapshot)
+    before = params.model_dump()
+    GreeksRunner(get_strategy(ValuationMethodology.FCFF_STANDARD)()).execute(params, params.structure)
+    assert params.model_dump() == before
+
+
+def test_disabled_greeks_return_none(mock_apple_snapshot):
+    params = _params(mock_apple_snapshot)
+    params.extensions.greeks.enabled = False
+    assert GreeksRunner(get_strategy(ValuationMethodology.FCFF_STANDARD)()).execute(params, params.structure) is None
+
+
+# ------------------------------------------------------------------
+# Cross-ticker attribution
+# ------------------------------------------------------------------
+
+def test_attribution_matrix_stacks_tickers(mock_apple_snapshot):
+    runner = GreeksRunner(get_strategy(ValuationMethodology.FCFF_STANDARD)())
+    base = _params(mock_apple_snapshot)
+    levered = _params(mock_apple_snapshot)
+    levered.common.capital.total_debt *= 2
+    results = runner.execute_many({"AAA": (base, base.structure), "BBB": (levered, levered.structure)})
+
+    tickers, drivers, matrix = GreeksRunner.attribution_matrix(results)
+
+    assert tickers == ["AAA", "BBB"]
+    assert matrix.shape == (2, len(drivers))
+    assert matrix[0, drivers.index("beta")] == results["AAA"].elasticities["beta"]
+    assert matrix[0, drivers.index("total_debt")] != matrix[1, drivers.index("total_debt")]
+
+
+def test_attribution_matrix_marks_missing_drivers(mock_apple_snapshot):
+    fcff = _params(mock_apple_snapshot)
+    graham = _params(mock_apple_snapshot, ValuationMethodology.GRAHAM)
+    results = {
+        "FCFF": GreeksRunner(get_strategy(ValuationMethodology.FCFF_STANDARD)()).compute(fcff, fcff.structure),
+        "GRAHAM": GreeksRunner(get_strategy(ValuationMethodology.GRAHAM)()).compute(graham, graham.structure),
+    }
+
+    _, drivers, matrix = GreeksRunner.attribution_matrix(results, field="gradient")
+
+    assert np.isnan(matrix[1, drivers.index("fcf_anchor")])
+    assert np.isnan(matrix[0, drivers.index("eps_normalized")])
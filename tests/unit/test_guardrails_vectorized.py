@@ -0,0 +1,189 @@
+"""
+tests/unit/test_guardrails_vectorized.py
+
+UNIT TESTS FOR VECTORIZED ECONOMIC GUARDRAILS
+=============================================
+Role: Checks that the batch guardrails reproduce the scalar checks row by row.
+"""
+
+import numpy as np
+import pytest
+
+from src.models.company import Company
+from src.models.enums import CompanySector
+from src.models.parameters.base_parameter import Parameters
+from src.models.parameters.common import CapitalStructureParameters, CommonParameters, FinancialRatesParameters
+from src.models.parameters.options import ExtensionBundleParameters, ScenarioParameters, ScenariosParameters
+from src.models.parameters.strategies import FCFFStandardParameters, TerminalValueParameters
+from src.valuation.guardrails import (
+    SEVERITY_ERROR,
+    SEVERITY_INFO,
+    SEVERITY_WARNING,
+    combine_guardrail_severity,
+    run_guardrails_batch,
+    validate_capital_structure,
+    validate_capital_structure_batch,
+    validate_roic_spread,
+    validate_scenario_probabilities,
+    validate_scenario_probabilities_batch,
+    validate_terminal_growth,
+    validate_terminal_growth_batch,
+)
+
+
+def _make_row(rng: np.random.Generator, i: int) -> tuple[Company, Parameters, float]:
+    """Random but reproducible company / parameter pair covering every rule branch."""
+    company = Company(ticker=f"T{i}", sector=CompanySector.TECHNOLOGY,
+                      current_price=float(rng.choice([0.0, 5.0, 100.0])))
+    ebit = rng.choice([None, -10.0, 0.0, 50.0, 110.0, 500.0, 5000.0])
+    if ebit is not None:
+        object.__setattr__(company, "ebit_ttm", float(ebit))
+
+    g_n = rng.choice([None, -0.01, 0.0, 0.02, 0.079, 0.08, 0.12])
+    g_p1 = rng.choice([None, -0.02, 0.0, 0.05])
+    strategy = FCFFStandardParameters(
+        growth_rate_p1=None if g_p1 is None else float(g_p1),
+        terminal_value=TerminalValueParameters(perpetual_growth_rate=None if g_n is None else float(g_n)),
+    )
+    common = CommonParameters(
+        rates=FinancialRatesParameters(tax_rate=rng.choice([None, 0.0, 0.25])),
+        capital=CapitalStructureParameters(
+            total_debt=rng.choice([None, -1.0, 0.0, 10.0, 2000.0]),
+            cash_and_equivalents=rng.choice([None, -1.0, 0.0, 30.0, 100.0]),
+            shares_outstanding=rng.choice([None, 0.0, 1.0, 10.0]),
+        ),
+    )
+    n_cases = int(rng.integers(0, 4))
+    probs = [rng.choice([None, 0.2, 0.3, 0.4, 0.5, 0.1]) for _ in range(n_cases)]
+    scenarios = ScenariosParameters(
+        enabled=bool(rng.integers(0, 2)),
+        cases=[ScenarioParameters(name=f"C{k}", probability=p) for k, p in enumerate(probs)],
+    )
+    params = Parameters(
+        structure=company, strategy=strategy, common=common,
+        extensions=ExtensionBundleParameters(scenarios=scenarios),
+    )
+    wacc = float(rng.choice([0.05, 0.08, 0.1]))
+    return company, params, wacc
+
+
+@pytest.fixture(scope="module")
+def random_batch():
+    rng = np.random.default_rng(7)
+    rows = [_make_row(rng, i) for i in range(300)]
+
+    # Hand-built row for the rare branches: ROIC ≈ WACC (8.25% vs 8%) and an inexact probability sum.
+    neutral = Company(ticker="NEUTRAL", current_price=100.0)
+    object.__setattr__(neutral, "ebit_ttm", 110e6)  # shares are stored in units (10M)
+    neutral_params = Parameters(
+        structure=neutral,
+        strategy=FCFFStandardParameters(growth_rate_p1=0.05),
+        common=CommonParameters(
+            rates=FinancialRatesParameters(tax_rate=0.25),
+            capital=CapitalStructureParameters(shares_outstanding=10.0),
+        ),
+        extensions=ExtensionBundleParameters(scenarios=ScenariosParameters(
+            enabled=True,
+            cases=[ScenarioParameters(name=f"C{k}", probability=p) for k, p in enumerate([0.3, 0.3, 0.3, 0.1])],
+        )),
+    )
+    rows.append((neutral, neutral_params, 0.08))
+    companies = [r[0] for r in rows]
+    params_list = [r[1] for r in rows]
+    waccs = np.array([r[2] for r in rows])
+    return companies, params_list, waccs
+
+
+def test_batch_matches_scalar_checks(random_batch):
+    """Every row carries the code and severity of the scalar guardrail."""
+    companies, params_list, waccs = random_batch
+    batch = run_guardrails_batch(companies, params_list, waccs)
+
+    for i, (company, params) in enumerate(zip(companies, params_list)):
+        wacc = float(waccs[i])
+        expected = {
+            "terminal_growth": validate_terminal_growth(params, wacc),
+            "roic_spread": validate_roic_spread(company, params, wacc),
+            "capital_structure": validate_capital_structure(company, params),
+            "scenario_probabilities": validate_scenario_probabilities(params),
+        }
+        for key, scalar in expected.items():
+            assert batch[key].codes[i] == scalar.code, (key, i)
+            assert batch[key].types[i] == scalar.type, (key, i)
+
+
+def test_batch_covers_all_branches(random_batch):
+    """Sanity check on the fixture: the random grid reaches each outcome."""
+    companies, params_list, waccs = random_batch
+    batch = run_guardrails_batch(companies, params_list, waccs)
+    for result in batch.values():
+        assert set(result.codes) == set(result.code_labels)
+
+
+def test_terminal_growth_batch_scalar_wacc_and_share():
+    result = validate_terminal_growth_batch(np.array([0.02, 0.10, 0.12, 0.097]), 0.10)
+    assert list(result.severity) == [SEVERITY_INFO, SEVERITY_ERROR, SEVERITY_ERROR, SEVERITY_WARNING]
+    assert result.share(SEVERITY_ERROR) == pytest.approx(0.5)
+    assert result.share(SEVERITY_WARNING) == pytest.approx(0.75)
+    assert result.is_blocking.tolist() == [False, True, True, False]
+    assert result.mask("GUARDRAIL_TERMINAL_GROWTH_CLOSE_TO_WACC").tolist() == [False, False, False, True]
+    assert not result.mask("UNKNOWN").any()
+
+
+def test_scenario_probabilities_batch_sum_is_exact():
+    """0.3 + 0.3 + 0.3 + 0.1 != 1.0 in float arithmetic, as in the scalar check."""
+    result = validate_scenario_probabilities_batch([[0.3, 0.3, 0.3, 0.1], [0.5, 0.5, None, None]])
+    assert list(result.codes) == [
+        "GUARDRAIL_SCENARIOS_PROBABILITIES_INEXACT",
+        "GUARDRAIL_SCENARIOS_PROBABILITIES_OK",
+    ]
+
+
+def test_fully_padded_scenario_row_is_disabled_like_the_scalar_check():
+    result = validate_scenario_probabilities_batch([[0.5, 0.5, None], [None, None, None]])
+
+    assert list(result.codes) == ["GUARDRAIL_SCENARIOS_PROBABILITIES_OK", "GUARDRAIL_SCENARIOS_NOT_ENABLED"]
+    assert list(result.severity) == [SEVERITY_INFO, SEVERITY_INFO]
+    assert validate_scenario_probabilities_batch(np.empty((2, 0))).codes.tolist() == [
+        "GUARDRAIL_SCENARIOS_NOT_ENABLED"] * 2
+
+
+def test_combine_severity_rejects_blocking_rows():
+    capital = validate_capital_structure_batch([-1.0, 10.0, 10.0], [0.0, 0.0, 100.0], [1.0, 1.0, 1.0], 10.0)
+    growth = validate_terminal_growth_batch([0.02, 0.2, 0.02], 0.1)
+    worst = combine_guardrail_severity(capital, growth)
+    assert worst.tolist() == [SEVERITY_ERROR, SEVERITY_ERROR, SEVERITY_WARNING]
+    assert combine_guardrail_severity().size == 0
+
+
+def test_run_guardrails_batch_length_mismatch():
+    with pytest.raises(ValueError):
+        run_guardrails_batch([Company(ticker="A")], [], 0.1)
+
+
+def test_monte_carlo_reports_terminal_growth_violation_rate():
+    """MC exposes the share of paths where g >= WACC without a Python loop."""
+    from src.models.parameters.options import MCParameters
+    from src.valuation.options.monte_carlo import MonteCarloRunner
+    from src.valuation.strategies.standard_fcff import StandardFCFFStrategy
+
+    def _run(g_n: float) -> float:
+        params = Parameters(
+            structure=Company(ticker="MC", current_price=100.0),
+            strategy=FCFFStandardParameters(
+                fcf_anchor=1000.0, growth_rate_p1=0.05,
+                terminal_value=TerminalValueParameters(perpetual_growth_rate=g_n),
+            ),
+            common=CommonParameters(
+                rates=FinancialRatesParameters(risk_free_rate=0.04, market_risk_premium=0.05, beta=1.0, wacc=0.20),
+                capital=CapitalStructureParameters(shares_outstanding=10.0, total_debt=0.0),
+            ),
+            extensions=ExtensionBundleParameters(monte_carlo=MCParameters(enabled=True, iterations=1000)),
+        )
+        result = MonteCarloRunner(StandardFCFFStrategy()).execute(params, params.structure)
+        assert result is not None
+        return result.terminal_growth_violation_rate
+
+    assert _run(0.02) == 0.0
+    # g_n centred on the mean WACC (9%): about half the paths diverge and are dropped (NaN), the rest are valued.
+    assert 0.3 < _run(0.09) < 0.7
@@ -0,0 +1,143 @@
+"""
+tests/unit/test_history_backend.py
+
+BULK HISTORY TESTS
+==================
+Role: Validates the multi-ticker history path: splitting of combined
+      downloads, chunking of Yahoo requests, and the universe
+      refresh through the offline backend and the raw store.
+"""
+
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+
+from infra.data_providers.config import ProviderConfig
+from infra.data_providers.history_backend import InMemoryHistoryBackend, YahooHistoryBackend, split_download
+from infra.data_providers.history_refresh import refresh_history, refresh_universe
+from infra.data_providers.raw_store import RawDataStore
+
+TICKERS = ["AAPL", "MSFT", "OR.PA"]
+
+
+def _bars(days: int, offset: float = 0.0, tz: str | None = "America/New_York") -> pd.DataFrame:
+    index = pd.date_range("2024-01-02", periods=days, freq="B", tz=tz)
+    close = 100.0 + offset + np.arange(days, dtype=float)
+    return pd.DataFrame({"Close": close, "Volume": 1e6}, index=index)
+
+
+def _combined(frames: dict) -> pd.DataFrame:
+    """A `yf.download(group_by='ticker')` result."""
+    return pd.concat(frames, axis=1)
+
+
+# ------------------------------------------------------------------
+# Split
+# ------------------------------------------------------------------
+
+def test_split_download_gives_one_frame_per_ticker():
+    aapl, paris = _bars(5, tz=None), _bars(3, offset=10.0, tz=None)
+    combined = _combined({"AAPL": aapl, "OR.PA": paris})  # OR.PA has no bar on the last two dates
+
+    frames = split_download(combined, TICKERS)
+
+    assert list(frames) == ["AAPL", "OR.PA"]
+    pd.testing.assert_frame_equal(frames["AAPL"], aapl, check_freq=False)
+    pd.testing.assert_frame_equal(frames["OR.PA"], paris, check_freq=False)
+
+
+def test_split_download_of_a_single_ticker():
+    bars = _bars(4, tz=None)
+    assert split_download(bars, ["AAPL"])["AAPL"].equals(bars)
+    assert split_download(None, TICKERS) == {} and split_download(pd.DataFrame(), TICKERS) == {}
+
+
+# ------------------------------------------------------------------
+# Yahoo backend
+# ------------------------------------------------------------------
+
+def test_yahoo_backend_chunks_requests():
+    def fake_download(tickers, **kwargs):
+        return _combined({ticker: _bars(3, tz=None) for ticker in tickers})
+
+    backend = YahooHistoryBackend(chunk_size=2)
+    with patch("infra.data_providers.history_backend.yf.download", side_effect=fake_download) as download:
+        frames = backend.download(TICKERS + ["SAP.DE"], {"period": "10y"})
+
+    assert [call.args[0] for call in download.call_args_list] == [["AAPL", "MSFT"], ["OR.PA", "SAP.DE"]]
+    assert download.call_args.kwargs["period"] == "10y" and download.call_args.kwargs["group_by"] == "ticker"
+    assert sorted(frames) == sorted(TICKERS + ["SAP.DE"])
+
+
+def test_yahoo_backend_default_settings():
+    assert YahooHistoryBackend().chunk_size == ProviderConfig.HISTORY_BULK_CHUNK_SIZE
+
+
+# ------------------------------------------------------------------
+# Universe refresh
+# ------------------------------------------------------------------
+
+def test_universe_refresh_downloads_cold_then_incremental(tmp_path):
+    store = RawDataStore(tmp_path)
+    series = {ticker: _bars(250, offset=i) for i, ticker in enumerate(TICKERS)}
+
+    backend = InMemoryHistoryBackend({ticker: frame.iloc[:200] for ticker, frame in series.items()})
+    cold = refresh_universe(TICKERS, backend, store)
+    assert backend.calls == [(tuple(TICKERS), {"period": ProviderConfig.HISTORY_PERIOD})]
+    assert all(len(cold[ticker]) == 200 for ticker in TICKERS)
+
+    backend = InMemoryHistoryBackend(series)
+    warm = refresh_universe(TICKERS, backend, store)
+    start = series["AAPL"].index[198].strftime("%Y-%m-%d")
+    assert backend.calls == [(tuple(TICKERS), {"start": start})]
+    for ticker in TICKERS:
+        pd.testing.assert_frame_equal(warm[ticker], series[ticker], check_freq=False)
+        pd.testing.assert_frame_equal(store.load_frame(ticker, "history"), series[ticker], check_freq=False)
+
+
+def test_universe_refresh_downloads_readjusted_tickers_in_full(tmp_path):
+    store = RawDataStore(tmp_path)
+    series = {ticker: _bars(250, offset=i) for i, ticker in enumerate(TICKERS)}
+    refresh_universe(TICKERS, InMemoryHistoryBackend({t: frame.iloc[:200] for t, frame in series.items()}), store)
+    split = series["MSFT"].assign(Close=series["MSFT"]["Close"] / 2.0)  # a 2:1 split re-bases the whole series
+    series["MSFT"] = split
+
+    backend = InMemoryHistoryBackend(series)
+    warm = refresh_universe(TICKERS, backend, store)
+
+    assert backend.calls[1] == (("MSFT",), {"period": ProviderConfig.HISTORY_PERIOD})
+    pd.testing.assert_frame_equal(warm["MSFT"], split, check_freq=False)
+    pd.testing.assert_frame_equal(store.load_frame("MSFT", "history"), split, check_freq=False)
+    pd.testing.assert_frame_equal(warm["AAPL"], series["AAPL"], check_freq=False)
+
+
+def test_universe_refresh_keeps_series_without_new_bars(tmp_path):
+    store = RawDataStore(tmp_path)
+    refresh_universe(["AAPL"], InMemoryHistoryBackend({"AAPL": _bars(10)}), store)
+
+    merged = refresh_universe(["AAPL", "DELISTED"], InMemoryHistoryBackend({}), store)
+
+    assert len(merged["AAPL"]) == 10 and merged["DELISTED"].empty
+    assert store.tickers() == ["AAPL"]
+
+
+def test_naive_bulk_dates_join_a_timezone_aware_series(tmp_path):
+    store = RawDataStore(tmp_path)
+    store.save_frame("AAPL", "history", _bars(5))
+
+    merged = refresh_universe(["AAPL"], InMemoryHistoryBackend({"AAPL": _bars(8, tz=None)}), store)["AAPL"]
+
+    assert str(merged.index.tz) == "America/New_York" and len(merged) == 8
+
+
+def test_timezone_aware_bars_join_a_naive_bulk_series(tmp_path):
+    """A series stored by a bulk (naive) download, refreshed by `Ticker.history` (tz-aware)."""
+    store = RawDataStore(tmp_path)
+    refresh_universe(["AAPL"], InMemoryHistoryBackend({"AAPL": _bars(5, tz=None)}), store)
+    aware = _bars(8)
+
+    merged = refresh_history(store.load_frame("AAPL", "history"), lambda request: aware.loc[request["start"]:])
+
+    assert merged.index.tz is None and len(merged) == 8
+    assert list(merged.index) == list(aware.index.tz_localize(None))
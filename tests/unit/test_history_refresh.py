@@ -0,0 +1,189 @@
+"""
+tests/unit/test_history_refresh.py
+
+INCREMENTAL HISTORY TESTS
+=========================
+Role: Validates the incremental price-history refresh: request sizing, the
+      append-only merge, the detection of a back-adjusted series (dividend,
+      split) with its full re-download, and a fetcher round-trip through the
+      local store that downloads only the missing bars.
+"""
+
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pandas as pd
+
+from infra.data_providers.config import ProviderConfig
+from infra.data_providers.history_refresh import history_request, is_readjusted, merge_history, refresh_history
+from infra.data_providers.raw_store import RawDataStore
+from infra.data_providers.yahoo_raw_fetcher import YahooRawFetcher
+
+TZ = "America/New_York"
+
+
+def _bars(start: str, days: int, offset: float = 0.0) -> pd.DataFrame:
+    index = pd.date_range(start, periods=days, freq="B", tz=TZ)
+    close = 100.0 + offset + np.arange(days, dtype=float)
+    return pd.DataFrame({"Close": close, "Volume": 1e6}, index=index)
+
+
+# ------------------------------------------------------------------
+# Request & merge
+# ------------------------------------------------------------------
+
+def test_cold_ticker_downloads_the_full_period():
+    assert history_request(None) == {"period": ProviderConfig.HISTORY_PERIOD}
+    assert history_request(pd.DataFrame()) == {"period": ProviderConfig.HISTORY_PERIOD}
+
+
+def test_stored_ticker_requests_from_its_second_to_last_bar():
+    """One settled bar is re-downloaded to check the price basis, then the possibly intraday one."""
+    assert history_request(_bars("2024-01-02", 10)) == {"start": "2024-01-12"}
+    assert history_request(_bars("2024-01-02", 1)) == {"start": "2024-01-02"}
+
+
+def test_merge_appends_and_replaces_the_last_stored_bar():
+    stored = _bars("2024-01-02", 10)
+    fresh = _bars("2024-01-15", 3, offset=50.0)  # re-downloads 01-15, a possibly intraday bar
+
+    merged = merge_history(stored, fresh)
+
+    assert len(merged) == 12 and merged.index.is_monotonic_increasing
+    pd.testing.assert_frame_equal(merged.iloc[:9], stored.iloc[:9])
+    pd.testing.assert_frame_equal(merged.iloc[9:], fresh)
+
+
+def test_failed_refresh_keeps_the_stored_series():
+    stored = _bars("2024-01-02", 10)
+
+    assert merge_history(stored, None) is stored
+    assert merge_history(stored, pd.DataFrame()) is stored
+    assert merge_history(None, None).empty
+
+
+def test_fresh_bars_are_aligned_on_the_stored_timezone():
+    stored = _bars("2024-01-02", 5)
+    fresh = _bars("2024-01-09", 2).tz_convert("UTC")
+
+    merged = merge_history(stored, fresh)
+
+    assert str(merged.index.tz) == TZ and len(merged) == 7
+
+
+# ------------------------------------------------------------------
+# Back-adjusted series
+# ------------------------------------------------------------------
+
+ADJUSTMENT = 0.97  # a 3% dividend back-adjusts every earlier close by this factor
+
+
+def _adjusted(bars: pd.DataFrame) -> pd.DataFrame:
+    adjusted = bars.copy()
+    adjusted["Close"] *= ADJUSTMENT
+    return adjusted
+
+
+def test_adjustment_factor_on_the_settled_bar_is_detected():
+    stored = _bars("2024-01-02", 10)
+    fresh = _bars("2024-01-02", 12).iloc[8:]  # 01-12 (settled), 01-15, two new bars
+
+    assert not is_readjusted(stored, fresh)
+    assert is_readjusted(stored, _adjusted(fresh))
+
+
+def test_intraday_move_of_the_last_bar_is_not_an_adjustment():
+    stored = _bars("2024-01-02", 10)
+    fresh = _bars("2024-01-02", 12).iloc[8:]
+    fresh.loc[fresh.index[1], "Close"] += 5.0  # the stored 01-15 bar was an intraday close
+
+    assert not is_readjusted(stored, fresh)
+
+
+def test_corporate_action_in_the_fresh_bars_is_detected():
+    stored = _bars("2024-01-02", 10).assign(Dividends=0.0, **{"Stock Splits": 0.0})
+    fresh = _bars("2024-01-02", 12).iloc[8:].assign(Dividends=0.0, **{"Stock Splits": 0.0})
+
+    assert not is_readjusted(stored, fresh)
+    fresh.loc[fresh.index[-1], "Stock Splits"] = 4.0
+    assert is_readjusted(stored, fresh)
+
+
+def test_dividend_already_stored_is_not_a_new_adjustment():
+    stored = _bars("2024-01-02", 10).assign(Dividends=0.0)
+    stored.loc[stored.index[-1], "Dividends"] = 0.25  # the stored series is already on the new basis
+    fresh = _bars("2024-01-02", 12).iloc[8:].assign(Dividends=0.0)
+    fresh.loc[stored.index[-1], "Dividends"] = 0.25
+
+    assert not is_readjusted(stored, fresh)
+    fresh.loc[fresh.index[-1], "Dividends"] = 0.30
+    assert is_readjusted(stored, fresh)
+
+
+def test_readjusted_series_is_downloaded_again_in_full():
+    stored = _bars("2024-01-02", 10)
+    full = _adjusted(_bars("2024-01-02", 12))
+    requests = []
+
+    def download(request):
+        requests.append(request)
+        return full if "period" in request else full.loc[request["start"]:]
+
+    refreshed = refresh_history(stored, download)
+
+    assert requests == [{"start": "2024-01-12"}, {"period": ProviderConfig.HISTORY_PERIOD}]
+    pd.testing.assert_frame_equal(refreshed, full)
+
+
+def test_failed_full_download_keeps_the_stored_series():
+    stored = _bars("2024-01-02", 10)
+    fresh = _adjusted(_bars("2024-01-02", 12).iloc[8:])
+
+    assert refresh_history(stored, lambda request: None if "period" in request else fresh) is stored
+
+
+# ------------------------------------------------------------------
+# Fetcher
+# ------------------------------------------------------------------
+
+def _yf_ticker(history: pd.DataFrame) -> MagicMock:
+    yf_ticker = MagicMock()
+    yf_ticker.info = {"shortName": "Apple"}
+    for statement in ("balance_sheet", "income_stmt", "cash_flow", "quarterly_income_stmt", "quarterly_cash_flow"):
+        setattr(yf_ticker, statement, pd.DataFrame())
+    yf_ticker.history.return_value = history
+    return yf_ticker
+
+
+def test_fetcher_refreshes_the_stored_history_incrementally(tmp_path):
+    store = RawDataStore(tmp_path)
+    full = _bars("2024-01-02", 250)
+    tail = _bars(full.index[-2].strftime("%Y-%m-%d"), 5, offset=248.0)
+
+    with patch("infra.data_providers.yahoo_raw_fetcher.yf.Ticker", return_value=_yf_ticker(full)) as cold:
+        YahooRawFetcher(store=store).fetch_ttm_snapshot("AAPL")
+    cold.return_value.history.assert_called_once_with(period=ProviderConfig.HISTORY_PERIOD)
+
+    with patch("infra.data_providers.yahoo_raw_fetcher.yf.Ticker", return_value=_yf_ticker(tail)) as warm:
+        data = YahooRawFetcher(store=store).fetch_ttm_snapshot("AAPL")
+    start = full.index[-2].strftime("%Y-%m-%d")
+    warm.return_value.history.assert_called_once_with(start=start)
+
+    assert len(data.history) == len(full) + len(tail) - 2
+    pd.testing.assert_frame_equal(store.load_frame("AAPL", "history"), data.history, check_freq=False)
+
+
+def test_fetcher_replaces_a_readjusted_history(tmp_path):
+    """After a dividend, Yahoo returns every close on the new basis: the whole series is replaced."""
+    store = RawDataStore(tmp_path)
+    full = _bars("2024-01-02", 250)
+    store.save_frame("AAPL", "history", full.iloc[:-3])
+    yf_ticker = _yf_ticker(full)
+    yf_ticker.history.side_effect = lambda **request: (_adjusted(full) if "period" in request
+                                                      else _adjusted(full).loc[request["start"]:])
+
+    with patch("infra.data_providers.yahoo_raw_fetcher.yf.Ticker", return_value=yf_ticker):
+        data = YahooRawFetcher(store=store).fetch_ttm_snapshot("AAPL")
+
+    assert yf_ticker.history.call_args.kwargs == {"period": ProviderConfig.HISTORY_PERIOD}
+    pd.testing.assert_frame_equal(data.history, _adjusted(full), check_freq=False)
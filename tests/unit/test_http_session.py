@@ -0,0 +1,105 @@
+"""
+tests/unit/test_http_session.py
+
+SHARED SESSION TESTS
+====================
+Role: Validates the process-wide HTTP session and API worker pool, their use
+      by the Yahoo fetchers, and the long-lived provider instance.
+"""
+
+import threading
+import time
+from unittest.mock import patch
+
+import pandas as pd
+import pytest
+
+from infra.data_providers import http_session
+from infra.data_providers.config import ProviderConfig
+from infra.data_providers.extraction_utils import safe_api_call
+from infra.data_providers.history_backend import YahooHistoryBackend
+from infra.data_providers.http_session import close_http_session, get_api_executor, get_http_session
+from infra.data_providers.yahoo_financial_provider import YahooFinancialProvider, get_yahoo_provider
+from infra.data_providers.yahoo_raw_fetcher import YahooRawFetcher
+
+
+@pytest.fixture(autouse=True)
+def fresh_session():
+    close_http_session()
+    yield
+    close_http_session()
+
+
+def test_session_is_shared_and_reopened_after_close():
+    session = get_http_session()
+
+    assert get_http_session() is session
+    close_http_session()
+    assert get_http_session() is not session
+
+
+def test_worker_pool_is_sized_from_the_config():
+    assert get_api_executor() is get_api_executor()
+    assert get_api_executor()._max_workers == ProviderConfig.HTTP_POOL_SIZE
+
+
+def test_session_falls_back_to_a_pooled_requests_session():
+    with patch.dict("sys.modules", {"curl_cffi": None}):
+        session = http_session._new_session(pool_size=3)
+
+    adapter = session.get_adapter("https://query1.finance.yahoo.com")
+    assert adapter._pool_maxsize == 3
+    session.close()
+
+
+def test_api_calls_reuse_long_lived_workers():
+    names = [safe_api_call(lambda: threading.current_thread().name, "Test") for _ in range(20)]
+
+    assert all(name.startswith("api") for name in names)
+    assert len(set(names)) <= ProviderConfig.HTTP_POOL_SIZE
+
+
+def test_queue_time_does_not_count_against_the_timeout():
+    """Twice as many callers as workers: the second wave waits for a worker, then gets its full timeout."""
+    callers = 2 * ProviderConfig.HTTP_POOL_SIZE
+    results = [None] * callers
+
+    def caller(i):
+        results[i] = safe_api_call(lambda: time.sleep(0.25) or "ok", "Test", max_retries=1)
+
+    with patch.object(ProviderConfig, "REQUEST_TIMEOUT", 0.4):
+        threads = [threading.Thread(target=caller, args=(i,)) for i in range(callers)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    assert results == ["ok"] * callers
+
+
+def test_timed_out_call_keeps_its_slot_until_it_returns():
+    release = threading.Event()
+    stuck = [http_session.submit_api_call(release.wait, wait=1.0) for _ in range(ProviderConfig.HTTP_POOL_SIZE)]
+
+    assert http_session.submit_api_call(lambda: "late", wait=0.05) is None
+    release.set()
+    assert all(future.result(timeout=1.0) for future in stuck)
+    assert http_session.submit_api_call(lambda: "free", wait=1.0).result(timeout=1.0) == "free"
+
+
+def test_fetchers_pass_the_shared_session():
+    with patch("infra.data_providers.yahoo_raw_fetcher.yf.Ticker") as ticker:
+        ticker.return_value.info = {}
+        YahooRawFetcher._execute_fetch("AAPL")
+    assert ticker.call_args.kwargs["session"] is get_http_session()
+
+    with patch("infra.data_providers.history_backend.yf.download", return_value=pd.DataFrame()) as download:
+        YahooHistoryBackend().download(["AAPL"], {"period": "1y"})
+    assert download.call_args.kwargs["session"] is get_http_session()
+
+
+def test_provider_instance_is_process_wide():
+    provider = get_yahoo_provider()
+
+    assert isinstance(provider, YahooFinancialProvider)
+    assert get_yahoo_provider() is provider and get_yahoo_provider().fetcher is provider.fetcher
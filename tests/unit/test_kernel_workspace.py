@@ -0,0 +1,181 @@
+"""
+tests/unit/test_kernel_workspace.py
+
+KERNEL WORKSPACE TESTS
+======================
+Role: Validates the pooled scratch buffers (reuse, growth, per-thread scope),
+      the running-product compounding and the constant allocation profile of
+      the `execute_stochastic` kernels that use them.
+"""
+
+import threading
+import tracemalloc
+
+import numpy as np
+import pytest
+
+from src.computation.workspace import KernelWorkspace, get_workspace, use_workspace
+from src.models.company import Company
+from src.models.enums import ValuationMethodology
+from src.models.parameters.base_parameter import Parameters
+from src.models.parameters.options import MCParameters
+from src.models.parameters.strategies import (
+    DDMParameters,
+    FCFEParameters,
+    FCFFGrowthParameters,
+    FCFFNormalizedParameters,
+    FCFFStandardParameters,
+    RIMParameters,
+    TerminalValueParameters,
+)
+from src.valuation.options.monte_carlo import MonteCarloRunner
+from src.valuation.registry import get_strategy
+from src.valuation.resolvers.base_resolver import Resolver
+
+N_SIMS = 20_000
+TV = TerminalValueParameters(perpetual_growth_rate=0.025)
+
+WORKSPACE_MODES = {
+    ValuationMethodology.FCFF_STANDARD: lambda: FCFFStandardParameters(fcf_anchor=100.0, growth_rate_p1=0.05,
+                                                                       terminal_value=TV),
+    ValuationMethodology.FCFF_NORMALIZED: lambda: FCFFNormalizedParameters(fcf_norm=100.0, cycle_growth_rate=0.04,
+                                                                           terminal_value=TV),
+    ValuationMethodology.FCFF_GROWTH: lambda: FCFFGrowthParameters(revenue_growth_rate=0.08, target_fcf_margin=0.25,
+                                                                   terminal_value=TV),
+    ValuationMethodology.FCFE: lambda: FCFEParameters(growth_rate=0.05, terminal_value=TV),
+    ValuationMethodology.DDM: lambda: DDMParameters(dividend_growth_rate=0.05, terminal_value=TV),
+    ValuationMethodology.RIM: lambda: RIMParameters(growth_rate=0.05, persistence_factor=0.6, terminal_value=TV),
+}
+
+
+def _kernel_inputs(mode, snapshot, seed=7):
+    ghost = Parameters(structure=Company(ticker=snapshot.ticker), strategy=WORKSPACE_MODES[mode]())
+    params = Resolver().resolve(ghost, snapshot)
+    params.extensions.monte_carlo = MCParameters(enabled=True)
+    vectors = MonteCarloRunner._generate_vectors(params, N_SIMS, seed, base_beta=1.2, base_wacc=0.09)
+    vectors["wacc"] = 0.04 + vectors["beta"] * 0.05
+    return get_strategy(mode)(), params, vectors
+
+
+# ------------------------------------------------------------------
+# Buffers
+# ------------------------------------------------------------------
+
+def test_buffer_is_reused_for_same_or_smaller_requests():
+    ws = KernelWorkspace()
+    a = ws.buffer("x", (5, 100))
+    b = ws.buffer("x", (5, 100))
+    c = ws.buffer("x", (3, 50))
+
+    assert np.shares_memory(a, b) and np.shares_memory(a, c)
+    assert c.shape == (3, 50) and c.flags.c_contiguous
+    assert ws.allocations == 1
+
+
+def test_buffer_grows_and_follows_dtype():
+    ws = KernelWorkspace()
+    ws.buffer("x", (10,))
+    ws.buffer("x", (20,))
+    f32 = ws.buffer("x", (20,), np.float32)
+
+    assert f32.dtype == np.float32
+    assert ws.allocations == 3
+    assert ws.nbytes == 20 * 4
+    ws.release()
+    assert ws.nbytes == 0
+
+
+@pytest.mark.parametrize("inverse", [False, True])
+def test_compound_factors_match_powers(inverse):
+    rate = np.random.default_rng(0).normal(0.06, 0.02, 1_000)
+    factors = KernelWorkspace().compound_factors("f", rate, 7, inverse=inverse)
+
+    sign = -1.0 if inverse else 1.0
+    expected = (1.0 + rate)[np.newaxis, :] ** (sign * np.arange(1, 8)[:, np.newaxis])
+    assert factors.shape == (7, 1_000)
+    np.testing.assert_allclose(factors, expected, rtol=1e-13)
+
+
+def test_compound_factors_keep_float32():
+    rate = np.full(10, 0.05, dtype=np.float32)
+    assert KernelWorkspace().compound_factors("f", rate, 5).dtype == np.float32
+
+
+def test_workspaces_are_scoped_per_thread():
+    seen = []
+    worker = threading.Thread(target=lambda: seen.append(get_workspace()))
+    worker.start()
+    worker.join()
+
+    assert seen[0] is not get_workspace()
+
+    custom = KernelWorkspace()
+    default = get_workspace()
+    with use_workspace(custom):
+        assert get_workspace() is custom
+    assert get_workspace() is default
+
+
+# ------------------------------------------------------------------
+# Kernels
+# ------------------------------------------------------------------
+
+def _second_call_profile(strategy, params, vectors):
+    """(allocations of a warm workspace unchanged?, traced peak of the second call)."""
+    ws = KernelWorkspace()
+    with use_workspace(ws):
+        strategy.execute_stochastic(params.structure, params, vectors)
+        allocations = ws.allocations
+        tracemalloc.start()
+        try:
+            strategy.execute_stochastic(params.structure, params, vectors)
+            peak = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+    return ws.allocations == allocations, peak
+
+
+@pytest.mark.parametrize("mode", list(WORKSPACE_MODES), ids=lambda m: m.value)
+def test_repeated_kernel_calls_do_not_reallocate(mode, mock_apple_snapshot):
+    strategy, params, vectors = _kernel_inputs(mode, mock_apple_snapshot)
+
+    params.strategy.projection_years = 5
+    stable, short_peak = _second_call_profile(strategy, params, vectors)
+    params.strategy.projection_years = 20
+    _, long_peak = _second_call_profile(strategy, params, vectors)
+
+    assert stable
+    # Only per-path vectors are allocated: no [N, T] temporaries, so the horizon does not matter.
+    assert long_peak < 1.1 * short_peak
+
+
+@pytest.mark.parametrize("mode", list(WORKSPACE_MODES), ids=lambda m: m.value)
+def test_kernel_results_do_not_alias_the_workspace(mode, mock_apple_snapshot):
+    strategy, params, vectors = _kernel_inputs(mode, mock_apple_snapshot)
+    _, _, other_vectors = _kernel_inputs(mode, mock_apple_snapshot, seed=8)
+
+    with use_workspace(KernelWorkspace()):
+        first = strategy.execute_stochastic(params.structure, params, vectors)
+        snapshot = first.copy()
+        strategy.execute_stochastic(params.structure, params, other_vectors)
+
+    np.testing.assert_array_equal(first, snapshot)
+
+
+def test_standard_kernel_matches_fade_down_reference(mock_apple_snapshot):
+    strategy, params, vectors = _kernel_inputs(ValuationMethodology.FCFF_STANDARD, mock_apple_snapshot)
+    wacc, g, g_n, fcf_0 = vectors["wacc"], vectors["growth"], vectors["terminal_growth"], vectors["base_flow"]
+    years = params.strategy.projection_years or 5
+    t = np.arange(1, years + 1)
+
+    # Linear fade from g to g_n, compounded year by year (DCFLibrary.project_flows_simple)
+    alpha = (t - 1) / (years - 1)
+    rates = g[:, np.newaxis] * (1 - alpha) + g_n[:, np.newaxis] * alpha
+    flows = fcf_0[:, np.newaxis] * np.cumprod(1 + rates, axis=1)
+    discount = (1 + wacc)[:, np.newaxis] ** -t
+    tv = flows[:, -1] * (1 + g_n) / np.maximum(wacc - g_n, 0.001) * discount[:, -1]
+    capital = params.common.capital
+    expected = ((flows * discount).sum(axis=1) + tv - (capital.total_debt or 0.0)
+                + (capital.cash_and_equivalents or 0.0)) / (capital.shares_outstanding or 1.0)
+
+    np.testing.assert_allclose(strategy.execute_stochastic(params.structure, params, vectors), expected, rtol=1e-12)
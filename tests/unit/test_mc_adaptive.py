@@ -0,0 +1,94 @@
+"""
+tests/unit/test_mc_adaptive.py
+
+ADAPTIVE MONTE CARLO TESTS
+==========================
+Role: Validates adaptive stopping (tolerance, time budget, path cap),
+      seed reproducibility and the convergence diagnostics in MCResults.
+"""
+
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from src.config.constants import MonteCarloDefaults
+from src.models.company import Company
+from src.models.parameters.base_parameter import Parameters
+from src.models.parameters.options import MCParameters
+from src.models.parameters.strategies import GrahamParameters
+from src.valuation.options.monte_carlo import MonteCarloRunner
+from src.valuation.resolvers.base_resolver import Resolver
+from src.valuation.strategies.graham_value import GrahamNumberStrategy
+
+BATCH = MonteCarloDefaults.ADAPTIVE_BATCH_SIZE
+
+
+@pytest.fixture
+def graham_params(mock_apple_snapshot):
+    strategy = GrahamParameters(eps_normalized=6.0, growth_estimate=0.06)
+    return Resolver().resolve(Parameters(structure=Company(ticker="AAPL"), strategy=strategy), mock_apple_snapshot)
+
+
+def _run(params, **mc_kwargs):
+    params.extensions.monte_carlo = MCParameters(enabled=True, adaptive=True, **mc_kwargs)
+    return MonteCarloRunner(GrahamNumberStrategy()).execute(params, params.structure)
+
+
+def test_stops_on_tolerance_and_reports_precision(graham_params):
+    result = _run(graham_params, tolerance=0.01, time_budget_s=None)
+
+    assert result.stop_reason == "tolerance"
+    assert max(result.achieved_precision.values()) <= 0.01
+    assert set(result.achieved_precision) == {"mean", "P10", "P50", "P90"}
+    assert len(result.simulation_values) % BATCH == 0
+    assert len(result.convergence_trace) >= MonteCarloDefaults.ADAPTIVE_MIN_BATCHES - 1
+
+
+def test_tighter_tolerance_needs_more_paths(graham_params):
+    loose = _run(graham_params, tolerance=0.02, time_budget_s=None)
+    tight = _run(graham_params, tolerance=0.004, time_budget_s=None)
+
+    assert tight.convergence_trace[-1].paths > loose.convergence_trace[-1].paths
+    # Precision improves along the trace.
+    first, last = tight.convergence_trace[0], tight.convergence_trace[-1]
+    assert last.relative_half_widths["mean"] < first.relative_half_widths["mean"]
+
+
+def test_path_cap_stops_the_run(graham_params):
+    result = _run(graham_params, tolerance=1e-6, time_budget_s=None, max_iterations=3 * BATCH + 100)
+
+    assert result.stop_reason == "max_iterations"
+    assert result.convergence_trace[-1].paths == 3 * BATCH + 100
+
+
+def test_time_budget_stops_the_run(graham_params):
+    clock = iter(np.arange(0.0, 100.0, 1.0))
+    with patch("src.valuation.options.monte_carlo.time.perf_counter", side_effect=lambda: next(clock)):
+        result = _run(graham_params, tolerance=1e-6, time_budget_s=2.5)
+
+    assert result.stop_reason == "time_budget"
+    assert len(result.simulation_values) <= 3 * BATCH
+
+
+def test_adaptive_runs_are_reproducible(graham_params):
+    a = _run(graham_params, tolerance=0.01, time_budget_s=None, random_seed=11)
+    b = _run(graham_params, tolerance=0.01, time_budget_s=None, random_seed=11)
+    c = _run(graham_params, tolerance=0.01, time_budget_s=None, random_seed=12)
+
+    assert a.simulation_values == b.simulation_values
+    assert a.simulation_values[:BATCH] != c.simulation_values[:BATCH]
+
+
+def test_batches_use_independent_streams(graham_params):
+    result = _run(graham_params, tolerance=1e-6, time_budget_s=None, max_iterations=2 * BATCH)
+    values = np.asarray(result.simulation_values)
+    assert not np.array_equal(values[:BATCH], values[BATCH:])
+
+
+def test_fixed_runs_leave_adaptive_fields_empty(graham_params):
+    graham_params.extensions.monte_carlo = MCParameters(enabled=True, iterations=1_000)
+    result = MonteCarloRunner(GrahamNumberStrategy()).execute(graham_params, graham_params.structure)
+
+    assert result.stop_reason is None
+    assert result.convergence_trace == []
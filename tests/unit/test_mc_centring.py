@@ -0,0 +1,128 @@
+"""
+tests/unit/test_mc_centring.py
+
+MONTE CARLO CENTRING TESTS
+==========================
+Role: Checks that the shocked vectors are centred on the strategy's
+      `stochastic_anchors`: with vanishing volatilities the simulated median
+      is the deterministic `execute` value, for every vectorized strategy and
+      in the mixture and control-variate modes.
+"""
+
+import pytest
+
+from src.models.company import Company
+from src.models.enums import ValuationMethodology
+from src.models.parameters.base_parameter import Parameters
+from src.models.parameters.options import (
+    GrahamMCShocksParameters,
+    MCParameters,
+    ScenarioParameters,
+    ScenariosParameters,
+    StandardMCShocksParameters,
+)
+from src.models.parameters.strategies import (
+    DDMParameters,
+    FCFEParameters,
+    FCFFGrowthParameters,
+    FCFFNormalizedParameters,
+    FCFFStandardParameters,
+    GrahamParameters,
+    RIMParameters,
+    TerminalValueParameters,
+)
+from src.valuation.options.monte_carlo import MonteCarloRunner
+from src.valuation.registry import get_strategy
+from src.valuation.resolvers.base_resolver import Resolver
+
+N_SIMS = 20_000
+TINY = 1e-9  # a 0.0 volatility falls back to the default one
+
+# The terminal growth keeps its fixed 0.5% dispersion: the median moves with its sample median only.
+RTOL = 5e-3
+
+
+def _tv(g_n=0.025):
+    return TerminalValueParameters(perpetual_growth_rate=g_n)
+
+
+MODES = {
+    ValuationMethodology.FCFF_STANDARD: lambda: FCFFStandardParameters(fcf_anchor=100.0, growth_rate_p1=0.08,
+                                                                       terminal_value=_tv()),
+    ValuationMethodology.FCFF_NORMALIZED: lambda: FCFFNormalizedParameters(fcf_norm=100.0, terminal_value=_tv()),
+    ValuationMethodology.FCFF_GROWTH: lambda: FCFFGrowthParameters(revenue_growth_rate=0.08, target_fcf_margin=0.25,
+                                                                   revenue_ttm=1_000.0, terminal_value=_tv()),
+    ValuationMethodology.FCFE: lambda: FCFEParameters(growth_rate=0.06, terminal_value=_tv()),
+    ValuationMethodology.DDM: lambda: DDMParameters(dividend_per_share=1.0, terminal_value=_tv()),
+    ValuationMethodology.RIM: lambda: RIMParameters(book_value_anchor=0.01, growth_rate=0.05, persistence_factor=0.6,
+                                                    terminal_value=_tv()),
+    ValuationMethodology.GRAHAM: lambda: GrahamParameters(eps_normalized=6.0, growth_estimate=0.06),
+}
+
+
+def _params(snapshot, mode, **mc_kwargs):
+    params = Resolver().resolve(Parameters(structure=Company(ticker=snapshot.ticker), strategy=MODES[mode]()),
+                                snapshot)
+    if mode == ValuationMethodology.GRAHAM:
+        shocks = GrahamMCShocksParameters(growth_volatility=TINY, eps_volatility=TINY)
+    else:
+        shocks = StandardMCShocksParameters(beta_volatility=TINY, growth_volatility=TINY, fcf_volatility=TINY)
+    params.extensions.monte_carlo = MCParameters(enabled=True, iterations=N_SIMS, shocks=shocks, **mc_kwargs)
+    return params
+
+
+def _execute(strategy, params):
+    return strategy.execute(params.structure, params.model_copy(deep=True)).results.common.intrinsic_value_per_share
+
+
+@pytest.mark.parametrize("variance_reduction", ["none", "control_variate"])
+@pytest.mark.parametrize("mode", list(MODES), ids=lambda m: m.value)
+def test_zero_volatility_median_is_the_deterministic_value(mode, variance_reduction, mock_apple_snapshot):
+    params = _params(mock_apple_snapshot, mode, variance_reduction=variance_reduction)
+    strategy = get_strategy(mode)()
+
+    result = MonteCarloRunner(strategy).execute(params, params.structure)
+
+    assert result is not None
+    assert result.quantiles["P50"] == pytest.approx(_execute(strategy, params), rel=RTOL)
+
+
+@pytest.mark.parametrize("variance_reduction", ["none", "control_variate"])
+def test_rim_with_dilution_is_centred_on_the_diluted_value(variance_reduction, mock_apple_snapshot):
+    params = _params(mock_apple_snapshot, ValuationMethodology.RIM, variance_reduction=variance_reduction)
+    params.common.capital.annual_dilution_rate = 0.02
+    strategy = get_strategy(ValuationMethodology.RIM)()
+
+    result = MonteCarloRunner(strategy).execute(params, params.structure)
+
+    assert result.quantiles["P50"] == pytest.approx(_execute(strategy, params), rel=RTOL)
+
+
+def test_mixture_paths_are_centred_on_their_scenario(mock_apple_snapshot):
+    """A single 3% terminal growth scenario values like `execute` at 3%."""
+    params = _params(mock_apple_snapshot, ValuationMethodology.FCFF_STANDARD, scenario_mixture=True)
+    params.extensions.scenarios = ScenariosParameters(enabled=True, cases=[
+        ScenarioParameters(name="Bull", probability=1.0, growth_override=0.03)])
+    strategy = get_strategy(ValuationMethodology.FCFF_STANDARD)()
+
+    result = MonteCarloRunner(strategy).execute(params, params.structure)
+    params.strategy.terminal_value.perpetual_growth_rate = 0.03
+
+    assert result.quantiles["P50"] == pytest.approx(_execute(strategy, params), rel=RTOL)
+
+
+def test_anchor_rate_moves_with_beta(mock_apple_snapshot):
+    """The rate slope comes from the strategy: the WACC weights for FCFF, none for Graham."""
+    fcff = _params(mock_apple_snapshot, ValuationMethodology.FCFF_STANDARD)
+    fcfe = _params(mock_apple_snapshot, ValuationMethodology.FCFE)
+    graham = _params(mock_apple_snapshot, ValuationMethodology.GRAHAM)
+    mrp = fcff.common.rates.market_risk_premium
+
+    def _slope(params, mode):
+        runner = MonteCarloRunner(get_strategy(mode)())
+        return runner._kernel_anchors(params, params.structure, params.common.rates.beta)[1]
+
+    assert _slope(fcfe, ValuationMethodology.FCFE) == pytest.approx(mrp)
+    assert 0.0 < _slope(fcff, ValuationMethodology.FCFF_STANDARD) < mrp
+    assert _slope(graham, ValuationMethodology.GRAHAM) == 0.0
+    assert fcff.common.rates.beta == mock_apple_snapshot.beta  # probe left the parameters untouched
@@ -0,0 +1,214 @@
+"""
+tests/unit/test_mc_growth_paths.py
+
+PATH-DEPENDENT MONTE CARLO TESTS
+================================
+Role: Validates the AR(1) growth and flow-noise matrices drawn by the
+      MonteCarloRunner, their consumption by the DCF kernels and the fan
+      charts reported in MCResults.
+"""
+
+import logging
+
+import numpy as np
+import pytest
+from pydantic import ValidationError
+
+from src.models.company import Company
+from src.models.enums import ValuationMethodology
+from src.models.parameters.base_parameter import Parameters
+from src.models.parameters.options import MCParameters
+from src.models.parameters.strategies import (
+    DDMParameters,
+    FCFEParameters,
+    FCFFGrowthParameters,
+    FCFFNormalizedParameters,
+    FCFFStandardParameters,
+    GrahamParameters,
+    TerminalValueParameters,
+)
+from src.valuation.options.monte_carlo import MonteCarloRunner
+from src.valuation.registry import get_strategy
+from src.valuation.resolvers.base_resolver import Resolver
+
+N_SIMS = 20_000
+TV = TerminalValueParameters(perpetual_growth_rate=0.025)
+
+DCF_MODES = {
+    ValuationMethodology.FCFF_STANDARD: lambda: FCFFStandardParameters(fcf_anchor=100.0, growth_rate_p1=0.08,
+                                                                       terminal_value=TV),
+    ValuationMethodology.FCFF_NORMALIZED: lambda: FCFFNormalizedParameters(fcf_norm=100.0, terminal_value=TV),
+    ValuationMethodology.FCFF_GROWTH: lambda: FCFFGrowthParameters(revenue_growth_rate=0.08, target_fcf_margin=0.25,
+                                                                   terminal_value=TV),
+    ValuationMethodology.FCFE: lambda: FCFEParameters(growth_rate=0.05, terminal_value=TV),
+    ValuationMethodology.DDM: lambda: DDMParameters(dividend_per_share=1.0, dividend_growth_rate=0.05,
+                                                    terminal_value=TV),
+}
+
+
+def _params(snapshot, mode=ValuationMethodology.FCFF_STANDARD, **mc_kwargs):
+    ghost = Parameters(structure=Company(ticker=snapshot.ticker), strategy=DCF_MODES[mode]())
+    params = Resolver().resolve(ghost, snapshot)
+    params.extensions.monte_carlo = MCParameters(enabled=True, iterations=N_SIMS, **mc_kwargs)
+    return params
+
+
+def _paths(params, seed=11):
+    vectors = MonteCarloRunner._generate_vectors(params, N_SIMS, seed, base_beta=1.2, base_wacc=0.09)
+    MonteCarloRunner._generate_paths(params, vectors, N_SIMS, seed, base_beta=1.2)
+    return vectors
+
+
+# ------------------------------------------------------------------
+# Sampling
+# ------------------------------------------------------------------
+
+def test_ar1_path_reverts_to_terminal_growth(mock_apple_snapshot):
+    params = _params(mock_apple_snapshot, growth_process="ar1", growth_persistence=0.5)
+    vectors = _paths(params)
+    path, g_n = vectors["growth_path"], vectors["terminal_growth"]
+
+    assert path.shape == (5, N_SIMS)
+    np.testing.assert_array_equal(path[0], vectors["growth"])
+
+    # Residuals of the AR(1) recursion are the innovations: centred, growth volatility
+    residuals = (path[1:] - g_n) - 0.5 * (path[:-1] - g_n)
+    assert abs(residuals.mean()) < 1e-3
+    assert residuals.std() == pytest.approx(0.015, rel=0.02)
+
+    # The expected gap to g_n shrinks by phi every year
+    gaps = (path - g_n).mean(axis=1)
+    np.testing.assert_allclose(gaps[1:], 0.5 * gaps[:-1], atol=5e-4)
+
+
+def test_paths_leave_the_scalar_shocks_untouched(mock_apple_snapshot):
+    plain = MonteCarloRunner._generate_vectors(
+        _params(mock_apple_snapshot), N_SIMS, 11, base_beta=1.2, base_wacc=0.09)
+    vectors = _paths(_params(mock_apple_snapshot, growth_process="ar1", flow_noise_volatility=0.1))
+
+    for key in plain:
+        np.testing.assert_array_equal(vectors[key], plain[key])
+
+
+def test_flow_noise_is_centred_on_one(mock_apple_snapshot):
+    vectors = _paths(_params(mock_apple_snapshot, flow_noise_volatility=0.2))
+
+    assert "growth_path" not in vectors
+    assert vectors["flow_noise"].mean() == pytest.approx(1.0, abs=2e-3)
+    assert vectors["flow_noise"].std() == pytest.approx(0.2, rel=0.02)
+
+
+def test_path_horizon_covers_a_longer_manual_vector(mock_apple_snapshot):
+    params = _params(mock_apple_snapshot, growth_process="ar1")
+    params.strategy.manual_growth_vector = [0.1] * 8
+    assert _paths(params)["growth_path"].shape == (8, N_SIMS)
+
+
+def test_float32_paths(mock_apple_snapshot):
+    vectors = _paths(_params(mock_apple_snapshot, growth_process="ar1", flow_noise_volatility=0.1,
+                             precision="float32"))
+    assert vectors["growth_path"].dtype == np.float32
+    assert vectors["flow_noise"].dtype == np.float32
+
+
+def test_invalid_path_settings_are_rejected():
+    with pytest.raises(ValidationError):
+        MCParameters(growth_persistence=1.5)
+    with pytest.raises(ValidationError):
+        MCParameters(flow_noise_volatility=-0.1)
+    with pytest.raises(ValidationError):
+        MCParameters(growth_process="garch")
+
+
+# ------------------------------------------------------------------
+# Kernels
+# ------------------------------------------------------------------
+
+@pytest.mark.parametrize("mode", list(DCF_MODES), ids=lambda m: m.value)
+def test_kernel_with_fade_path_and_unit_noise_matches_plain_kernel(mode, mock_apple_snapshot):
+    params = _params(mock_apple_snapshot, mode)
+    strategy = get_strategy(mode)()
+    vectors = MonteCarloRunner._generate_vectors(params, 1_000, 3, base_beta=1.2, base_wacc=0.09)
+    vectors["wacc"] = 0.04 + vectors["beta"] * 0.05
+    reference = strategy.execute_stochastic(params.structure, params, vectors)
+
+    years = params.strategy.projection_years or 5
+    alpha = np.arange(years)[:, np.newaxis] / (years - 1)
+    vectors["growth_path"] = vectors["growth"] * (1 - alpha) + vectors["terminal_growth"] * alpha
+    vectors["flow_noise"] = np.ones((years, 1_000))
+
+    np.testing.assert_allclose(strategy.execute_stochastic(params.structure, params, vectors), reference, rtol=1e-12)
+
+
+def test_flow_noise_is_transitory(mock_apple_snapshot):
+    params = _params(mock_apple_snapshot)
+    strategy = get_strategy(ValuationMethodology.FCFF_STANDARD)()
+    vectors = MonteCarloRunner._generate_vectors(params, 100, 3, base_beta=1.2, base_wacc=0.09)
+    clean = np.array(strategy.stochastic_flows(params.structure, params, vectors))
+
+    noise = np.ones((5, 100))
+    noise[1] = 1.5
+    vectors["flow_noise"] = noise
+    noisy = strategy.stochastic_flows(params.structure, params, vectors)
+
+    np.testing.assert_allclose(noisy[1], 1.5 * clean[1])
+    np.testing.assert_allclose(noisy[[0, 2, 3, 4]], clean[[0, 2, 3, 4]])
+
+
+def test_short_growth_path_is_rejected(mock_apple_snapshot):
+    params = _params(mock_apple_snapshot)
+    strategy = get_strategy(ValuationMethodology.FCFF_STANDARD)()
+    vectors = MonteCarloRunner._generate_vectors(params, 100, 3, base_beta=1.2, base_wacc=0.09)
+    vectors["growth_path"] = np.full((3, 100), 0.05)
+
+    with pytest.raises(ValueError, match="growth_path"):
+        strategy.stochastic_flows(params.structure, params, vectors)
+
+
+# ------------------------------------------------------------------
+# Fan charts
+# ------------------------------------------------------------------
+
+# FCFF_NORMALIZED is left out: the runner centres 'base_flow' on fcf_anchor / revenue_ttm, not fcf_norm.
+@pytest.mark.parametrize("mode", [m for m in DCF_MODES if m != ValuationMethodology.FCFF_NORMALIZED],
+                         ids=lambda m: m.value)
+def test_path_dependent_run_reports_fan_charts(mode, mock_apple_snapshot):
+    params = _params(mock_apple_snapshot, mode, growth_process="ar1", flow_noise_volatility=0.05)
+    result = MonteCarloRunner(get_strategy(mode)()).execute(params, params.structure)
+
+    assert result is not None
+    for chart in (result.flow_fan_chart, result.growth_fan_chart):
+        assert set(chart) == {"P10", "P50", "P90"}
+        p10, p50, p90 = (np.array(chart[k]) for k in ("P10", "P50", "P90"))
+        assert p10.size == 5
+        assert np.all(p10 < p50) and np.all(p50 < p90)
+    # Growth dispersion narrows as the paths revert to the perpetual growth
+    spread = np.array(result.growth_fan_chart["P90"]) - np.array(result.growth_fan_chart["P10"])
+    assert spread[-1] < spread[0] * 1.5
+
+
+def test_constant_growth_run_has_no_fan_chart(mock_apple_snapshot):
+    params = _params(mock_apple_snapshot)
+    result = MonteCarloRunner(get_strategy(ValuationMethodology.FCFF_STANDARD)()).execute(params, params.structure)
+
+    assert result.flow_fan_chart == {} and result.growth_fan_chart == {}
+
+
+def test_adaptive_run_merges_batch_paths(mock_apple_snapshot):
+    params = _params(mock_apple_snapshot, growth_process="ar1", adaptive=True, max_iterations=10_000)
+    result = MonteCarloRunner(get_strategy(ValuationMethodology.FCFF_STANDARD)()).execute(params, params.structure)
+
+    assert len(result.flow_fan_chart["P50"]) == 5
+
+
+def test_strategy_without_path_kernel_falls_back(mock_apple_snapshot, caplog):
+    ghost = Parameters(structure=Company(ticker=mock_apple_snapshot.ticker),
+                       strategy=GrahamParameters(eps_normalized=6.0, growth_estimate=0.06))
+    params = Resolver().resolve(ghost, mock_apple_snapshot)
+    params.extensions.monte_carlo = MCParameters(enabled=True, iterations=1_000, growth_process="ar1")
+
+    with caplog.at_level(logging.WARNING):
+        result = MonteCarloRunner(get_strategy(ValuationMethodology.GRAHAM)()).execute(params, params.structure)
+
+    assert result is not None and result.growth_fan_chart == {}
+    assert "path-dependent" in caplog.text
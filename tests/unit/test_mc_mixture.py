@@ -0,0 +1,114 @@
+"""
+tests/unit/test_mc_mixture.py
+
+SCENARIO-WEIGHTED MIXTURE MONTE CARLO TESTS
+===========================================
+Role: Validates the `scenario_mixture` mode of MonteCarloRunner: scenario
+      draws follow the probabilities, overrides re-center the shocked vectors,
+      and the result is one probability-weighted distribution.
+"""
+
+import numpy as np
+import pytest
+
+from src.models.company import Company
+from src.models.parameters.base_parameter import Parameters
+from src.models.parameters.options import MCParameters, ScenarioParameters, ScenariosParameters
+from src.models.parameters.strategies import (
+    FCFFGrowthParameters,
+    FCFFStandardParameters,
+    TerminalValueParameters,
+)
+from src.valuation.options.monte_carlo import MonteCarloRunner
+from src.valuation.resolvers.base_resolver import Resolver
+from src.valuation.strategies.revenue_growth_fcff import RevenueGrowthFCFFStrategy
+from src.valuation.strategies.standard_fcff import StandardFCFFStrategy
+
+N_SIMS = 20_000
+
+
+def _params(strategy_params, snapshot, cases, mixture=True):
+    params = Resolver().resolve(Parameters(structure=Company(ticker="AAPL"), strategy=strategy_params), snapshot)
+    params.extensions.monte_carlo = MCParameters(enabled=True, iterations=N_SIMS, scenario_mixture=mixture)
+    params.extensions.scenarios = ScenariosParameters(enabled=True, cases=cases)
+    return params
+
+
+def _fcff_params(g_n=0.02):
+    return FCFFStandardParameters(
+        fcf_anchor=100.0, growth_rate_p1=0.05,
+        terminal_value=TerminalValueParameters(perpetual_growth_rate=g_n),
+    )
+
+
+BEAR_BULL = [
+    ScenarioParameters(name="Bear", probability=0.25, growth_override=0.01),
+    ScenarioParameters(name="Bull", probability=0.75, growth_override=0.03),
+]
+
+
+def test_scenario_draws_follow_probabilities():
+    cases = [ScenarioParameters(name=n, probability=p) for n, p in (("A", 0.2), ("B", 0.5), ("C", 0.3))]
+    idx = MonteCarloRunner._draw_scenarios(cases, 100_000, seed=7)
+    np.testing.assert_allclose(np.bincount(idx) / idx.size, [0.2, 0.5, 0.3], atol=0.01)
+    np.testing.assert_array_equal(idx, MonteCarloRunner._draw_scenarios(cases, 100_000, seed=7))
+
+
+def test_missing_probabilities_default_to_uniform():
+    cases = [ScenarioParameters(name="A"), ScenarioParameters(name="B")]
+    idx = MonteCarloRunner._draw_scenarios(cases, 50_000, seed=1)
+    assert np.bincount(idx)[0] / idx.size == pytest.approx(0.5, abs=0.01)
+
+
+def test_mixture_reports_scenario_mix_and_shifts_distribution(mock_apple_snapshot):
+    runner = MonteCarloRunner(StandardFCFFStrategy())
+    params = _params(_fcff_params(), mock_apple_snapshot, BEAR_BULL)
+    mixed = runner.execute(params, params.structure)
+    params.extensions.monte_carlo.scenario_mixture = False
+    plain = runner.execute(params, params.structure)
+
+    assert set(mixed.scenario_mix) == {"Bear", "Bull"}
+    assert sum(mixed.scenario_mix.values()) == pytest.approx(1.0)
+    assert mixed.scenario_mix["Bull"] == pytest.approx(0.75, abs=0.02)
+    assert plain.scenario_mix == {}
+    # Bull (g_n 3%) dominates a 2% base: the mixture mean lies above the plain run.
+    assert mixed.mean > plain.mean
+
+
+def test_mixture_matches_per_scenario_runs(mock_apple_snapshot):
+    """The mixture mean equals the probability-weighted mean of one MC run per scenario."""
+    runner = MonteCarloRunner(StandardFCFFStrategy())
+    params = _params(_fcff_params(), mock_apple_snapshot, BEAR_BULL)
+    mixed = runner.execute(params, params.structure)
+
+    per_case = []
+    for case in BEAR_BULL:
+        case_params = _params(_fcff_params(case.growth_override), mock_apple_snapshot, BEAR_BULL, mixture=False)
+        per_case.append(runner.execute(case_params, case_params.structure))
+    expected = sum(case.probability * res.mean for case, res in zip(BEAR_BULL, per_case))
+    assert mixed.mean == pytest.approx(expected, rel=0.02)
+
+
+def test_margin_override_feeds_target_margin_vector(mock_apple_snapshot):
+    strategy_params = FCFFGrowthParameters(
+        revenue_growth_rate=0.06, target_fcf_margin=0.20,
+        terminal_value=TerminalValueParameters(perpetual_growth_rate=0.02),
+    )
+    cases = [
+        ScenarioParameters(name="Squeeze", probability=0.5, margin_override=0.05),
+        ScenarioParameters(name="Base", probability=0.5),
+    ]
+    params = _params(strategy_params, mock_apple_snapshot, cases)
+    runner = MonteCarloRunner(RevenueGrowthFCFFStrategy())
+
+    vectors = runner._generate_vectors(params, 1_000, 3, base_beta=1.2, base_wacc=0.09)
+    idx = runner._draw_scenarios(cases, 1_000, 3)
+    runner._apply_scenario_overrides(params, params.structure, vectors, cases, idx, base_wacc=0.09)
+
+    assert np.all(vectors["target_margin"][idx == 0] == 0.05)
+    assert np.all(vectors["target_margin"][idx == 1] == pytest.approx(0.20))
+
+    mixed = runner.execute(params, params.structure)
+    params.extensions.monte_carlo.scenario_mixture = False
+    plain = runner.execute(params, params.structure)
+    assert mixed.mean < plain.mean
@@ -0,0 +1,136 @@
+"""
+tests/unit/test_mc_variance_reduction.py
+
+MONTE CARLO VARIANCE REDUCTION TESTS
+====================================
+Role: Validates the antithetic / Sobol / control-variate samplers of
+      MonteCarloRunner, the control-variate estimators and the reported
+      standard errors / efficiency gains.
+"""
+
+import numpy as np
+import pytest
+from pydantic import ValidationError
+
+from src.computation.statistics import (
+    control_variate_weights,
+    iid_quantile_standard_error,
+    weighted_quantiles,
+)
+from src.models.company import Company
+from src.models.parameters.base_parameter import Parameters
+from src.models.parameters.options import MCParameters
+from src.models.parameters.strategies import GrahamParameters
+from src.valuation.options.monte_carlo import MonteCarloRunner
+from src.valuation.resolvers.base_resolver import Resolver
+from src.valuation.strategies.graham_value import GrahamNumberStrategy
+
+N_SIMS = 20_000
+MODES = ["none", "antithetic", "sobol", "control_variate"]
+
+
+@pytest.fixture
+def graham_params(mock_apple_snapshot):
+    strategy = GrahamParameters(eps_normalized=6.0, growth_estimate=0.06)
+    return Resolver().resolve(Parameters(structure=Company(ticker="AAPL"), strategy=strategy), mock_apple_snapshot)
+
+
+def _run(params, mode, seed=42, n_sims=N_SIMS):
+    params.extensions.monte_carlo = MCParameters(
+        enabled=True, iterations=n_sims, variance_reduction=mode, random_seed=seed)
+    return MonteCarloRunner(GrahamNumberStrategy()).execute(params, params.structure)
+
+
+# ------------------------------------------------------------------
+# Estimators
+# ------------------------------------------------------------------
+
+def test_control_variate_weights_match_known_mean():
+    rng = np.random.default_rng(0)
+    x = rng.normal(1.0, 1.0, 5_000)
+    w = control_variate_weights(x, 1.0)
+    assert w.sum() == pytest.approx(1.0)
+    assert w @ x == pytest.approx(1.0)
+
+
+def test_weighted_quantiles_reduce_to_empirical_quantiles():
+    values = np.arange(1.0, 101.0)
+    weights = np.full(100, 0.01)
+    np.testing.assert_allclose(weighted_quantiles(values, weights, [0.1, 0.5, 0.9]), [10.0, 50.0, 90.0])
+
+
+def test_iid_quantile_standard_error_matches_normal_theory():
+    values = np.random.default_rng(1).standard_normal(100_000)
+    # sqrt(p(1-p)/n) / phi(z_p) for the median of N(0, 1)
+    expected = np.sqrt(0.25 / 100_000) / 0.3989
+    assert iid_quantile_standard_error(values, 0.5) == pytest.approx(expected, rel=0.05)
+
+
+# ------------------------------------------------------------------
+# Samplers
+# ------------------------------------------------------------------
+
+def test_antithetic_pairs_mirror_the_shocks(graham_params):
+    graham_params.extensions.monte_carlo = MCParameters(enabled=True, variance_reduction="antithetic")
+    vectors = MonteCarloRunner._generate_vectors(graham_params, 1_000, 3, base_beta=1.2, base_wacc=0.5)
+    growth = vectors["growth"]
+    centre = MonteCarloRunner._vector_centers(graham_params)["growth"]
+    np.testing.assert_allclose(growth[0::2] - centre, -(growth[1::2] - centre), atol=1e-12)
+
+
+def test_sobol_vectors_have_target_moments(graham_params):
+    graham_params.extensions.monte_carlo = MCParameters(enabled=True, variance_reduction="sobol")
+    vectors = MonteCarloRunner._generate_vectors(graham_params, 2 ** 14, 3, base_beta=1.2, base_wacc=0.5)
+    assert vectors["beta"].mean() == pytest.approx(1.2, abs=1e-4)
+    assert vectors["beta"].std() == pytest.approx(0.12, rel=1e-3)
+
+
+def test_batch_bounds_are_even_and_cover_all_paths():
+    bounds = MonteCarloRunner._batch_bounds(10_001)
+    assert bounds[0] == 0 and bounds[-1] == 10_001
+    assert np.all(bounds[1:-1] % 2 == 0)
+    assert MonteCarloRunner._batch_bounds(60) is None
+
+
+def test_unknown_mode_is_rejected():
+    with pytest.raises(ValidationError):
+        MCParameters(variance_reduction="latin_hypercube")
+
+
+# ------------------------------------------------------------------
+# Runner
+# ------------------------------------------------------------------
+
+@pytest.mark.parametrize("mode", MODES)
+def test_modes_agree_on_the_distribution(graham_params, mode):
+    plain = _run(graham_params, "none", n_sims=20_000)
+    result = _run(graham_params, mode)
+
+    assert result.variance_reduction == mode
+    assert result.mean == pytest.approx(plain.mean, rel=0.01)
+    for label in ("P10", "P50", "P90"):
+        assert result.quantiles[label] == pytest.approx(plain.quantiles[label], rel=0.02)
+    assert set(result.standard_errors) == {"mean", "P10", "P50", "P90"}
+
+
+@pytest.mark.parametrize("mode", ["antithetic", "sobol", "control_variate"])
+def test_variance_reduction_shrinks_the_mean_error(graham_params, mode):
+    plain = _run(graham_params, "none")
+    reduced = _run(graham_params, mode)
+
+    assert reduced.standard_errors["mean"] < plain.standard_errors["mean"] / 3
+    assert reduced.efficiency_gains["mean"] > 5
+
+
+def test_control_variate_is_skipped_in_mixture_mode(graham_params, caplog):
+    from src.models.parameters.options import ScenarioParameters, ScenariosParameters
+
+    graham_params.extensions.scenarios = ScenariosParameters(
+        enabled=True, cases=[ScenarioParameters(name="A", probability=1.0, growth_override=0.05)])
+    graham_params.extensions.monte_carlo = MCParameters(
+        enabled=True, iterations=2_000, variance_reduction="control_variate", scenario_mixture=True)
+
+    result = MonteCarloRunner(GrahamNumberStrategy()).execute(graham_params, graham_params.structure)
+
+    assert result is not None
+    assert "control variate disabled" in caplog.text
@@ -0,0 +1,198 @@
+"""
+tests/unit/test_prewarm.py
+
+PRE-WARM TESTS
+==============
+Role: Validates the persistent snapshot cache (round-trip, TTL, corrupted
+      entries), the provider serving pre-warmed snapshots without fetching
+      and handing its raw-data store to the fetcher,
+      and the watchlist pre-warm job and its command line.
+"""
+
+import os
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from infra.data_providers import prewarm
+from infra.data_providers.config import ProviderConfig
+from infra.data_providers.prewarm import main, prewarm_watchlist, read_watchlist
+from infra.data_providers.raw_store import RawDataStore
+from infra.data_providers.snapshot_cache import SnapshotCache
+from infra.data_providers.yahoo_financial_provider import (
+    YahooFinancialProvider,
+    _get_cached_snapshot,
+    get_yahoo_provider,
+)
+from src.models.company import CompanySnapshot
+
+BUILD = "infra.data_providers.yahoo_financial_provider.build_company_snapshot"
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return SnapshotCache(tmp_path / "snapshots", ttl_seconds=3600)
+
+
+@pytest.fixture
+def provider(cache):
+    return YahooFinancialProvider(macro_provider=MagicMock(), snapshot_cache=cache)
+
+
+def _build(ticker, *args):
+    return None if ticker == "BAD" else CompanySnapshot(ticker=ticker, current_price=100.0)
+
+
+# ------------------------------------------------------------------
+# Snapshot cache
+# ------------------------------------------------------------------
+
+def test_cache_round_trip(cache, mock_apple_snapshot):
+    cache.put(mock_apple_snapshot)
+
+    assert cache.get("aapl") == mock_apple_snapshot
+    assert cache.is_fresh("AAPL") and cache.age("AAPL") < 60
+
+
+def test_expired_and_corrupted_entries_are_not_served(cache, mock_apple_snapshot):
+    path = cache.put(mock_apple_snapshot)
+    old = time.time() - 7200
+    os.utime(path, (old, old))
+    assert cache.get("AAPL") is None and not cache.is_fresh("AAPL")
+
+    path.write_text("{not json", encoding="utf-8")
+    os.utime(path, None)
+    assert cache.get("AAPL") is None
+    assert cache.get("MSFT") is None and cache.age("MSFT") is None
+
+
+# ------------------------------------------------------------------
+# Provider
+# ------------------------------------------------------------------
+
+def test_provider_serves_a_prewarmed_snapshot_without_fetching(provider, cache, mock_apple_snapshot):
+    cache.put(mock_apple_snapshot)
+    _get_cached_snapshot.clear()
+
+    with patch(BUILD) as build:
+        snapshot = provider.get_company_snapshot("AAPL")
+
+    build.assert_not_called()
+    assert snapshot == mock_apple_snapshot
+    _get_cached_snapshot.clear()
+
+
+def test_interactive_fetches_do_not_write_the_cache(provider, cache):
+    """Only the pre-warm job writes: a click-handler price is never served for the whole TTL."""
+    _get_cached_snapshot.clear()
+
+    with patch(BUILD, side_effect=_build):
+        assert provider.get_company_snapshot("MSFT").current_price == 100.0
+
+    assert cache.age("MSFT") is None
+    _get_cached_snapshot.clear()
+
+
+def test_provider_hands_its_raw_store_to_the_fetcher(tmp_path):
+    store = RawDataStore(tmp_path / "raw")
+
+    assert YahooFinancialProvider(macro_provider=MagicMock(), raw_store=store).fetcher.store is store
+    assert YahooFinancialProvider(macro_provider=MagicMock()).fetcher.store is None
+
+
+def test_process_wide_provider_refreshes_history_through_the_raw_store():
+    get_yahoo_provider.cache_clear()
+    try:
+        assert isinstance(get_yahoo_provider().fetcher.store, RawDataStore)
+        get_yahoo_provider.cache_clear()
+        with patch.object(ProviderConfig, "RAW_STORE_ENABLED", False):
+            assert get_yahoo_provider().fetcher.store is None
+    finally:
+        get_yahoo_provider.cache_clear()
+
+
+# ------------------------------------------------------------------
+# Pre-warm job
+# ------------------------------------------------------------------
+
+def test_prewarm_builds_skips_fresh_and_reports_failures(provider, cache):
+    cache.put(CompanySnapshot(ticker="AAPL"))
+    events = []
+
+    with patch(BUILD, side_effect=_build) as build:
+        report = prewarm_watchlist(["aapl", "MSFT", "BAD", "MSFT"], provider,
+                                   progress=lambda *event: events.append(event))
+
+    assert report.skipped == ["AAPL"] and report.warmed == ["MSFT"] and report.failed == ["BAD"]
+    assert sorted(call.args[0] for call in build.call_args_list) == ["BAD", "MSFT"]
+    assert [event[:2] for event in events] == [(1, 3), (2, 3), (3, 3)]
+    assert cache.is_fresh("MSFT") and not cache.is_fresh("BAD")
+
+
+def test_entries_are_keyed_by_the_requested_symbol(provider, cache):
+    """A suffix fallback resolves MC to MC.PA; the entry is still found as MC."""
+    with patch(BUILD, side_effect=lambda ticker, *args: CompanySnapshot(ticker=f"{ticker}.PA")) as build:
+        prewarm_watchlist(["MC"], provider)
+        report = prewarm_watchlist(["MC"], provider)
+
+    assert build.call_count == 1 and report.skipped == ["MC"]
+    assert cache.get("MC").ticker == "MC.PA" and cache.age("MC.PA") is None
+
+
+def test_force_rebuilds_fresh_entries(provider, cache):
+    cache.put(CompanySnapshot(ticker="AAPL"))
+
+    with patch(BUILD, side_effect=_build):
+        report = prewarm_watchlist(["AAPL"], provider, force=True)
+
+    assert report.warmed == ["AAPL"] and cache.get("AAPL").current_price == 100.0
+
+
+def test_concurrency_is_bounded(provider):
+    running, peak, lock = 0, 0, threading.Lock()
+
+    def slow_build(ticker, *args):
+        nonlocal running, peak
+        with lock:
+            running += 1
+            peak = max(peak, running)
+        time.sleep(0.02)
+        with lock:
+            running -= 1
+        return _build(ticker)
+
+    with patch(BUILD, side_effect=slow_build):
+        report = prewarm_watchlist([f"T{i}" for i in range(12)], provider, max_workers=3)
+
+    assert len(report.warmed) == 12 and 1 < peak <= 3
+
+
+def test_provider_without_cache_is_rejected():
+    with pytest.raises(ValueError, match="snapshot cache"):
+        prewarm_watchlist(["AAPL"], YahooFinancialProvider(macro_provider=MagicMock()))
+
+
+# ------------------------------------------------------------------
+# Command line
+# ------------------------------------------------------------------
+
+def test_watchlist_file_parsing(tmp_path):
+    path = tmp_path / "watchlist.txt"
+    path.write_text("# US\naapl\nMSFT  # software\n\nOR.PA\nAAPL\n", encoding="utf-8")
+
+    assert read_watchlist(path) == ["AAPL", "MSFT", "OR.PA"]
+
+
+def test_cli_exit_codes(provider, tmp_path, capsys):
+    path = tmp_path / "watchlist.txt"
+    path.write_text("AAPL\n", encoding="utf-8")
+
+    with patch.object(prewarm, "get_yahoo_provider", return_value=provider), patch(BUILD, side_effect=_build):
+        assert main(["-w", str(path), "msft"]) == 0
+        assert main(["BAD"]) == 1
+    assert main([]) == 2
+
+    out = capsys.readouterr().out
+    assert "[2/2]" in out and "2 warmed, 0 fresh, 0 failed" in out
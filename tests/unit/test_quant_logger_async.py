@@ -0,0 +1,112 @@
+"""
+tests/unit/test_quant_logger_async.py
+
+LOW-OVERHEAD QUANT LOGGER TESTS
+===============================
+Role: Validates lazy formatting and the queued JSON-lines writer of src/core/quant_logger.py.
+Standards: pytest + unittest.mock
+"""
+
+import json
+import logging
+import threading
+from unittest.mock import patch
+
+import pytest
+
+from src.core import quant_logger
+from src.core.quant_logger import (
+    JsonLinesFormatter,
+    QuantLogger,
+    configure_quant_logging,
+    shutdown_quant_logging,
+)
+
+
+@pytest.fixture(autouse=True)
+def restore_quant_logger():
+    """Leaves the module-level logger exactly as it was found."""
+    level = quant_logger._logger.level
+    handlers = list(quant_logger._logger.handlers)
+    yield
+    shutdown_quant_logging()
+    quant_logger._logger.setLevel(level)
+    assert quant_logger._logger.handlers == handlers
+
+
+def test_default_mode_is_eager():
+    """Without configuration, handlers receive plain strings (legacy behaviour)."""
+    with patch('src.core.quant_logger._logger') as mock_log:
+        QuantLogger.log_stage_start("AAPL", "HYDRATION")
+    assert isinstance(mock_log.info.call_args[0][0], str)
+
+
+def test_lazy_mode_skips_formatting_when_level_disabled():
+    configure_quant_logging(lazy=True, level=logging.WARNING)
+    with patch.object(QuantLogger, "_format_message") as fmt, \
+            patch("src.core.quant_logger.json.dumps") as dumps:
+        QuantLogger.log_stage_start("AAPL", "HYDRATION")
+        QuantLogger.log_json(event="valuation_completed", ticker="AAPL")
+    fmt.assert_not_called()
+    dumps.assert_not_called()
+
+
+def test_lazy_message_renders_like_eager():
+    eager = QuantLogger._format_message(
+        quant_logger.LogDomain.PIPELINE, quant_logger.LogLevel.INFO, "AAPL", stage="HYDRATION", wacc_rate=0.0812
+    )
+    configure_quant_logging(lazy=True)
+    with patch('src.core.quant_logger._logger') as mock_log:
+        QuantLogger._emit(
+            logging.INFO, quant_logger.LogDomain.PIPELINE, quant_logger.LogLevel.INFO, "AAPL",
+            stage="HYDRATION", wacc_rate=0.0812,
+        )
+    deferred = mock_log.info.call_args[0][0]
+    assert not isinstance(deferred, str)
+    assert str(deferred) == eager
+
+
+def test_background_writer_emits_json_lines(tmp_path):
+    log_file = tmp_path / "quant.jsonl"
+    configure_quant_logging(log_file=log_file, console=False)
+
+    render_threads = []
+    original = QuantLogger._format_message
+
+    def _spy(*args, **kwargs):
+        render_threads.append(threading.current_thread())
+        return original(*args, **kwargs)
+
+    with patch.object(QuantLogger, "_format_message", side_effect=_spy):
+        QuantLogger.log_stage_complete("MSFT", "STRATEGY_EXECUTION", duration_ms=12)
+        QuantLogger.log_json(event="valuation_completed", ticker="MSFT", execution_time_ms=12)
+        QuantLogger.log_error("MSFT", ValueError("boom"))
+        shutdown_quant_logging()
+
+    lines = [json.loads(line) for line in log_file.read_text(encoding="utf-8").splitlines()]
+    assert len(lines) == 3
+    assert "Stage: STRATEGY_EXECUTION" in lines[0]["message"]
+    assert lines[1]["event"] == "valuation_completed"
+    assert lines[1]["execution_time_ms"] == 12
+    assert lines[2]["level"] == "ERROR"
+    # Rendering happened on the listener thread, not on the caller.
+    assert render_threads and all(t is not threading.main_thread() for t in render_threads)
+
+
+def test_background_writer_rotates(tmp_path):
+    log_file = tmp_path / "quant.jsonl"
+    configure_quant_logging(log_file=log_file, console=False, max_bytes=512, backup_count=2)
+    for i in range(50):
+        QuantLogger.log_json(event="tick", index=i)
+    shutdown_quant_logging()
+
+    assert log_file.exists()
+    assert (tmp_path / "quant.jsonl.1").exists()
+    assert not (tmp_path / "quant.jsonl.3").exists()
+
+
+def test_json_lines_formatter_plain_record():
+    record = logging.LogRecord("quant", logging.INFO, __file__, 1, "hello %s", ("world",), None)
+    entry = json.loads(JsonLinesFormatter().format(record))
+    assert entry["message"] == "hello world"
+    assert entry["level"] == "INFO"
@@ -0,0 +1,57 @@
+"""
+tests/unit/test_quasi_random.py
+
+QUASI-RANDOM SEQUENCE TESTS
+===========================
+Role: Validates the Sobol generator (reference points, balance, digital shift)
+      and the vectorized inverse normal CDF.
+"""
+
+from statistics import NormalDist
+
+import numpy as np
+import pytest
+
+from src.computation.quasi_random import SOBOL_BITS, SOBOL_MAX_DIM, inverse_normal_cdf, sobol_points
+
+HALF_CELL = 0.5 / 2 ** SOBOL_BITS
+
+
+def test_sobol_reference_points():
+    # Gray-code order of the first three Joe-Kuo dimensions.
+    points = np.rint((sobol_points(8, 3) - HALF_CELL) * 8).astype(int)
+    np.testing.assert_array_equal(points[:, 0], [0, 4, 6, 2, 3, 7, 5, 1])
+    np.testing.assert_array_equal(points[:, 1], [0, 4, 2, 6, 3, 7, 1, 5])
+    np.testing.assert_array_equal(points[:, 2], [0, 4, 2, 6, 5, 1, 7, 3])
+
+
+def test_sobol_power_of_two_is_stratified():
+    points = sobol_points(1024, SOBOL_MAX_DIM, np.random.default_rng(0))
+    for d in range(SOBOL_MAX_DIM):
+        counts = np.bincount((points[:, d] * 16).astype(int), minlength=16)
+        assert np.all(counts == 64)
+
+
+def test_digital_shift_is_seeded_and_stays_in_unit_interval():
+    a = sobol_points(256, 4, np.random.default_rng(5))
+    b = sobol_points(256, 4, np.random.default_rng(5))
+    np.testing.assert_array_equal(a, b)
+    assert not np.array_equal(a, sobol_points(256, 4, np.random.default_rng(6)))
+    assert a.min() > 0.0 and a.max() < 1.0
+
+
+def test_sobol_rejects_unsupported_dimension():
+    with pytest.raises(ValueError, match="dimension"):
+        sobol_points(8, SOBOL_MAX_DIM + 1)
+
+
+def test_inverse_normal_cdf_accuracy():
+    u = np.array([1e-10, 1e-4, 0.02, 0.3, 0.5, 0.8, 0.99, 1 - 1e-6])
+    expected = [NormalDist().inv_cdf(x) for x in u]
+    np.testing.assert_allclose(inverse_normal_cdf(u), expected, rtol=1e-8, atol=1e-8)
+
+
+def test_sobol_normals_have_unit_moments():
+    z = inverse_normal_cdf(sobol_points(2 ** 14, 2, np.random.default_rng(1)))
+    np.testing.assert_allclose(z.mean(axis=0), 0.0, atol=1e-3)
+    np.testing.assert_allclose(z.std(axis=0), 1.0, atol=1e-3)
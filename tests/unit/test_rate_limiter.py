@@ -0,0 +1,161 @@
+"""
+tests/unit/test_rate_limiter.py
+
+RATE LIMITER TESTS
+==================
+Role: Validates the token bucket (burst, refill, queued reservations), its
+      state shared through a file between limiter instances and processes,
+      and its use in front of every `safe_api_call` attempt.
+"""
+
+import multiprocessing
+import time
+from unittest.mock import patch
+
+import pytest
+
+from infra.data_providers import rate_limiter
+from infra.data_providers.config import ProviderConfig
+from infra.data_providers.extraction_utils import safe_api_call
+from infra.data_providers.rate_limiter import TokenBucketRateLimiter, get_rate_limiter, set_rate_limiter
+
+
+class FakeClock:
+    """Deterministic clock whose sleep advances time."""
+
+    def __init__(self):
+        self.now = 1_000.0
+        self.slept = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.slept.append(seconds)
+        self.now += seconds
+
+
+def _limiter(clock, **kwargs) -> TokenBucketRateLimiter:
+    return TokenBucketRateLimiter(rate=kwargs.pop("rate", 2.0), capacity=kwargs.pop("capacity", 3.0),
+                                  clock=clock, sleep=clock.sleep, **kwargs)
+
+
+# ------------------------------------------------------------------
+# Bucket
+# ------------------------------------------------------------------
+
+def test_burst_then_sustained_rate():
+    clock = FakeClock()
+    limiter = _limiter(clock)
+
+    waits = [limiter.acquire() for _ in range(7)]
+
+    assert waits[:3] == [0.0, 0.0, 0.0]  # banked burst
+    assert waits[3:] == pytest.approx([0.5] * 4)  # then one token every 1/rate seconds
+    assert clock.now == pytest.approx(1_002.0)
+
+
+def test_idle_time_refills_up_to_capacity():
+    clock = FakeClock()
+    limiter = _limiter(clock)
+    for _ in range(3):
+        limiter.acquire()
+
+    clock.now += 60.0
+    assert limiter.available() == 3.0
+
+
+def test_concurrent_callers_queue_their_reservations():
+    clock = FakeClock()
+    limiter = _limiter(clock, capacity=1.0)
+    limiter.acquire()
+
+    # Two callers arrive at once: the second waits behind the first's reservation
+    assert limiter._reserve(1.0, allow_debt=True) == pytest.approx(0.5)
+    assert limiter._reserve(1.0, allow_debt=True) == pytest.approx(1.0)
+    assert limiter.available() == pytest.approx(-2.0)
+
+
+def test_try_acquire_never_waits():
+    clock = FakeClock()
+    limiter = _limiter(clock, capacity=1.0)
+
+    assert limiter.try_acquire() and not limiter.try_acquire()
+    assert clock.slept == []
+
+
+def test_invalid_settings_are_rejected():
+    with pytest.raises(ValueError, match="rate"):
+        TokenBucketRateLimiter(rate=0.0, capacity=5.0)
+
+
+# ------------------------------------------------------------------
+# Cross-process state
+# ------------------------------------------------------------------
+
+def test_limiters_sharing_a_state_file_share_the_budget(tmp_path):
+    clock = FakeClock()
+    path = tmp_path / "rate.bin"
+    first, second = _limiter(clock, state_path=path), _limiter(clock, state_path=path)
+
+    assert first.try_acquire() and second.try_acquire() and first.try_acquire()
+    assert not second.try_acquire()
+    assert path.stat().st_size == 16
+
+
+def _drain(path: str, n: int) -> None:
+    limiter = TokenBucketRateLimiter(rate=20.0, capacity=1.0, state_path=path)
+    for _ in range(n):
+        limiter.acquire()
+
+
+@pytest.mark.skipif(rate_limiter.fcntl is None, reason="file locking requires fcntl (POSIX)")
+def test_processes_are_limited_together(tmp_path):
+    path = str(tmp_path / "rate.bin")
+    start = time.perf_counter()
+    workers = [multiprocessing.get_context("fork").Process(target=_drain, args=(path, 5)) for _ in range(2)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join(timeout=30)
+    elapsed = time.perf_counter() - start
+
+    assert all(worker.exitcode == 0 for worker in workers)
+    # 10 requests at 20/s with a burst of 1: at least 9 intervals of 50 ms across both processes
+    assert elapsed >= 0.45
+
+
+# ------------------------------------------------------------------
+# Provider integration
+# ------------------------------------------------------------------
+
+def test_every_api_attempt_takes_a_token():
+    clock = FakeClock()
+    limiter = _limiter(clock, capacity=10.0)
+    set_rate_limiter(limiter)
+    try:
+        calls = iter([ValueError("throttled"), "ok"])
+
+        def flaky():
+            outcome = next(calls)
+            if isinstance(outcome, Exception):
+                raise outcome
+            return outcome
+
+        with patch("infra.data_providers.extraction_utils.time.sleep"):
+            assert safe_api_call(flaky, "Test", max_retries=3) == "ok"
+        assert limiter.available() == pytest.approx(8.0)
+    finally:
+        set_rate_limiter(None)
+
+
+def test_shared_limiter_is_built_from_the_config(tmp_path):
+    set_rate_limiter(rate_limiter._UNSET)
+    try:
+        with patch.object(ProviderConfig, "RATE_LIMIT_STATE_FILE", str(tmp_path / "rate.bin")):
+            limiter = get_rate_limiter()
+        assert get_rate_limiter() is limiter
+        assert limiter.rate == ProviderConfig.RATE_LIMIT_PER_SECOND
+        assert limiter.capacity == ProviderConfig.RATE_LIMIT_BURST
+    finally:
+        set_rate_limiter(None)
@@ -0,0 +1,118 @@
+"""
+tests/unit/test_raw_store.py
+
+RAW DATA STORE TESTS
+====================
+Role: Validates the local columnar store: lossless round-trip of a raw bundle,
+      memory-mapped single-column reads, atomic replacement and the optional
+      write-through of the fetcher.
+"""
+
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from infra.data_providers.raw_store import RawDataStore
+from infra.data_providers.yahoo_raw_fetcher import RawFinancialData, YahooRawFetcher
+from infra.data_providers.yahoo_snapshot_mapper import YahooSnapshotMapper
+from tests.benchmarks.conftest import load_raw_payload
+
+
+def _history(days: int = 30) -> pd.DataFrame:
+    index = pd.date_range("2024-01-02", periods=days, freq="B", tz="America/New_York")
+    close = 100.0 + np.arange(days, dtype=float)
+    return pd.DataFrame({"Open": close - 0.5, "Close": close, "Volume": 1e6}, index=index)
+
+
+@pytest.fixture
+def raw():
+    payload = load_raw_payload("aapl_raw")
+    payload.history = _history()
+    return payload
+
+
+@pytest.fixture
+def store(tmp_path):
+    return RawDataStore(tmp_path)
+
+
+# ------------------------------------------------------------------
+# Round-trip
+# ------------------------------------------------------------------
+
+def test_round_trip_is_lossless(store, raw):
+    store.save(raw)
+    back = store.load(raw.ticker)
+
+    assert back.ticker == raw.ticker and back.is_valid == raw.is_valid
+    assert back.info == raw.info
+    for name in ("balance_sheet", "income_stmt", "cash_flow", "quarterly_income_stmt", "quarterly_cash_flow"):
+        pd.testing.assert_frame_equal(getattr(back, name), getattr(raw, name).astype(float), check_column_type=False)
+    pd.testing.assert_frame_equal(back.history, raw.history, check_freq=False)
+    assert str(back.history.index.tz) == "America/New_York"
+
+
+def test_remapping_from_the_store_gives_the_same_snapshot(store, raw):
+    store.save(raw)
+    mapper = YahooSnapshotMapper()
+
+    assert mapper.map_to_snapshot(store.load(raw.ticker)) == mapper.map_to_snapshot(raw)
+
+
+def test_reads_are_memory_mapped(store, raw):
+    store.save(raw)
+
+    close = store.load_column(raw.ticker, "history", "Close")
+    assert isinstance(close, np.memmap) or isinstance(close.base, np.memmap)
+    assert close.flags.c_contiguous and not close.flags.writeable
+    np.testing.assert_array_equal(close, raw.history["Close"].to_numpy())
+
+    assert store.load_frame(raw.ticker, "history", mmap=False).equals(store.load_frame(raw.ticker, "history"))
+
+
+def test_non_numeric_cells_are_stored_as_missing(store):
+    frame = pd.DataFrame({"2024": ["n/a", 5], "2023": [100, 6]}, index=["Revenue", "Expenses"])
+    store.save(RawFinancialData(ticker="X", income_stmt=frame, is_valid=True))
+
+    back = store.load_frame("X", "income_stmt")
+    assert np.isnan(back.loc["Revenue", "2024"]) and back.loc["Expenses", "2023"] == 6.0
+
+
+# ------------------------------------------------------------------
+# Catalogue
+# ------------------------------------------------------------------
+
+def test_save_replaces_the_previous_bundle(store, raw):
+    store.save(raw)
+    raw.history = _history(5)
+    store.save(raw)
+
+    assert len(store.load_frame(raw.ticker, "history")) == 5
+    assert store.tickers() == [raw.ticker]
+
+
+def test_missing_entries_return_none(store, raw):
+    assert store.load("MSFT") is None and "MSFT" not in store
+    assert store.tickers() == []
+
+    store.save(raw)
+    assert store.load_frame(raw.ticker, "options") is None
+    assert store.load_column(raw.ticker, "history", "Adj Close") is None
+    store.delete(raw.ticker)
+    assert raw.ticker not in store and store.saved_at(raw.ticker) is None
+
+
+# ------------------------------------------------------------------
+# Fetcher write-through
+# ------------------------------------------------------------------
+
+def test_fetcher_writes_valid_fetches_through(store, raw):
+    invalid = RawFinancialData(ticker="NOPE")
+    with patch.object(YahooRawFetcher, "_execute_fetch", side_effect=[raw, invalid] + [invalid] * 7):
+        fetcher = YahooRawFetcher(store=store)
+        fetcher.fetch_ttm_snapshot(raw.ticker)
+        fetcher.fetch_ttm_snapshot("NOPE")
+
+    assert store.tickers() == [raw.ticker]
@@ -0,0 +1,90 @@
+"""
+tests/unit/test_record_replay.py
+
+RECORD / REPLAY TESTS
+=====================
+Role: Validates the record/replay provider: a live run archives the raw
+      payload, a replay rebuilds the same snapshot and valuation without
+      network, archive misses and the market-suffix fallback.
+"""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from infra.data_providers.raw_store import RawDataStore
+from infra.data_providers.record_replay import RecordReplayProvider
+from infra.macro.default_macro_provider import DefaultMacroProvider
+from src.models.company import Company
+from src.models.enums import ValuationMethodology
+from src.models.parameters.base_parameter import Parameters
+from src.models.parameters.strategies import FCFFStandardParameters
+from src.models.valuation import ValuationRequest
+from src.valuation.orchestrator import ValuationOrchestrator
+from tests.benchmarks.conftest import load_raw_payload
+
+YF_TICKER = "infra.data_providers.yahoo_raw_fetcher.yf.Ticker"
+STATEMENTS = ("balance_sheet", "income_stmt", "cash_flow", "quarterly_income_stmt", "quarterly_cash_flow")
+
+
+@pytest.fixture
+def archive(tmp_path):
+    return RawDataStore(tmp_path / "archive")
+
+
+def _live_ticker():
+    """A yf.Ticker double answering with the recorded AAPL payload."""
+    raw = load_raw_payload("aapl_raw")
+    yf_ticker = MagicMock()
+    yf_ticker.info = raw.info
+    for name in STATEMENTS:
+        setattr(yf_ticker, name, getattr(raw, name))
+    yf_ticker.history.return_value = raw.history
+    return yf_ticker
+
+
+def _provider(archive, mode):
+    return RecordReplayProvider(archive, DefaultMacroProvider(), mode=mode)
+
+
+def _value(snapshot):
+    request = ValuationRequest(
+        mode=ValuationMethodology.FCFF_STANDARD,
+        parameters=Parameters(structure=Company(ticker=snapshot.ticker),
+                              strategy=FCFFStandardParameters(growth_rate_p1=0.05)),
+    )
+    return ValuationOrchestrator().run(request, snapshot).results.common.intrinsic_value_per_share
+
+
+def test_replay_reproduces_the_recorded_run_offline(archive):
+    with patch(YF_TICKER, return_value=_live_ticker()):
+        recorded = _provider(archive, "record").get_company_snapshot("AAPL")
+    assert recorded is not None and "AAPL" in archive
+
+    with patch(YF_TICKER, side_effect=AssertionError("network used in replay")):
+        replay = _provider(archive, "replay")
+        first, second = replay.get_company_snapshot("AAPL"), replay.get_company_snapshot("AAPL")
+
+    assert first == recorded and second == recorded
+    assert _value(first) == _value(second) == _value(recorded)
+
+
+def test_archive_miss_returns_none(archive):
+    with patch(YF_TICKER, side_effect=AssertionError("network used in replay")):
+        assert _provider(archive, "replay").get_company_snapshot("MSFT") is None
+
+
+def test_replay_keeps_the_market_suffix_fallback(archive):
+    raw = load_raw_payload("aapl_raw")
+    raw.ticker = "OR.PA"
+    archive.save(raw)
+    provider = _provider(archive, "replay")
+
+    snapshot = provider.get_company_snapshot("OR")
+
+    assert snapshot is not None and provider.recorded_tickers() == ["OR.PA"]
+
+
+def test_unknown_mode_is_rejected(archive):
+    with pytest.raises(ValueError, match="mode"):
+        _provider(archive, "live")
@@ -0,0 +1,109 @@
+"""
+tests/unit/test_resource_accounting.py
+
+RESOURCE ACCOUNTING TESTS
+=========================
+Role: Validates src/core/resource_accounting.py and its wiring into
+      ValuationRunMetadata / the structured completion log.
+"""
+
+import tracemalloc
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from src.core.resource_accounting import ResourceAccountant, resource_accounting_requested
+from src.models.parameters.options import MCParameters, SensitivityParameters
+from src.valuation.orchestrator import ValuationOrchestrator
+
+
+def test_disabled_accountant_is_a_no_op():
+    with ResourceAccountant(enabled=False) as accountant:
+        with accountant.stage("strategy"):
+            np.ones(10_000)
+    assert accountant.stages == {}
+    assert accountant.totals() is None
+    assert not tracemalloc.is_tracing()
+
+
+def test_stage_measures_peak_memory_and_stops_tracemalloc():
+    with ResourceAccountant(enabled=True) as accountant:
+        with accountant.stage("small"):
+            np.ones(1_000)
+        with accountant.stage("large"):
+            buffer = np.ones(1_000_000)  # 8 MB
+            del buffer
+        totals = accountant.totals()
+
+    stages = accountant.stages
+    assert list(stages) == ["small", "large"]
+    assert stages["large"]["peak_memory_bytes"] >= 8_000_000
+    assert stages["small"]["peak_memory_bytes"] < 1_000_000
+    assert stages["large"]["cpu_time_ms"] >= 0.0
+    assert totals["peak_memory_bytes"] >= stages["large"]["peak_memory_bytes"]
+    assert not tracemalloc.is_tracing()
+
+
+def test_nested_stage_peak_propagates_to_parent():
+    with ResourceAccountant(enabled=True) as accountant:
+        with accountant.stage("outer"):
+            with accountant.stage("inner"):
+                buffer = np.ones(500_000)  # 4 MB
+                del buffer
+            with accountant.stage("after"):
+                pass
+
+    assert accountant.stages["outer"]["peak_memory_bytes"] >= accountant.stages["inner"]["peak_memory_bytes"]
+    assert accountant.stages["after"]["peak_memory_bytes"] < 1_000_000
+
+
+def test_external_tracemalloc_session_is_left_running():
+    tracemalloc.start()
+    try:
+        with ResourceAccountant(enabled=True) as accountant:
+            with accountant.stage("stage"):
+                pass
+        assert tracemalloc.is_tracing()
+    finally:
+        tracemalloc.stop()
+
+
+def test_environment_flag(monkeypatch):
+    monkeypatch.setenv("VALUATION_RESOURCE_ACCOUNTING", "1")
+    assert resource_accounting_requested()
+    assert ValuationOrchestrator().track_resources
+    monkeypatch.setenv("VALUATION_RESOURCE_ACCOUNTING", "0")
+    assert not ValuationOrchestrator().track_resources
+
+
+@pytest.fixture
+def request_with_extensions(fcff_request_standard):
+    ext = fcff_request_standard.parameters.extensions
+    ext.monte_carlo = MCParameters(enabled=True, iterations=2_000)
+    ext.sensitivity = SensitivityParameters(enabled=True)
+    return fcff_request_standard
+
+
+def test_orchestrator_attaches_stage_resources(request_with_extensions, mock_apple_snapshot):
+    with patch("src.core.quant_logger.QuantLogger.log_json") as log_json:
+        result = ValuationOrchestrator(track_resources=True).run(request_with_extensions, mock_apple_snapshot)
+
+    meta = result.metadata
+    assert set(meta.stage_resources) == {
+        "hydration", "guardrails", "strategy", "extension.monte_carlo", "extension.sensitivity",
+    }
+    assert meta.stage_resources["extension.monte_carlo"].peak_memory_bytes > 0
+    assert meta.cpu_time_ms is not None and meta.cpu_time_ms >= 0
+    assert meta.peak_memory_bytes >= meta.stage_resources["extension.monte_carlo"].peak_memory_bytes
+
+    logged = log_json.call_args.kwargs
+    assert logged["stage_resources"]["strategy"]["wall_time_ms"] >= 0
+    assert logged["peak_memory_bytes"] == meta.peak_memory_bytes
+    assert not tracemalloc.is_tracing()
+
+
+def test_orchestrator_default_leaves_metadata_lean(fcff_request_standard, mock_apple_snapshot):
+    result = ValuationOrchestrator(track_resources=False).run(fcff_request_standard, mock_apple_snapshot)
+    assert result.metadata.stage_resources == {}
+    assert result.metadata.peak_memory_bytes is None
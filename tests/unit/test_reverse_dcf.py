@@ -0,0 +1,177 @@
+"""
+tests/unit/test_reverse_dcf.py
+
+REVERSE DCF TESTS
+=================
+Role: Validates the market-implied solve: implied inputs that reprice the
+      kernel and `execute` at the market price, the lockstep universe solve
+      against per-ticker solves, and the non-convergence reporting.
+"""
+
+import numpy as np
+import pytest
+
+from src.config.constants import MacroDefaults
+from src.models.company import Company
+from src.models.enums import ValuationMethodology
+from src.models.parameters.base_parameter import Parameters
+from src.models.parameters.options import ReverseDCFParameters
+from src.models.parameters.strategies import (
+    DDMParameters,
+    FCFEParameters,
+    FCFFGrowthParameters,
+    FCFFStandardParameters,
+    GrahamParameters,
+    RIMParameters,
+    TerminalValueParameters,
+)
+from src.valuation.options.reverse_dcf import ReverseDCFRunner
+from src.valuation.registry import get_strategy
+from src.valuation.resolvers.base_resolver import Resolver
+
+TV = TerminalValueParameters(perpetual_growth_rate=0.025)
+
+MODES = {
+    ValuationMethodology.FCFF_STANDARD: lambda: FCFFStandardParameters(fcf_anchor=100.0, growth_rate_p1=0.08,
+                                                                       terminal_value=TV),
+    ValuationMethodology.FCFF_GROWTH: lambda: FCFFGrowthParameters(revenue_growth_rate=0.08, target_fcf_margin=0.25,
+                                                                   terminal_value=TV),
+    ValuationMethodology.FCFE: lambda: FCFEParameters(growth_rate=0.05, terminal_value=TV),
+    ValuationMethodology.DDM: lambda: DDMParameters(dividend_per_share=1.0, terminal_value=TV),
+    ValuationMethodology.GRAHAM: lambda: GrahamParameters(eps_normalized=6.0, growth_estimate=0.06),
+}
+
+
+def _case(snapshot, mode=ValuationMethodology.FCFF_STANDARD, strategy=None, **reverse_kwargs):
+    ghost = Parameters(structure=Company(ticker=snapshot.ticker), strategy=strategy or MODES[mode]())
+    params = Resolver().resolve(ghost, snapshot)
+    params.extensions.reverse_dcf = ReverseDCFParameters(enabled=True, **reverse_kwargs)
+    return get_strategy(mode)(), params, params.structure
+
+
+def _value(strategy, params):
+    return strategy.execute(params.structure, params).results.common.intrinsic_value_per_share
+
+
+def _kernel_at(strategy, params, target, x):
+    anchors = strategy.stochastic_anchors(params.structure, params)
+    vectors = {key: np.array([float(value)]) for key, value in anchors.items()}
+    vectors[target] = np.array([x])
+    return strategy.execute_stochastic(params.structure, params, vectors)[0]
+
+
+# ------------------------------------------------------------------
+# Implied inputs
+# ------------------------------------------------------------------
+
+@pytest.mark.parametrize("target", ["growth", "terminal_growth", "wacc"])
+@pytest.mark.parametrize("mode", [m for m in MODES if m != ValuationMethodology.GRAHAM], ids=lambda m: m.value)
+def test_implied_input_reprices_the_kernel(mode, target, mock_apple_snapshot):
+    strategy, params, financials = _case(mock_apple_snapshot, mode)
+    price = 0.8 * _value(strategy, params)
+
+    result = ReverseDCFRunner.solve_universe({"X": (strategy, params, financials)}, target, {"X": price})["X"]
+
+    assert result.converged
+    assert result.iterations <= 20
+    assert _kernel_at(strategy, params, target, result.implied_value) == pytest.approx(price, rel=1e-6)
+    # A lower price implies less growth or a higher discount rate
+    if target == "wacc":
+        assert result.implied_value > result.model_value
+    else:
+        assert result.implied_value < result.model_value
+
+
+def test_implied_growth_reprices_execute(mock_apple_snapshot):
+    strategy, params, financials = _case(mock_apple_snapshot)
+    price = 1.2 * _value(strategy, params)
+
+    result = ReverseDCFRunner.solve_universe({"X": (strategy, params, financials)}, "growth", {"X": price})["X"]
+
+    repriced = params.model_copy(deep=True)
+    repriced.strategy.growth_rate_p1 = result.implied_value
+    assert _value(strategy, repriced) == pytest.approx(price, rel=1e-6)
+
+
+def test_graham_implied_growth_is_closed_form(mock_apple_snapshot):
+    strategy, params, financials = _case(mock_apple_snapshot, ValuationMethodology.GRAHAM)
+    result = ReverseDCFRunner(strategy).execute(params, financials)
+
+    y = (params.common.rates.corporate_aaa_yield or MacroDefaults.DEFAULT_CORPORATE_AAA_YIELD) * 100.0
+    expected = (params.structure.current_price * y / (6.0 * 4.4) - 8.5) / 200.0
+    assert result.converged and result.market_price == params.structure.current_price
+    assert result.implied_value == pytest.approx(expected, rel=1e-9)
+
+
+# ------------------------------------------------------------------
+# Universe
+# ------------------------------------------------------------------
+
+def test_universe_solve_matches_single_ticker_solves(mock_apple_snapshot):
+    cases, prices = {}, {}
+    for i, mode in enumerate(m for m in MODES if m != ValuationMethodology.GRAHAM):
+        strategy, params, financials = _case(mock_apple_snapshot, mode)
+        cases[mode.value] = (strategy, params, financials)
+        prices[mode.value] = (0.7 + 0.2 * i) * _value(strategy, params)
+
+    universe = ReverseDCFRunner.solve_universe(cases, "wacc", prices)
+
+    assert list(universe) == list(cases)
+    for ticker, case in cases.items():
+        single = ReverseDCFRunner.solve_universe({ticker: case}, "wacc", {ticker: prices[ticker]})[ticker]
+        assert universe[ticker].converged
+        assert universe[ticker].implied_value == pytest.approx(single.implied_value, rel=1e-12)
+        assert universe[ticker].iterations == single.iterations
+
+
+def test_unsolvable_tickers_are_flagged(mock_apple_snapshot):
+    fcfe = _case(mock_apple_snapshot, ValuationMethodology.FCFE)
+    rim = _case(mock_apple_snapshot, ValuationMethodology.RIM,
+                strategy=RIMParameters(persistence_factor=0.6, terminal_value=TV))
+    graham = _case(mock_apple_snapshot, ValuationMethodology.GRAHAM)
+    price = 0.9 * _value(fcfe[0], fcfe[1])
+
+    results = ReverseDCFRunner.solve_universe(
+        {"FCFE": fcfe, "RIM": rim, "GRAHAM": graham, "NOPRICE": fcfe}, "wacc",
+        {"FCFE": price, "RIM": price, "GRAHAM": price, "NOPRICE": 0.0})
+
+    assert results["FCFE"].converged
+    assert not results["RIM"].converged and results["RIM"].model_value is None  # kernel not at parity
+    assert not results["NOPRICE"].converged
+    # Graham does not discount: no sign change of IV - price over the bracket
+    assert not results["GRAHAM"].converged and results["GRAHAM"].iterations == 0
+    assert results["GRAHAM"].implied_value is None
+
+
+def test_rim_at_kernel_parity_is_solved(mock_apple_snapshot):
+    """With its book value anchor set, the RIM kernel passes the parity probe like the DCF family."""
+    strategy, params, financials = _case(mock_apple_snapshot, ValuationMethodology.RIM, strategy=RIMParameters(
+        book_value_anchor=0.01, growth_rate=0.05, persistence_factor=0.6, terminal_value=TV))
+    price = 0.8 * _value(strategy, params)
+
+    result = ReverseDCFRunner.solve_universe({"X": (strategy, params, financials)}, "wacc", {"X": price})["X"]
+
+    assert result.converged and result.implied_value > result.model_value
+    assert _kernel_at(strategy, params, "wacc", result.implied_value) == pytest.approx(price, rel=1e-6)
+
+
+# ------------------------------------------------------------------
+# Settings
+# ------------------------------------------------------------------
+
+def test_unknown_target_is_rejected(mock_apple_snapshot):
+    with pytest.raises(ValueError, match="target"):
+        ReverseDCFRunner.solve_universe({"X": _case(mock_apple_snapshot)}, "beta")
+
+
+def test_disabled_reverse_dcf_returns_none(mock_apple_snapshot):
+    strategy, params, financials = _case(mock_apple_snapshot)
+    params.extensions.reverse_dcf.enabled = False
+    assert ReverseDCFRunner(strategy).execute(params, financials) is None
+
+
+def test_parameters_are_left_untouched(mock_apple_snapshot):
+    strategy, params, financials = _case(mock_apple_snapshot, ValuationMethodology.FCFE, target="terminal_growth")
+    before = params.model_dump()
+    ReverseDCFRunner(strategy).execute(params, financials)
+    assert params.model_dump() == before
@@ -0,0 +1,166 @@
+"""
+tests/unit/test_scenarios_vectorized.py
+
+VECTORIZED SCENARIOS RUNNER TESTS
+=================================
+Role: Checks that stacked scenario cases reproduce the per-case loop,
+      that margin overrides are honoured and that the parity probe guards the fast path.
+"""
+
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from src.models.company import Company
+from src.models.parameters.base_parameter import Parameters
+from src.models.parameters.options import ScenarioParameters, ScenariosParameters
+from src.models.parameters.strategies import (
+    FCFFGrowthParameters,
+    FCFFStandardParameters,
+    GrahamParameters,
+    TerminalValueParameters,
+)
+from src.valuation.options.scenarios import ScenariosRunner
+from src.valuation.resolvers.base_resolver import Resolver
+from src.valuation.strategies.graham_value import GrahamNumberStrategy
+from src.valuation.strategies.revenue_growth_fcff import RevenueGrowthFCFFStrategy
+from src.valuation.strategies.standard_fcff import StandardFCFFStrategy
+
+
+def _resolve(strategy_params, snapshot, cases):
+    params = Resolver().resolve(Parameters(structure=Company(ticker="AAPL"), strategy=strategy_params), snapshot)
+    params.extensions.scenarios = ScenariosParameters(enabled=True, cases=cases)
+    return params
+
+
+def _many_cases(n):
+    rng = np.random.default_rng(3)
+    return [
+        ScenarioParameters(
+            name=f"S{i}",
+            probability=1.0 / n,
+            growth_override=float(rng.uniform(0.0, 0.08)),
+            margin_override=float(rng.uniform(0.1, 0.3)),
+        )
+        for i in range(n)
+    ]
+
+
+def _growth_params():
+    return FCFFGrowthParameters(
+        revenue_growth_rate=0.06,
+        target_fcf_margin=0.20,
+        terminal_value=TerminalValueParameters(perpetual_growth_rate=0.02),
+    )
+
+
+def _loop_values(runner, params):
+    return runner._evaluate_loop(params, params.structure, params.extensions.scenarios.cases)
+
+
+def test_graham_cases_evaluated_in_one_kernel_call(mock_apple_snapshot):
+    params = _resolve(GrahamParameters(eps_normalized=6.0, growth_estimate=0.05), mock_apple_snapshot, _many_cases(200))
+    runner = ScenariosRunner(GrahamNumberStrategy())
+    expected = _loop_values(runner, params)
+
+    with patch.object(GrahamNumberStrategy, "execute", wraps=runner.strategy.execute) as execute:
+        result = runner.execute(params, params.structure)
+
+    assert execute.call_count == 1  # parity probe only
+    assert [o.intrinsic_value for o in result.outcomes] == pytest.approx(expected, rel=1e-12)
+    assert runner.strategy.glass_box_enabled is True
+
+
+def test_dcf_cases_use_the_kernel_fast_path(mock_apple_snapshot):
+    """The fade-down FCFF kernel reproduces `execute`, so its cases skip the per-case loop."""
+    cases = [ScenarioParameters(name="Bear", probability=0.5, growth_override=0.01),
+             ScenarioParameters(name="Bull", probability=0.5, growth_override=0.04)]
+    params = _resolve(FCFFStandardParameters(fcf_anchor=100_000.0, growth_rate_p1=0.08), mock_apple_snapshot, cases)
+    runner = ScenariosRunner(StandardFCFFStrategy())
+
+    values = runner._evaluate_vectorized(params, params.structure, cases)
+
+    assert values == pytest.approx(_loop_values(runner, params), rel=1e-12)
+
+
+def test_kernel_mismatch_falls_back_to_loop(mock_apple_snapshot):
+    """A kernel that drifts from `execute` is rejected by the parity probe."""
+    cases = [ScenarioParameters(name="Bear", probability=0.5, growth_override=0.01),
+             ScenarioParameters(name="Bull", probability=0.5, growth_override=0.04)]
+    params = _resolve(FCFFStandardParameters(fcf_anchor=100_000.0, growth_rate_p1=0.08), mock_apple_snapshot, cases)
+    runner = ScenariosRunner(StandardFCFFStrategy())
+    kernel = StandardFCFFStrategy.execute_stochastic
+
+    with patch.object(StandardFCFFStrategy, "execute_stochastic",
+                      side_effect=lambda f, p, v: kernel(f, p, v) * 1.01):
+        assert runner._evaluate_vectorized(params, params.structure, cases) is None
+        result = runner.execute(params, params.structure)
+
+    assert [o.intrinsic_value for o in result.outcomes] == pytest.approx(_loop_values(runner, params))
+    assert result.expected_intrinsic_value == pytest.approx(np.mean(_loop_values(runner, params)))
+
+
+def test_override_rows_match_the_loop_at_the_edges(mock_apple_snapshot):
+    """A 0.0 growth override resolves to the default like `execute`; g >= WACC is dropped like the loop."""
+    cases = [ScenarioParameters(name="Zero", probability=0.3, growth_override=0.0),
+             ScenarioParameters(name="Base", probability=0.4, growth_override=0.02),
+             ScenarioParameters(name="Crazy", probability=0.3, growth_override=0.30)]
+    params = _resolve(FCFFStandardParameters(fcf_anchor=100_000.0, growth_rate_p1=0.08), mock_apple_snapshot, cases)
+    runner = ScenariosRunner(StandardFCFFStrategy())
+    expected = _loop_values(runner, params)
+
+    values = runner._evaluate_vectorized(params, params.structure, cases)
+
+    assert expected[2] is None
+    assert values[2] is None
+    assert values[:2] == pytest.approx(expected[:2], rel=1e-12)
+    assert values[0] == pytest.approx(values[1], rel=1e-12)
+
+
+def test_margin_override_is_applied(mock_apple_snapshot):
+    cases = [ScenarioParameters(name="Low", probability=0.5, margin_override=0.10),
+             ScenarioParameters(name="High", probability=0.5, margin_override=0.30)]
+    params = _resolve(_growth_params(), mock_apple_snapshot, cases)
+
+    result = ScenariosRunner(RevenueGrowthFCFFStrategy()).execute(params, params.structure)
+
+    low, high = (o.intrinsic_value for o in result.outcomes)
+    assert high > low
+    # The base parameters are left untouched.
+    assert params.strategy.target_fcf_margin == pytest.approx(0.20)
+
+
+def test_revenue_kernel_accepts_per_path_target_margin(mock_apple_snapshot):
+    params = _resolve(_growth_params(), mock_apple_snapshot, [])
+    strategy = RevenueGrowthFCFFStrategy()
+    anchors = strategy.stochastic_anchors(params.structure, params)
+    vectors = {k: np.full(3, v) for k, v in anchors.items()}
+    vectors["target_margin"] = np.array([0.10, 0.20, 0.30])
+
+    values = strategy.execute_stochastic(params.structure, params, vectors)
+    scalar = strategy.execute_stochastic(params.structure, params, {k: v[1:2] for k, v in vectors.items()
+                                                                    if k != "target_margin"})
+
+    assert values[0] < values[1] < values[2]
+    assert values[1] == pytest.approx(scalar[0])
+
+
+def test_non_finite_case_is_dropped(mock_apple_snapshot):
+    params = _resolve(GrahamParameters(eps_normalized=6.0, growth_estimate=0.05), mock_apple_snapshot, [
+        ScenarioParameters(name="Ok", probability=0.5, growth_override=0.04),
+        ScenarioParameters(name="Broken", probability=0.5, growth_override=0.06),
+    ])
+    runner = ScenariosRunner(GrahamNumberStrategy())
+    kernel = GrahamNumberStrategy.execute_stochastic
+
+    def _kernel(financials, p, vectors):
+        values = kernel(financials, p, vectors)
+        values[2] = np.nan
+        return values
+
+    with patch.object(GrahamNumberStrategy, "execute_stochastic", side_effect=_kernel):
+        result = runner.execute(params, params.structure)
+
+    assert [o.label for o in result.outcomes] == ["Ok"]
+    assert result.expected_intrinsic_value == pytest.approx(result.outcomes[0].intrinsic_value)
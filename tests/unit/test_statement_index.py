@@ -0,0 +1,132 @@
+"""
+tests/unit/test_statement_index.py
+
+STATEMENT INDEX TESTS
+=====================
+Role: Validates the compiled statement lookups (latest value, TTM sum, alias
+      priority, numeric coercion) and that the snapshot mapper built on them
+      reproduces the DataFrame-based extraction.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from infra.data_providers.extraction_utils import CAPEX_KEYS, DEBT_KEYS, OCF_KEYS
+from infra.data_providers.statement_index import StatementIndex
+from infra.data_providers.yahoo_snapshot_mapper import YahooSnapshotMapper
+from tests.benchmarks.conftest import load_raw_payload
+
+DATES = pd.to_datetime(["2023-12-31", "2024-03-31", "2024-06-30", "2024-09-30", "2024-12-31"])
+
+
+def _statement(rows: dict) -> pd.DataFrame:
+    """Statement in chronological column order (the index must sort it)."""
+    return pd.DataFrame.from_dict(rows, orient="index", columns=DATES)
+
+
+# ------------------------------------------------------------------
+# Lookups
+# ------------------------------------------------------------------
+
+def test_columns_are_sorted_most_recent_first():
+    index = StatementIndex.from_frame(_statement({"Total Revenue": [1, 2, 3, 4, 5]}))
+
+    assert index.columns[0] == DATES[-1]
+    np.testing.assert_array_equal(index.row(["Total Revenue"]), [5, 4, 3, 2, 1])
+
+
+def test_latest_skips_missing_periods_and_empty_aliases():
+    index = StatementIndex.from_frame(_statement({
+        "Total Debt": [np.nan] * 5,
+        "Net Debt": [10.0, 20.0, 30.0, np.nan, np.nan],
+    }))
+
+    assert index.latest(DEBT_KEYS) == 30.0
+    assert index.latest(["Minority Interest"]) is None
+
+
+def test_ttm_sums_the_four_most_recent_quarters():
+    index = StatementIndex.from_frame(_statement({
+        "Operating Cash Flow": [1.0, 10.0, 20.0, 30.0, 40.0],
+        "Total Cash From Operating Activities": [0.0] * 5,
+        "Capital Expenditure": [1.0, np.nan, -2.0, -3.0, -4.0],
+        "Purchase Of PPE": [-1.0, -1.0, -1.0, -1.0, -1.0],
+    }))
+
+    assert index.ttm(OCF_KEYS) == 100.0
+    # A gap in the first alias falls back to the next one
+    assert index.ttm(CAPEX_KEYS) == -4.0
+
+
+def test_short_statement_has_no_ttm():
+    frame = pd.DataFrame({"2024": [1.0], "2023": [2.0]}, index=["Total Revenue"])
+    assert StatementIndex.from_frame(frame).ttm(["Total Revenue"]) is None
+
+
+def test_non_numeric_cells_are_missing():
+    frame = pd.DataFrame({"2024": ["n/a", 5], "2023": [100, 6]}, index=["Revenue", "Expenses"])
+    index = StatementIndex.from_frame(frame)
+
+    assert index.latest(["Revenue"]) == 100.0
+    assert index.values.dtype == np.float64
+
+
+def test_duplicated_line_items_keep_the_first_row():
+    frame = pd.DataFrame({"2024": [1.0, 2.0]}, index=["EBIT", "EBIT"])
+    index = StatementIndex.from_frame(frame)
+
+    assert index.latest(["EBIT"]) == 1.0
+    assert len(index) == 1
+
+
+@pytest.mark.parametrize("frame", [None, pd.DataFrame()])
+def test_empty_statement(frame):
+    index = StatementIndex.from_frame(frame)
+
+    assert len(index) == 0 and "Total Debt" not in index
+    assert index.latest(DEBT_KEYS) is None and index.ttm(OCF_KEYS) is None
+    assert index.row(DEBT_KEYS) is None
+
+
+def test_alias_resolution_is_memoized():
+    index = StatementIndex.from_frame(_statement({"Net Debt": [1, 2, 3, 4, 5]}))
+
+    assert index.resolve(DEBT_KEYS) == (0,)
+    assert index.resolve(DEBT_KEYS) is index.resolve(list(DEBT_KEYS))
+
+
+# ------------------------------------------------------------------
+# Mapper
+# ------------------------------------------------------------------
+
+def _frame_latest(df, keys):
+    df = df.sort_index(axis=1, ascending=False)
+    for key in keys:
+        if key in df.index:
+            values = df.loc[key].dropna()
+            if not values.empty:
+                return float(values.iloc[0])
+    return None
+
+
+def _frame_ttm(df, keys):
+    for key in keys:
+        if key in df.index:
+            last_4 = df.loc[key].iloc[:4]
+            if len(last_4) == 4 and not last_4.isnull().any():
+                return float(last_4.sum())
+    return None
+
+
+def test_mapper_matches_dataframe_extraction():
+    raw = load_raw_payload("aapl_raw")
+    snapshot = YahooSnapshotMapper().map_to_snapshot(raw)
+
+    assert snapshot.total_debt == _frame_latest(raw.balance_sheet, DEBT_KEYS)
+    assert snapshot.cash_and_equivalents == _frame_latest(raw.balance_sheet, ["Cash And Cash Equivalents"])
+    assert snapshot.interest_expense == _frame_latest(raw.income_stmt, ["Interest Expense"])
+    assert snapshot.revenue_ttm == _frame_ttm(raw.quarterly_income_stmt, ["Total Revenue"])
+    assert snapshot.net_income_ttm == _frame_ttm(raw.quarterly_income_stmt, ["Net Income"])
+    assert snapshot.fcf_ttm == (_frame_ttm(raw.quarterly_cash_flow, OCF_KEYS)
+                                + _frame_ttm(raw.quarterly_cash_flow, CAPEX_KEYS))
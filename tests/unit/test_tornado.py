@@ -0,0 +1,169 @@
+"""
+tests/unit/test_tornado.py
+
+TORNADO SENSITIVITY TESTS
+=========================
+Role: Validates the one-at-a-time driver ranking: batched kernel evaluation
+      at parity with per-variant `execute` runs, driver discovery, and the
+      fallback for kernels that cannot carry every driver.
+"""
+
+import numpy as np
+import pytest
+
+from src.config.constants import ModelDefaults
+from src.models.company import Company
+from src.models.enums import ValuationMethodology
+from src.models.parameters.base_parameter import Parameters
+from src.models.parameters.options import TornadoParameters
+from src.models.parameters.strategies import (
+    DDMParameters,
+    FCFEParameters,
+    FCFFGrowthParameters,
+    FCFFNormalizedParameters,
+    FCFFStandardParameters,
+    GrahamParameters,
+    RIMParameters,
+    TerminalValueParameters,
+)
+from src.valuation.options.tornado import TornadoRunner
+from src.valuation.registry import get_strategy
+from src.valuation.resolvers.base_resolver import Resolver
+from src.valuation.strategies.standard_fcff import StandardFCFFStrategy
+
+TV = TerminalValueParameters(perpetual_growth_rate=0.025)
+
+MODES = {
+    ValuationMethodology.FCFF_STANDARD: lambda: FCFFStandardParameters(fcf_anchor=100.0, growth_rate_p1=0.08,
+                                                                       terminal_value=TV),
+    ValuationMethodology.FCFF_NORMALIZED: lambda: FCFFNormalizedParameters(fcf_norm=100.0, terminal_value=TV),
+    ValuationMethodology.FCFF_GROWTH: lambda: FCFFGrowthParameters(revenue_growth_rate=0.08, target_fcf_margin=0.25,
+                                                                   terminal_value=TV),
+    ValuationMethodology.FCFE: lambda: FCFEParameters(growth_rate=0.06, terminal_value=TV),
+    ValuationMethodology.DDM: lambda: DDMParameters(dividend_per_share=1.0, terminal_value=TV),
+    ValuationMethodology.GRAHAM: lambda: GrahamParameters(eps_normalized=6.0, growth_estimate=0.06),
+}
+
+
+def _params(snapshot, mode=ValuationMethodology.FCFF_STANDARD, strategy=None, **tornado_kwargs):
+    ghost = Parameters(structure=Company(ticker=snapshot.ticker), strategy=strategy or MODES[mode]())
+    params = Resolver().resolve(ghost, snapshot)
+    params.extensions.tornado = TornadoParameters(enabled=True, **tornado_kwargs)
+    return params
+
+
+def _loop_only(mode):
+    runner = TornadoRunner(get_strategy(mode)())
+    runner._evaluate_vectorized = lambda *args: None
+    return runner
+
+
+@pytest.mark.parametrize("mode", list(MODES), ids=lambda m: m.value)
+def test_batched_bars_match_per_variant_execute(mode, mock_apple_snapshot):
+    params = _params(mock_apple_snapshot, mode)
+
+    batched = TornadoRunner(get_strategy(mode)()).execute(params, params.structure)
+    looped = _loop_only(mode).execute(params, params.structure)
+
+    assert batched.vectorized and not looped.vectorized
+    assert batched.base_value == pytest.approx(looped.base_value, rel=1e-12)
+    assert [b.driver for b in batched.bars] == [b.driver for b in looped.bars]
+    for fast, slow in zip(batched.bars, looped.bars):
+        assert fast.low_value == pytest.approx(slow.low_value, rel=1e-9, abs=1e-9)
+        assert fast.high_value == pytest.approx(slow.high_value, rel=1e-9, abs=1e-9)
+
+
+def test_terminal_growth_shock_above_wacc_is_skipped_like_the_loop(mock_apple_snapshot):
+    """A high g_n move past the WACC raises in `execute`; the kernel row is NaN and the bar is dropped too."""
+    params = _params(mock_apple_snapshot, rate_shock=0.01, strategy=FCFFStandardParameters(
+        fcf_anchor=100.0, growth_rate_p1=0.08, terminal_value=TerminalValueParameters(perpetual_growth_rate=0.025)))
+    strategy = get_strategy(ValuationMethodology.FCFF_STANDARD)()
+    wacc = strategy.stochastic_anchors(params.structure, params)['wacc']
+    params.strategy.terminal_value.perpetual_growth_rate = wacc - 0.005
+
+    batched = TornadoRunner(strategy).execute(params, params.structure)
+    looped = _loop_only(ValuationMethodology.FCFF_STANDARD).execute(params, params.structure)
+
+    assert batched.vectorized
+    assert "perpetual_growth_rate" not in {bar.driver for bar in batched.bars}
+    assert [b.driver for b in batched.bars] == [b.driver for b in looped.bars]
+    for fast, slow in zip(batched.bars, looped.bars):
+        assert (fast.low_value, fast.high_value) == pytest.approx((slow.low_value, slow.high_value), rel=1e-9)
+
+
+def test_bars_are_ranked_by_swing(mock_apple_snapshot):
+    params = _params(mock_apple_snapshot)
+    result = TornadoRunner(get_strategy(ValuationMethodology.FCFF_STANDARD)()).execute(params, params.structure)
+
+    swings = [bar.swing for bar in result.bars]
+    assert swings == sorted(swings, reverse=True)
+    assert {bar.driver for bar in result.bars} == {
+        "beta", "risk_free_rate", "market_risk_premium", "tax_rate", "growth_rate_p1", "perpetual_growth_rate",
+        "fcf_anchor", "total_debt", "cash_and_equivalents", "shares_outstanding", "projection_years",
+    }
+
+
+def test_moves_follow_the_configured_shocks(mock_apple_snapshot):
+    params = _params(mock_apple_snapshot, relative_shock=0.2, rate_shock=0.005, years_shock=2)
+    params.strategy.growth_rate_p1 = None  # execute falls back on the default growth
+    result = TornadoRunner(get_strategy(ValuationMethodology.FCFF_STANDARD)()).execute(params, params.structure)
+    bars = {bar.driver: bar for bar in result.bars}
+
+    assert bars["beta"].low_input == pytest.approx(bars["beta"].base_input * 0.8)
+    assert bars["perpetual_growth_rate"].high_input == pytest.approx(0.03)
+    assert bars["growth_rate_p1"].base_input == ModelDefaults.DEFAULT_GROWTH_RATE
+    assert (bars["projection_years"].low_input, bars["projection_years"].high_input) == (3.0, 7.0)
+    # More cash raises the value (debt also moves the WACC weights, so its sign is not fixed)
+    assert bars["cash_and_equivalents"].high_value > bars["cash_and_equivalents"].low_value
+
+
+def test_parameters_are_left_untouched(mock_apple_snapshot):
+    params = _params(mock_apple_snapshot)
+    before = params.model_dump()
+    TornadoRunner(get_strategy(ValuationMethodology.FCFF_STANDARD)()).execute(params, params.structure)
+    assert params.model_dump() == before
+
+
+def test_kernel_ignoring_capital_vectors_falls_back(mock_apple_snapshot, monkeypatch):
+    original = StandardFCFFStrategy.execute_stochastic
+
+    def blind_kernel(financials, params, vectors):
+        return original(financials, params, {k: v for k, v in vectors.items() if k != "shares_outstanding"})
+
+    monkeypatch.setattr(StandardFCFFStrategy, "execute_stochastic", staticmethod(blind_kernel))
+    params = _params(mock_apple_snapshot)
+    result = TornadoRunner(StandardFCFFStrategy()).execute(params, params.structure)
+
+    assert not result.vectorized
+    bars = {bar.driver: bar for bar in result.bars}
+    assert bars["shares_outstanding"].swing > 0
+
+
+def test_strategy_without_kernel_parity_uses_execute(mock_apple_snapshot):
+    params = _params(mock_apple_snapshot, strategy=RIMParameters(persistence_factor=0.6, terminal_value=TV))
+    result = TornadoRunner(get_strategy(ValuationMethodology.RIM)()).execute(params, params.structure)
+
+    assert result is not None and not result.vectorized
+
+
+def test_disabled_tornado_returns_none(mock_apple_snapshot):
+    params = _params(mock_apple_snapshot)
+    params.extensions.tornado.enabled = False
+    assert TornadoRunner(get_strategy(ValuationMethodology.FCFF_STANDARD)()).execute(params, params.structure) is None
+
+
+def test_capital_vectors_reach_the_equity_bridge(mock_apple_snapshot):
+    params = _params(mock_apple_snapshot)
+    strategy = StandardFCFFStrategy()
+    anchors = strategy.stochastic_anchors(params.structure, params)
+    vectors = {key: np.full(2, float(value)) for key, value in anchors.items()}
+    base = strategy.execute_stochastic(params.structure, params, vectors)
+
+    capital = params.common.capital
+    vectors["shares_outstanding"] = np.array([capital.shares_outstanding, 2 * capital.shares_outstanding])
+    vectors["total_debt"] = np.full(2, capital.total_debt)
+    vectors["cash_and_equivalents"] = np.full(2, capital.cash_and_equivalents)
+    values = strategy.execute_stochastic(params.structure, params, vectors)
+
+    assert values[0] == pytest.approx(base[0], rel=1e-14)
+    assert values[1] == pytest.approx(base[1] / 2, rel=1e-14)
@@ -0,0 +1,143 @@
+"""
+tests/unit/test_tracing.py
+
+SPAN TRACING TESTS
+==================
+Role: Validates src/core/tracing.py (nesting, ring buffer, exports) and the
+      spans emitted by the Monte Carlo path.
+Standards: pytest
+"""
+
+import json
+import threading
+
+import pytest
+
+from src.core.tracing import Tracer, tracer
+
+
+@pytest.fixture
+def global_tracer():
+    """Enables the process-wide tracer for one test, then restores it."""
+    previous = tracer.enabled
+    tracer.configure(enabled=True)
+    tracer.clear()
+    yield tracer
+    tracer.clear()
+    tracer.configure(enabled=previous)
+
+
+def test_disabled_tracer_records_nothing():
+    t = Tracer(enabled=False)
+    with t.span("noop") as span:
+        span.set(ignored=True)
+    assert t.records() == []
+
+
+def test_nested_spans_link_parents():
+    t = Tracer(enabled=True)
+    with t.span("root", ticker="AAPL"):
+        with t.span("child", category="kernel") as child:
+            child.set(n_sims=10)
+        with t.span("sibling"):
+            pass
+
+    records = {r.name: r for r in t.records()}
+    assert records["root"].parent_id is None and records["root"].depth == 0
+    assert records["child"].parent_id == records["root"].span_id
+    assert records["sibling"].parent_id == records["root"].span_id
+    assert records["child"].depth == 1
+    assert records["child"].attrs == {"n_sims": 10}
+    assert records["root"].duration_ns >= records["child"].duration_ns + records["sibling"].duration_ns
+
+
+def test_span_records_exception_and_reraises():
+    t = Tracer(enabled=True)
+    with pytest.raises(ValueError):
+        with t.span("boom"):
+            raise ValueError("x")
+    assert t.records()[0].attrs["error"] == "ValueError"
+
+
+def test_ring_buffer_drops_oldest():
+    t = Tracer(capacity=3, enabled=True)
+    for i in range(5):
+        with t.span(f"s{i}"):
+            pass
+    assert [r.name for r in t.records()] == ["s2", "s3", "s4"]
+
+
+def test_threads_have_independent_stacks():
+    t = Tracer(enabled=True)
+
+    def worker():
+        with t.span("worker"):
+            pass
+
+    with t.span("main"):
+        th = threading.Thread(target=worker)
+        th.start()
+        th.join()
+
+    records = {r.name: r for r in t.records()}
+    assert records["worker"].parent_id is None
+    assert records["worker"].thread_id != records["main"].thread_id
+
+
+def test_traced_decorator():
+    t = Tracer(enabled=True)
+
+    @t.traced(category="provider")
+    def fetch(x):
+        return x * 2
+
+    assert fetch(2) == 4
+    assert t.records()[0].name.endswith("fetch")
+    assert t.records()[0].category == "provider"
+
+
+def test_chrome_trace_export(tmp_path):
+    t = Tracer(enabled=True)
+    with t.span("root"):
+        with t.span("leaf", category="kernel"):
+            pass
+
+    path = tmp_path / "trace.json"
+    trace = t.export_chrome_trace(path)
+    on_disk = json.loads(path.read_text(encoding="utf-8"))
+
+    assert on_disk == json.loads(json.dumps(trace))
+    events = {e["name"]: e for e in trace["traceEvents"]}
+    assert events["leaf"]["ph"] == "X"
+    assert events["leaf"]["cat"] == "kernel"
+    assert events["root"]["ts"] <= events["leaf"]["ts"]
+    assert events["leaf"]["args"]["parent_id"] == events["root"]["args"]["span_id"]
+
+    plain = t.export_json(tmp_path / "spans.json")
+    assert {p["name"] for p in plain} == {"root", "leaf"}
+
+
+def test_monte_carlo_spans_reach_inside_kernel(global_tracer):
+    from src.models.company import Company
+    from src.models.parameters.base_parameter import Parameters
+    from src.models.parameters.common import CapitalStructureParameters, CommonParameters
+    from src.models.parameters.options import ExtensionBundleParameters, MCParameters
+    from src.models.parameters.strategies import FCFFStandardParameters, TerminalValueParameters
+    from src.valuation.options.monte_carlo import MonteCarloRunner
+    from src.valuation.strategies.standard_fcff import StandardFCFFStrategy
+
+    params = Parameters(
+        structure=Company(ticker="TRACE", current_price=50.0),
+        strategy=FCFFStandardParameters(
+            fcf_anchor=1000.0, terminal_value=TerminalValueParameters(perpetual_growth_rate=0.02)
+        ),
+        common=CommonParameters(capital=CapitalStructureParameters(shares_outstanding=100.0)),
+        extensions=ExtensionBundleParameters(monte_carlo=MCParameters(enabled=True, iterations=200)),
+    )
+    MonteCarloRunner(StandardFCFFStrategy()).execute(params, params.structure)
+
+    records = {r.name: r for r in global_tracer.records()}
+    assert {"mc.generate_vectors", "mc.execute_stochastic", "kernel.projection",
+            "kernel.discounting", "kernel.terminal_value"} <= set(records)
+    assert records["kernel.projection"].parent_id == records["mc.execute_stochastic"].span_id
+    assert records["mc.execute_stochastic"].attrs["n_sims"] == 200